@@ -0,0 +1,78 @@
+"""Benchmark ExcelTool workbook creation: regular vs write-only mode.
+
+Builds a styled sheet (header style, cell style, one number format) of
+10k and 100k rows through both creation paths and reports throughput and
+peak memory.  Each run happens in a fresh process so peak RSS is not
+inherited from the previous one.
+
+Usage::
+
+    python benchmarks/excel_create.py
+    python benchmarks/excel_create.py --rows 10000 250000 --columns 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tools.spreadsheet.models import SheetSpec
+
+MODES = {"regular": 0, "write-only": 1}
+
+
+def _build_sheet(n_rows: int, n_columns: int) -> SheetSpec:
+    from firefly_dworkers.design.models import TextStyle
+    from firefly_dworkers.tools.spreadsheet.models import SheetSpec
+
+    headers = ["id", "amount", *(f"text_{i}" for i in range(n_columns - 2))]
+    rows = [[i, i * 1.25, *(f"row {i} col {j}" for j in range(n_columns - 2))] for i in range(n_rows)]
+    return SheetSpec(
+        name="Data",
+        headers=headers,
+        rows=rows,
+        header_style=TextStyle(bold=True, color="#FFFFFF"),
+        cell_style=TextStyle(font_name="Arial", font_size=10),
+        number_formats={"B": "#,##0.00"},
+    )
+
+
+def _run(n_rows: int, n_columns: int, write_only_rows: int) -> tuple[float, int, int]:
+    from firefly_dworkers.tools.spreadsheet.excel import ExcelTool
+
+    sheet = _build_sheet(n_rows, n_columns)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    data = ExcelTool(write_only_rows=write_only_rows)._create_sync([sheet])
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return elapsed, (peak - baseline) * scale, len(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--columns", type=int, default=6)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'rows':>9}  {'mode':<10}  {'seconds':>8}  {'rows/sec':>10}  {'peak MiB':>9}  {'file KiB':>9}")
+    for n_rows in args.rows:
+        for mode, write_only_rows in MODES.items():
+            with ctx.Pool(1) as pool:
+                elapsed, peak, size = pool.apply(_run, (n_rows, args.columns, write_only_rows))
+            print(
+                f"{n_rows:>9,}  {mode:<10}  {elapsed:>8.2f}  {n_rows / elapsed:>10,.0f}"
+                f"  {peak / 2**20:>9.1f}  {size / 1024:>9,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from firefly_dworkers.config import DworkersConfig, get_config, reset_config
 from firefly_dworkers.exceptions import (
     CheckpointError,
     CheckpointRejectedError,
+    ConcurrencyLimitError,
     ConnectorAuthError,
     ConnectorError,
     DworkersError,
@@ -35,6 +36,7 @@ __all__ = [
     "AutonomyLevel",
     "CheckpointError",
     "CheckpointRejectedError",
+    "ConcurrencyLimitError",
     "ConnectorAuthError",
     "ConnectorError",
     "DworkersConfig",
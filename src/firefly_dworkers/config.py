@@ -17,6 +17,13 @@ class DworkersConfig(BaseSettings):
     max_concurrent_workers: int = 10
     knowledge_backend: Literal["in_memory", "file", "postgres", "mongodb"] = "in_memory"
     default_failure_strategy: Literal["skip_downstream", "fail_pipeline", "ignore"] = "fail_pipeline"
+    step_memo_dir: str = ""  # where memoised plan step outputs are stored; empty = in memory
+    response_cache_path: str = ""  # SQLite file for persistent LLM response caching; empty = in memory only
+    http_max_connections: int = 100  # shared HTTP client pool used by HTTP-based tools
+    http_max_keepalive_connections: int = 20
+    http_max_connections_per_host: int = 10  # 0 = no per-host limit
+    http_keepalive_expiry: float = 30.0
+    http2: bool = True  # negotiated only when the h2 package is installed
 
 
 def get_config() -> DworkersConfig:
@@ -6,13 +6,13 @@ capturing colors, fonts, layouts, and other design attributes.
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import os
 from typing import Any
 from xml.etree.ElementTree import Element
 
 from firefly_dworkers.design.models import DesignProfile, LayoutZone, PlaceholderZone
+from firefly_dworkers.tools.executors import run_blocking
 
 # ── Lazy library imports ────────────────────────────────────────────────────
 
@@ -95,7 +95,7 @@ class TemplateAnalyzer:
         """Extract from PPTX: layout names, theme colors, font scheme, slide dimensions."""
         if not PPTX_AVAILABLE:
             raise ImportError("python-pptx required: pip install firefly-dworkers[presentation]")
-        profile = await asyncio.to_thread(self._analyze_pptx_sync, path)
+        profile = await run_blocking("render", self._analyze_pptx_sync, path)
 
         # LLM-based classification for custom placeholders
         if self._vlm_model and profile.layout_zones:
@@ -168,7 +168,7 @@ class TemplateAnalyzer:
         """Extract from DOCX: style names, fonts from styles, margins from first section."""
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx required: pip install firefly-dworkers[document]")
-        return await asyncio.to_thread(self._analyze_docx_sync, path)
+        return await run_blocking("render", self._analyze_docx_sync, path)
 
     def _analyze_docx_sync(self, path: str) -> DesignProfile:
         doc = docx.Document(path)
@@ -212,7 +212,7 @@ class TemplateAnalyzer:
         """Extract from XLSX: default font, column widths, sheet names."""
         if not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl required: pip install firefly-dworkers[data]")
-        return await asyncio.to_thread(self._analyze_xlsx_sync, path)
+        return await run_blocking("render", self._analyze_xlsx_sync, path)
 
     def _analyze_xlsx_sync(self, path: str) -> DesignProfile:
         wb = openpyxl.load_workbook(path, read_only=True)
@@ -6,12 +6,12 @@ and rasterised PNG images via matplotlib for DOCX/PDF embedding.
 
 from __future__ import annotations
 
-import asyncio
 import io
 import logging
 from typing import Any
 
 from firefly_dworkers.design.models import DesignProfile, ResolvedChart
+from firefly_dworkers.tools.executors import run_blocking
 
 # ── Lazy library imports ────────────────────────────────────────────────────
 
@@ -97,11 +97,11 @@ class ChartRenderer:
 
         Used for DOCX / PDF embedding where native chart objects are not
         available.  The heavy matplotlib work runs in a thread via
-        :func:`asyncio.to_thread` to avoid blocking the event loop.
+        :func:`~firefly_dworkers.tools.executors.run_blocking` to avoid blocking the event loop.
         """
         if not MATPLOTLIB_AVAILABLE:
             raise ImportError("matplotlib required: pip install matplotlib")
-        return await asyncio.to_thread(self.render_to_image_sync, chart, width, height)
+        return await run_blocking("render", self.render_to_image_sync, chart, width, height)
 
     def render_to_image_sync(self, chart: ResolvedChart, width: int = 800, height: int = 600) -> bytes:
         """Synchronous variant of :meth:`render_to_image`.
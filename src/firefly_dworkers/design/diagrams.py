@@ -6,10 +6,10 @@ matplotlib-based fallback for environments where graphviz is unavailable.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from firefly_dworkers.design.models import DiagramSpec
+from firefly_dworkers.tools.executors import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ class DiagramRenderer:
 
     async def _render_dot(self, dot_source: str) -> bytes:
         """Render DOT source to PNG using graphviz."""
-        return await asyncio.to_thread(self._render_dot_sync, dot_source)
+        return await run_blocking("render", self._render_dot_sync, dot_source)
 
     def _render_dot_sync(self, dot_source: str) -> bytes:
         """Sync graphviz rendering."""
@@ -45,7 +45,7 @@ class DiagramRenderer:
 
     async def _render_fallback(self, title: str) -> bytes:
         """Fallback: render a simple labeled image using matplotlib."""
-        return await asyncio.to_thread(self._render_fallback_sync, title)
+        return await run_blocking("render", self._render_fallback_sync, title)
 
     def _render_fallback_sync(self, title: str) -> bytes:
         import io
@@ -15,6 +15,7 @@ import base64
 import httpx
 
 from firefly_dworkers.design.models import ImageRequest, ResolvedImage
+from firefly_dworkers.tools.executors import run_blocking
 
 
 class ImageResolver:
@@ -67,7 +68,7 @@ class ImageResolver:
 
     async def _resolve_file(self, request: ImageRequest) -> ResolvedImage:
         """Read image bytes from local file."""
-        data = await asyncio.to_thread(self._read_file_sync, request.file_path)
+        data = await run_blocking("render", self._read_file_sync, request.file_path)
         mime = self._detect_mime(request.file_path)
         return ResolvedImage(data=data, mime_type=mime, alt_text=request.alt_text)
 
@@ -8,6 +8,7 @@ Three-stage pipeline:
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from enum import StrEnum
 from typing import Any
 
@@ -92,6 +93,42 @@ class DataSet(BaseModel):
     series: list[DataSeries] = Field(default_factory=list)
     suggested_chart_type: str = ""
 
+    @classmethod
+    def from_columns(
+        cls,
+        name: str,
+        data: Mapping[str, Sequence[Any]],
+        *,
+        category: str = "",
+        series: Sequence[str] | None = None,
+        description: str = "",
+        suggested_chart_type: str = "",
+    ) -> DataSet:
+        """Build a dataset from a columnar ``data`` mapping (``result_format="columns"``).
+
+        *category* names the column holding the category labels (default:
+        the first column); *series* names the value columns and defaults to
+        every other column.  Missing values become ``0``.
+        """
+        category = category or next(iter(data), "")
+        if category not in data:
+            raise KeyError(f"Category column '{category}' not in data")
+        names = list(series) if series is not None else [c for c in data if c != category]
+        return cls(
+            name=name,
+            description=description,
+            categories=["" if v is None else str(v) for v in _plain(data[category])],
+            series=[
+                DataSeries(name=n, values=[0 if v is None else v for v in _plain(data[n])]) for n in names
+            ],
+            suggested_chart_type=suggested_chart_type,
+        )
+
+
+def _plain(values: Sequence[Any]) -> list[Any]:
+    """Return *values* as a list of Python scalars (unwrapping NumPy arrays)."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
 
 class ImageRequest(BaseModel):
     """Request for an image from various sources."""
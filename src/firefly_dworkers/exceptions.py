@@ -12,6 +12,12 @@ class WorkerError(DworkersError): ...
 class WorkerNotFoundError(WorkerError): ...
 
 
+class ConcurrencyLimitError(WorkerError): ...
+
+
+class GuardViolationError(WorkerError): ...
+
+
 class TenantError(DworkersError): ...
 
 
@@ -0,0 +1,25 @@
+"""Jobs layer -- background execution of worker, plan and project runs.
+
+Runs submitted to the :data:`job_scheduler` are queued with a priority and
+dispatched fairly across tenants, so long batch plans cannot starve
+interactive requests.  Job records live in a pluggable :class:`JobStore`.
+"""
+
+from __future__ import annotations
+
+from firefly_dworkers.jobs.models import Job, JobPriority, JobStatus
+from firefly_dworkers.jobs.scheduler import JobContext, JobRunner, JobScheduler, job_scheduler
+from firefly_dworkers.jobs.store import FileJobStore, InMemoryJobStore, JobStore
+
+__all__ = [
+    "FileJobStore",
+    "InMemoryJobStore",
+    "Job",
+    "JobContext",
+    "JobPriority",
+    "JobRunner",
+    "JobScheduler",
+    "JobStatus",
+    "JobStore",
+    "job_scheduler",
+]
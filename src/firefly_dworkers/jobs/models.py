@@ -0,0 +1,116 @@
+"""Job data models -- records for runs executed by the :class:`JobScheduler`."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import IntEnum, StrEnum
+from typing import Any
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the job has finished (successfully or not)."""
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobPriority(IntEnum):
+    """Scheduling priority -- lower values are dispatched first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+    @classmethod
+    def parse(cls, value: str | int | JobPriority | None, default: JobPriority) -> JobPriority:
+        """Coerce a name (``"batch"``), number or ``None`` into a priority."""
+        if value is None or value == "":
+            return default
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError as exc:
+                raise ValueError(f"Unknown job priority '{value}'. Expected one of {[p.name.lower() for p in cls]}") from exc
+        return cls(value)
+
+
+@dataclass
+class Job:
+    """A unit of work submitted to the scheduler.
+
+    The runner callable is held by the scheduler, not the record, so jobs
+    can be persisted by any :class:`~firefly_dworkers.jobs.store.JobStore`.
+    """
+
+    kind: str
+    tenant_id: str = "default"
+    priority: JobPriority = JobPriority.NORMAL
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.QUEUED
+    metadata: dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: str = ""
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def queue_wait_ms(self) -> float:
+        """Time spent queued before dispatch (so far, if still queued)."""
+        end = self.started_at or datetime.now(UTC)
+        return (end - self.created_at).total_seconds() * 1000
+
+    @property
+    def duration_ms(self) -> float:
+        """Run time once started (so far, if still running)."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at or datetime.now(UTC)
+        return (end - self.started_at).total_seconds() * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise to a JSON-friendly dict."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "tenant_id": self.tenant_id,
+            "priority": self.priority.name.lower(),
+            "status": self.status.value,
+            "metadata": dict(self.metadata),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "queue_wait_ms": self.queue_wait_ms,
+            "duration_ms": self.duration_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Job:
+        """Rebuild a job from :meth:`to_dict` output."""
+
+        def _dt(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            kind=data["kind"],
+            tenant_id=data.get("tenant_id", "default"),
+            priority=JobPriority.parse(data.get("priority"), JobPriority.NORMAL),
+            id=data["id"],
+            status=JobStatus(data.get("status", JobStatus.QUEUED)),
+            metadata=dict(data.get("metadata", {})),
+            result=data.get("result"),
+            error=data.get("error", ""),
+            created_at=_dt(data.get("created_at")) or datetime.now(UTC),
+            started_at=_dt(data.get("started_at")),
+            finished_at=_dt(data.get("finished_at")),
+        )
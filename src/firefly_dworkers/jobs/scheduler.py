@@ -0,0 +1,364 @@
+"""JobScheduler -- in-process, priority-aware scheduler for long-running runs.
+
+Jobs are queued per tenant in priority order.  When a slot frees up the
+scheduler picks the most urgent priority class that has pending work and
+then serves the tenants holding such work in weighted round-robin order,
+so one tenant's batch of plans cannot starve another tenant's interactive
+requests.
+
+Every event a job publishes is appended to a bounded per-job log under a
+sequential id, so a client whose event stream drops can reconnect and
+replay what it missed (``subscribe(job_id, after=last_seen_id)``).
+
+Example::
+
+    async def _runner(ctx: JobContext) -> dict:
+        await ctx.emit(StreamEvent(type="token", content="working..."))
+        return {"answer": 42}
+
+    job = job_scheduler.submit("demo", _runner, tenant_id="acme", priority=JobPriority.BATCH)
+    finished = await job_scheduler.wait(job.id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from firefly_dworkers.jobs.models import Job, JobPriority, JobStatus
+from firefly_dworkers.jobs.store import InMemoryJobStore, JobStore
+
+if TYPE_CHECKING:
+    from firefly_dworkers.sdk.models import ProjectEvent, StreamEvent
+
+    JobEvent = StreamEvent | ProjectEvent
+
+logger = logging.getLogger(__name__)
+
+JobRunner = Callable[["JobContext"], Awaitable[Any]]
+
+
+class JobContext:
+    """Handle passed to a job runner for publishing progress events."""
+
+    def __init__(self, job: Job, scheduler: JobScheduler) -> None:
+        self._job = job
+        self._scheduler = scheduler
+
+    @property
+    def job(self) -> Job:
+        """The job being executed."""
+        return self._job
+
+    async def emit(self, event: JobEvent) -> None:
+        """Publish a progress event to everyone subscribed to this job."""
+        self._scheduler._publish(self._job.id, event)
+
+
+class _TenantQueue:
+    """Priority heap of pending job IDs for one tenant."""
+
+    __slots__ = ("heap", "credits")
+
+    def __init__(self) -> None:
+        self.heap: list[tuple[int, int, str]] = []
+        self.credits = 0
+
+
+class JobScheduler:
+    """Priority and tenant-fair scheduler for background jobs.
+
+    Parameters:
+        max_concurrency: Maximum jobs running at once.  Defaults to
+            :attr:`DworkersConfig.max_concurrent_workers`.
+        store: Persistence backend for job records.  Defaults to
+            :class:`InMemoryJobStore`.
+        weight_for: Callable returning a tenant's round-robin weight (how
+            many jobs it may dispatch per turn).  Defaults to the tenant's
+            ``scheduling.weight`` setting, or ``1`` for unknown tenants.
+        max_events_per_job: Size of each job's replay log; older events
+            are dropped once it is full.
+        max_event_logs: Number of finished jobs whose event logs are kept
+            for replay.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        store: JobStore | None = None,
+        weight_for: Callable[[str], int] | None = None,
+        max_events_per_job: int = 1000,
+        max_event_logs: int = 100,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._store: JobStore = store or InMemoryJobStore()
+        self._weight_for = weight_for or _tenant_weight
+        self._queues: dict[str, _TenantQueue] = {}
+        self._rotation: deque[str] = deque()
+        self._active: dict[str, Job] = {}
+        self._runners: dict[str, JobRunner] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue[tuple[int, JobEvent] | None]]] = {}
+        self._event_logs: OrderedDict[str, deque[tuple[int, JobEvent]]] = OrderedDict()
+        self._max_events_per_job = max_events_per_job
+        self._max_event_logs = max_event_logs
+        self._done: dict[str, asyncio.Event] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    # -- Properties ------------------------------------------------------------
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of concurrently running jobs."""
+        if self._max_concurrency is None:
+            from firefly_dworkers.config import get_config
+
+            return max(1, get_config().max_concurrent_workers)
+        return max(1, self._max_concurrency)
+
+    @property
+    def store(self) -> JobStore:
+        """The job persistence backend."""
+        return self._store
+
+    # -- Public API ------------------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        runner: JobRunner,
+        *,
+        tenant_id: str = "default",
+        priority: JobPriority = JobPriority.NORMAL,
+        metadata: dict[str, Any] | None = None,
+    ) -> Job:
+        """Queue *runner* as a job and return its record immediately.
+
+        Must be called from a running event loop; the job runs on it.
+        """
+        job = Job(kind=kind, tenant_id=tenant_id, priority=priority, metadata=dict(metadata or {}))
+        with self._lock:
+            self._active[job.id] = job
+            self._runners[job.id] = runner
+            self._done[job.id] = asyncio.Event()
+            self._event_logs[job.id] = deque(maxlen=self._max_events_per_job)
+            queue = self._queues.get(tenant_id)
+            if queue is None:
+                queue = self._queues[tenant_id] = _TenantQueue()
+                queue.credits = self._weight(tenant_id)
+                self._rotation.append(tenant_id)
+            heapq.heappush(queue.heap, (int(priority), next(self._seq), job.id))
+        self._store.save(job)
+        self._dispatch()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the job record for *job_id*, or ``None``."""
+        with self._lock:
+            job = self._active.get(job_id)
+        return job or self._store.get(job_id)
+
+    def list_jobs(self, tenant_id: str | None = None) -> list[Job]:
+        """Return known jobs, newest first."""
+        return self._store.list_jobs(tenant_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job.  Returns ``False`` if already finished."""
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is None:
+                return False
+            task = self._tasks.get(job_id)
+            queued = job.status == JobStatus.QUEUED
+            if queued:
+                self._runners.pop(job_id, None)
+        if task is not None:
+            task.cancel()
+            return True
+        if queued:
+            # The heap entry is skipped lazily at dispatch time.
+            self._finish(job, JobStatus.CANCELLED, error="Cancelled before start")
+        return True
+
+    async def wait(self, job_id: str, timeout: float | None = None) -> Job | None:
+        """Wait until the job finishes and return its final record."""
+        with self._lock:
+            done = self._done.get(job_id)
+        if done is not None:
+            await asyncio.wait_for(done.wait(), timeout)
+        return self.get(job_id)
+
+    async def subscribe(self, job_id: str, *, after: int = 0) -> AsyncIterator[tuple[int, JobEvent]]:
+        """Yield ``(event_id, event)`` pairs published by the job.
+
+        Logged events with an id greater than *after* are replayed first,
+        then live events follow until the job finishes.  For a finished
+        job only the replay is yielded.
+        """
+        queue: asyncio.Queue[tuple[int, JobEvent] | None] = asyncio.Queue()
+        with self._lock:
+            backlog = [item for item in self._event_logs.get(job_id, ()) if item[0] > after]
+            live = job_id in self._done
+            if live:
+                self._subscribers.setdefault(job_id, []).append(queue)
+        for item in backlog:
+            yield item
+        if not live:
+            return
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(job_id, [])
+                if queue in subs:
+                    subs.remove(queue)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth per tenant and the number of running jobs."""
+        with self._lock:
+            return {
+                "running": len(self._tasks),
+                "max_concurrency": self.max_concurrency,
+                "queued": {tid: len(q.heap) for tid, q in self._queues.items() if q.heap},
+            }
+
+    # -- Dispatch --------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while there is spare capacity."""
+        while True:
+            with self._lock:
+                if len(self._tasks) >= self.max_concurrency:
+                    return
+                job_id = self._next_job_id()
+                if job_id is None:
+                    return
+                runner = self._runners.pop(job_id)
+                job = self._active[job_id]
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(UTC)
+                task = asyncio.get_running_loop().create_task(self._execute(job, runner))
+                self._tasks[job_id] = task
+            self._store.save(job)
+
+    def _next_job_id(self) -> str | None:
+        """Pick the next job: best priority first, then weighted round-robin.
+
+        Caller holds the lock.
+        """
+        while True:
+            self._prune_cancelled()
+            heads = [q.heap[0][0] for q in self._queues.values() if q.heap]
+            if not heads:
+                return None
+            best = min(heads)
+            for _ in range(len(self._rotation)):
+                tenant_id = self._rotation[0]
+                queue = self._queues[tenant_id]
+                if not queue.heap or queue.heap[0][0] != best:
+                    self._rotation.rotate(-1)
+                    continue
+                _, _, job_id = heapq.heappop(queue.heap)
+                queue.credits -= 1
+                if not queue.heap:
+                    self._rotation.popleft()
+                    del self._queues[tenant_id]
+                elif queue.credits <= 0:
+                    queue.credits = self._weight(tenant_id)
+                    self._rotation.rotate(-1)
+                if job_id in self._runners:
+                    return job_id
+                break  # Cancelled while queued -- pick again
+            else:
+                return None
+
+    def _prune_cancelled(self) -> None:
+        """Drop heap heads whose jobs were cancelled.  Caller holds the lock."""
+        for tenant_id in list(self._rotation):
+            queue = self._queues[tenant_id]
+            while queue.heap and queue.heap[0][2] not in self._runners:
+                heapq.heappop(queue.heap)
+            if not queue.heap:
+                self._rotation.remove(tenant_id)
+                del self._queues[tenant_id]
+
+    async def _execute(self, job: Job, runner: JobRunner) -> None:
+        try:
+            result = await runner(JobContext(job, self))
+        except asyncio.CancelledError:
+            self._finish(job, JobStatus.CANCELLED, error="Cancelled")
+        except Exception as exc:
+            logger.exception("Job '%s' (%s) failed", job.id, job.kind)
+            self._finish(job, JobStatus.FAILED, error=str(exc))
+        else:
+            job.result = result
+            self._finish(job, JobStatus.SUCCEEDED)
+        finally:
+            with self._lock:
+                self._tasks.pop(job.id, None)
+            self._dispatch()
+
+    def _finish(self, job: Job, status: JobStatus, *, error: str = "") -> None:
+        from firefly_dworkers.sdk.models import StreamEvent
+
+        job.status = status
+        job.error = error
+        job.finished_at = datetime.now(UTC)
+        self._store.save(job)
+        self._publish(job.id, StreamEvent(type="job_complete", content=status.value, metadata={"error": error}))
+        with self._lock:
+            self._active.pop(job.id, None)
+            done = self._done.pop(job.id, None)
+            subscribers = self._subscribers.pop(job.id, [])
+            # Finished jobs keep their log for replay; the oldest are dropped.
+            if job.id in self._event_logs:
+                self._event_logs.move_to_end(job.id)
+            finished = [jid for jid in self._event_logs if jid not in self._done]
+            for jid in finished[: max(0, len(finished) - self._max_event_logs)]:
+                del self._event_logs[jid]
+        for queue in subscribers:
+            queue.put_nowait(None)
+        if done is not None:
+            done.set()
+
+    def _publish(self, job_id: str, event: JobEvent) -> None:
+        with self._lock:
+            log = self._event_logs.get(job_id)
+            if log is None:
+                return
+            event_id = log[-1][0] + 1 if log else 1
+            log.append((event_id, event))
+            subscribers = list(self._subscribers.get(job_id, []))
+        for queue in subscribers:
+            queue.put_nowait((event_id, event))
+
+    def _weight(self, tenant_id: str) -> int:
+        try:
+            return max(1, int(self._weight_for(tenant_id)))
+        except Exception:
+            return 1
+
+
+def _tenant_weight(tenant_id: str) -> int:
+    """Default weight lookup: the tenant's ``scheduling.weight`` setting."""
+    from firefly_dworkers.tenants.registry import tenant_registry
+
+    if not tenant_registry.has(tenant_id):
+        return 1
+    return tenant_registry.get(tenant_id).scheduling.weight
+
+
+job_scheduler = JobScheduler()
@@ -0,0 +1,122 @@
+"""Job persistence backends.
+
+Defines the :class:`JobStore` protocol used by the scheduler to record job
+state, plus an in-memory store (default) and a JSON file store that keeps
+job records and results across server restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from firefly_dworkers.jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class JobStore(Protocol):
+    """Protocol for job record storage."""
+
+    def save(self, job: Job) -> None:
+        """Insert or update *job*."""
+        ...
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the job with *job_id*, or ``None`` if unknown."""
+        ...
+
+    def list_jobs(self, tenant_id: str | None = None) -> list[Job]:
+        """Return stored jobs, newest first, optionally for one tenant."""
+        ...
+
+    def delete(self, job_id: str) -> None:
+        """Remove the job with *job_id* (no-op if unknown)."""
+        ...
+
+
+class InMemoryJobStore:
+    """Thread-safe in-memory store.
+
+    Parameters:
+        max_jobs: Maximum number of records kept.  The oldest finished
+            jobs are evicted first; queued and running jobs are never
+            evicted.
+    """
+
+    def __init__(self, *, max_jobs: int = 1000) -> None:
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict()
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, tenant_id: str | None = None) -> list[Job]:
+        with self._lock:
+            jobs = [j for j in self._jobs.values() if tenant_id is None or j.tenant_id == tenant_id]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _evict(self) -> None:
+        overflow = len(self._jobs) - self._max_jobs
+        if overflow <= 0:
+            return
+        for job_id in [jid for jid, j in self._jobs.items() if j.status.is_terminal][:overflow]:
+            del self._jobs[job_id]
+
+
+class FileJobStore:
+    """Stores each job as ``<job_id>.json`` under *directory*.
+
+    Results must be JSON-serialisable; anything else is stored via
+    ``str()``.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def save(self, job: Job) -> None:
+        path = self._dir / f"{job.id}.json"
+        with self._lock:
+            path.write_text(json.dumps(job.to_dict(), default=str))
+
+    def get(self, job_id: str) -> Job | None:
+        path = self._dir / f"{job_id}.json"
+        with self._lock:
+            if not path.exists():
+                return None
+            return Job.from_dict(json.loads(path.read_text()))
+
+    def list_jobs(self, tenant_id: str | None = None) -> list[Job]:
+        jobs: list[Job] = []
+        with self._lock:
+            for path in self._dir.glob("*.json"):
+                try:
+                    job = Job.from_dict(json.loads(path.read_text()))
+                except (ValueError, KeyError):
+                    logger.warning("Skipping unreadable job record %s", path)
+                    continue
+                if tenant_id is None or job.tenant_id == tenant_id:
+                    jobs.append(job)
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            (self._dir / f"{job_id}.json").unlink(missing_ok=True)
@@ -33,6 +33,9 @@ def _import_delegation() -> tuple[Any, Any]:
     return DelegationRouter, ContentBasedStrategy
 
 
+_DELEGATION_ROLES = (WorkerRole.ANALYST, WorkerRole.RESEARCHER, WorkerRole.DATA_ANALYST)
+
+
 class ProjectOrchestrator:
     """Orchestrates multi-agent collaboration on consulting projects.
 
@@ -59,6 +62,7 @@ class ProjectOrchestrator:
         self._workspace = ProjectWorkspace(self._project_id)
         self._enable_delegation = enable_delegation
         self._router: Any | None = None
+        self._specialists: list[Any] = []
 
     # -- Public API -----------------------------------------------------------
 
@@ -87,6 +91,8 @@ class ProjectOrchestrator:
             logger.exception("Project '%s' failed", self._project_id)
             success = False
             deliverables = {"error": str(exc)}
+        finally:
+            self._release_specialists()
 
         elapsed = (time.perf_counter() - t0) * 1000
         return {
@@ -144,19 +150,21 @@ class ProjectOrchestrator:
 
             # Phase 3: Synthesise
             yield ProjectEvent(type="phase_start", content="synthesis")
-            await self._synthesize(brief, task_results)
+            deliverables = await self._synthesize(brief, task_results)
             yield ProjectEvent(type="phase_complete", content="synthesis")
 
             elapsed = (time.perf_counter() - t0) * 1000
             yield ProjectEvent(
                 type="project_complete",
                 content=self._project_id,
-                metadata={"success": True, "duration_ms": elapsed},
+                metadata={"success": True, "duration_ms": elapsed, "deliverables": deliverables},
             )
 
         except Exception as exc:
             logger.exception("Project '%s' streaming failed", self._project_id)
             yield ProjectEvent(type="error", content=str(exc))
+        finally:
+            self._release_specialists()
 
     # -- Internal helpers -----------------------------------------------------
 
@@ -256,6 +264,11 @@ class ProjectOrchestrator:
     def _get_delegation_router(self) -> Any | None:
         """Create a DelegationRouter with specialist workers for task routing.
 
+        Specialists are leased from the shared
+        :data:`~firefly_dworkers.workers.pool.specialist_pool` and bound to
+        the project workspace memory; they are returned to the pool when
+        the run finishes.
+
         Returns ``None`` when delegation is disabled, the framework module
         is not installed, or no specialist workers can be created.
         """
@@ -267,16 +280,16 @@ class ProjectOrchestrator:
 
         try:
             router_cls, strategy_cls = _import_delegation()
-            from firefly_dworkers.workers.factory import worker_factory
+            from firefly_dworkers.workers.pool import specialist_pool
 
             specialists = []
-            for role in [WorkerRole.ANALYST, WorkerRole.RESEARCHER, WorkerRole.DATA_ANALYST]:
+            for role in _DELEGATION_ROLES:
                 try:
-                    worker = worker_factory.create(role, self._config, name=f"{role.value}-{self._project_id}")
-                    worker.memory = self._workspace.memory
+                    worker = specialist_pool.acquire(role, self._config, memory=self._workspace.memory)
                     specialists.append(worker)
                 except KeyError:
                     pass
+            self._specialists = specialists
 
             if specialists:
                 self._router = router_cls(
@@ -287,9 +300,21 @@ class ProjectOrchestrator:
                 return self._router
         except (ImportError, Exception):
             logger.debug("DelegationRouter not available, using keyword-based routing")
+            self._release_specialists()
 
         return None
 
+    def _release_specialists(self) -> None:
+        """Return leased specialists to the shared pool and drop the router."""
+        if not self._specialists:
+            return
+        from firefly_dworkers.workers.pool import specialist_pool
+
+        for worker in self._specialists:
+            specialist_pool.release(worker)
+        self._specialists = []
+        self._router = None
+
     async def _synthesize(self, brief: str, task_results: dict[str, Any]) -> dict[str, Any]:
         """Synthesise final deliverables from task results."""
         from firefly_dworkers.workers.factory import worker_factory
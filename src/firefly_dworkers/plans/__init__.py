@@ -9,8 +9,28 @@ from __future__ import annotations
 
 # Import templates to trigger registration
 import firefly_dworkers.plans.templates  # noqa: F401
+from firefly_dworkers.plans.analysis import PlanAnalysis, PlanRunReport, analyze_plan, build_run_report
 from firefly_dworkers.plans.base import BasePlan, PlanStep
 from firefly_dworkers.plans.builder import PlanBuilder
+from firefly_dworkers.plans.compiled import CompiledPlan, PlanCache, plan_cache
 from firefly_dworkers.plans.registry import PlanRegistry, plan_registry
+from firefly_dworkers.plans.simulation import SimulationModel, SimulationReport, StepProfile, calibrated_model
 
-__all__ = ["BasePlan", "PlanStep", "PlanRegistry", "plan_registry", "PlanBuilder"]
+__all__ = [
+    "BasePlan",
+    "PlanStep",
+    "PlanRegistry",
+    "plan_registry",
+    "PlanBuilder",
+    "CompiledPlan",
+    "PlanCache",
+    "plan_cache",
+    "PlanAnalysis",
+    "PlanRunReport",
+    "analyze_plan",
+    "build_run_report",
+    "SimulationModel",
+    "SimulationReport",
+    "StepProfile",
+    "calibrated_model",
+]
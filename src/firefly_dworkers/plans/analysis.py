@@ -0,0 +1,150 @@
+"""Plan analysis -- topological levels, critical path and run reports.
+
+:func:`analyze_plan` inspects a plan's DAG statically: which steps can run
+side by side (topological levels), how wide the plan gets and which chain
+of steps bounds its wall time (the critical path).  :func:`build_run_report`
+does the same against the latencies observed in a finished run, so plan
+templates can be tuned for throughput::
+
+    analysis = analyze_plan(market_analysis_plan())
+    print(analysis.levels, analysis.critical_path)
+
+    result = await PlanBuilder(plan, config).build().run(inputs=inputs)
+    report = build_run_report(plan, result)
+    print(f"{report.parallelism:.1f}x parallel, {report.wall_time_ms:.0f} ms wall")
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from firefly_dworkers.exceptions import PlanError
+
+if TYPE_CHECKING:
+    from firefly_dworkers.plans.base import BasePlan
+
+
+class PlanAnalysis(BaseModel):
+    """Static shape of a plan's DAG."""
+
+    plan_name: str
+    step_count: int = 0
+    levels: list[list[str]] = Field(default_factory=list)  # steps that may run together, in order
+    max_width: int = 0  # largest level
+    critical_path: list[str] = Field(default_factory=list)
+    critical_path_cost: float = 0.0  # steps on the path, or summed latency when weighted
+    max_concurrency: int = 0  # plan's cap, 0 = unlimited
+
+    @property
+    def effective_width(self) -> int:
+        """Peak parallelism once the plan's concurrency cap is applied."""
+        if self.max_concurrency > 0:
+            return min(self.max_width, self.max_concurrency)
+        return self.max_width
+
+
+class PlanRunReport(BaseModel):
+    """Observed timings of one plan run compared against its DAG shape."""
+
+    plan_name: str
+    success: bool = True
+    wall_time_ms: float = 0.0
+    step_time_ms: float = 0.0  # sum of step latencies
+    parallelism: float = 0.0  # step_time_ms / wall_time_ms
+    critical_path: list[str] = Field(default_factory=list)
+    critical_path_ms: float = 0.0  # lower bound on wall time
+    max_width: int = 0
+    max_concurrency: int = 0
+    step_latencies: dict[str, float] = Field(default_factory=dict)
+
+
+def topological_levels(plan: BasePlan) -> list[list[str]]:
+    """Group step IDs into levels whose steps depend only on earlier levels.
+
+    Steps keep their declaration order within a level.
+
+    Raises:
+        PlanError: If a dependency is unknown or the steps form a cycle.
+    """
+    plan.validate()
+    remaining = {s.step_id: set(s.depends_on) for s in plan.steps}
+    order = [s.step_id for s in plan.steps]
+    levels: list[list[str]] = []
+    done: set[str] = set()
+    while remaining:
+        level = [sid for sid in order if sid in remaining and remaining[sid] <= done]
+        if not level:
+            raise PlanError(f"Plan '{plan.name}' has a dependency cycle among steps {sorted(remaining)}")
+        levels.append(level)
+        done.update(level)
+        for sid in level:
+            del remaining[sid]
+    return levels
+
+
+def analyze_plan(plan: BasePlan, *, latencies: dict[str, float] | None = None) -> PlanAnalysis:
+    """Compute levels, width and critical path for *plan*.
+
+    Parameters:
+        plan: The plan to analyse.
+        latencies: Optional per-step cost (e.g. observed latency in ms).
+            Steps without an entry count as ``1.0``; without the mapping
+            the critical path is simply the longest chain of steps.
+    """
+    levels = topological_levels(plan)
+    deps = {s.step_id: s.depends_on for s in plan.steps}
+    path, cost = _critical_path(deps, levels, latencies or {})
+    return PlanAnalysis(
+        plan_name=plan.name,
+        step_count=len(plan.steps),
+        levels=levels,
+        max_width=max((len(level) for level in levels), default=0),
+        critical_path=path,
+        critical_path_cost=cost,
+        max_concurrency=plan.max_concurrency,
+    )
+
+
+def build_run_report(plan: BasePlan, result: Any) -> PlanRunReport:
+    """Summarise a finished run of *plan* from its ``PipelineResult``."""
+    latencies = {nid: float(nr.latency_ms) for nid, nr in result.outputs.items()}
+    # Steps that never ran (skipped downstream of a failure) cost nothing.
+    analysis = analyze_plan(plan, latencies={s.step_id: latencies.get(s.step_id, 0.0) for s in plan.steps})
+    wall = float(result.total_duration_ms)
+    step_time = sum(latencies.values())
+    return PlanRunReport(
+        plan_name=plan.name,
+        success=bool(result.success),
+        wall_time_ms=wall,
+        step_time_ms=step_time,
+        parallelism=step_time / wall if wall > 0 else 0.0,
+        critical_path=analysis.critical_path,
+        critical_path_ms=sum(latencies.get(sid, 0.0) for sid in analysis.critical_path),
+        max_width=analysis.max_width,
+        max_concurrency=analysis.max_concurrency,
+        step_latencies=latencies,
+    )
+
+
+def _critical_path(
+    deps: dict[str, list[str]], levels: list[list[str]], weights: dict[str, float]
+) -> tuple[list[str], float]:
+    """Longest weighted path through the DAG (levels give a valid topological order)."""
+    best: dict[str, float] = {}
+    prev: dict[str, str | None] = {}
+    for level in levels:
+        for sid in level:
+            parent = max(deps[sid], key=lambda d: best[d], default=None)
+            best[sid] = weights.get(sid, 1.0) + (best[parent] if parent is not None else 0.0)
+            prev[sid] = parent
+    if not best:
+        return [], 0.0
+    node: str | None = max(best, key=lambda sid: best[sid])
+    cost = best[node]
+    path: list[str] = []
+    while node is not None:
+        path.append(node)
+        node = prev[node]
+    return path[::-1], cost
@@ -40,6 +40,8 @@ class BasePlan:
         name: Unique plan name.
         description: Human-readable description of the plan.
         steps: Optional initial list of :class:`PlanStep` instances.
+        max_concurrency: Maximum number of steps allowed to run at once
+            (``0`` = no cap beyond the DAG's own width).
     """
 
     def __init__(
@@ -48,10 +50,12 @@ class BasePlan:
         *,
         description: str = "",
         steps: list[PlanStep] | None = None,
+        max_concurrency: int = 0,
     ) -> None:
         self._name = name
         self._description = description
         self._steps: list[PlanStep] = list(steps or [])
+        self._max_concurrency = max_concurrency
 
     @property
     def name(self) -> str:
@@ -63,6 +67,11 @@ class BasePlan:
         """Human-readable description."""
         return self._description
 
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of concurrently running steps (``0`` = uncapped)."""
+        return self._max_concurrency
+
     @property
     def steps(self) -> list[PlanStep]:
         """The ordered list of steps in this plan."""
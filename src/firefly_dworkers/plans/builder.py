@@ -1,17 +1,26 @@
 """PlanBuilder -- converts a BasePlan + TenantConfig into an executable pipeline.
 
 Given a :class:`BasePlan` and :class:`TenantConfig`, creates the appropriate
-workers and wires them into a framework :class:`PipelineBuilder` DAG.
+workers and wires them into a framework :class:`PipelineBuilder` DAG.  The
+validated plan is compiled once per tenant and model and cached in
+:data:`~firefly_dworkers.plans.compiled.plan_cache`.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from fireflyframework_genai.pipeline.builder import PipelineBuilder
 from fireflyframework_genai.pipeline.steps import CallableStep
 
+from firefly_dworkers.plans.analysis import PlanAnalysis, analyze_plan, topological_levels
 from firefly_dworkers.plans.base import BasePlan, PlanStep
+from firefly_dworkers.plans.compiled import CompiledPlan, PlanCache, plan_cache, plan_fingerprint
+from firefly_dworkers.plans.memo import StepMemoStore, memoize_runs
+from firefly_dworkers.plans.simulation import SimulationModel, SimulationReport, calibrated_model, simulate_plan
 
 if TYPE_CHECKING:
     from fireflyframework_genai.pipeline.dag import DAG
@@ -33,6 +42,15 @@ class PlanBuilder:
             and worker config.
         model: Optional model override passed to all workers.
             Useful for testing (e.g. ``TestModel()``).
+        max_concurrency: Override the plan's cap on concurrently running
+            steps (``0`` = uncapped).
+        memo: Optional store of step outputs.  When given, steps whose
+            definition, model, worker configuration and inputs are
+            unchanged since a previous run for the same tenant reuse that
+            run's output instead of calling the model.
+        cache: Compiled-plan cache.  Defaults to the shared
+            :data:`~firefly_dworkers.plans.compiled.plan_cache`.
+        use_cache: Set to ``False`` to always recompile the plan.
     """
 
     def __init__(
@@ -41,34 +59,88 @@ class PlanBuilder:
         tenant_config: TenantConfig,
         *,
         model: Any = None,
+        max_concurrency: int | None = None,
+        memo: StepMemoStore | None = None,
+        cache: PlanCache | None = None,
+        use_cache: bool = True,
     ) -> None:
         self._plan = plan
         self._tenant_config = tenant_config
         self._model = model
+        self._max_concurrency = plan.max_concurrency if max_concurrency is None else max_concurrency
+        self._memo = memo
+        self._cache = (cache or plan_cache) if use_cache else None
+
+    def compile(self) -> CompiledPlan:
+        """Validate the plan and prepare its worker factories.
+
+        Returns the cached :class:`CompiledPlan` when the plan, tenant
+        config and model are unchanged since it was last compiled.
+
+        Raises:
+            PlanError: If a dependency is unknown or the steps form a cycle.
+        """
+        model_key = self._cache_model_key()
+        if self._cache is not None:
+            compiled = self._cache.get(self._plan, self._tenant_config, model_key)
+            if compiled is not None:
+                return compiled
+
+        levels = topological_levels(self._plan)
+        steps = {s.step_id: s.model_copy() for s in self._plan.steps}
+        compiled = CompiledPlan(
+            plan_name=self._plan.name,
+            fingerprint=plan_fingerprint(self._plan),
+            tenant_config=self._tenant_config,
+            model_id=model_key,
+            steps=steps,
+            levels=levels,
+            edges=[(dep, sid) for sid, step in steps.items() for dep in step.depends_on],
+            factories={sid: self._worker_factory(step) for sid, step in steps.items()},
+        )
+        if self._cache is not None:
+            self._cache.put(compiled)
+        return compiled
 
     def build(self) -> PipelineEngine:
         """Build an executable pipeline from the plan.
 
-        Creates workers for each step based on ``worker_role``,
-        wraps them as pipeline nodes (the framework auto-wraps
-        :class:`FireflyAgent` as :class:`AgentStep`), and connects
-        edges based on ``depends_on``.
+        Wires one lazily-bound worker per step as a pipeline node (the
+        framework auto-wraps agent-like objects as :class:`AgentStep`) and
+        connects edges based on ``depends_on``.  Each worker is created
+        for its ``worker_role`` when the step first runs.  When a
+        concurrency cap is set, steps beyond it wait for a running step to
+        finish.
         """
+        compiled = self.compile()
         pb = PipelineBuilder(self._plan.name)
+        limiter = asyncio.Semaphore(self._max_concurrency) if self._max_concurrency > 0 else None
 
-        for step in self._plan.steps:
-            worker = self._create_worker(step)
+        for step_id in compiled.order:
+            step = compiled.steps[step_id]
+            worker = compiled.lazy_worker(step_id)
+            if limiter is not None:
+                _limit_runs(worker, limiter)
+            if self._memo is not None:
+                # Outermost, so reused outputs never wait for a slot
+                memoize_runs(
+                    worker,
+                    self._memo,
+                    self._plan.name,
+                    step,
+                    self._model_id(),
+                    tenant_id=self._tenant_config.id,
+                    fingerprint=lambda w=worker: str(w.worker.config_fingerprint),
+                )
             pb.add_node(
-                step.step_id,
+                step_id,
                 worker,
                 retry_max=step.retry_max,
                 timeout_seconds=step.timeout_seconds,
             )
 
-        # Add edges based on dependencies
-        for step in self._plan.steps:
-            for dep_id in step.depends_on:
-                pb.add_edge(dep_id, step.step_id)
+        for source, target in compiled.edges:
+            pb.add_edge(source, target)
 
         return pb.build()
 
@@ -78,32 +150,105 @@ class PlanBuilder:
         Uses placeholder :class:`CallableStep` instances instead of real
         workers so that no heavyweight resources are created.
         """
+        compiled = self.compile()
         pb = PipelineBuilder(self._plan.name)
 
-        for step in self._plan.steps:
+        for step_id in compiled.order:
+            step = compiled.steps[step_id]
             # Use a lightweight placeholder callable instead of a real worker
-            placeholder = _make_placeholder(step.step_id)
             pb.add_node(
-                step.step_id,
-                placeholder,
+                step_id,
+                _make_placeholder(step_id),
                 retry_max=step.retry_max,
                 timeout_seconds=step.timeout_seconds,
             )
 
-        for step in self._plan.steps:
-            for dep_id in step.depends_on:
-                pb.add_edge(dep_id, step.step_id)
+        for source, target in compiled.edges:
+            pb.add_edge(source, target)
 
         return pb.build_dag()
 
+    def analyze(self) -> PlanAnalysis:
+        """Return the plan's topological levels, width and critical path.
+
+        The reported ``max_concurrency`` reflects this builder's cap.
+        """
+        analysis = analyze_plan(self._plan)
+        analysis.max_concurrency = self._max_concurrency
+        return analysis
+
+    def simulate(self, model: SimulationModel | None = None) -> SimulationReport:
+        """Project wall time, peak concurrency and token spend without running the plan.
+
+        Steps are replayed against *model* under this builder's
+        concurrency cap and the tenant's per-role ``max_concurrent_tasks``.
+        No workers are created and no model is called.
+
+        Parameters:
+            model: Step latency/token/cost profiles.  Defaults to a model
+                calibrated from the usage observed so far.
+        """
+        compiled = self.compile()
+        roles = {str(step.worker_role) for step in compiled.steps.values()}
+        return simulate_plan(
+            compiled,
+            model or calibrated_model(self._plan),
+            max_concurrency=self._max_concurrency,
+            role_limits={role: _role_limit(self._tenant_config, role) for role in roles},
+        )
+
+    def _model_id(self) -> str:
+        if self._model is not None:
+            return str(getattr(self._model, "model_name", self._model))
+        return self._tenant_config.models.default
+
+    def _cache_model_key(self) -> str:
+        # Model override objects are bound into the worker factories, so
+        # the cache must not hand one builder's model to another.
+        if self._model is not None:
+            return f"{self._model_id()}@{id(self._model)}"
+        return self._model_id()
+
     def _create_worker(self, step: PlanStep) -> BaseWorker:
         """Create the appropriate worker for a step based on its role."""
-        from firefly_dworkers.workers.factory import worker_factory
+        return _create_step_worker(self._plan.name, step, self._tenant_config, self._model)
 
-        kwargs: dict[str, Any] = {"name": f"{self._plan.name}-{step.step_id}"}
-        if self._model is not None:
-            kwargs["model"] = self._model
-        return worker_factory.create(step.worker_role, self._tenant_config, **kwargs)
+    def _worker_factory(self, step: PlanStep) -> Callable[[], BaseWorker]:
+        plan_name, config, model = self._plan.name, self._tenant_config, self._model
+
+        def _factory() -> BaseWorker:
+            return _create_step_worker(plan_name, step, config, model)
+
+        return _factory
+
+
+def _create_step_worker(plan_name: str, step: PlanStep, config: TenantConfig, model: Any) -> BaseWorker:
+    from firefly_dworkers.workers.factory import worker_factory
+
+    kwargs: dict[str, Any] = {"name": f"{plan_name}-{step.step_id}"}
+    if model is not None:
+        kwargs["model"] = model
+    return worker_factory.create(step.worker_role, config, **kwargs)
+
+
+def _role_limit(config: TenantConfig, role: str) -> int:
+    """The tenant's ``max_concurrent_tasks`` for *role* (``0`` = uncapped)."""
+    try:
+        return int(config.workers.settings_for(role).max_concurrent_tasks)
+    except AttributeError:
+        return 0
+
+
+def _limit_runs(worker: BaseWorker, limiter: asyncio.Semaphore) -> None:
+    """Make *worker*'s runs hold a slot of the plan-wide *limiter*."""
+    run = worker.run
+
+    @functools.wraps(run)
+    async def _run(*args: Any, **kwargs: Any) -> Any:
+        async with limiter:
+            return await run(*args, **kwargs)
+
+    worker.run = _run  # type: ignore[method-assign]
 
 
 def _make_placeholder(step_id: str) -> CallableStep:
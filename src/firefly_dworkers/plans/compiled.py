@@ -0,0 +1,158 @@
+"""CompiledPlan -- cached, validated form of a plan for one tenant and model.
+
+Compiling a plan validates its dependencies, computes the topological
+order and prepares one worker factory per step.  The result is cached in
+:data:`plan_cache` keyed by plan name, a fingerprint of the plan's steps,
+the tenant config and the model, so repeated executions of a hot plan skip
+straight to wiring the pipeline.
+
+Workers are bound lazily: the pipeline receives a lightweight
+:class:`LazyWorker` per step, and the real worker is only constructed
+when that step first runs.  Steps skipped because an upstream step failed
+never pay for worker construction at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from firefly_dworkers.plans.base import BasePlan, PlanStep
+    from firefly_dworkers.tenants.config import TenantConfig
+    from firefly_dworkers.workers.base import BaseWorker
+
+WorkerFactory = Callable[[], "BaseWorker"]
+
+
+class LazyWorker:
+    """Agent-like stand-in that constructs its worker on first use.
+
+    Parameters:
+        name: Name the worker will be created with.
+        factory: Zero-argument callable creating the worker.
+    """
+
+    def __init__(self, name: str, factory: WorkerFactory) -> None:
+        self.name = name
+        self._factory = factory
+        self._worker: BaseWorker | None = None
+
+    @property
+    def bound(self) -> bool:
+        """Whether the underlying worker has been constructed."""
+        return self._worker is not None
+
+    @property
+    def worker(self) -> BaseWorker:
+        """The underlying worker, constructing it if necessary."""
+        if self._worker is None:
+            self._worker = self._factory()
+        return self._worker
+
+    async def run(self, prompt: Any, **kwargs: Any) -> Any:
+        return await self.worker.run(prompt, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.worker, name)
+
+
+@dataclass
+class CompiledPlan:
+    """A validated plan ready to be wired into a pipeline."""
+
+    plan_name: str
+    fingerprint: str
+    tenant_config: TenantConfig
+    model_id: str
+    steps: dict[str, PlanStep]
+    levels: list[list[str]]
+    edges: list[tuple[str, str]]
+    factories: dict[str, WorkerFactory] = field(default_factory=dict)
+
+    @property
+    def order(self) -> list[str]:
+        """Step IDs in a valid topological order."""
+        return [sid for level in self.levels for sid in level]
+
+    def lazy_worker(self, step_id: str) -> LazyWorker:
+        """Return a fresh lazily-bound worker for *step_id*."""
+        return LazyWorker(f"{self.plan_name}-{step_id}", self.factories[step_id])
+
+
+def plan_fingerprint(plan: BasePlan) -> str:
+    """Hash of the plan's steps and settings; changes whenever the plan is edited."""
+    payload = {
+        "steps": [s.model_dump(mode="json") for s in plan.steps],
+        "max_concurrency": plan.max_concurrency,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class PlanCache:
+    """Thread-safe LRU cache of :class:`CompiledPlan` instances.
+
+    Entries are keyed by ``(plan name, fingerprint, tenant ID, model)`` and
+    are only returned for the exact tenant config object they were
+    compiled against, so re-registering a tenant invalidates its plans.
+
+    Parameters:
+        max_entries: Maximum number of compiled plans kept.
+    """
+
+    def __init__(self, *, max_entries: int = 128) -> None:
+        self._entries: OrderedDict[tuple[str, str, str, str], CompiledPlan] = OrderedDict()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, plan: BasePlan, config: TenantConfig, model_id: str) -> CompiledPlan | None:
+        """Return the cached compiled plan, or ``None`` on a miss."""
+        key = (plan.name, plan_fingerprint(plan), config.id, model_id)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is None or compiled.tenant_config is not config:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return compiled
+
+    def put(self, compiled: CompiledPlan) -> None:
+        """Cache *compiled*, evicting the least recently used entry if full."""
+        key = (compiled.plan_name, compiled.fingerprint, compiled.tenant_config.id, compiled.model_id)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, plan_name: str | None = None, tenant_id: str | None = None) -> None:
+        """Drop entries for a plan and/or tenant (everything if neither given)."""
+        with self._lock:
+            for key in list(self._entries):
+                if (plan_name is None or key[0] == plan_name) and (tenant_id is None or key[2] == tenant_id):
+                    del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters (useful for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+plan_cache = PlanCache()
@@ -0,0 +1,218 @@
+"""Step-output memoisation for plan runs.
+
+Each step's output is stored under a key derived from the tenant, the plan
+name, the step's definition (ID, role, description, prompt template), the
+model, a fingerprint of the worker's resolved instructions and tools, and
+the exact prompt the step received.  Because a step's prompt carries its
+upstream outputs, a step is re-executed only when it or something upstream
+of it changed -- re-running a plan after one step failed or was edited
+reuses every unaffected output and recomputes just the invalidated
+subgraph.
+
+Example::
+
+    builder = PlanBuilder(plan, config, memo=step_memo_store())
+    result = await builder.build().run(inputs=inputs)  # reuses cached steps
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from firefly_dworkers.plans.base import PlanStep
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MemoizedRun:
+    """Stand-in for an agent run result when a step output is reused."""
+
+    output: Any
+    memoized: bool = True
+
+
+@runtime_checkable
+class StepMemoStore(Protocol):
+    """Protocol for step-output storage."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the stored output for *key*, or ``None`` on a miss."""
+        ...
+
+    def put(self, key: str, output: Any) -> None:
+        """Store *output* under *key*."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all stored outputs."""
+        ...
+
+
+class InMemoryStepMemoStore:
+    """Thread-safe LRU store kept in process memory.
+
+    Parameters:
+        max_entries: Maximum number of outputs kept; least recently used
+            entries are evicted first.
+    """
+
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, output: Any) -> None:
+        with self._lock:
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileStepMemoStore:
+    """Stores each output as ``<key>.json`` under *directory*.
+
+    Outputs must be JSON-serialisable; anything else is stored via
+    ``str()``.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        path = self._dir / f"{key}.json"
+        with self._lock:
+            if not path.exists():
+                return None
+            try:
+                return json.loads(path.read_text())["output"]
+            except (ValueError, KeyError):
+                logger.warning("Ignoring unreadable step memo %s", path)
+                return None
+
+    def put(self, key: str, output: Any) -> None:
+        with self._lock:
+            (self._dir / f"{key}.json").write_text(json.dumps({"output": output}, default=str))
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+def step_memo_key(
+    plan_name: str,
+    step: PlanStep,
+    prompt: Any,
+    model: str,
+    *,
+    tenant_id: str = "",
+    worker_fingerprint: str = "",
+) -> str:
+    """Canonical hash identifying one step execution.
+
+    *tenant_id* and *worker_fingerprint* keep tenants whose instructions,
+    verticals or tools differ from sharing outputs in a common store.
+    """
+    payload = {
+        "tenant": tenant_id,
+        "worker": worker_fingerprint,
+        "plan": plan_name,
+        "step": step.step_id,
+        "role": str(step.worker_role),
+        "description": step.description,
+        "template": step.prompt_template,
+        "model": model,
+        "prompt": prompt,
+    }
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def memoize_runs(
+    worker: Any,
+    store: StepMemoStore,
+    plan_name: str,
+    step: PlanStep,
+    model: str,
+    *,
+    tenant_id: str = "",
+    fingerprint: Callable[[], str] | None = None,
+) -> None:
+    """Make *worker* reuse stored outputs for prompts it has already answered.
+
+    Only successful runs are stored, so a failed step runs again next time.
+
+    Parameters:
+        tenant_id: Tenant the run belongs to; part of the key.
+        fingerprint: Returns a hash of the worker's resolved instructions
+            and tools.  Called on each run, so a lazily-bound worker is
+            only created when the step first runs.
+    """
+    run = worker.run
+
+    async def _run(prompt: Any, **kwargs: Any) -> Any:
+        key = step_memo_key(
+            plan_name,
+            step,
+            prompt,
+            model,
+            tenant_id=tenant_id,
+            worker_fingerprint=fingerprint() if fingerprint is not None else "",
+        )
+        cached = store.get(key)
+        if cached is not None:
+            logger.debug("Reusing memoised output for step '%s' of plan '%s'", step.step_id, plan_name)
+            return MemoizedRun(output=cached)
+        result = await run(prompt, **kwargs)
+        output = result.output if hasattr(result, "output") else result
+        store.put(key, output)
+        return result
+
+    worker.run = _run
+
+
+# -- Default store ------------------------------------------------------------
+
+_default_store: StepMemoStore | None = None
+_default_lock = threading.Lock()
+
+
+def step_memo_store() -> StepMemoStore:
+    """Return the process-wide store.
+
+    Outputs are written under ``DWORKERS_STEP_MEMO_DIR`` when it is set
+    and kept in memory otherwise.
+    """
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                from firefly_dworkers.config import get_config
+
+                directory = get_config().step_memo_dir
+                _default_store = FileStepMemoStore(directory) if directory else InMemoryStepMemoStore()
+    return _default_store
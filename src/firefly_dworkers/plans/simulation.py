@@ -0,0 +1,241 @@
+"""Plan simulation -- dry-run a plan's DAG against a synthetic cost model.
+
+:func:`simulate_plan` replays a compiled plan as a discrete-event
+simulation: each step takes the latency and token count given by a
+:class:`SimulationModel`, starts as soon as its dependencies finish and a
+concurrency slot is free, and never calls a model.  The resulting
+:class:`SimulationReport` projects wall time, peak concurrency and
+tokens/cost, so plan-template edits and scheduler changes can be
+benchmarked offline::
+
+    report = PlanBuilder(plan, config).simulate()
+    print(f"{report.wall_time_ms / 1000:.0f}s, peak {report.peak_concurrency}, ${report.estimated_cost_usd:.2f}")
+
+:func:`calibrated_model` builds the model from the usage the framework has
+observed so far, falling back to a default :class:`StepProfile` for roles
+and steps it has not seen.  Each step is modelled as one model request.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from firefly_dworkers.plans.analysis import _critical_path
+from firefly_dworkers.types import WorkerRole
+
+if TYPE_CHECKING:
+    from firefly_dworkers.plans.base import BasePlan, PlanStep
+    from firefly_dworkers.plans.compiled import CompiledPlan
+
+
+class StepProfile(BaseModel):
+    """Expected cost of running one step."""
+
+    latency_ms: float = 10_000.0
+    tokens: int = 2_000
+    cost_usd: float = 0.01
+
+
+class SimulationModel(BaseModel):
+    """Per-step and per-role profiles used by the simulator.
+
+    Lookups prefer a profile for the exact step, then one for the step's
+    worker role, then *default*.
+    """
+
+    default: StepProfile = Field(default_factory=StepProfile)
+    roles: dict[str, StepProfile] = Field(default_factory=dict)
+    steps: dict[str, StepProfile] = Field(default_factory=dict)
+
+    def profile_for(self, step: PlanStep) -> StepProfile:
+        """Return the profile used to simulate *step*."""
+        if step.step_id in self.steps:
+            return self.steps[step.step_id]
+        return self.roles.get(str(step.worker_role), self.default)
+
+    @classmethod
+    def from_usage(cls, by_agent: Mapping[str, Any], *, plan: BasePlan | None = None) -> SimulationModel:
+        """Build a model from per-agent usage summaries.
+
+        Parameters:
+            by_agent: Usage keyed by agent name, each entry exposing
+                ``total_requests``, ``total_latency_ms``, ``total_tokens``
+                and ``total_cost_usd`` (as attributes or mapping keys).
+            plan: When given, agents named ``<plan>-<step_id>`` (the names
+                :class:`PlanBuilder` gives its workers) calibrate that step.
+                Agents named ``<role>-...`` calibrate the role.
+        """
+        step_roles = {f"{plan.name}-{s.step_id}": (s.step_id, str(s.worker_role)) for s in plan.steps} if plan else {}
+        role_prefixes = sorted((str(r) for r in WorkerRole), key=len, reverse=True)
+        steps: dict[str, StepProfile] = {}
+        role_totals: dict[str, list[float]] = {}
+
+        for name, usage in by_agent.items():
+            totals = [float(_usage_field(usage, f) or 0) for f in _USAGE_FIELDS]
+            if totals[0] <= 0:
+                continue
+            if name in step_roles:
+                step_id, role = step_roles[name]
+                steps[step_id] = _average(totals)
+            else:
+                role = next((r for r in role_prefixes if name.startswith(f"{r}-")), "")
+                if not role:
+                    continue
+            acc = role_totals.setdefault(role, [0.0] * len(_USAGE_FIELDS))
+            for i, value in enumerate(totals):
+                acc[i] += value
+
+        return cls(roles={role: _average(totals) for role, totals in role_totals.items()}, steps=steps)
+
+
+class SimulatedStep(BaseModel):
+    """Projected timing and cost of one step."""
+
+    worker_role: str
+    start_ms: float = 0.0
+    end_ms: float = 0.0
+    tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def latency_ms(self) -> float:
+        return self.end_ms - self.start_ms
+
+
+class SimulationReport(BaseModel):
+    """Projected outcome of running a plan."""
+
+    plan_name: str
+    wall_time_ms: float = 0.0
+    step_time_ms: float = 0.0  # sum of step latencies
+    parallelism: float = 0.0  # step_time_ms / wall_time_ms
+    peak_concurrency: int = 0
+    max_concurrency: int = 0  # plan's cap, 0 = unlimited
+    total_tokens: int = 0
+    estimated_cost_usd: float = 0.0
+    critical_path: list[str] = Field(default_factory=list)
+    critical_path_ms: float = 0.0  # lower bound on wall time
+    steps: dict[str, SimulatedStep] = Field(default_factory=dict)
+
+
+def calibrated_model(plan: BasePlan | None = None) -> SimulationModel:
+    """Build a :class:`SimulationModel` from the framework's usage tracker.
+
+    Returns the uncalibrated default model when the tracker is unavailable
+    or has not recorded any usage.
+    """
+    try:
+        from fireflyframework_genai.observability.usage import default_usage_tracker
+
+        by_agent = default_usage_tracker.get_summary().by_agent
+    except ImportError:
+        return SimulationModel()
+    return SimulationModel.from_usage(by_agent or {}, plan=plan)
+
+
+def simulate_plan(
+    compiled: CompiledPlan,
+    model: SimulationModel,
+    *,
+    max_concurrency: int = 0,
+    role_limits: Mapping[str, int] | None = None,
+) -> SimulationReport:
+    """Simulate running *compiled* without calling any model.
+
+    Ready steps start in topological order whenever the plan-wide cap and
+    their role's cap allow.
+
+    Parameters:
+        compiled: The compiled plan to simulate.
+        model: Latency/token/cost profiles for the steps.
+        max_concurrency: Plan-wide cap on concurrently running steps
+            (``0`` = uncapped).
+        role_limits: Optional per-role caps, e.g. the tenant's
+            ``max_concurrent_tasks`` (``0`` = uncapped).
+    """
+    order = compiled.order
+    rank = {sid: i for i, sid in enumerate(order)}
+    limits = role_limits or {}
+    waiting_on = {sid: len(step.depends_on) for sid, step in compiled.steps.items()}
+    dependents: dict[str, list[str]] = {sid: [] for sid in order}
+    for source, target in compiled.edges:
+        dependents[source].append(target)
+
+    ready = [sid for sid in order if waiting_on[sid] == 0]
+    running: list[tuple[float, int, str]] = []
+    per_role: dict[str, int] = {}
+    simulated: dict[str, SimulatedStep] = {}
+    clock = 0.0
+    peak = 0
+
+    while ready or running:
+        for sid in list(ready):
+            if max_concurrency > 0 and len(running) >= max_concurrency:
+                break
+            step = compiled.steps[sid]
+            role = str(step.worker_role)
+            limit = limits.get(role, 0)
+            if limit > 0 and per_role.get(role, 0) >= limit:
+                continue
+            profile = model.profile_for(step)
+            simulated[sid] = SimulatedStep(
+                worker_role=role,
+                start_ms=clock,
+                end_ms=clock + profile.latency_ms,
+                tokens=profile.tokens,
+                cost_usd=profile.cost_usd,
+            )
+            heapq.heappush(running, (clock + profile.latency_ms, rank[sid], sid))
+            per_role[role] = per_role.get(role, 0) + 1
+            ready.remove(sid)
+        peak = max(peak, len(running))
+
+        clock, _, sid = heapq.heappop(running)
+        finished = [sid]
+        while running and running[0][0] == clock:
+            finished.append(heapq.heappop(running)[2])
+        for sid in finished:
+            per_role[simulated[sid].worker_role] -= 1
+            for target in dependents[sid]:
+                waiting_on[target] -= 1
+                if waiting_on[target] == 0:
+                    ready.append(target)
+        ready.sort(key=rank.__getitem__)
+
+    latencies = {sid: s.latency_ms for sid, s in simulated.items()}
+    deps = {sid: step.depends_on for sid, step in compiled.steps.items()}
+    path, path_ms = _critical_path(deps, compiled.levels, latencies)
+    step_time = sum(latencies.values())
+    return SimulationReport(
+        plan_name=compiled.plan_name,
+        wall_time_ms=clock,
+        step_time_ms=step_time,
+        parallelism=step_time / clock if clock > 0 else 0.0,
+        peak_concurrency=peak,
+        max_concurrency=max_concurrency,
+        total_tokens=sum(s.tokens for s in simulated.values()),
+        estimated_cost_usd=sum(s.cost_usd for s in simulated.values()),
+        critical_path=path,
+        critical_path_ms=path_ms,
+        steps={sid: simulated[sid] for sid in order},
+    )
+
+
+# -- Helpers ------------------------------------------------------------------
+
+_USAGE_FIELDS = ("total_requests", "total_latency_ms", "total_tokens", "total_cost_usd")
+
+
+def _usage_field(usage: Any, name: str) -> Any:
+    if isinstance(usage, Mapping):
+        return usage.get(name)
+    return getattr(usage, name, None)
+
+
+def _average(totals: list[float]) -> StepProfile:
+    requests, latency, tokens, cost = totals
+    return StepProfile(latency_ms=latency / requests, tokens=round(tokens / requests), cost_usd=cost / requests)
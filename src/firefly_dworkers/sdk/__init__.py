@@ -9,11 +9,13 @@ from firefly_dworkers.sdk.models import (
     HealthResponse,
     IndexDocumentRequest,
     IndexResponse,
+    JobResponse,
     KnowledgeChunkResponse,
     PlanResponse,
     RunWorkerRequest,
     SearchKnowledgeRequest,
     SearchResponse,
+    SubmitJobRequest,
     WorkerResponse,
 )
 
@@ -24,10 +26,12 @@ __all__ = [
     "HealthResponse",
     "IndexDocumentRequest",
     "IndexResponse",
+    "JobResponse",
     "KnowledgeChunkResponse",
     "PlanResponse",
     "RunWorkerRequest",
     "SearchKnowledgeRequest",
     "SearchResponse",
+    "SubmitJobRequest",
     "WorkerResponse",
 ]
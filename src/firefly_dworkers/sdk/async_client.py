@@ -11,10 +11,12 @@ from firefly_dworkers.sdk.models import (
     HealthResponse,
     IndexDocumentRequest,
     IndexResponse,
+    JobResponse,
     PlanResponse,
     RunWorkerRequest,
     SearchKnowledgeRequest,
     SearchResponse,
+    SubmitJobRequest,
     WorkerResponse,
 )
 
@@ -73,6 +75,24 @@ class AsyncDworkersClient:
         resp.raise_for_status()
         return SearchResponse.model_validate(resp.json())
 
+    async def submit_job(self, request: SubmitJobRequest) -> JobResponse:
+        """Submit a worker, plan or project run as a background job."""
+        resp = await self._client.post("/api/jobs", json=request.model_dump(exclude_none=True))
+        resp.raise_for_status()
+        return JobResponse.model_validate(resp.json())
+
+    async def get_job(self, job_id: str) -> JobResponse:
+        """Get a background job's status and result."""
+        resp = await self._client.get(f"/api/jobs/{job_id}")
+        resp.raise_for_status()
+        return JobResponse.model_validate(resp.json())
+
+    async def cancel_job(self, job_id: str) -> JobResponse:
+        """Cancel a queued or running background job."""
+        resp = await self._client.delete(f"/api/jobs/{job_id}")
+        resp.raise_for_status()
+        return JobResponse.model_validate(resp.json())
+
     async def list_plans(self) -> list[str]:
         """List available plans."""
         resp = await self._client.get("/api/plans")
@@ -29,6 +29,8 @@ class RunWorkerRequest(BaseModel):
     autonomy_level: str | None = None  # override
     model: str | None = None  # override
     attachments: list[FileAttachmentPayload] = Field(default_factory=list)
+    background: bool = False  # return a job id instead of streaming
+    priority: str | None = None  # "interactive", "normal" or "batch"
 
 
 class ExecutePlanRequest(BaseModel):
@@ -37,6 +39,9 @@ class ExecutePlanRequest(BaseModel):
     plan_name: str
     tenant_id: str = "default"
     inputs: dict[str, Any] = Field(default_factory=dict)
+    reuse_step_outputs: bool = False  # memoise step outputs and reuse unchanged ones
+    background: bool = False  # return a job id instead of streaming
+    priority: str | None = None  # "interactive", "normal" or "batch"
 
 
 class IndexDocumentRequest(BaseModel):
@@ -79,6 +84,7 @@ class PlanResponse(BaseModel):
     success: bool
     outputs: dict[str, Any] = Field(default_factory=dict)
     duration_ms: float = 0.0
+    report: dict[str, Any] = Field(default_factory=dict)  # PlanRunReport: wall time vs. step time, critical path
 
 
 class KnowledgeChunkResponse(BaseModel):
@@ -127,6 +133,8 @@ class ProjectRequest(BaseModel):
     tenant_id: str = "default"
     project_id: str | None = None  # auto-generated if not provided
     worker_roles: list[str] = Field(default_factory=list)  # optional override
+    background: bool = False  # return a job id instead of streaming
+    priority: str | None = None  # "interactive", "normal" or "batch"
 
 
 class ProjectEvent(BaseModel):
@@ -155,6 +163,37 @@ class ProjectResponse(BaseModel):
     duration_ms: float = 0.0
 
 
+class SubmitJobRequest(BaseModel):
+    """Request to run a worker, plan or project as a background job.
+
+    ``params`` holds the body of the matching run request
+    (:class:`RunWorkerRequest`, :class:`ExecutePlanRequest` or
+    :class:`ProjectRequest`).
+    """
+
+    kind: str  # "worker", "plan" or "project"
+    params: dict[str, Any] = Field(default_factory=dict)
+    priority: str | None = None  # defaults per kind
+
+
+class JobResponse(BaseModel):
+    """Status of a background job."""
+
+    id: str
+    kind: str
+    tenant_id: str = "default"
+    priority: str = "normal"
+    status: str = "queued"  # "queued", "running", "succeeded", "failed", "cancelled"
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    result: Any = None
+    error: str = ""
+    created_at: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+    queue_wait_ms: float = 0.0
+    duration_ms: float = 0.0
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -20,7 +20,9 @@ class WorkerConfig(BaseModel):
         enabled: bool = True
         autonomy: Literal["manual", "semi_supervised", "autonomous"] = "semi_supervised"
         custom_instructions: str = ""
-        max_concurrent_tasks: int = 10
+        max_concurrent_tasks: int = 10  # 0 = unlimited
+        max_queue_wait_seconds: float = 0.0  # 0 = wait until a slot frees up
+        reject_when_busy: bool = False  # Fail fast instead of queueing
 
     analyst: WorkerSettings = Field(default_factory=WorkerSettings)
     researcher: WorkerSettings = Field(default_factory=WorkerSettings)
@@ -64,6 +66,8 @@ class SharePointConnectorConfig(BaseConnectorConfig):
     client_id: str = ""
     client_secret: str = ""
     auth_type: str = "client_credentials"
+    max_read_bytes: int = 4_194_304  # content returned by "read"; larger files are read partially
+    upload_chunk_size: int = 3_276_800  # upload-session chunk size (multiple of 320 KiB)
 
 
 class GoogleDriveConnectorConfig(BaseConnectorConfig):
@@ -152,6 +156,9 @@ class SQLConnectorConfig(BaseConnectorConfig):
     read_only: bool = True
     max_rows: int = 1000
     pool_size: int = 5
+    cache_ttl_seconds: float = 0.0  # 0 = query result cache disabled
+    cache_max_entries: int = 128
+    cache_track_changes: bool = True  # Drop cached results when the database reports a write
 
 
 class WebBrowserConnectorConfig(BaseConnectorConfig):
@@ -242,6 +249,20 @@ class StockImageConnectorConfig(BaseModel):
     credential_ref: str = ""
 
 
+class ExecutorsConfig(BaseModel):
+    """Thread pool sizes for blocking connector calls.
+
+    Pools are named after the connector (``google``, ``confluence``,
+    ``jira``, ``slack``, ``s3``, ``sharepoint``, ``email``, ``sql``,
+    ``rss``, ``auth``) or ``render`` for document and presentation
+    rendering.  Pools are process-wide, so the largest size configured by
+    any tenant wins.
+    """
+
+    default_max_workers: int = 4
+    max_workers: dict[str, int] = Field(default_factory=dict)  # Pool name -> thread count
+
+
 class ConnectorsConfig(BaseModel, extra="allow"):
     """Typed connector configuration registry.
 
@@ -269,6 +290,7 @@ class ConnectorsConfig(BaseModel, extra="allow"):
     vision: VisionConnectorConfig = Field(default_factory=VisionConnectorConfig)
     image_generation: ImageGenerationConnectorConfig = Field(default_factory=ImageGenerationConnectorConfig)
     stock_images: StockImageConnectorConfig = Field(default_factory=StockImageConnectorConfig)
+    executors: ExecutorsConfig = Field(default_factory=ExecutorsConfig)
 
     def enabled_connectors(self) -> dict[str, BaseConnectorConfig]:
         """Return only connectors where ``enabled=True``."""
@@ -312,6 +334,24 @@ class ObservabilityConfig(BaseModel):
     log_level: str = "INFO"  # Tenant-specific log level
 
 
+class SchedulingConfig(BaseModel):
+    """Tenant-level background job scheduling settings."""
+
+    weight: int = 1  # Jobs dispatched per round-robin turn relative to other tenants
+
+
+class CacheConfig(BaseModel):
+    """Tenant-level LLM response cache settings."""
+
+    enabled: bool = False  # Serve identical worker requests from the cache
+    ttl_seconds: float = 3600.0  # 0 = entries never expire
+    max_entries: int = 1024  # In-memory LRU size
+    persistent: bool = False  # Also store responses in DWORKERS_RESPONSE_CACHE_PATH
+    semantic_enabled: bool = False  # Also serve answers to similar (not identical) prompts
+    semantic_threshold: float = 0.9  # Minimum cosine similarity for a semantic match
+    semantic_max_entries: int = 256  # Prompts remembered per role
+
+
 class GuardsConfig(BaseModel):
     """Guard settings for a tenant.
 
@@ -330,6 +370,8 @@ class GuardsConfig(BaseModel):
     custom_deny_patterns: list[str] = Field(default_factory=list)
     max_input_length: int = 0
     max_output_length: int = 0
+    output_guard_mode: Literal["complete", "streaming"] = "complete"  # "streaming" also scans streamed tokens
+    stream_window_chars: int = 256  # Streamed text held back so matches spanning chunks are caught
 
 
 class SecurityConfig(BaseModel):
@@ -356,4 +398,6 @@ class TenantConfig(BaseModel):
     branding: BrandingConfig = Field(default_factory=BrandingConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
     observability: ObservabilityConfig = Field(default_factory=ObservabilityConfig)
+    scheduling: SchedulingConfig = Field(default_factory=SchedulingConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     user_profile: UserProfileConfig = Field(default_factory=UserProfileConfig)
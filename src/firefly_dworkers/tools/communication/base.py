@@ -18,6 +18,7 @@ class Message(BaseModel):
     sender: str = ""
     content: str = ""
     timestamp: str = ""
+    subject: str = ""
 
 
 class MessageTool(BaseTool):
@@ -28,7 +29,14 @@ class MessageTool(BaseTool):
     platform (e.g. Slack, Microsoft Teams, email).
     """
 
-    def __init__(self, name: str, *, description: str = "", guards: Sequence[GuardProtocol] = ()):
+    def __init__(
+        self,
+        name: str,
+        *,
+        description: str = "",
+        guards: Sequence[GuardProtocol] = (),
+        extra_parameters: Sequence[ParameterSpec] = (),
+    ):
         super().__init__(
             name,
             description=description or f"Send and receive messages via {name}",
@@ -38,7 +46,7 @@ class MessageTool(BaseTool):
                 ParameterSpec(
                     name="action",
                     type_annotation="str",
-                    description="One of: send, read, list_channels",
+                    description="One of: send, read, list_channels (email also supports sync)",
                     required=True,
                 ),
                 ParameterSpec(
@@ -62,6 +70,7 @@ class MessageTool(BaseTool):
                     required=False,
                     default="",
                 ),
+                *extra_parameters,
             ],
         )
 
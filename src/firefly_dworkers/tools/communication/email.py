@@ -4,22 +4,35 @@ Uses ``aiosmtplib`` for sending and the stdlib ``imaplib`` for reading.
 Install with::
 
     pip install firefly-dworkers[email]
+
+Reading goes through pooled IMAP sessions
+(:mod:`~firefly_dworkers.tools.communication.imap_pool`) and fetches many
+messages per ``UID FETCH`` command.  Listing fetches headers and
+``BODYSTRUCTURE`` only, then downloads just the first part of each text
+body that is needed.  Message ids are IMAP UIDs, which stay stable between
+sessions; the ``sync`` action returns messages newer than a UID, so a
+mailbox is read incrementally instead of from the top.
 """
 
 from __future__ import annotations
 
-import asyncio
-import email as _email_mod
+import binascii
+import email.policy
 import imaplib
 import logging
-from collections.abc import Sequence
+import quopri
+import re
+from collections.abc import Iterator, Sequence
 from email.mime.text import MIMEText
+from email.parser import BytesHeaderParser
 from typing import Any
 
-from fireflyframework_genai.tools.base import GuardProtocol
+from fireflyframework_genai.tools.base import GuardProtocol, ParameterSpec
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
 from firefly_dworkers.tools.communication.base import Message, MessageTool
+from firefly_dworkers.tools.communication.imap_pool import imap_sessions
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
@@ -32,6 +45,14 @@ except ImportError:
     aiosmtplib = None  # type: ignore[assignment]
     AIOSMTPLIB_AVAILABLE = False
 
+_MAX_BODY_CHARS = 10_000
+# Encoded bytes requested per body: room for base64 and multi-byte text.
+_BODY_BYTES = 4 * _MAX_BODY_CHARS
+# UIDs per FETCH command, keeping command lines well below server limits.
+_FETCH_BATCH = 500
+_HEADER_ITEMS = "(UID INTERNALDATE BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS (FROM TO SUBJECT DATE MESSAGE-ID)])"
+_UID_SET = re.compile(r"^(\d+|\*)(:(\d+|\*))?(,(\d+|\*)(:(\d+|\*))?)*$")
+
 
 @tool_registry.register("email", category="communication")
 class EmailTool(MessageTool):
@@ -45,6 +66,13 @@ class EmailTool(MessageTool):
     * ``username`` / ``password`` -- Authentication credentials.
     * ``from_address`` -- Sender address (defaults to ``username``).
     * ``timeout`` -- Connection timeout in seconds.
+
+    ``read`` returns the latest ``limit`` messages, or the messages whose
+    UIDs are given as ``message_id`` (``"4021"``, ``"4021,4030:4040"``).
+    ``sync`` returns headers of messages with a UID above ``since_uid``,
+    oldest first, plus the ``last_uid`` and ``uidvalidity`` to pass to the
+    next call.  Mailboxes are opened read-only, so reading does not mark
+    messages as seen.
     """
 
     def __init__(
@@ -62,7 +90,41 @@ class EmailTool(MessageTool):
         guards: Sequence[GuardProtocol] = (),
         **kwargs: Any,
     ):
-        super().__init__("email", description="Send and receive messages via email", guards=guards)
+        super().__init__(
+            "email",
+            description="Send and receive messages via email",
+            guards=guards,
+            extra_parameters=[
+                ParameterSpec(
+                    name="limit",
+                    type_annotation="int",
+                    description="Maximum messages to return (default 10 for read, 200 for sync)",
+                    required=False,
+                    default=0,
+                ),
+                ParameterSpec(
+                    name="include_body",
+                    type_annotation="bool",
+                    description="Download message text for read; False returns headers only",
+                    required=False,
+                    default=True,
+                ),
+                ParameterSpec(
+                    name="since_uid",
+                    type_annotation="int",
+                    description="For sync: return messages with a UID above this (last_uid of the previous sync)",
+                    required=False,
+                    default=0,
+                ),
+                ParameterSpec(
+                    name="uidvalidity",
+                    type_annotation="int",
+                    description="For sync: uidvalidity of the previous sync; a mismatch restarts from the top",
+                    required=False,
+                    default=0,
+                ),
+            ],
+        )
         self._smtp_host = smtp_host
         self._smtp_port = smtp_port
         self._smtp_use_tls = smtp_use_tls
@@ -73,6 +135,25 @@ class EmailTool(MessageTool):
         self._from_address = from_address or username
         self._timeout = timeout
 
+    async def _execute(self, **kwargs: Any) -> Any:
+        action = kwargs["action"]
+        if action == "read":
+            messages = await self.read_messages(
+                kwargs.get("channel", ""),
+                kwargs.get("message_id", ""),
+                limit=kwargs.get("limit") or 10,
+                include_body=kwargs.get("include_body", True),
+            )
+            return [m.model_dump() for m in messages]
+        if action == "sync":
+            return await self.sync(
+                kwargs.get("channel", ""),
+                since_uid=kwargs.get("since_uid", 0),
+                uidvalidity=kwargs.get("uidvalidity", 0),
+                limit=kwargs.get("limit") or 200,
+            )
+        return await super()._execute(**kwargs)
+
     # -- port implementation -------------------------------------------------
 
     async def _send(self, channel: str, content: str) -> Message:
@@ -108,80 +189,314 @@ class EmailTool(MessageTool):
         )
 
     async def _read(self, channel: str, message_id: str) -> list[Message]:
-        if not self._imap_host:
-            raise ConnectorError("EmailTool read requires imap_host")
-        if not self._username or not self._password:
-            raise ConnectorAuthError("EmailTool requires username and password")
+        return await self.read_messages(channel, message_id)
 
-        def _fetch() -> list[Message]:
-            conn = imaplib.IMAP4_SSL(self._imap_host, self._imap_port)
-            try:
-                conn.login(self._username, self._password)
-                mailbox = channel or "INBOX"
-                conn.select(mailbox)
+    async def _list_channels(self) -> list[str]:
+        self._require_imap("list_channels")
+
+        def _list_mailboxes() -> list[str]:
+            with self._session() as conn:
+                _, mailboxes = conn.list()
+            result = []
+            for mb in mailboxes or []:
+                decoded = mb.decode() if isinstance(mb, bytes) else str(mb)
+                # Parse IMAP list response: e.g. '(\\HasNoChildren) "/" "INBOX"'
+                parts = decoded.rsplit('" "', 1)
+                name = parts[-1].strip('"') if len(parts) > 1 else decoded.rsplit(" ", 1)[-1].strip('"')
+                result.append(name)
+            return result
+
+        return await run_blocking("email", _list_mailboxes)
+
+    # -- IMAP reading ------------------------------------------------------------
 
+    async def read_messages(
+        self, channel: str = "", message_id: str = "", *, limit: int = 10, include_body: bool = True
+    ) -> list[Message]:
+        """Read messages from mailbox *channel* (default ``INBOX``).
+
+        Parameters:
+            channel: Mailbox name.
+            message_id: UID or UID set to read; the latest *limit*
+                messages when empty.
+            limit: Number of latest messages to read without *message_id*.
+            include_body: Download the text body (first
+                ``10,000`` characters); headers only when ``False``.
+        """
+        self._require_imap("read")
+        mailbox = channel or "INBOX"
+        message_id = message_id.replace(" ", "")
+        if message_id and not _UID_SET.match(message_id):
+            raise ValueError(f"Invalid message_id '{message_id}'; expected a UID or UID set such as '12,15:20'")
+
+        def _fetch() -> list[Message]:
+            with self._session() as conn:
+                exists, _ = _select(conn, mailbox)
                 if message_id:
-                    _, data = conn.fetch(message_id, "(RFC822)")
-                    ids_to_fetch = [message_id]
+                    items = _fetch_items(conn, message_id, _HEADER_ITEMS, by_uid=True)
+                elif exists:
+                    # The newest messages have the highest sequence numbers.
+                    items = _fetch_items(conn, f"{max(exists - limit + 1, 1)}:{exists}", _HEADER_ITEMS, by_uid=False)
                 else:
-                    _, data = conn.search(None, "ALL")
-                    ids_to_fetch = data[0].split()[-10:] if data[0] else []
-
-                messages: list[Message] = []
-                for uid in ids_to_fetch:
-                    _, msg_data = conn.fetch(uid, "(RFC822)")
-                    if msg_data[0] is None:
-                        continue
-                    raw = msg_data[0]
-                    if isinstance(raw, tuple):
-                        raw = raw[1]
-                    parsed = _email_mod.message_from_bytes(raw if isinstance(raw, bytes) else raw.encode())
-                    body = ""
-                    if parsed.is_multipart():
-                        for part in parsed.walk():
-                            if part.get_content_type() == "text/plain":
-                                payload = part.get_payload(decode=True)
-                                body = payload.decode("utf-8", errors="replace") if payload else ""
-                                break
-                    else:
-                        payload = parsed.get_payload(decode=True)
-                        body = payload.decode("utf-8", errors="replace") if payload else ""
-
-                    messages.append(
-                        Message(
-                            id=uid.decode() if isinstance(uid, bytes) else str(uid),
-                            channel=mailbox,
-                            sender=parsed.get("From", ""),
-                            content=body[:10_000],
-                            timestamp=parsed.get("Date", ""),
-                        )
-                    )
-                return messages
-            finally:
-                conn.logout()
-
-        return await asyncio.to_thread(_fetch)
+                    items = []
+                bodies = _fetch_bodies(conn, items) if include_body else {}
+            return [_to_message(item, mailbox, bodies.get(item.get("UID", ""), "")) for item in items]
 
-    async def _list_channels(self) -> list[str]:
+        return await run_blocking("email", _fetch)
+
+    async def sync(
+        self, channel: str = "", *, since_uid: int = 0, uidvalidity: int = 0, limit: int = 200
+    ) -> dict[str, Any]:
+        """Return headers of messages in *channel* added since the last sync.
+
+        Parameters:
+            channel: Mailbox name (default ``INBOX``).
+            since_uid: ``last_uid`` returned by the previous call (``0`` for
+                a full sync).
+            uidvalidity: ``uidvalidity`` returned by the previous call.  If
+                the server reports a different value, UIDs were reassigned
+                and the sync restarts from the top with ``reset`` set.
+            limit: Maximum messages per call, oldest first; ``has_more``
+                tells whether to call again with the new ``last_uid``.
+
+        Bodies are not downloaded; read them with ``read`` and the UIDs
+        of the messages that need them.
+        """
+        self._require_imap("sync")
+        mailbox = channel or "INBOX"
+
+        def _sync() -> dict[str, Any]:
+            with self._session() as conn:
+                _, current_validity = _select(conn, mailbox)
+                reset = bool(uidvalidity) and uidvalidity != current_validity
+                since = 0 if reset else since_uid
+                typ, data = conn.uid("SEARCH", f"UID {since + 1}:*")
+                _check(typ, data, "SEARCH")
+                # "n:*" always matches the highest UID, even when it is below n.
+                uids = sorted(uid for uid in map(int, (data[0] or b"").split()) if uid > since)
+                page = uids[:limit]
+                items = [
+                    item
+                    for batch in _batched(page, _FETCH_BATCH)
+                    for item in _fetch_items(conn, _uid_set(batch), _HEADER_ITEMS, by_uid=True)
+                ]
+            messages = sorted((_to_message(item, mailbox, "") for item in items), key=lambda m: int(m.id or 0))
+            return {
+                "mailbox": mailbox,
+                "uidvalidity": current_validity,
+                "last_uid": page[-1] if page else since,
+                "has_more": len(uids) > len(page),
+                "reset": reset,
+                "messages": [m.model_dump() for m in messages],
+            }
+
+        return await run_blocking("email", _sync)
+
+    def _require_imap(self, action: str) -> None:
         if not self._imap_host:
-            raise ConnectorError("EmailTool list_channels requires imap_host")
+            raise ConnectorError(f"EmailTool {action} requires imap_host")
         if not self._username or not self._password:
             raise ConnectorAuthError("EmailTool requires username and password")
 
-        def _list_mailboxes() -> list[str]:
-            conn = imaplib.IMAP4_SSL(self._imap_host, self._imap_port)
-            try:
-                conn.login(self._username, self._password)
-                _, mailboxes = conn.list()
-                result = []
-                for mb in mailboxes or []:
-                    decoded = mb.decode() if isinstance(mb, bytes) else str(mb)
-                    # Parse IMAP list response: e.g. '(\\HasNoChildren) "/" "INBOX"'
-                    parts = decoded.rsplit('" "', 1)
-                    name = parts[-1].strip('"') if len(parts) > 1 else decoded.rsplit(" ", 1)[-1].strip('"')
-                    result.append(name)
-                return result
-            finally:
-                conn.logout()
-
-        return await asyncio.to_thread(_list_mailboxes)
+    def _session(self) -> Any:
+        return imap_sessions.session(
+            self._imap_host, self._imap_port, self._username, self._password, timeout=self._timeout
+        )
+
+
+# -- IMAP helpers ----------------------------------------------------------------
+
+
+def _check(typ: str, data: Any, command: str) -> None:
+    if typ != "OK":
+        detail = data[0].decode(errors="replace") if data and isinstance(data[0], bytes) else data
+        raise ConnectorError(f"IMAP {command} failed: {detail}")
+
+
+def _select(conn: imaplib.IMAP4, mailbox: str) -> tuple[int, int]:
+    """Open *mailbox* read-only; return its message count and UIDVALIDITY."""
+    typ, data = conn.select(mailbox, readonly=True)
+    _check(typ, data, f"SELECT {mailbox}")
+    _, validity = conn.response("UIDVALIDITY")
+    values = [v for v in validity or [] if v]
+    return int(data[0] or 0), int(values[-1]) if values else 0
+
+
+def _fetch_items(conn: imaplib.IMAP4, message_set: str, items: str, *, by_uid: bool) -> list[dict[str, Any]]:
+    """Run one FETCH for *message_set* and parse the response."""
+    if by_uid:
+        typ, data = conn.uid("FETCH", message_set, items)
+    else:
+        typ, data = conn.fetch(message_set, items)
+    _check(typ, data, "FETCH")
+    return _parse_fetch(data)
+
+
+def _fetch_bodies(conn: imaplib.IMAP4, items: list[dict[str, Any]]) -> dict[str, str]:
+    """Download the text part of each message, one FETCH per body section."""
+    by_section: dict[str, list[tuple[str, str, str]]] = {}
+    for item in items:
+        part = _find_text_part(item.get("BODYSTRUCTURE"))
+        if part is not None and item.get("UID"):
+            section, encoding, charset = part
+            by_section.setdefault(section, []).append((item["UID"], encoding, charset))
+
+    bodies: dict[str, str] = {}
+    for section, parts in by_section.items():
+        key = f"BODY[{section}]<0>"
+        for batch in _batched(parts, _FETCH_BATCH):
+            uids = _uid_set([int(uid) for uid, _, _ in batch])
+            fetched = {
+                item.get("UID"): item.get(key)
+                for item in _fetch_items(conn, uids, f"(UID BODY.PEEK[{section}]<0.{_BODY_BYTES}>)", by_uid=True)
+            }
+            for uid, encoding, charset in batch:
+                raw = fetched.get(uid)
+                if isinstance(raw, bytes):
+                    bodies[uid] = _decode_body(raw, encoding, charset)
+    return bodies
+
+
+def _to_message(item: dict[str, Any], mailbox: str, body: str) -> Message:
+    header_bytes = next((v for k, v in item.items() if k.startswith("BODY[HEADER") and isinstance(v, bytes)), b"")
+    headers = BytesHeaderParser(policy=email.policy.default).parsebytes(header_bytes)
+    return Message(
+        id=str(item.get("UID", "")),
+        channel=mailbox,
+        sender=str(headers.get("From", "")),
+        subject=str(headers.get("Subject", "")),
+        content=body,
+        timestamp=str(headers.get("Date", "") or item.get("INTERNALDATE") or ""),
+    )
+
+
+def _find_text_part(structure: Any, section: str = "") -> tuple[str, str, str] | None:
+    """Return ``(section, encoding, charset)`` of the body text in a BODYSTRUCTURE.
+
+    A single-part message is used if it is any ``text/*`` type; in a
+    multipart message the first ``text/plain`` part is used.
+    """
+    if not isinstance(structure, list) or not structure:
+        return None
+    if isinstance(structure[0], list):
+        # Multipart: child parts come first, then the subtype and extensions.
+        for index, child in enumerate(_leading_lists(structure), start=1):
+            found = _find_text_part(child, f"{section}.{index}" if section else str(index))
+            if found is not None:
+                return found
+        return None
+    if len(structure) < 7:
+        return None
+    media_type, subtype = str(structure[0]).lower(), str(structure[1]).lower()
+    if media_type != "text" or (section and subtype != "plain"):
+        return None
+    params = structure[2] if isinstance(structure[2], list) else []
+    attrs = {str(k).lower(): str(v) for k, v in zip(params[::2], params[1::2], strict=False)}
+    return section or "1", str(structure[5] or "7BIT").upper(), attrs.get("charset", "utf-8")
+
+
+def _leading_lists(structure: list[Any]) -> Iterator[list[Any]]:
+    for child in structure:
+        if not isinstance(child, list):
+            return
+        yield child
+
+
+def _decode_body(raw: bytes, encoding: str, charset: str) -> str:
+    """Decode a (possibly truncated) body part to at most ``_MAX_BODY_CHARS`` characters."""
+    if encoding == "BASE64":
+        compact = b"".join(raw.split())
+        try:
+            raw = binascii.a2b_base64(compact[: len(compact) - len(compact) % 4])
+        except binascii.Error:
+            return ""
+    elif encoding == "QUOTED-PRINTABLE":
+        raw = quopri.decodestring(raw)
+    try:
+        text = raw.decode(charset, errors="replace")
+    except LookupError:
+        text = raw.decode("utf-8", errors="replace")
+    return text[:_MAX_BODY_CHARS]
+
+
+def _batched(values: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _uid_set(uids: Sequence[int]) -> str:
+    """Compress UIDs into an IMAP sequence set, e.g. ``[1, 2, 3, 7]`` -> ``"1:3,7"``."""
+    ranges: list[list[int]] = []
+    for uid in sorted(set(uids)):
+        if ranges and uid == ranges[-1][1] + 1:
+            ranges[-1][1] = uid
+        else:
+            ranges.append([uid, uid])
+    return ",".join(str(lo) if lo == hi else f"{lo}:{hi}" for lo, hi in ranges)
+
+
+# -- FETCH response parsing -------------------------------------------------------
+
+_LITERAL = re.compile(rb"\{(\d+)\}\s*$")
+_TOKEN = re.compile(rb'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"\[]+(?:\[[^\]]*\](?:<\d+>)?)?))')
+_OPEN = object()
+_CLOSE = object()
+
+
+def _parse_fetch(data: list[Any]) -> list[dict[str, Any]]:
+    """Parse an ``imaplib`` FETCH response into one ``{ITEM: value}`` dict per message.
+
+    Atoms and quoted strings become ``str`` (``NIL`` becomes ``None``),
+    literals stay ``bytes`` and parenthesised lists become lists.
+    """
+    tokens: list[Any] = []
+    for part in data:
+        if isinstance(part, tuple):
+            head, literal = part
+            tokens.extend(_tokenize(_LITERAL.sub(b"", head)))
+            tokens.append(bytes(literal))
+        elif isinstance(part, bytes):
+            tokens.extend(_tokenize(part))
+
+    messages: list[dict[str, Any]] = []
+    pos = 0
+    while pos < len(tokens):
+        if tokens[pos] is not _OPEN:
+            pos += 1  # message sequence number
+            continue
+        values, pos = _parse_list(tokens, pos + 1)
+        messages.append({str(k).upper(): v for k, v in zip(values[::2], values[1::2], strict=False)})
+    return messages
+
+
+def _tokenize(text: bytes) -> Iterator[Any]:
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos:
+            return
+        pos = match.end()
+        open_, close, quoted, atom = match.groups()
+        if open_:
+            yield _OPEN
+        elif close:
+            yield _CLOSE
+        elif quoted is not None:
+            yield re.sub(rb"\\(.)", rb"\1", quoted).decode("utf-8", errors="replace")
+        elif atom is not None:
+            yield None if atom.upper() == b"NIL" else atom.decode("utf-8", errors="replace")
+
+
+def _parse_list(tokens: list[Any], pos: int) -> tuple[list[Any], int]:
+    values: list[Any] = []
+    while pos < len(tokens):
+        token = tokens[pos]
+        if token is _CLOSE:
+            return values, pos + 1
+        if token is _OPEN:
+            nested, pos = _parse_list(tokens, pos + 1)
+            values.append(nested)
+            continue
+        values.append(token)
+        pos += 1
+    return values, pos
@@ -0,0 +1,142 @@
+"""Reusable IMAP sessions for :class:`~firefly_dworkers.tools.communication.email.EmailTool`.
+
+Logging in to an IMAP server costs a TCP connect, a TLS handshake and an
+authentication round trip -- often more than the command that follows.
+:data:`imap_sessions` keeps authenticated ``imaplib`` connections per
+server and account and hands them out one caller at a time:
+
+* a connection idle for longer than ``check_after`` seconds is probed
+  with ``NOOP`` before reuse and replaced if the server dropped it;
+* a connection that raised during use is logged out and discarded;
+* at most ``max_idle`` connections per account are kept between calls.
+
+Sessions are used from ``email`` executor threads.  Call
+:func:`close_imap_sessions` on shutdown; the server does this from its
+lifespan.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import imaplib
+import logging
+import threading
+import time
+from collections.abc import Iterator
+
+from firefly_dworkers.exceptions import ConnectorAuthError
+
+logger = logging.getLogger(__name__)
+
+_SessionKey = tuple[str, int, str, str]
+
+
+class IMAPSessions:
+    """Authenticated IMAP connections shared by tool instances.
+
+    Parameters:
+        max_idle: Connections kept per account between calls.
+        check_after: Idle seconds after which a connection is probed with
+            ``NOOP`` before reuse.
+    """
+
+    def __init__(self, *, max_idle: int = 2, check_after: float = 60.0) -> None:
+        self._max_idle = max_idle
+        self._check_after = check_after
+        self._idle: dict[_SessionKey, list[tuple[imaplib.IMAP4, float]]] = {}
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._reused = 0
+
+    @contextlib.contextmanager
+    def session(
+        self, host: str, port: int, username: str, password: str, *, timeout: float | None = None
+    ) -> Iterator[imaplib.IMAP4]:
+        """Check out a logged-in connection to *host* for *username*.
+
+        The connection is returned to the pool when the block exits
+        normally and discarded if it raises.
+        """
+        # Keyed by a password digest so a caller with other credentials
+        # never receives a session it could not have opened itself.
+        key = (host, port, username, hashlib.sha256(password.encode()).hexdigest())
+        conn = self._checkout(key)
+        if conn is None:
+            conn = self._connect(host, port, username, password, timeout)
+        try:
+            yield conn
+        except BaseException:
+            _logout(conn)
+            raise
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append((conn, time.monotonic()))
+                conn = None
+        if conn is not None:
+            _logout(conn)
+
+    def stats(self) -> dict[str, int]:
+        """Return idle, opened and reused connection counts."""
+        with self._lock:
+            return {
+                "idle": sum(len(conns) for conns in self._idle.values()),
+                "opened": self._opened,
+                "reused": self._reused,
+            }
+
+    def close(self) -> None:
+        """Log out of every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                _logout(conn)
+
+    # -- Internals -------------------------------------------------------------
+
+    def _checkout(self, key: _SessionKey) -> imaplib.IMAP4 | None:
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                conn, released_at = idle.pop()
+            if time.monotonic() - released_at < self._check_after or _alive(conn):
+                with self._lock:
+                    self._reused += 1
+                return conn
+            _logout(conn)
+
+    def _connect(self, host: str, port: int, username: str, password: str, timeout: float | None) -> imaplib.IMAP4:
+        conn = imaplib.IMAP4_SSL(host, port, timeout=timeout)
+        try:
+            conn.login(username, password)
+        except imaplib.IMAP4.error as exc:
+            _logout(conn)
+            raise ConnectorAuthError(f"IMAP login failed for {username}@{host}: {exc}") from exc
+        with self._lock:
+            self._opened += 1
+        return conn
+
+
+def _alive(conn: imaplib.IMAP4) -> bool:
+    try:
+        return conn.noop()[0] == "OK"
+    except (imaplib.IMAP4.error, OSError):
+        return False
+
+
+def _logout(conn: imaplib.IMAP4) -> None:
+    with contextlib.suppress(Exception):
+        conn.logout()
+
+
+imap_sessions = IMAPSessions()
+
+
+def close_imap_sessions() -> None:
+    """Log out of all pooled IMAP sessions (call on application shutdown)."""
+    imap_sessions.close()
+    logger.debug("Closed IMAP sessions")
@@ -7,7 +7,6 @@ Uses the ``slack-sdk`` library.  Install with::
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -16,6 +15,7 @@ from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
 from firefly_dworkers.tools.communication.base import Message, MessageTool
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
@@ -81,7 +81,7 @@ class SlackTool(MessageTool):
             raise ConnectorError("SlackTool send requires a channel")
 
         try:
-            resp = await asyncio.to_thread(client.chat_postMessage, channel=target, text=content)
+            resp = await run_blocking("slack", client.chat_postMessage, channel=target, text=content)
         except _SlackApiError as exc:
             raise ConnectorError(f"Slack send failed: {exc.response['error']}") from exc
 
@@ -102,14 +102,16 @@ class SlackTool(MessageTool):
         try:
             if message_id:
                 # Get replies to a specific thread
-                resp = await asyncio.to_thread(
+                resp = await run_blocking(
+                    "slack",
                     client.conversations_replies,
                     channel=target,
                     ts=message_id,
                     limit=50,
                 )
             else:
-                resp = await asyncio.to_thread(
+                resp = await run_blocking(
+                    "slack",
                     client.conversations_history,
                     channel=target,
                     limit=20,
@@ -131,7 +133,8 @@ class SlackTool(MessageTool):
     async def _list_channels(self) -> list[str]:
         client = self._get_client()
         try:
-            resp = await asyncio.to_thread(
+            resp = await run_blocking(
+                "slack",
                 client.conversations_list,
                 types="public_channel,private_channel",
                 limit=200,
@@ -8,7 +8,6 @@ Uses ``httpx`` for async HTTP calls against the Microsoft Graph API and
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -17,27 +16,14 @@ from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
 from firefly_dworkers.tools.communication.base import Message, MessageTool
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
 from firefly_dworkers.tools.registry import tool_registry
+from firefly_dworkers.tools.token_cache import MSAL_AVAILABLE, graph_access_token, graph_token_key, token_cache
 
 logger = logging.getLogger(__name__)
 
-try:
-    import msal
-
-    MSAL_AVAILABLE = True
-except ImportError:
-    msal = None  # type: ignore[assignment]
-    MSAL_AVAILABLE = False
-
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    httpx = None  # type: ignore[assignment]
-    HTTPX_AVAILABLE = False
-
 _GRAPH_BASE = "https://graph.microsoft.com/v1.0"
+_GRAPH_SCOPES = ("https://graph.microsoft.com/.default",)
 
 
 @tool_registry.register("teams", category="communication")
@@ -73,7 +59,6 @@ class TeamsTool(MessageTool):
         self._client_secret = client_secret
         self._team_id = team_id
         self._timeout = timeout
-        self._access_token: str | None = None
 
     def _ensure_deps(self) -> None:
         if not MSAL_AVAILABLE:
@@ -82,56 +67,47 @@ class TeamsTool(MessageTool):
             raise ImportError("httpx is required for TeamsTool. Install with: pip install httpx")
 
     async def _get_token(self) -> str:
+        """Return a cached OAuth2 access token shared across connector instances."""
         self._ensure_deps()
-        if self._access_token:
-            return self._access_token
-
-        if not self._tenant_id or not self._client_id or not self._client_secret:
-            raise ConnectorAuthError("TeamsTool requires tenant_id, client_id, and client_secret")
-
-        authority = f"https://login.microsoftonline.com/{self._tenant_id}"
-        app = msal.ConfidentialClientApplication(
-            self._client_id,
-            authority=authority,
-            client_credential=self._client_secret,
-        )
-        result = await asyncio.to_thread(
-            app.acquire_token_for_client,
-            scopes=["https://graph.microsoft.com/.default"],
+        return await graph_access_token(
+            tenant_id=self._tenant_id,
+            client_id=self._client_id,
+            client_secret=self._client_secret,
+            scopes=_GRAPH_SCOPES,
+            label="TeamsTool",
         )
-        if "access_token" not in result:
-            raise ConnectorAuthError(
-                f"Teams auth failed: {result.get('error_description', result.get('error', 'unknown'))}"
-            )
-        self._access_token = result["access_token"]
-        return self._access_token
+
+    def _invalidate_token(self) -> None:
+        token_cache.invalidate(graph_token_key(self._tenant_id, self._client_id, self._client_secret, _GRAPH_SCOPES))
 
     async def _graph_get(self, path: str) -> dict[str, Any]:
         token = await self._get_token()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.get(
-                f"{_GRAPH_BASE}{path}",
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            if resp.status_code == 401:
-                self._access_token = None
-                raise ConnectorAuthError("Teams token expired or invalid")
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        resp = await client.get(
+            f"{_GRAPH_BASE}{path}",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=self._timeout,
+        )
+        if resp.status_code == 401:
+            self._invalidate_token()
+            raise ConnectorAuthError("Teams token expired or invalid")
+        resp.raise_for_status()
+        return resp.json()
 
     async def _graph_post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
         token = await self._get_token()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(
-                f"{_GRAPH_BASE}{path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json=body,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        resp = await client.post(
+            f"{_GRAPH_BASE}{path}",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            json=body,
+            timeout=self._timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     # -- port implementation -------------------------------------------------
 
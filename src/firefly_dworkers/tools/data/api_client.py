@@ -7,16 +7,9 @@ from typing import Any
 
 from fireflyframework_genai.tools.base import BaseTool, GuardProtocol, ParameterSpec
 
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
 from firefly_dworkers.tools.registry import tool_registry
 
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    httpx = None  # type: ignore[assignment]
-    HTTPX_AVAILABLE = False
-
 
 @tool_registry.register("api_client", category="data")
 class GenericAPITool(BaseTool):
@@ -88,17 +81,17 @@ class GenericAPITool(BaseTool):
         if extra_headers:
             headers.update(json.loads(extra_headers))
 
-        async with httpx.AsyncClient(timeout=self._http_timeout) as client:
-            if method == "GET":
-                response = await client.get(url, headers=headers)
-            elif method == "POST":
-                body = kwargs.get("body", "")
-                json_body = json.loads(body) if body else None
-                response = await client.post(url, headers=headers, json=json_body)
-            else:
-                raise ValueError(f"Unsupported HTTP method '{method}'; use GET or POST")
-
-            response.raise_for_status()
+        client = http_client()
+        if method == "GET":
+            response = await client.get(url, headers=headers, timeout=self._http_timeout)
+        elif method == "POST":
+            body = kwargs.get("body", "")
+            json_body = json.loads(body) if body else None
+            response = await client.post(url, headers=headers, json=json_body, timeout=self._http_timeout)
+        else:
+            raise ValueError(f"Unsupported HTTP method '{method}'; use GET or POST")
+
+        response.raise_for_status()
 
         return {
             "status_code": response.status_code,
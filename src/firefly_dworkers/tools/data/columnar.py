@@ -0,0 +1,86 @@
+"""Column-oriented results for the data tools.
+
+Tools return rows as a list of dicts by default.  That repeats every
+column name once per row and allocates a dict per row, which dominates
+memory for wide or long results.  With ``result_format="columns"`` the
+SQL and spreadsheet tools return one list per column instead::
+
+    {"columns": ["region", "revenue"],
+     "data": {"region": ["EMEA", "APAC"], "revenue": [120.5, 98.0]},
+     "row_count": 2, "format": "columns", ...}
+
+This is also compact JSON.  :func:`to_numpy` and :func:`to_arrow` turn
+the ``data`` mapping into NumPy arrays or a ``pyarrow.Table`` when those
+libraries are installed, and
+:meth:`DataSet.from_columns <firefly_dworkers.design.models.DataSet.from_columns>`
+builds chart data from it directly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None  # type: ignore[assignment]
+    PYARROW_AVAILABLE = False
+
+RESULT_FORMATS = ("rows", "columns")
+
+
+def check_result_format(result_format: str) -> str:
+    """Return *result_format*, raising :class:`ValueError` if it is unknown."""
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(f"Unknown result_format '{result_format}'; expected one of {', '.join(RESULT_FORMATS)}")
+    return result_format
+
+
+def to_columns(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> dict[str, list[Any]]:
+    """Transpose positional *rows* into ``{column: values}``.
+
+    Rows shorter than *columns* are padded with ``None``; extra cells are
+    dropped.
+    """
+    width = len(columns)
+    data: list[list[Any]] = [[] for _ in range(width)]
+    for row in rows:
+        cells = tuple(row)
+        for index in range(width):
+            data[index].append(cells[index] if index < len(cells) else None)
+    return dict(zip(columns, data, strict=True))
+
+
+def to_numpy(data: Mapping[str, Sequence[Any]]) -> dict[str, Any]:
+    """Convert a columnar ``data`` mapping to one NumPy array per column.
+
+    Numeric columns become numeric arrays; anything else is kept as an
+    ``object`` array.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for NumPy results. Install with: pip install firefly-dworkers[data]")
+    arrays: dict[str, Any] = {}
+    for name, values in data.items():
+        array = np.asarray(values)
+        if array.dtype.kind not in "biufcmM":
+            array = np.asarray(values, dtype=object)
+        arrays[name] = array
+    return arrays
+
+
+def to_arrow(data: Mapping[str, Sequence[Any]]) -> Any:
+    """Convert a columnar ``data`` mapping to a ``pyarrow.Table``."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Arrow results. Install with: pip install pyarrow")
+    return pa.table({name: list(values) for name, values in data.items()})
@@ -1,18 +1,26 @@
 """SpreadsheetTool — parse CSV and Excel files.
 
-CSV parsing uses the standard library.  Excel support requires ``openpyxl``
-(install with ``pip install firefly-dworkers[data]``).
+CSV parsing uses the standard library and reads either inline ``content``
+or a ``file_path``; files are streamed, so only the rows a call returns are
+held in memory.  The ``profile`` action summarises every column in a single
+pass (see :mod:`~firefly_dworkers.tools.data.csv_profile`) and requires
+NumPy.  Excel support requires ``openpyxl`` (install with
+``pip install firefly-dworkers[data]``).
 """
 
 from __future__ import annotations
 
 import csv
 import io
-from collections.abc import Sequence
-from typing import Any
+import itertools
+from collections.abc import Callable, Sequence
+from typing import Any, TextIO
 
 from fireflyframework_genai.tools.base import BaseTool, GuardProtocol, ParameterSpec
 
+from firefly_dworkers.tools.data.columnar import check_result_format, to_columns
+from firefly_dworkers.tools.data.csv_profile import profile_csv
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 try:
@@ -33,6 +41,8 @@ class SpreadsheetTool(BaseTool):
     * ``delimiter`` -- CSV delimiter character (default ``,``).
     * ``max_rows`` -- Default maximum rows to return.
     * ``encoding`` -- Text encoding for CSV data (default ``utf-8``).
+    * ``result_format`` -- ``"rows"`` (a dict per row) or ``"columns"``
+      (a list per column, see :mod:`firefly_dworkers.tools.data.columnar`).
     """
 
     def __init__(
@@ -41,6 +51,7 @@ class SpreadsheetTool(BaseTool):
         delimiter: str = ",",
         max_rows: int = 100,
         encoding: str = "utf-8",
+        result_format: str = "rows",
         guards: Sequence[GuardProtocol] = (),
     ):
         super().__init__(
@@ -52,7 +63,7 @@ class SpreadsheetTool(BaseTool):
                 ParameterSpec(
                     name="action",
                     type_annotation="str",
-                    description="One of: parse_csv, parse_excel, describe, to_csv",
+                    description="One of: parse_csv, parse_excel, describe, profile, to_csv",
                     required=True,
                 ),
                 ParameterSpec(
@@ -65,7 +76,7 @@ class SpreadsheetTool(BaseTool):
                 ParameterSpec(
                     name="file_path",
                     type_annotation="str",
-                    description="Path to an Excel file (for parse_excel action)",
+                    description="Path to a CSV file (instead of content) or an Excel file (for parse_excel)",
                     required=False,
                     default="",
                 ),
@@ -90,35 +101,97 @@ class SpreadsheetTool(BaseTool):
                     required=False,
                     default=delimiter,
                 ),
+                ParameterSpec(
+                    name="result_format",
+                    type_annotation="str",
+                    description="'rows' for a dict per row, 'columns' for a list of values per column",
+                    required=False,
+                    default=result_format,
+                ),
+                ParameterSpec(
+                    name="cell_range",
+                    type_annotation="str",
+                    description="Excel A1 range to read, e.g. 'A1:F5000' (for parse_excel action)",
+                    required=False,
+                    default="",
+                ),
+                ParameterSpec(
+                    name="columns",
+                    type_annotation="list",
+                    description="Excel columns to return, as header names or letters (for parse_excel action)",
+                    required=False,
+                    default=[],
+                ),
+                ParameterSpec(
+                    name="cursor",
+                    type_annotation="str",
+                    description="next_cursor from the previous parse_excel call, to read the next page",
+                    required=False,
+                    default="",
+                ),
+                ParameterSpec(
+                    name="top_k",
+                    type_annotation="int",
+                    description="Most frequent values reported per text column (for profile action)",
+                    required=False,
+                    default=5,
+                ),
             ],
         )
         self._delimiter = delimiter
         self._max_rows = max_rows
         self._encoding = encoding
+        self._result_format = check_result_format(result_format)
 
     async def _execute(self, **kwargs: Any) -> Any:
         action = kwargs["action"]
         content = kwargs.get("content", "")
         max_rows = kwargs.get("max_rows", self._max_rows)
         delimiter = kwargs.get("delimiter", self._delimiter)
+        result_format = check_result_format(kwargs.get("result_format", self._result_format))
+
+        file_path = kwargs.get("file_path", "")
 
         if action == "parse_csv":
-            return self._parse_csv(content, max_rows, delimiter)
+            if result_format == "columns":
+                return await self._read_csv(content, file_path, self._parse_csv_columns, max_rows, delimiter)
+            return await self._read_csv(content, file_path, self._parse_csv, max_rows, delimiter)
         if action == "describe":
-            return self._describe_csv(content, delimiter)
+            return await self._read_csv(content, file_path, self._describe_csv, delimiter)
+        if action == "profile":
+            return await self._read_csv(content, file_path, self._profile_csv, delimiter, kwargs.get("top_k", 5))
         if action == "parse_excel":
-            return self._parse_excel(
-                kwargs.get("file_path", ""),
+            return await run_blocking(
+                "data",
+                self._parse_excel,
+                file_path,
                 kwargs.get("sheet_name", ""),
                 max_rows,
+                result_format,
+                cell_range=kwargs.get("cell_range", ""),
+                columns=kwargs.get("columns") or (),
+                cursor=kwargs.get("cursor", ""),
             )
         if action == "to_csv":
-            return self._describe_csv(content, delimiter)
-        raise ValueError(f"Unknown action '{action}'; expected parse_csv, parse_excel, describe, or to_csv")
+            return await self._read_csv(content, file_path, self._describe_csv, delimiter)
+        raise ValueError(f"Unknown action '{action}'; expected parse_csv, parse_excel, describe, profile, or to_csv")
+
+    async def _read_csv(
+        self, content: str, file_path: str, handler: Callable[..., dict[str, Any]], *args: Any
+    ) -> dict[str, Any]:
+        """Run *handler* over inline *content*, or over *file_path* on a worker thread."""
+        if content or not file_path:
+            return handler(io.StringIO(content), *args)
 
-    def _parse_csv(self, content: str, max_rows: int, delimiter: str) -> dict[str, Any]:
+        def _run() -> dict[str, Any]:
+            with open(file_path, encoding=self._encoding, newline="") as source:
+                return handler(source, *args)
+
+        return await run_blocking("data", _run)
+
+    def _parse_csv(self, source: TextIO, max_rows: int, delimiter: str) -> dict[str, Any]:
         """Parse CSV content into rows."""
-        reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
+        reader = csv.DictReader(source, delimiter=delimiter)
         rows = []
         for i, row in enumerate(reader):
             if i >= max_rows:
@@ -131,9 +204,22 @@ class SpreadsheetTool(BaseTool):
             "truncated": len(rows) >= max_rows,
         }
 
-    def _describe_csv(self, content: str, delimiter: str) -> dict[str, Any]:
+    def _parse_csv_columns(self, source: TextIO, max_rows: int, delimiter: str) -> dict[str, Any]:
+        """Parse CSV content into one list of values per column."""
+        reader = csv.reader(source, delimiter=delimiter)
+        headers = next(reader, [])
+        rows = list(itertools.islice(reader, max_rows))
+        return {
+            "columns": headers,
+            "data": to_columns(headers, rows),
+            "format": "columns",
+            "row_count": len(rows),
+            "truncated": len(rows) >= max_rows,
+        }
+
+    def _describe_csv(self, source: TextIO, delimiter: str) -> dict[str, Any]:
         """Describe the structure of CSV content."""
-        reader = csv.reader(io.StringIO(content), delimiter=delimiter)
+        reader = csv.reader(source, delimiter=delimiter)
         headers = next(reader, [])
         row_count = sum(1 for _ in reader)
         return {
@@ -142,33 +228,53 @@ class SpreadsheetTool(BaseTool):
             "row_count": row_count,
         }
 
-    def _parse_excel(self, file_path: str, sheet_name: str, max_rows: int) -> dict[str, Any]:
-        """Parse an Excel file into rows."""
+    def _profile_csv(self, source: TextIO, delimiter: str, top_k: int) -> dict[str, Any]:
+        """Profile every column of CSV content in one pass."""
+        reader = csv.reader(source, delimiter=delimiter)
+        headers = next(reader, [])
+        return profile_csv(reader, headers, top_k=top_k)
+
+    def _parse_excel(
+        self,
+        file_path: str,
+        sheet_name: str,
+        max_rows: int,
+        result_format: str = "rows",
+        *,
+        cell_range: str = "",
+        columns: Sequence[str] = (),
+        cursor: str = "",
+    ) -> dict[str, Any]:
+        """Parse up to *max_rows* rows of an Excel sheet, optionally a range or page of it."""
         if not OPENPYXL_AVAILABLE:
             raise ImportError(
                 "openpyxl is required for Excel support. Install with: pip install firefly-dworkers[data]"
             )
         if not file_path:
             raise ValueError("parse_excel requires file_path")
+        from firefly_dworkers.tools.spreadsheet import xlsx_reader
 
-        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-        ws = wb[sheet_name] if sheet_name and sheet_name in wb.sheetnames else wb.active
-
-        rows: list[dict[str, Any]] = []
-        headers: list[str] = []
-        for i, row in enumerate(ws.iter_rows(values_only=True)):
-            if i == 0:
-                headers = [str(cell) if cell is not None else f"col_{j}" for j, cell in enumerate(row)]
-                continue
-            if len(rows) >= max_rows:
-                break
-            rows.append({headers[j]: cell for j, cell in enumerate(row) if j < len(headers)})
+        names = [info.name for info in xlsx_reader.sheet_index(file_path)]
+        sheet = xlsx_reader.read_rows(
+            file_path,
+            sheet_name=sheet_name if sheet_name in names else "",
+            cell_range=cell_range,
+            columns=columns,
+            page_size=max_rows,
+            cursor=cursor,
+        )
 
-        wb.close()
-        return {
-            "rows": rows,
-            "row_count": len(rows),
-            "columns": headers,
-            "sheets": wb.sheetnames if hasattr(wb, "sheetnames") else [],
-            "truncated": len(rows) >= max_rows,
-        }
+        result: dict[str, Any] = {}
+        if result_format == "columns":
+            result["data"] = to_columns(sheet.headers, sheet.rows)
+            result["format"] = "columns"
+        else:
+            result["rows"] = [dict(zip(sheet.headers, row, strict=False)) for row in sheet.rows]
+        result.update(
+            row_count=sheet.row_count,
+            columns=sheet.headers,
+            sheets=names,
+            truncated=bool(sheet.next_cursor),
+            next_cursor=sheet.next_cursor,
+        )
+        return result
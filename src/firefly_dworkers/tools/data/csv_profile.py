@@ -0,0 +1,194 @@
+"""Single-pass, bounded-memory profiling of CSV data.
+
+:func:`profile_csv` consumes rows in chunks and keeps only per-column
+accumulators, so multi-GB exports can be summarised without loading them.
+Each chunk is processed column-wise with NumPy:
+
+* numeric detection parses the whole column slice at once, falling back
+  to per-cell parsing only for columns that mix numbers and text;
+* count, nulls, min, max, mean and standard deviation are exact; mean
+  and variance are merged chunk by chunk with Chan's parallel update, so
+  large offsets (e.g. epoch timestamps) do not cancel out the variance;
+* quantiles come from a fixed-size reservoir sample (exact while a column
+  has no more numeric values than the sample);
+* top-k categories are counted exactly until a column exceeds
+  ``max_distinct`` values, after which only already-seen values are
+  counted and the result is flagged as approximate.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+DEFAULT_CHUNK_SIZE = 10_000
+_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+class _ColumnProfile:
+    """Running statistics for one column."""
+
+    def __init__(self, name: str, *, sample_size: int, max_distinct: int, rng: Any) -> None:
+        self.name = name
+        self.count = 0
+        self.nulls = 0
+        self.numeric = 0
+        self.integral = True
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.sample = np.empty(sample_size, dtype=np.float64)
+        self.counts: Counter[str] = Counter()
+        self.counts_exact = True
+        self._max_distinct = max_distinct
+        self._rng = rng
+
+    def update(self, cells: Any) -> None:
+        """Fold an object array of raw cell strings into the statistics."""
+        self.count += len(cells)
+        present = cells[cells != ""]
+        self.nulls += len(cells) - len(present)
+        if not len(present):
+            return
+        values, is_number = _parse_numbers(present)
+        self._update_numbers(values[is_number])
+        self._update_counts(present)
+
+    def _update_numbers(self, values: Any) -> None:
+        if not len(values):
+            return
+        seen = self.numeric
+        self.numeric += len(values)
+        # Chan et al.: merge this chunk's mean and sum of squared deviations.
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(np.square(values - chunk_mean).sum())
+        delta = chunk_mean - self.mean
+        self.mean += delta * len(values) / self.numeric
+        self.m2 += chunk_m2 + delta * delta * seen * len(values) / self.numeric
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        if self.integral and not np.all(np.mod(values, 1) == 0):
+            self.integral = False
+        # Reservoir sampling (Algorithm R), vectorised over the chunk.
+        size = len(self.sample)
+        fill = max(0, min(size - seen, len(values)))
+        self.sample[seen : seen + fill] = values[:fill]
+        rest = values[fill:]
+        if len(rest):
+            positions = np.arange(seen + fill + 1, seen + len(values) + 1)
+            slots = self._rng.integers(0, positions)
+            keep = slots < size
+            self.sample[slots[keep]] = rest[keep]
+
+    def _update_counts(self, present: Any) -> None:
+        uniques, counts = np.unique(present.astype(str), return_counts=True)
+        for value, n in zip(uniques.tolist(), counts.tolist(), strict=True):
+            if value in self.counts or len(self.counts) < self._max_distinct:
+                self.counts[value] += n
+            else:
+                self.counts_exact = False
+
+    def result(self, top_k: int) -> dict[str, Any]:
+        present = self.count - self.nulls
+        if present == 0:
+            kind = "empty"
+        elif self.numeric == present:
+            kind = "integer" if self.integral else "number"
+        elif self.numeric:
+            kind = "mixed"
+        else:
+            kind = "string"
+        out: dict[str, Any] = {
+            "name": self.name,
+            "type": kind,
+            "count": self.count,
+            "nulls": self.nulls,
+            "distinct": len(self.counts) if self.counts_exact else None,
+        }
+        if self.numeric:
+            sample = self.sample[: min(self.numeric, len(self.sample))]
+            quantiles = np.quantile(sample, _QUANTILES)
+            out.update(
+                min=self.minimum,
+                max=self.maximum,
+                mean=self.mean,
+                std=math.sqrt(self.m2 / self.numeric),
+                quantiles={f"{int(q * 100)}%": float(v) for q, v in zip(_QUANTILES, quantiles, strict=True)},
+                quantiles_approximate=self.numeric > len(self.sample),
+            )
+        if kind in ("string", "mixed"):
+            out["top"] = [{"value": v, "count": n} for v, n in self.counts.most_common(top_k)]
+            out["top_approximate"] = not self.counts_exact
+        return out
+
+
+def profile_csv(
+    rows: Iterable[Sequence[str]],
+    columns: Sequence[str],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    top_k: int = 5,
+    sample_size: int = 10_000,
+    max_distinct: int = 10_000,
+) -> dict[str, Any]:
+    """Profile CSV *rows* (without the header) in one pass.
+
+    Parameters:
+        rows: Parsed CSV rows, e.g. a :func:`csv.reader` over an open file.
+        columns: Column names from the header row.  Short rows are padded
+            with empty cells; extra cells are ignored.
+        chunk_size: Rows held in memory at a time.
+        top_k: Most frequent values reported for text columns.
+        sample_size: Reservoir size per column used for quantiles.
+        max_distinct: Distinct values counted per column before top-k
+            counts become approximate.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for CSV profiling. Install with: pip install firefly-dworkers[data]")
+    rng = np.random.default_rng(0)
+    profiles = [_ColumnProfile(c, sample_size=sample_size, max_distinct=max_distinct, rng=rng) for c in columns]
+    width = len(columns)
+    row_count = 0
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        row_count += len(chunk)
+        grid = np.full((len(chunk), width), "", dtype=object)
+        for i, row in enumerate(chunk):
+            cells = row[:width]
+            grid[i, : len(cells)] = cells
+        for index, profile in enumerate(profiles):
+            profile.update(grid[:, index])
+    return {
+        "row_count": row_count,
+        "column_count": width,
+        "columns": [profile.result(top_k) for profile in profiles],
+    }
+
+
+def _parse_numbers(cells: Any) -> tuple[Any, Any]:
+    """Parse an object array of strings, returning ``(values, is_number_mask)``."""
+    try:
+        values = cells.astype(np.float64)
+    except ValueError:
+        # Mixed column: parse cell by cell, marking text as NaN.
+        values = np.fromiter((_to_float(c) for c in cells), dtype=np.float64, count=len(cells))
+    return values, np.isfinite(values)
+
+
+def _to_float(cell: str) -> float:
+    try:
+        return float(cell)
+    except ValueError:
+        return math.nan
@@ -1,41 +1,41 @@
 """SQLClientTool — execute SQL queries against databases.
 
 Supports SQLite (via ``aiosqlite``), PostgreSQL (via ``asyncpg``), and
-generic DBAPI connections (via ``asyncio.to_thread``).
+generic DBAPI connections (on the ``sql`` connector thread pool).
+Connections are pooled per connection string by
+:data:`~firefly_dworkers.tools.data.sql_pool.sql_pools`.  PostgreSQL
+queries are read through a server-side cursor, so at most ``max_rows``
+rows leave the database; :meth:`SQLClientTool.iter_batches` streams a full
+result set in batches.  Read-only query results can be cached per tool
+(see :mod:`~firefly_dworkers.tools.data.sql_cache`).
 
 For SQLite, install ``aiosqlite``.  For PostgreSQL, install ``asyncpg``.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import sqlite3
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
 from typing import Any
 
 from fireflyframework_genai.tools.base import BaseTool, GuardProtocol, ParameterSpec
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.data.columnar import check_result_format, to_columns
+from firefly_dworkers.tools.data.sql_cache import QueryResultCache, normalize_query
+from firefly_dworkers.tools.data.sql_pool import AIOSQLITE_AVAILABLE, ASYNCPG_AVAILABLE, sql_pools
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiosqlite
+# Statements PostgreSQL can run behind ``DECLARE ... CURSOR``.
+_CURSOR_STATEMENTS = ("SELECT", "WITH", "VALUES", "TABLE")
 
-    AIOSQLITE_AVAILABLE = True
-except ImportError:
-    aiosqlite = None  # type: ignore[assignment]
-    AIOSQLITE_AVAILABLE = False
-
-try:
-    import asyncpg
-
-    ASYNCPG_AVAILABLE = True
-except ImportError:
-    asyncpg = None  # type: ignore[assignment]
-    ASYNCPG_AVAILABLE = False
+# Database-wide write counter; statistics lag commits by up to a second.
+_PG_DATA_VERSION = "SELECT coalesce(sum(n_tup_ins + n_tup_upd + n_tup_del), 0) FROM pg_stat_user_tables"
 
 
 @tool_registry.register("sql", category="data")
@@ -50,6 +50,18 @@ class SQLClientTool(BaseTool):
     * ``read_only`` -- If ``True``, only SELECT queries are allowed.
     * ``max_rows`` -- Maximum rows to return from a query.
     * ``timeout`` -- Query timeout in seconds.
+    * ``pool_size`` -- Maximum pooled connections per connection string
+      (see :attr:`SQLConnectorConfig.pool_size
+      <firefly_dworkers.tenants.config.SQLConnectorConfig.pool_size>`).
+      The first tool to open a pool sets its size.
+    * ``result_format`` -- ``"rows"`` (a dict per row) or ``"columns"``
+      (a list per column, see :mod:`firefly_dworkers.tools.data.columnar`).
+    * ``cache_ttl_seconds`` -- Cache read-only query results for this long
+      (``0`` disables the cache).
+    * ``cache_max_entries`` -- Maximum cached results.
+    * ``cache_track_changes`` -- Also drop cached results as soon as the
+      database reports a change (SQLite ``data_version``, PostgreSQL
+      table statistics).
     """
 
     def __init__(
@@ -59,6 +71,11 @@ class SQLClientTool(BaseTool):
         read_only: bool = True,
         max_rows: int = 1000,
         timeout: float = 30.0,
+        pool_size: int = 5,
+        result_format: str = "rows",
+        cache_ttl_seconds: float = 0.0,
+        cache_max_entries: int = 128,
+        cache_track_changes: bool = True,
         guards: Sequence[GuardProtocol] = (),
     ):
         super().__init__(
@@ -80,12 +97,37 @@ class SQLClientTool(BaseTool):
                     required=False,
                     default=max_rows,
                 ),
+                ParameterSpec(
+                    name="result_format",
+                    type_annotation="str",
+                    description="'rows' for a dict per row, 'columns' for a list of values per column",
+                    required=False,
+                    default=result_format,
+                ),
             ],
         )
         self._connection_string = connection_string
         self._read_only = read_only
         self._max_rows = max_rows
         self._timeout = timeout
+        self._pool_size = pool_size
+        self._result_format = check_result_format(result_format)
+        self._cache = (
+            QueryResultCache(ttl_seconds=cache_ttl_seconds, max_entries=cache_max_entries)
+            if cache_ttl_seconds > 0
+            else None
+        )
+        self._cache_track_changes = cache_track_changes
+
+    @property
+    def cache(self) -> QueryResultCache | None:
+        """The tool's result cache, or ``None`` when caching is disabled."""
+        return self._cache
+
+    async def aclose(self) -> None:
+        """Close the pooled connections for this tool's connection string."""
+        if self._connection_string:
+            await sql_pools.close(self._connection_string)
 
     def _detect_backend(self) -> str:
         cs = self._connection_string
@@ -103,80 +145,200 @@ class SQLClientTool(BaseTool):
                     f"Read-only mode: only SELECT/WITH queries are allowed, got '{normalized[:20]}...'"
                 )
 
+    async def iter_batches(self, query: str, *, batch_size: int = 500) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield every row of *query* in batches of up to *batch_size* rows.
+
+        Unlike :meth:`execute`, the result is not capped at ``max_rows``;
+        rows are fetched from the database one batch at a time.  A
+        connection is held until the iterator is exhausted or closed, so
+        wrap early exits in :func:`contextlib.aclosing`.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._validate_query(query)
+        backend = self._detect_backend()
+        if backend == "postgres":
+            batches = self._iter_postgres(query, batch_size)
+        elif AIOSQLITE_AVAILABLE:
+            batches = self._iter_sqlite_async(query, batch_size)
+        else:
+            batches = self._iter_sqlite_sync(query, batch_size)
+        async with aclosing(batches):
+            async for batch in batches:
+                yield batch
+
     async def _execute(self, **kwargs: Any) -> dict[str, Any]:
         query = kwargs["query"]
         max_rows = kwargs.get("max_rows", self._max_rows)
+        try:
+            result_format = check_result_format(kwargs.get("result_format", self._result_format))
+        except ValueError as exc:
+            raise ConnectorError(str(exc)) from exc
         self._validate_query(query)
 
         backend = self._detect_backend()
+        cache_key: tuple[Any, ...] | None = None
+        version: Any = None
+        if self._cache is not None:
+            if self._is_cacheable(query):
+                cache_key = (normalize_query(query), max_rows, result_format)
+                if self._cache_track_changes:
+                    version = await self._data_version(backend)
+                cached = self._cache.get(cache_key, version)
+                if cached is not None:
+                    return {**_copy_result(cached), "query": query, "cached": True}
+            else:
+                # The statement may have changed data the cache was built from.
+                self._cache.clear()
+
         if backend == "sqlite":
-            return await self._execute_sqlite(query, max_rows)
+            columns, records, truncated = await self._execute_sqlite(query, max_rows)
+        elif backend == "postgres":
+            columns, records, truncated = await self._execute_postgres(query, max_rows)
+        else:
+            raise ConnectorError(f"Unsupported database backend: {backend}")
+        result: dict[str, Any] = {"query": query, "columns": columns}
+        if result_format == "columns":
+            # Records are positional (sqlite3.Row / asyncpg.Record); no per-row dicts.
+            result["data"] = to_columns(columns, records)
+            result["format"] = "columns"
+        else:
+            result["rows"] = [dict(record) for record in records]
+        result["row_count"] = len(records)
+        result["truncated"] = truncated
+        if cache_key is not None and self._cache is not None:
+            self._cache.put(cache_key, _copy_result(result), version)
+        return result
+
+    def _is_cacheable(self, query: str) -> bool:
+        normalized = query.lstrip().upper()
+        if normalized.startswith("WITH"):
+            # Outside read-only mode a CTE may wrap INSERT/UPDATE/DELETE.
+            return self._read_only
+        return normalized.startswith(("SELECT", "VALUES", "TABLE"))
+
+    async def _data_version(self, backend: str) -> Any:
+        """Return a value that changes when the database is written to (``None`` if unknown)."""
         if backend == "postgres":
-            return await self._execute_postgres(query, max_rows)
-        raise ConnectorError(f"Unsupported database backend: {backend}")
+            pool, conn = await self._acquire_postgres()
+            try:
+                return await conn.fetchval(_PG_DATA_VERSION, timeout=self._timeout)
+            finally:
+                await pool.release(conn)
+        if self._connection_string == ":memory:":
+            return None
+        return await run_blocking("sql", sql_pools.sqlite_data_version, self._connection_string)
 
-    async def _execute_sqlite(self, query: str, max_rows: int) -> dict[str, Any]:
+    async def _execute_sqlite(self, query: str, max_rows: int) -> tuple[list[str], list[Any], bool]:
         if AIOSQLITE_AVAILABLE:
             return await self._execute_sqlite_async(query, max_rows)
         return await self._execute_sqlite_sync(query, max_rows)
 
-    async def _execute_sqlite_async(self, query: str, max_rows: int) -> dict[str, Any]:
-        async with aiosqlite.connect(self._connection_string) as db:
-            db.row_factory = aiosqlite.Row
+    async def _execute_sqlite_async(self, query: str, max_rows: int) -> tuple[list[str], list[Any], bool]:
+        async with sql_pools.sqlite(self._connection_string, max_size=self._pool_size) as db:
             cursor = await db.execute(query)
             columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            raw_rows = await cursor.fetchmany(max_rows)
-            rows = [dict(row) for row in raw_rows]
-            return {
-                "query": query,
-                "columns": columns,
-                "rows": rows,
-                "row_count": len(rows),
-                "truncated": len(rows) >= max_rows,
-            }
-
-    async def _execute_sqlite_sync(self, query: str, max_rows: int) -> dict[str, Any]:
-        def _run() -> dict[str, Any]:
-            conn = sqlite3.connect(self._connection_string)
-            conn.row_factory = sqlite3.Row
+            rows = list(await cursor.fetchmany(max_rows))
+            await cursor.close()
+            return columns, rows, len(rows) >= max_rows
+
+    async def _execute_sqlite_sync(self, query: str, max_rows: int) -> tuple[list[str], list[Any], bool]:
+        def _run() -> tuple[list[str], list[Any], bool]:
+            conn = sql_pools.sqlite_sync(self._connection_string)
             try:
                 cursor = conn.execute(query)
                 columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                raw_rows = cursor.fetchmany(max_rows)
-                rows = [dict(row) for row in raw_rows]
-                return {
-                    "query": query,
-                    "columns": columns,
-                    "rows": rows,
-                    "row_count": len(rows),
-                    "truncated": len(rows) >= max_rows,
-                }
+                rows = cursor.fetchmany(max_rows)
+                cursor.close()
+                return columns, rows, len(rows) >= max_rows
             finally:
-                conn.close()
+                # Discard uncommitted changes, as closing a per-query connection did.
+                if conn.in_transaction:
+                    conn.rollback()
 
-        return await asyncio.to_thread(_run)
+        return await run_blocking("sql", _run)
 
-    async def _execute_postgres(self, query: str, max_rows: int) -> dict[str, Any]:
+    async def _iter_sqlite_async(self, query: str, batch_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+        async with sql_pools.sqlite(self._connection_string, max_size=self._pool_size) as db:
+            cursor = await db.execute(query)
+            try:
+                while batch := await cursor.fetchmany(batch_size):
+                    yield [dict(row) for row in batch]
+            finally:
+                await cursor.close()
+
+    async def _iter_sqlite_sync(self, query: str, batch_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+        # A dedicated connection: batches may be fetched on different worker
+        # threads, which must not share the per-thread pooled connections.
+        def _connect() -> sqlite3.Connection:
+            conn = sqlite3.connect(self._connection_string, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            return conn
+
+        conn = await run_blocking("sql", _connect)
+        try:
+            cursor = await run_blocking("sql", conn.execute, query)
+            while batch := await run_blocking("sql", cursor.fetchmany, batch_size):
+                yield [dict(row) for row in batch]
+        finally:
+            await run_blocking("sql", conn.close)
+
+    async def _execute_postgres(self, query: str, max_rows: int) -> tuple[list[str], list[Any], bool]:
+        pool, conn = await self._acquire_postgres()
+        try:
+            if self._uses_cursor(query):
+                # Fetch one extra row to tell whether the result was truncated.
+                async with conn.transaction(readonly=self._read_only):
+                    cursor = await conn.cursor(query)
+                    records = await cursor.fetch(max_rows + 1, timeout=self._timeout)
+            else:
+                records = await conn.fetch(query, timeout=self._timeout)
+            rows = list(records[:max_rows])
+            columns = list(rows[0].keys()) if rows else []
+            return columns, rows, len(records) > max_rows
+        finally:
+            await pool.release(conn)
+
+    async def _iter_postgres(self, query: str, batch_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+        pool, conn = await self._acquire_postgres()
+        try:
+            if not self._uses_cursor(query):
+                records = await conn.fetch(query, timeout=self._timeout)
+                for start in range(0, len(records), batch_size):
+                    yield [dict(r) for r in records[start : start + batch_size]]
+                return
+            async with conn.transaction(readonly=self._read_only):
+                cursor = await conn.cursor(query)
+                while batch := await cursor.fetch(batch_size, timeout=self._timeout):
+                    yield [dict(r) for r in batch]
+        finally:
+            await pool.release(conn)
+
+    async def _acquire_postgres(self) -> tuple[Any, Any]:
         if not ASYNCPG_AVAILABLE:
             raise ImportError("asyncpg is required for PostgreSQL support. Install with: pip install asyncpg")
         try:
-            conn = await asyncio.wait_for(
-                asyncpg.connect(self._connection_string),
-                timeout=self._timeout,
-            )
+            pool = await sql_pools.postgres(self._connection_string, max_size=self._pool_size, timeout=self._timeout)
+            conn = await pool.acquire(timeout=self._timeout)
         except Exception as exc:
             raise ConnectorAuthError(f"PostgreSQL connection failed: {exc}") from exc
+        return pool, conn
 
-        try:
-            records = await conn.fetch(query)
-            rows = [dict(r) for r in records[:max_rows]]
-            columns = list(rows[0].keys()) if rows else []
-            return {
-                "query": query,
-                "columns": columns,
-                "rows": rows,
-                "row_count": len(rows),
-                "truncated": len(records) > max_rows,
-            }
-        finally:
-            await conn.close()
+    @staticmethod
+    def _uses_cursor(query: str) -> bool:
+        return query.lstrip().upper().startswith(_CURSOR_STATEMENTS)
+
+
+def _copy_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Copy the row and column containers of a query result.
+
+    Cached results are copied on the way in and out, so a caller that
+    mutates its rows cannot change what later cache hits return.
+    """
+    out = dict(result)
+    out["columns"] = list(result["columns"])
+    if "rows" in result:
+        out["rows"] = [dict(row) for row in result["rows"]]
+    if "data" in result:
+        out["data"] = {name: list(values) for name, values in result["data"].items()}
+    return out
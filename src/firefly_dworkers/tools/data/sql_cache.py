@@ -0,0 +1,88 @@
+"""Result cache for read-only :class:`~firefly_dworkers.tools.data.sql.SQLClientTool` queries.
+
+Analyst workers often re-issue the same ``SELECT`` while iterating on a
+chart or summary.  :class:`QueryResultCache` keeps recent results keyed by
+the normalised SQL text, ``max_rows`` and result format.  Entries expire
+after a TTL and, optionally, as soon as the database reports a change:
+
+* SQLite -- ``PRAGMA data_version`` on a dedicated probe connection, which
+  changes whenever any other connection commits.
+* PostgreSQL -- the database-wide insert/update/delete counters in
+  ``pg_stat_user_tables``.  Statistics are flushed asynchronously, so a
+  write can take up to a second to show up; the TTL bounds staleness.
+
+Caching is opt-in per tool (``cache_ttl_seconds``) or per tenant via
+:class:`~firefly_dworkers.tenants.config.SQLConnectorConfig`.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Quoted literals and identifiers are kept verbatim; other whitespace runs collapse.
+_TOKENS = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|\s+""")
+
+
+def normalize_query(query: str) -> str:
+    """Return *query* with insignificant whitespace and trailing semicolons removed."""
+    normalized = _TOKENS.sub(lambda m: m.group(1) or " ", query).strip()
+    return normalized.rstrip(";").rstrip()
+
+
+class QueryResultCache:
+    """Thread-safe LRU of query results with TTL and data-version checks.
+
+    Parameters:
+        ttl_seconds: How long an entry stays valid (``0`` = never expires).
+        max_entries: Maximum number of results kept; least recently used
+            entries are evicted first.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = 128) -> None:
+        self._entries: OrderedDict[tuple[Any, ...], tuple[dict[str, Any], float, Any]] = OrderedDict()
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple[Any, ...], version: Any = None) -> dict[str, Any] | None:
+        """Return the result under *key*, or ``None`` if missing, expired or from another *version*."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at, cached_version = entry
+                if (expires_at and expires_at <= time.monotonic()) or cached_version != version:
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return result
+            self._misses += 1
+            return None
+
+    def put(self, key: tuple[Any, ...], result: dict[str, Any], version: Any = None) -> None:
+        """Store *result* under *key* as observed at data *version*."""
+        expires_at = time.monotonic() + self._ttl if self._ttl else 0.0
+        with self._lock:
+            self._entries[key] = (result, expires_at, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return entry, hit and miss counts."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
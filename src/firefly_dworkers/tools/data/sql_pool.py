@@ -0,0 +1,224 @@
+"""Connection pools for :class:`~firefly_dworkers.tools.data.sql.SQLClientTool`.
+
+Opening a database connection per query costs a TCP/TLS handshake and
+authentication round trip for PostgreSQL, and file open plus schema load
+for SQLite.  :data:`sql_pools` keeps connections per connection string and
+shares them between tool instances:
+
+* PostgreSQL -- an ``asyncpg`` pool per event loop.
+* SQLite with ``aiosqlite`` -- a bounded set of reusable connections per
+  event loop.
+* SQLite without ``aiosqlite`` -- one ``sqlite3`` connection per
+  ``sql`` executor thread.
+
+Call :func:`close_sql_pools` on shutdown; the server does this from its
+lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import threading
+import weakref
+from collections.abc import AsyncIterator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import aiosqlite
+
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    aiosqlite = None  # type: ignore[assignment]
+    AIOSQLITE_AVAILABLE = False
+
+try:
+    import asyncpg
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    asyncpg = None  # type: ignore[assignment]
+    ASYNCPG_AVAILABLE = False
+
+
+class _SqlitePool:
+    """Bounded set of reusable ``aiosqlite`` connections to one database."""
+
+    def __init__(self, path: str, max_size: int) -> None:
+        self._path = path
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: list[Any] = []
+        self._open: set[Any] = set()
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await self._connect()
+            try:
+                yield conn
+                # Leave no open transaction behind, as closing the connection would.
+                if conn.in_transaction:
+                    await conn.rollback()
+            except BaseException:
+                self._open.discard(conn)
+                with contextlib.suppress(Exception):
+                    await conn.close()
+                raise
+            self._idle.append(conn)
+
+    async def close(self) -> None:
+        conns, self._open, self._idle = self._open, set(), []
+        for conn in conns:
+            with contextlib.suppress(Exception):
+                await conn.close()
+
+    @property
+    def size(self) -> int:
+        return len(self._open)
+
+    async def _connect(self) -> Any:
+        conn = await aiosqlite.connect(self._path)
+        conn.row_factory = aiosqlite.Row
+        self._open.add(conn)
+        return conn
+
+
+class SQLPools:
+    """Process-wide registry of SQL connection pools keyed by connection string.
+
+    Async pools are bound to the event loop that created them, so one set is
+    kept per running loop.
+    """
+
+    def __init__(self) -> None:
+        self._loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._thread_local = threading.local()
+        self._sync_conns: dict[sqlite3.Connection, str] = {}
+        self._probes: dict[str, tuple[sqlite3.Connection, threading.Lock]] = {}
+        self._lock = threading.Lock()
+
+    async def postgres(self, dsn: str, *, max_size: int, timeout: float) -> Any:
+        """Return the ``asyncpg`` pool for *dsn*, creating it on first use.
+
+        Concurrent first callers share one creation; a failed creation is
+        forgotten so the next call retries.
+        """
+        pools = self._loop_pools()
+        key = ("postgres", dsn)
+        creating = pools.get(key)
+        if creating is None:
+            creating = pools[key] = asyncio.ensure_future(
+                asyncpg.create_pool(dsn, min_size=1, max_size=max_size, timeout=timeout)
+            )
+        try:
+            return await asyncio.shield(creating)
+        except Exception:
+            if pools.get(key) is creating:
+                del pools[key]
+            raise
+
+    @contextlib.asynccontextmanager
+    async def sqlite(self, path: str, *, max_size: int) -> AsyncIterator[Any]:
+        """Acquire a pooled ``aiosqlite`` connection for *path*."""
+        pools = self._loop_pools()
+        key = ("sqlite", path)
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = _SqlitePool(path, max_size)
+        async with pool.acquire() as conn:
+            yield conn
+
+    def sqlite_sync(self, path: str) -> sqlite3.Connection:
+        """Return this thread's ``sqlite3`` connection for *path* (call from a worker thread)."""
+        conns: dict[str, sqlite3.Connection] | None = getattr(self._thread_local, "conns", None)
+        if conns is None:
+            conns = self._thread_local.conns = {}
+        conn = conns.get(path)
+        with self._lock:
+            if conn is not None and conn in self._sync_conns:
+                return conn
+            # Only ever used by this thread, but closed from whichever thread shuts down.
+            conn = conns[path] = sqlite3.connect(path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._sync_conns[conn] = path
+        return conn
+
+    def sqlite_data_version(self, path: str) -> int:
+        """Return ``PRAGMA data_version`` for *path* (call from a worker thread).
+
+        The probe connection never writes, so the value changes whenever
+        any other connection -- pooled or external -- commits.
+        """
+        with self._lock:
+            probe = self._probes.get(path)
+            if probe is None:
+                probe = self._probes[path] = (sqlite3.connect(path, check_same_thread=False), threading.Lock())
+        conn, lock = probe
+        with lock:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of pools and open connections by backend."""
+        with self._lock:
+            loop_pools = [pool for pools in self._loops.values() for pool in pools.items()]
+            sync_conns = len(self._sync_conns)
+        sqlite_pools = [pool for (backend, _), pool in loop_pools if backend == "sqlite"]
+        return {
+            "postgres_pools": sum(1 for (backend, _), _pool in loop_pools if backend == "postgres"),
+            "sqlite_pools": len(sqlite_pools),
+            "sqlite_connections": sum(pool.size for pool in sqlite_pools),
+            "sqlite_sync_connections": sync_conns,
+        }
+
+    async def close(self, connection_string: str | None = None) -> None:
+        """Close pools for *connection_string*, or all pools.
+
+        Async pools can only be closed from the loop that owns them; pools
+        of other loops are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            to_close: list[Any] = []
+            for owner, pools in list(self._loops.items()):
+                for key in [k for k in pools if connection_string in (None, k[1])]:
+                    pool = pools.pop(key)
+                    if owner is loop:
+                        to_close.append(pool)
+            sync_conns = [c for c, p in self._sync_conns.items() if connection_string in (None, p)]
+            for conn in sync_conns:
+                del self._sync_conns[conn]
+            for path in [p for p in self._probes if connection_string in (None, p)]:
+                sync_conns.append(self._probes.pop(path)[0])
+        for pool in to_close:
+            with contextlib.suppress(Exception):
+                if isinstance(pool, asyncio.Future):
+                    await (await pool).close()
+                else:
+                    await pool.close()
+        for conn in sync_conns:
+            # Worker threads notice the connection is no longer tracked and reconnect.
+            with contextlib.suppress(Exception):
+                conn.close()
+
+    def _loop_pools(self) -> dict[tuple[str, str], Any]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._loops.get(loop)
+            if pools is None:
+                pools = self._loops[loop] = {}
+            return pools
+
+
+sql_pools = SQLPools()
+
+
+async def close_sql_pools() -> None:
+    """Close all SQL connection pools (call on application shutdown)."""
+    await sql_pools.close()
+    logger.debug("Closed SQL connection pools")
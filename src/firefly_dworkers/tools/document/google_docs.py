@@ -8,7 +8,6 @@ Install with::
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -23,6 +22,7 @@ from firefly_dworkers.tools.document.models import (
     ParagraphData,
     SectionSpec,
 )
+from firefly_dworkers.tools.google_api import GoogleApiSession, google_api_session, google_execute
 from firefly_dworkers.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,8 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+_BATCH_URL = "https://docs.googleapis.com/batch"
+
 
 def _hex_to_rgb_docs(hex_color: str) -> dict[str, float]:
     """Convert a hex color string (e.g. '#1A73E8') to Google Docs API rgbColor dict."""
@@ -104,7 +106,9 @@ class GoogleDocsTool(DocumentTool):
         self._service_account_key = service_account_key
         self._credentials_json = credentials_json
         self._scopes = list(scopes)
+        self._timeout = timeout
         self._service: Any | None = None
+        self._session: GoogleApiSession | None = None
 
     def _ensure_deps(self) -> None:
         if not GOOGLE_AVAILABLE:
@@ -127,6 +131,7 @@ class GoogleDocsTool(DocumentTool):
         else:
             raise ConnectorAuthError("GoogleDocsTool requires service_account_key or credentials_json")
 
+        self._session = google_api_session(creds, batch_url=_BATCH_URL, timeout=self._timeout)
         self._service = _build("docs", "v1", credentials=creds)
         return self._service
 
@@ -135,7 +140,7 @@ class GoogleDocsTool(DocumentTool):
     async def _read_document(self, source: str) -> DocumentData:
         """Read a Google Doc by document ID."""
         svc = self._get_service()
-        doc = await asyncio.to_thread(lambda: svc.documents().get(documentId=source).execute())
+        doc = await google_execute(svc.documents().get(documentId=source), self._session)
 
         title = doc.get("title", "")
         paragraphs = []
@@ -182,7 +187,7 @@ class GoogleDocsTool(DocumentTool):
         svc = self._get_service()
 
         body: dict[str, Any] = {"title": title or "Untitled Document"}
-        doc = await asyncio.to_thread(lambda: svc.documents().create(body=body).execute())
+        doc = await google_execute(svc.documents().create(body=body), self._session)
         document_id = doc["documentId"]
 
         # Build batch update requests for content
@@ -335,15 +340,9 @@ class GoogleDocsTool(DocumentTool):
             # Combine content requests and style requests
             all_requests = requests + style_requests
             if all_requests:
-                await asyncio.to_thread(
-                    lambda: (
-                        svc.documents()
-                        .batchUpdate(
-                            documentId=document_id,
-                            body={"requests": all_requests},
-                        )
-                        .execute()
-                    )
+                await google_execute(
+                    svc.documents().batchUpdate(documentId=document_id, body={"requests": all_requests}),
+                    self._session,
                 )
 
         return document_id.encode("utf-8")
@@ -371,15 +370,9 @@ class GoogleDocsTool(DocumentTool):
                     )
 
         if requests:
-            await asyncio.to_thread(
-                lambda: (
-                    svc.documents()
-                    .batchUpdate(
-                        documentId=source,
-                        body={"requests": requests},
-                    )
-                    .execute()
-                )
+            await google_execute(
+                svc.documents().batchUpdate(documentId=source, body={"requests": requests}),
+                self._session,
             )
 
         return source.encode("utf-8")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 import logging
 import os
@@ -11,6 +10,7 @@ from typing import Any
 
 from fireflyframework_genai.tools.base import BaseTool, GuardProtocol, ParameterSpec
 
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 try:
@@ -108,7 +108,7 @@ class PDFTool(BaseTool):
         content_type = kwargs.get("content_type", "markdown")
         css = kwargs.get("css", "") or self._default_css
 
-        pdf_bytes = await asyncio.to_thread(self._generate_sync, content, content_type, css)
+        pdf_bytes = await run_blocking("render", self._generate_sync, content, content_type, css)
         self._last_artifact = pdf_bytes
         return {
             "bytes_length": len(pdf_bytes),
@@ -122,7 +122,8 @@ class PDFTool(BaseTool):
 
     async def generate(self, content: str, *, content_type: str = "markdown", css: str = "") -> bytes:
         """Generate a PDF and return the raw bytes."""
-        return await asyncio.to_thread(
+        return await run_blocking(
+            "render",
             self._generate_sync, content, content_type, css or self._default_css
         )
 
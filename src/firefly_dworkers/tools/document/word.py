@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import io
 import logging
 from collections.abc import Sequence
@@ -17,6 +16,7 @@ from firefly_dworkers.tools.document.models import (
     ParagraphData,
     SectionSpec,
 )
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 try:
@@ -54,15 +54,15 @@ class WordTool(DocumentTool):
 
     async def _read_document(self, source: str) -> DocumentData:
         _require_docx()
-        return await asyncio.to_thread(self._read_sync, source)
+        return await run_blocking("render", self._read_sync, source)
 
     async def _create_document(self, title: str, sections: list[SectionSpec]) -> bytes:
         _require_docx()
-        return await asyncio.to_thread(self._create_sync, title, sections)
+        return await run_blocking("render", self._create_sync, title, sections)
 
     async def _modify_document(self, source: str, operations: list[DocumentOperation]) -> bytes:
         _require_docx()
-        return await asyncio.to_thread(self._modify_sync, source, operations)
+        return await run_blocking("render", self._modify_sync, source, operations)
 
     # -- Sync implementations --
 
@@ -0,0 +1,234 @@
+"""Named, bounded thread pools for blocking connector calls.
+
+``asyncio.to_thread`` runs everything on the event loop's single default
+executor, so one slow integration (a long Confluence search, a large
+PowerPoint render) can occupy every worker thread and stall unrelated
+tools.  Blocking calls are instead routed to a dedicated pool per
+connector::
+
+    result = await run_blocking("jira", client.jql, jql, limit=50)
+
+Pools are created on first use and sized from
+``connectors.executors`` in the tenant configuration (see
+:func:`configure_executors`).  Each pool tracks queue depth and
+saturation, exposed through :meth:`ConnectorExecutors.stats` and the
+``/api/observability/executors`` endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tenants.config import ExecutorsConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class ExecutorStats(BaseModel):
+    """Point-in-time metrics for one connector pool."""
+
+    name: str
+    max_workers: int
+    active: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    saturated: bool = False  # All threads busy right now
+    saturated_submissions: int = 0  # Calls that had to queue for a thread
+    avg_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+
+class ConnectorExecutor:
+    """A bounded thread pool for one connector, with queue metrics.
+
+    Parameters:
+        name: Pool name, also used as the worker thread name prefix.
+        max_workers: Maximum number of threads.
+    """
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError(f"Executor '{name}' needs at least one worker, got {max_workers}")
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix=f"dworkers-{name}")
+        self._active = 0
+        self._queued = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._saturated_submissions = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+        self._lock = threading.Lock()
+
+    async def run[T](self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` on this pool and await the result.
+
+        Context variables are propagated to the worker thread, as with
+        :func:`asyncio.to_thread`.
+        """
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, self._call, fn, args, kwargs, time.monotonic())
+        with self._lock:
+            self._submitted += 1
+            if self._active + self._queued >= self.max_workers:
+                self._saturated_submissions += 1
+            self._queued += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queued)
+        future = self._pool.submit(call)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> ExecutorStats:
+        """Return a snapshot of this pool's metrics."""
+        with self._lock:
+            started = self._completed + self._active
+            return ExecutorStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                active=self._active,
+                queue_depth=self._queued,
+                peak_queue_depth=self._peak_queue_depth,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                saturated=self._active >= self.max_workers,
+                saturated_submissions=self._saturated_submissions,
+                avg_wait_ms=self._total_wait_ms / started if started else 0.0,
+                max_wait_ms=self._max_wait_ms,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop accepting work; queued calls still run."""
+        self._pool.shutdown(wait=wait)
+
+    def _call[T](self, fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any], enqueued: float) -> T:
+        wait_ms = (time.monotonic() - enqueued) * 1000
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def _on_done(self, future: concurrent.futures.Future[Any]) -> None:
+        # A call cancelled before it started never reaches ``_call``.
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+
+class ConnectorExecutors:
+    """Registry of per-connector pools, created lazily by name.
+
+    A module-level singleton :data:`connector_executors` is provided and
+    is what :func:`run_blocking` uses.
+
+    Parameters:
+        default_max_workers: Size of pools without an explicit size.
+        max_workers: Pool sizes by name.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_max_workers: int = DEFAULT_MAX_WORKERS,
+        max_workers: Mapping[str, int] | None = None,
+    ) -> None:
+        self._default_max_workers = default_max_workers
+        self._max_workers = dict(max_workers or {})
+        self._executors: dict[str, ConnectorExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ConnectorExecutor:
+        """Return the pool for *name*, creating it on first use."""
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                size = self._max_workers.get(name, self._default_max_workers)
+                executor = self._executors[name] = ConnectorExecutor(name, size)
+            return executor
+
+    def configure(
+        self,
+        *,
+        default_max_workers: int | None = None,
+        max_workers: Mapping[str, int] | None = None,
+    ) -> None:
+        """Grow pools to the given sizes.
+
+        Pools are shared by all tenants, so sizes only ever increase: when
+        tenants disagree the largest size wins.  A pool that grows is
+        replaced; calls already queued on the old pool still complete.
+        """
+        retired: list[ConnectorExecutor] = []
+        with self._lock:
+            if default_max_workers is not None:
+                self._default_max_workers = max(self._default_max_workers, default_max_workers)
+            for name, size in (max_workers or {}).items():
+                self._max_workers[name] = max(self._max_workers.get(name, 0), size)
+            for name, executor in list(self._executors.items()):
+                size = self._max_workers.get(name, self._default_max_workers)
+                if size > executor.max_workers:
+                    retired.append(executor)
+                    self._executors[name] = ConnectorExecutor(name, size)
+                    logger.debug("Resized executor '%s' to %d workers", name, size)
+        for executor in retired:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> list[ExecutorStats]:
+        """Return metrics for every pool created so far, sorted by name."""
+        with self._lock:
+            executors = sorted(self._executors.values(), key=lambda e: e.name)
+        return [executor.stats() for executor in executors]
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down and forget all pools (call on application shutdown)."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+
+connector_executors = ConnectorExecutors()
+
+
+async def run_blocking[T](pool: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the named connector pool.
+
+    Drop-in replacement for ``asyncio.to_thread(fn, *args, **kwargs)``.
+    """
+    return await connector_executors.get(pool).run(fn, *args, **kwargs)
+
+
+def configure_executors(config: ExecutorsConfig) -> None:
+    """Apply a tenant's ``connectors.executors`` settings to the shared pools."""
+    connector_executors.configure(default_max_workers=config.default_max_workers, max_workers=config.max_workers)
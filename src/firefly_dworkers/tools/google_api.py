@@ -0,0 +1,226 @@
+"""Async execution of Google API client requests over the shared HTTP pool.
+
+``googleapiclient`` builds requests cheaply but executes them synchronously
+on a non-thread-safe ``httplib2`` connection.  :class:`GoogleApiSession`
+sends the same request objects asynchronously through
+:func:`~firefly_dworkers.tools.http_pool.http_client`, authorising them with
+a service-account token from the shared
+:data:`~firefly_dworkers.tools.token_cache.token_cache`.  Independent calls
+can be coalesced into a single round trip through Google's batch endpoint::
+
+    session = GoogleApiSession(creds, batch_url="https://sheets.googleapis.com/batch")
+    meta = await session.execute(svc.spreadsheets().get(spreadsheetId=sid))
+    results = await session.execute_batch([svc.spreadsheets().values().append(...), ...])
+
+Requests with a resumable media upload are delegated to the client
+library on the ``google`` connector thread pool.
+"""
+
+from __future__ import annotations
+
+import calendar
+import time
+import uuid
+from collections.abc import Sequence
+from email.parser import BytesParser
+from typing import Any
+from urllib.parse import urlsplit
+
+from firefly_dworkers.exceptions import ConnectorError
+from firefly_dworkers.tools.executors import run_blocking
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
+from firefly_dworkers.tools.token_cache import AccessToken, token_cache
+
+try:
+    import google_auth_httplib2
+    import httplib2
+
+    GOOGLE_AUTH_AVAILABLE = True
+except ImportError:
+    GOOGLE_AUTH_AVAILABLE = False
+
+# Google batch endpoints accept at most 100 calls per request.
+MAX_BATCH_SIZE = 100
+
+_DEFAULT_EXPIRES_IN = 3600
+_SKIPPED_HEADERS = {"content-length", "host"}
+
+
+class _HttpResponse(dict):
+    """Minimal ``httplib2.Response`` stand-in passed to request post-processors."""
+
+    def __init__(self, status: int, reason: str, headers: dict[str, str]) -> None:
+        super().__init__({key.lower(): value for key, value in headers.items()})
+        self["status"] = str(status)
+        self.status = status
+        self.reason = reason
+
+
+class GoogleApiSession:
+    """Sends ``googleapiclient`` requests asynchronously with pooled connections.
+
+    Parameters:
+        credentials: Service-account credentials used to mint access tokens.
+        batch_url: The API's batch endpoint.
+        timeout: Request timeout in seconds.
+        max_batch_size: Calls per batch round trip.
+    """
+
+    def __init__(
+        self,
+        credentials: Any,
+        *,
+        batch_url: str,
+        timeout: float = 60.0,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        self._credentials = credentials
+        self._batch_url = batch_url
+        self._timeout = timeout
+        self._max_batch_size = max_batch_size
+        self._token_key = (
+            "google",
+            getattr(credentials, "service_account_email", "") or "",
+            *sorted(getattr(credentials, "scopes", None) or ()),
+        )
+
+    async def execute(self, request: Any) -> Any:
+        """Send one request and return its parsed response."""
+        if getattr(request, "resumable", None) is not None:
+            return await run_blocking("google", request.execute)
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in _SKIPPED_HEADERS}
+        resp = await self._send(request.method, request.uri, content=request.body, headers=headers)
+        return request.postproc(_HttpResponse(resp.status_code, resp.reason_phrase, dict(resp.headers)), resp.content)
+
+    async def execute_batch(self, requests: Sequence[Any]) -> list[Any]:
+        """Send independent requests in as few batch round trips as possible.
+
+        Results are returned in request order.  The batch endpoint gives no
+        ordering guarantee between calls, so requests must not depend on
+        each other.  The first failed call raises after its batch completes.
+        """
+        if len(requests) == 1:
+            return [await self.execute(requests[0])]
+        results: list[Any] = []
+        for start in range(0, len(requests), self._max_batch_size):
+            results.extend(await self._send_batch(requests[start : start + self._max_batch_size]))
+        return results
+
+    async def _send_batch(self, requests: Sequence[Any]) -> list[Any]:
+        boundary = f"batch_{uuid.uuid4().hex}"
+        resp = await self._send(
+            "POST",
+            self._batch_url,
+            content=_encode_batch(requests, boundary),
+            headers={"content-type": f"multipart/mixed; boundary={boundary}"},
+        )
+        if resp.status_code >= 300:
+            raise ConnectorError(f"Google batch request failed: HTTP {resp.status_code} {resp.text[:200]}")
+        parts = _decode_batch(resp.headers.get("content-type", ""), resp.content)
+        results: list[Any] = []
+        for index, request in enumerate(requests):
+            if index not in parts:
+                raise ConnectorError(f"Google batch response is missing the reply to call {index}")
+            status, reason, headers, body = parts[index]
+            results.append(request.postproc(_HttpResponse(status, reason, headers), body))
+        return results
+
+    async def _send(self, method: str, url: str, *, content: Any, headers: dict[str, str]) -> Any:
+        """Send an authorised request, retrying once with a new token on HTTP 401."""
+        for attempt in range(2):
+            headers["authorization"] = f"Bearer {await self._token()}"
+            resp = await http_client().request(method, url, content=content, headers=headers, timeout=self._timeout)
+            if resp.status_code != 401 or attempt:
+                return resp
+            # The cached token was revoked or expired early; mint a new one.
+            token_cache.invalidate(self._token_key)
+        return resp
+
+    async def _token(self) -> str:
+        async def _fetch() -> AccessToken:
+            if not GOOGLE_AUTH_AVAILABLE:
+                raise ImportError(
+                    "google-auth-httplib2 is required. Install with: pip install firefly-dworkers[google]"
+                )
+            creds = self._credentials
+            await run_blocking("auth", creds.refresh, google_auth_httplib2.Request(httplib2.Http()))
+            if creds.expiry is not None:
+                expires_at = float(calendar.timegm(creds.expiry.utctimetuple()))
+            else:
+                expires_at = time.time() + _DEFAULT_EXPIRES_IN
+            return AccessToken(token=creds.token, expires_at=expires_at)
+
+        return await token_cache.get(self._token_key, _fetch)
+
+
+def google_api_session(credentials: Any, *, batch_url: str, timeout: float = 60.0) -> GoogleApiSession | None:
+    """Return a session for *credentials*, or ``None`` when httpx or google-auth-httplib2 is missing."""
+    if not HTTPX_AVAILABLE or not GOOGLE_AUTH_AVAILABLE:
+        return None
+    return GoogleApiSession(credentials, batch_url=batch_url, timeout=timeout)
+
+
+async def google_execute(request: Any, session: GoogleApiSession | None) -> Any:
+    """Execute *request* through *session*, or via the client library when there is none."""
+    if session is None:
+        return await run_blocking("google", request.execute)
+    return await session.execute(request)
+
+
+async def google_execute_batch(requests: Sequence[Any], session: GoogleApiSession | None) -> list[Any]:
+    """Execute independent *requests* as batches, or one by one when there is no session."""
+    if session is None:
+        return [await run_blocking("google", request.execute) for request in requests]
+    return await session.execute_batch(requests)
+
+
+# -- Batch wire format -------------------------------------------------------
+
+
+def _encode_batch(requests: Sequence[Any], boundary: str) -> bytes:
+    out = bytearray()
+    for index, request in enumerate(requests):
+        url = urlsplit(request.uri)
+        target = url.path + (f"?{url.query}" if url.query else "")
+        body = request.body.encode() if isinstance(request.body, str) else (request.body or b"")
+        lines = [f"{request.method} {target} HTTP/1.1", f"Host: {url.netloc}"]
+        lines += [f"{k}: {v}" for k, v in request.headers.items() if k.lower() not in _SKIPPED_HEADERS]
+        if body:
+            lines.append(f"Content-Length: {len(body)}")
+        out += (
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item-{index}>\r\n\r\n" + "\r\n".join(lines) + "\r\n\r\n"
+        ).encode()
+        out += body + b"\r\n"
+    out += f"--{boundary}--\r\n".encode()
+    return bytes(out)
+
+
+def _decode_batch(content_type: str, content: bytes) -> dict[int, tuple[int, str, dict[str, str], bytes]]:
+    """Parse a ``multipart/mixed`` batch reply into ``{index: (status, reason, headers, body)}``."""
+    message = BytesParser().parsebytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + content)
+    if not message.is_multipart():
+        raise ConnectorError("Google batch response is not multipart")
+    parts: dict[int, tuple[int, str, dict[str, str], bytes]] = {}
+    for part in message.get_payload():
+        content_id = (part.get("Content-ID") or "").strip("<> ")
+        _, _, index = content_id.rpartition("item-")
+        if not index.isdigit():
+            continue
+        payload: bytes = part.get_payload(decode=True) or b""
+        head, body = _split_head(payload)
+        status_line, *header_lines = head.decode("latin-1").splitlines()
+        _, status, reason = (status_line.split(" ", 2) + [""])[:3]
+        headers = dict(line.split(":", 1) for line in header_lines if ":" in line)
+        parts[int(index)] = (int(status), reason, {k.strip(): v.strip() for k, v in headers.items()}, body)
+    return parts
+
+
+def _split_head(payload: bytes) -> tuple[bytes, bytes]:
+    """Split an embedded HTTP response at the blank line ending its headers."""
+    ends = [(index, sep) for sep in (b"\r\n\r\n", b"\n\n") if (index := payload.find(sep)) >= 0]
+    if not ends:
+        return payload, b""
+    index, sep = min(ends)
+    return payload[:index], payload[index + len(sep) :]
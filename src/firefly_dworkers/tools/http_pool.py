@@ -0,0 +1,233 @@
+"""Shared HTTP connection pool for HTTP-based tools.
+
+Opening a fresh ``httpx.AsyncClient`` per call pays a TCP (and TLS)
+handshake on every request.  :func:`http_client` instead returns one
+long-lived client per event loop, so connections are kept alive and
+reused across tools and calls::
+
+    client = http_client()
+    resp = await client.get(url, timeout=self._timeout)
+
+Pool limits come from :class:`~firefly_dworkers.config.DworkersConfig`
+(``DWORKERS_HTTP_*`` env vars).  HTTP/2 is negotiated when enabled and the
+``h2`` package is installed.  The shared client never stores cookies, so a
+``Set-Cookie`` from one tool or tenant is not replayed on another's
+requests.  Call :func:`close_http_clients` on shutdown;
+the server does this from its lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.cookiejar
+import importlib.util
+import logging
+import threading
+import weakref
+from collections.abc import AsyncIterator
+from typing import Any
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_pool: HttpClientPool | None = None
+
+
+class HttpClientPool:
+    """Process-wide pool of keep-alive ``httpx.AsyncClient`` instances.
+
+    An ``AsyncClient`` is bound to the event loop it first ran on, so one
+    client is kept per running loop.
+
+    Parameters:
+        max_connections: Maximum open connections across all hosts.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        max_connections_per_host: Maximum concurrent requests per host
+            (``0`` = no per-host limit).
+        keepalive_expiry: Seconds an idle connection is kept open.
+        timeout: Default request timeout in seconds; callers usually pass
+            their own ``timeout=`` per request.
+        http2: Negotiate HTTP/2 when the ``h2`` package is installed.
+        transport: Override the underlying transport (mainly for testing).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_connections_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+        http2: bool = True,
+        transport: Any | None = None,
+    ) -> None:
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._keepalive_expiry = keepalive_expiry
+        self._timeout = timeout
+        self._http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._transport = transport
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = weakref.WeakKeyDictionary()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @property
+    def http2(self) -> bool:
+        """Whether clients negotiate HTTP/2."""
+        return self._http2
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared client for the running event loop, creating it on first use."""
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for HTTP-based tools. Install with: pip install httpx")
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._build_client()
+                self._clients[loop] = client
+                self._created += 1
+            return client
+
+    async def aclose(self) -> None:
+        """Close the client of the running loop and forget all others."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+            self._clients.clear()
+        if client is not None:
+            await client.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of open clients and pool settings."""
+        with self._lock:
+            open_clients = sum(1 for client in self._clients.values() if not client.is_closed)
+            return {
+                "clients": open_clients,
+                "created": self._created,
+                "http2": self._http2,
+                "max_connections": self._max_connections,
+                "max_connections_per_host": self._max_connections_per_host,
+            }
+
+    def _build_client(self) -> httpx.AsyncClient:
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+        )
+        if self._max_connections_per_host > 0:
+            transport = _HostLimitedTransport(transport, self._max_connections_per_host)
+        return httpx.AsyncClient(transport=transport, timeout=self._timeout, cookies=_DiscardingCookieJar())
+
+
+class _DiscardingCookieJar(http.cookiejar.CookieJar):
+    """Cookie jar that drops every cookie it is given.
+
+    The pooled client is shared by all tools and tenants; a stored cookie
+    would be sent on their later requests to the same host.
+    """
+
+    def set_cookie(self, cookie: http.cookiejar.Cookie) -> None:
+        pass
+
+
+if HTTPX_AVAILABLE:
+
+    class _HostLimitedTransport(httpx.AsyncBaseTransport):
+        """Caps concurrent requests per host; a slot is held until the response is closed."""
+
+        def __init__(self, transport: httpx.AsyncBaseTransport, limit: int) -> None:
+            self._transport = transport
+            self._limit = limit
+            self._slots: dict[tuple[str, str, int | None], asyncio.Semaphore] = {}
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            key = (request.url.scheme, request.url.host, request.url.port)
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = asyncio.Semaphore(self._limit)
+            await slot.acquire()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except BaseException:
+                slot.release()
+                raise
+            if isinstance(response.stream, httpx.ByteStream):
+                slot.release()  # body already in memory
+            else:
+                response.stream = _ReleasingStream(response.stream, slot)
+            return response
+
+        async def aclose(self) -> None:
+            await self._transport.aclose()
+
+    class _ReleasingStream(httpx.AsyncByteStream):
+        def __init__(self, stream: Any, slot: asyncio.Semaphore) -> None:
+            self._stream = stream
+            self._slot: asyncio.Semaphore | None = slot
+
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            async for chunk in self._stream:
+                yield chunk
+
+        async def aclose(self) -> None:
+            try:
+                await self._stream.aclose()
+            finally:
+                if self._slot is not None:
+                    self._slot.release()
+                    self._slot = None
+
+
+# -- Module-level accessors ------------------------------------------------
+
+
+def get_http_pool() -> HttpClientPool:
+    """Return the process-wide pool, built from :func:`~firefly_dworkers.config.get_config`."""
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                from firefly_dworkers.config import get_config
+
+                cfg = get_config()
+                _pool = HttpClientPool(
+                    max_connections=cfg.http_max_connections,
+                    max_keepalive_connections=cfg.http_max_keepalive_connections,
+                    max_connections_per_host=cfg.http_max_connections_per_host,
+                    keepalive_expiry=cfg.http_keepalive_expiry,
+                    http2=cfg.http2,
+                )
+    return _pool
+
+
+def http_client() -> httpx.AsyncClient:
+    """Return the shared ``httpx.AsyncClient`` for the running event loop.
+
+    The client must not be closed or used as a context manager by callers.
+    """
+    return get_http_pool().client()
+
+
+async def close_http_clients() -> None:
+    """Close pooled connections (call on application shutdown)."""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        await pool.aclose()
+        logger.debug("Closed shared HTTP client pool")
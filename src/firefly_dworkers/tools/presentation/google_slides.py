@@ -8,7 +8,6 @@ Install with::
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -16,6 +15,7 @@ from typing import Any
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError
+from firefly_dworkers.tools.google_api import GoogleApiSession, google_api_session, google_execute
 from firefly_dworkers.tools.presentation.base import PresentationTool
 from firefly_dworkers.tools.presentation.models import (
     PresentationData,
@@ -35,6 +35,8 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+_BATCH_URL = "https://slides.googleapis.com/batch"
+
 
 def _hex_to_rgb(hex_color: str) -> dict[str, float]:
     """Convert a hex color string (e.g. '#1A73E8') to Google API rgbColor dict."""
@@ -92,6 +94,11 @@ def _build_text_style_request(
     }
 
 
+def _slide_body_text(spec: SlideSpec) -> str:
+    """Text for the body placeholder: the content, else the bullet points."""
+    return spec.content or "\n".join(spec.bullet_points)
+
+
 @tool_registry.register("google_slides", category="presentation")
 class GoogleSlidesTool(PresentationTool):
     """Read, create, and modify Google Slides presentations via Slides API v1."""
@@ -114,7 +121,9 @@ class GoogleSlidesTool(PresentationTool):
         self._service_account_key = service_account_key
         self._credentials_json = credentials_json
         self._scopes = list(scopes)
+        self._timeout = timeout
         self._service: Any | None = None
+        self._session: GoogleApiSession | None = None
 
     def _ensure_deps(self) -> None:
         if not GOOGLE_AVAILABLE:
@@ -137,6 +146,7 @@ class GoogleSlidesTool(PresentationTool):
         else:
             raise ConnectorAuthError("GoogleSlidesTool requires service_account_key or credentials_json")
 
+        self._session = google_api_session(creds, batch_url=_BATCH_URL, timeout=self._timeout)
         self._service = _build("slides", "v1", credentials=creds)
         return self._service
 
@@ -145,7 +155,7 @@ class GoogleSlidesTool(PresentationTool):
     async def _read_presentation(self, source: str) -> PresentationData:
         """Read a Google Slides presentation by ID."""
         svc = self._get_service()
-        pres = await asyncio.to_thread(lambda: svc.presentations().get(presentationId=source).execute())
+        pres = await google_execute(svc.presentations().get(presentationId=source), self._session)
 
         slides = []
         for i, slide in enumerate(pres.get("slides", [])):
@@ -191,53 +201,39 @@ class GoogleSlidesTool(PresentationTool):
         if slides and slides[0].title:
             body["title"] = slides[0].title
 
-        pres = await asyncio.to_thread(lambda: svc.presentations().create(body=body).execute())
+        pres = await google_execute(svc.presentations().create(body=body), self._session)
         presentation_id = pres["presentationId"]
 
-        # Add slides via batch update
+        # Create, fill and style every slide in a single batchUpdate.  Object
+        # IDs are assigned up front so later requests can refer to them.
         if slides:
+            slide_ids = [f"dw_slide_{i}" for i in range(len(slides))]
             requests: list[dict[str, Any]] = []
-            for _spec in slides:
+            for spec, slide_id in zip(slides, slide_ids, strict=True):
                 requests.append(
                     {
                         "createSlide": {
+                            "objectId": slide_id,
                             "slideLayoutReference": {"predefinedLayout": "TITLE_AND_BODY"},
+                            "placeholderIdMappings": [
+                                {"layoutPlaceholder": {"type": "TITLE"}, "objectId": f"{slide_id}_title"},
+                                {"layoutPlaceholder": {"type": "BODY"}, "objectId": f"{slide_id}_body"},
+                            ],
                         }
                     }
                 )
-            result = await asyncio.to_thread(
-                lambda: (
-                    svc.presentations()
-                    .batchUpdate(
-                        presentationId=presentation_id,
-                        body={"requests": requests},
-                    )
-                    .execute()
-                )
+                if spec.title:
+                    requests.append({"insertText": {"objectId": f"{slide_id}_title", "text": spec.title}})
+                body_text = _slide_body_text(spec)
+                if body_text:
+                    requests.append({"insertText": {"objectId": f"{slide_id}_body", "text": body_text}})
+            requests.extend(self._build_slide_enhancement_requests(slides, slide_ids, pres))
+
+            await google_execute(
+                svc.presentations().batchUpdate(presentationId=presentation_id, body={"requests": requests}),
+                self._session,
             )
 
-            # Collect created slide IDs from the batch update reply
-            slide_ids = []
-            for reply in result.get("replies", []):
-                create_reply = reply.get("createSlide", {})
-                obj_id = create_reply.get("objectId", "")
-                if obj_id:
-                    slide_ids.append(obj_id)
-
-            # Build styling / image / background requests
-            style_requests = self._build_slide_enhancement_requests(slides, slide_ids, pres)
-            if style_requests:
-                await asyncio.to_thread(
-                    lambda: (
-                        svc.presentations()
-                        .batchUpdate(
-                            presentationId=presentation_id,
-                            body={"requests": style_requests},
-                        )
-                        .execute()
-                    )
-                )
-
         return presentation_id.encode("utf-8")
 
     def _build_slide_enhancement_requests(
@@ -273,8 +269,8 @@ class GoogleSlidesTool(PresentationTool):
                     }
                 )
 
-            # --- Title styling ---
-            if spec.title_style:
+            # --- Title styling (only placeholders that received text) ---
+            if spec.title_style and spec.title:
                 # Use a deterministic element ID for the title placeholder
                 title_element_id = f"{slide_id}_title"
                 req = _build_text_style_request(title_element_id, spec.title_style)
@@ -282,7 +278,7 @@ class GoogleSlidesTool(PresentationTool):
                     requests.append(req)
 
             # --- Body styling ---
-            if spec.body_style:
+            if spec.body_style and _slide_body_text(spec):
                 body_element_id = f"{slide_id}_body"
                 req = _build_text_style_request(body_element_id, spec.body_style)
                 if req:
@@ -337,9 +333,7 @@ class GoogleSlidesTool(PresentationTool):
         has_update = any(op.operation == "update_content" for op in operations)
         pres: dict[str, Any] = {}
         if has_update:
-            pres = await asyncio.to_thread(
-                lambda: svc.presentations().get(presentationId=source).execute()
-            )
+            pres = await google_execute(svc.presentations().get(presentationId=source), self._session)
 
         requests: list[dict[str, Any]] = []
         for op in operations:
@@ -357,15 +351,9 @@ class GoogleSlidesTool(PresentationTool):
                 )
 
         if requests:
-            await asyncio.to_thread(
-                lambda: (
-                    svc.presentations()
-                    .batchUpdate(
-                        presentationId=source,
-                        body={"requests": requests},
-                    )
-                    .execute()
-                )
+            await google_execute(
+                svc.presentations().batchUpdate(presentationId=source, body={"requests": requests}),
+                self._session,
             )
 
         return source.encode("utf-8")
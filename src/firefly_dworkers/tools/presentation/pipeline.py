@@ -106,7 +106,10 @@ class DesignPipelineTool(BaseTool):
             ParameterSpec(
                 name="datasets",
                 type_annotation="list",
-                description="List of dataset dicts for chart generation.",
+                description=(
+                    "List of dataset dicts for chart generation: categories/series, or columnar "
+                    "tool output as data plus optional category and series column names."
+                ),
                 required=False,
                 default=[],
             ),
@@ -300,6 +303,18 @@ class DesignPipelineTool(BaseTool):
         for ds in kwargs.get("datasets", []):
             if isinstance(ds, DataSet):
                 datasets.append(ds)
+            elif isinstance(ds, dict) and "data" in ds:
+                # Columnar tool output (result_format="columns")
+                datasets.append(
+                    DataSet.from_columns(
+                        ds.get("name", ""),
+                        ds["data"],
+                        category=ds.get("category", ""),
+                        series=ds.get("series"),
+                        description=ds.get("description", ""),
+                        suggested_chart_type=ds.get("suggested_chart_type", ""),
+                    )
+                )
             elif isinstance(ds, dict):
                 series = [
                     DataSeries(**sr) if isinstance(sr, dict) else sr
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import io
 from collections.abc import Sequence
@@ -10,6 +9,7 @@ from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.presentation.base import PresentationTool
 from firefly_dworkers.tools.presentation.models import (
     PlaceholderInfo,
@@ -109,15 +109,15 @@ class PowerPointTool(PresentationTool):
 
     async def _read_presentation(self, source: str) -> PresentationData:
         _require_pptx()
-        return await asyncio.to_thread(self._read_sync, source)
+        return await run_blocking("render", self._read_sync, source)
 
     async def _create_presentation(self, template: str, slides: list[SlideSpec]) -> bytes:
         _require_pptx()
-        return await asyncio.to_thread(self._create_sync, template, slides)
+        return await run_blocking("render", self._create_sync, template, slides)
 
     async def _modify_presentation(self, source: str, operations: list[SlideOperation]) -> bytes:
         _require_pptx()
-        return await asyncio.to_thread(self._modify_sync, source, operations)
+        return await run_blocking("render", self._modify_sync, source, operations)
 
     # -- Sync implementations --
 
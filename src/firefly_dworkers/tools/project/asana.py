@@ -14,19 +14,12 @@ from typing import Any
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
 from firefly_dworkers.tools.project.base import ProjectManagementTool, ProjectTask
 from firefly_dworkers.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
 
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    httpx = None  # type: ignore[assignment]
-    HTTPX_AVAILABLE = False
-
 _ASANA_BASE = "https://app.asana.com/api/1.0"
 
 
@@ -73,40 +66,43 @@ class AsanaTool(ProjectManagementTool):
 
     async def _api_get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         self._ensure_deps()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.get(
-                f"{_ASANA_BASE}{path}",
-                headers=self._headers(),
-                params=params or {},
-            )
-            if resp.status_code == 401:
-                raise ConnectorAuthError("Asana token invalid or expired")
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        resp = await client.get(
+            f"{_ASANA_BASE}{path}",
+            headers=self._headers(),
+            params=params or {},
+            timeout=self._timeout,
+        )
+        if resp.status_code == 401:
+            raise ConnectorAuthError("Asana token invalid or expired")
+        resp.raise_for_status()
+        return resp.json()
 
     async def _api_post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
         self._ensure_deps()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(
-                f"{_ASANA_BASE}{path}",
-                headers={**self._headers(), "Content-Type": "application/json"},
-                json={"data": body},
-            )
-            if resp.status_code == 401:
-                raise ConnectorAuthError("Asana token invalid or expired")
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        resp = await client.post(
+            f"{_ASANA_BASE}{path}",
+            headers={**self._headers(), "Content-Type": "application/json"},
+            json={"data": body},
+            timeout=self._timeout,
+        )
+        if resp.status_code == 401:
+            raise ConnectorAuthError("Asana token invalid or expired")
+        resp.raise_for_status()
+        return resp.json()
 
     async def _api_put(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
         self._ensure_deps()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.put(
-                f"{_ASANA_BASE}{path}",
-                headers={**self._headers(), "Content-Type": "application/json"},
-                json={"data": body},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        resp = await client.put(
+            f"{_ASANA_BASE}{path}",
+            headers={**self._headers(), "Content-Type": "application/json"},
+            json={"data": body},
+            timeout=self._timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     def _to_task(self, data: dict[str, Any]) -> ProjectTask:
         return ProjectTask(
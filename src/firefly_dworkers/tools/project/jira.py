@@ -7,7 +7,6 @@ Uses the ``atlassian-python-api`` library.  Install with::
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -15,6 +14,7 @@ from typing import Any
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.project.base import ProjectManagementTool, ProjectTask
 from firefly_dworkers.tools.registry import tool_registry
 
@@ -115,9 +115,9 @@ class JiraTool(ProjectManagementTool):
             "description": description,
             "issuetype": {"name": "Task"},
         }
-        result = await asyncio.to_thread(client.create_issue, fields=fields)
+        result = await run_blocking("jira", client.create_issue, fields=fields)
         issue_key = result.get("key", "") if isinstance(result, dict) else str(result)
-        issue = await asyncio.to_thread(client.issue, issue_key)
+        issue = await run_blocking("jira", client.issue, issue_key)
         return self._issue_to_task(issue)
 
     async def _list_tasks(self, project: str) -> list[ProjectTask]:
@@ -125,7 +125,7 @@ class JiraTool(ProjectManagementTool):
         project_key = project or self._project_key
         jql = f"project = {project_key} ORDER BY updated DESC" if project_key else "ORDER BY updated DESC"
 
-        results = await asyncio.to_thread(client.jql, jql, limit=50)
+        results = await run_blocking("jira", client.jql, jql, limit=50)
         return [self._issue_to_task(issue) for issue in results.get("issues", [])]
 
     async def _update_task(self, task_id: str, status: str) -> ProjectTask:
@@ -135,7 +135,7 @@ class JiraTool(ProjectManagementTool):
 
         if status:
             # Get available transitions
-            transitions = await asyncio.to_thread(client.get_issue_transitions, task_id)
+            transitions = await run_blocking("jira", client.get_issue_transitions, task_id)
             target = None
             for t in transitions:
                 if (
@@ -145,11 +145,11 @@ class JiraTool(ProjectManagementTool):
                     target = t["id"]
                     break
             if target:
-                await asyncio.to_thread(client.set_issue_status, task_id, status)
+                await run_blocking("jira", client.set_issue_status, task_id, status)
             else:
                 logger.warning("Transition to '%s' not found for %s", status, task_id)
 
-        issue = await asyncio.to_thread(client.issue, task_id)
+        issue = await run_blocking("jira", client.issue, task_id)
         return self._issue_to_task(issue)
 
     async def _get_task(self, task_id: str) -> ProjectTask:
@@ -157,5 +157,5 @@ class JiraTool(ProjectManagementTool):
         if not task_id:
             raise ConnectorError("JiraTool get_task requires task_id")
 
-        issue = await asyncio.to_thread(client.issue, task_id)
+        issue = await run_blocking("jira", client.issue, task_id)
         return self._issue_to_task(issue)
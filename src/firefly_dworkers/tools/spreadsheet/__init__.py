@@ -9,6 +9,7 @@ from firefly_dworkers.tools.spreadsheet.models import (
     CellData,
     CellSpec,
     SheetData,
+    SheetInfo,
     SheetSpec,
     SpreadsheetOperation,
     WorkbookData,
@@ -21,6 +22,7 @@ __all__ = [
     "ExcelTool",
     "GoogleSheetsTool",
     "SheetData",
+    "SheetInfo",
     "SheetSpec",
     "SpreadsheetOperation",
     "SpreadsheetPipelineTool",
@@ -32,7 +32,7 @@ class SpreadsheetPort(BaseTool):
             ParameterSpec(
                 name="action",
                 type_annotation="str",
-                description="Action: read, create, or modify.",
+                description="Action: read, create, or modify (Excel also supports index).",
                 required=True,
             ),
             ParameterSpec(
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
 import io
 import logging
 from collections.abc import Sequence
+from copy import copy
 from typing import Any
 
-from fireflyframework_genai.tools.base import GuardProtocol
+from fireflyframework_genai.tools.base import GuardProtocol, ParameterSpec
 
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
+from firefly_dworkers.tools.spreadsheet import xlsx_reader
 from firefly_dworkers.tools.spreadsheet.base import SpreadsheetPort
 from firefly_dworkers.tools.spreadsheet.models import (
     SheetData,
+    SheetInfo,
     SheetSpec,
     SpreadsheetOperation,
     WorkbookData,
@@ -36,32 +39,124 @@ def _require_openpyxl() -> None:
 
 @tool_registry.register("excel", category="spreadsheet")
 class ExcelTool(SpreadsheetPort):
-    """Read, create, and modify Excel (.xlsx) workbooks using openpyxl."""
+    """Read, create, and modify Excel (.xlsx) workbooks using openpyxl.
+
+    Large workbooks can be read a slice at a time: ``read`` accepts a
+    ``cell_range`` (``A1:F5000``), a ``columns`` projection and
+    ``page_size``/``cursor`` pagination, and the ``index`` action lists
+    every sheet's size and header row (see
+    :mod:`~firefly_dworkers.tools.spreadsheet.xlsx_reader`).
+
+    ``create`` streams workbooks with a sheet of *write_only_rows* or more
+    rows through openpyxl's write-only mode, styling cells with shared
+    named styles as they are written (``0`` disables the fast path).
+    """
 
     def __init__(
         self,
         *,
         timeout: float = 60.0,
         guards: Sequence[GuardProtocol] = (),
+        write_only_rows: int = 5_000,
     ) -> None:
+        self._write_only_rows = write_only_rows
         super().__init__(
             "excel",
             description="Read, create, and modify Excel (.xlsx) workbooks.",
             timeout=timeout,
             guards=guards,
+            extra_parameters=[
+                ParameterSpec(
+                    name="cell_range",
+                    type_annotation="str",
+                    description="A1 range to read, e.g. 'A1:F5000', 'B:D' or '10:500'.",
+                    required=False,
+                    default="",
+                ),
+                ParameterSpec(
+                    name="columns",
+                    type_annotation="list",
+                    description="Columns to return, as header names or letters.",
+                    required=False,
+                    default=[],
+                ),
+                ParameterSpec(
+                    name="page_size",
+                    type_annotation="int",
+                    description="Maximum rows per read (0 = all).",
+                    required=False,
+                    default=0,
+                ),
+                ParameterSpec(
+                    name="cursor",
+                    type_annotation="str",
+                    description="next_cursor from the previous page.",
+                    required=False,
+                    default="",
+                ),
+            ],
+        )
+
+    async def _execute(self, **kwargs: Any) -> dict[str, Any]:
+        action = kwargs.get("action", "read")
+        if action == "index":
+            return {"sheets": [info.model_dump() for info in await self.sheet_index(kwargs["source"])]}
+        if action == "read" and any(kwargs.get(k) for k in ("cell_range", "columns", "page_size", "cursor")):
+            sheet = await self.read_range(
+                kwargs["source"],
+                sheet_name=kwargs.get("sheet_name", ""),
+                cell_range=kwargs.get("cell_range", ""),
+                columns=kwargs.get("columns") or (),
+                page_size=kwargs.get("page_size", 0),
+                cursor=kwargs.get("cursor", ""),
+            )
+            self._last_artifact = None
+            return WorkbookData(sheets=[sheet], active_sheet=sheet.name).model_dump()
+        return await super()._execute(**kwargs)
+
+    async def sheet_index(self, source: str) -> list[SheetInfo]:
+        """Return the name, size and header row of every sheet (cached per file version)."""
+        _require_openpyxl()
+        return await run_blocking("render", xlsx_reader.sheet_index, source)
+
+    async def read_range(
+        self,
+        source: str,
+        *,
+        sheet_name: str = "",
+        cell_range: str = "",
+        columns: Sequence[str] = (),
+        page_size: int = 0,
+        cursor: str = "",
+    ) -> SheetData:
+        """Read a range, column projection or page of one sheet.
+
+        Pass the returned ``next_cursor`` back as *cursor* to read the next
+        page; sequential pages continue where the previous one stopped.
+        """
+        _require_openpyxl()
+        return await run_blocking(
+            "render",
+            xlsx_reader.read_rows,
+            source,
+            sheet_name=sheet_name,
+            cell_range=cell_range,
+            columns=columns,
+            page_size=page_size,
+            cursor=cursor,
         )
 
     async def _read_spreadsheet(self, source: str, sheet_name: str = "") -> WorkbookData:
         _require_openpyxl()
-        return await asyncio.to_thread(self._read_sync, source, sheet_name)
+        return await run_blocking("render", self._read_sync, source, sheet_name)
 
     async def _create_spreadsheet(self, sheets: list[SheetSpec]) -> bytes:
         _require_openpyxl()
-        return await asyncio.to_thread(self._create_sync, sheets)
+        return await run_blocking("render", self._create_sync, sheets)
 
     async def _modify_spreadsheet(self, source: str, operations: list[SpreadsheetOperation]) -> bytes:
         _require_openpyxl()
-        return await asyncio.to_thread(self._modify_sync, source, operations)
+        return await run_blocking("render", self._modify_sync, source, operations)
 
     # -- synchronous helpers ---------------------------------------------------
 
@@ -99,6 +194,9 @@ class ExcelTool(SpreadsheetPort):
         )
 
     def _create_sync(self, sheets: list[SheetSpec]) -> bytes:
+        if self._use_write_only(sheets):
+            return self._create_write_only_sync(sheets)
+
         from openpyxl.styles import Alignment, Font, PatternFill
         from openpyxl.utils import get_column_letter
 
@@ -189,6 +287,132 @@ class ExcelTool(SpreadsheetPort):
         wb.save(buf)
         return buf.getvalue()
 
+    def _use_write_only(self, sheets: list[SheetSpec]) -> bool:
+        # Charts write their data table with random cell access, which
+        # write-only worksheets do not allow.
+        if not self._write_only_rows or any(spec.chart for spec in sheets):
+            return False
+        return any(len(spec.rows) >= self._write_only_rows for spec in sheets)
+
+    def _create_write_only_sync(self, sheets: list[SheetSpec]) -> bytes:
+        """Build the workbook in write-only mode, one row at a time.
+
+        Produces the same cells, styles and number formats as the regular
+        path.  Each distinct (style, number format) pair becomes one named
+        style that cells reference, instead of per-cell font and format
+        objects applied after the fact.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+        from openpyxl.styles.fonts import DEFAULT_FONT
+        from openpyxl.utils import column_index_from_string, get_column_letter
+
+        wb = openpyxl.Workbook(write_only=True)
+        named_styles: dict[tuple[str, str], Any] = {}
+
+        def named_style(style: Any, number_format: str = "General") -> Any:
+            """Return the style array of the named style for *style* + *number_format*."""
+            if style is None and number_format == "General":
+                return None
+            key = (style.model_dump_json() if style is not None else "", number_format)
+            if key not in named_styles:
+                named = NamedStyle(name=f"dworkers_{len(named_styles)}", number_format=number_format, font=DEFAULT_FONT)
+                if style is not None:
+                    font, fill, alignment = self._make_openpyxl_style(style, Font, PatternFill, Alignment)
+                    if font:
+                        named.font = font
+                    if fill:
+                        named.fill = fill
+                    if alignment:
+                        named.alignment = alignment
+                wb.add_named_style(named)
+                # Cells copy this style array, as ``cell.style = name`` would,
+                # without looking the name up for every cell.
+                named_styles[key] = named.as_tuple()
+            return named_styles[key]
+
+        def make_cell(ws: Any, value: Any, style: Any, cell_spec: Any = None) -> Any:
+            if cell_spec is not None:
+                if cell_spec.formula:
+                    value = cell_spec.formula
+                elif cell_spec.value is not None:
+                    value = cell_spec.value
+            cell = WriteOnlyCell(ws, value)
+            if style is not None:
+                cell._style = copy(style)
+            if cell_spec is not None:
+                if cell_spec.number_format:
+                    cell.number_format = cell_spec.number_format
+                if cell_spec.style:
+                    font, fill, alignment = self._make_openpyxl_style(cell_spec.style, Font, PatternFill, Alignment)
+                    if font:
+                        cell.font = font
+                    if fill:
+                        cell.fill = fill
+                    if alignment:
+                        cell.alignment = alignment
+            return cell
+
+        for spec in sheets:
+            ws = wb.create_sheet(title=spec.name)
+            for i, width in enumerate(spec.column_widths):
+                ws.column_dimensions[get_column_letter(i + 1)].width = width
+
+            cell_specs: dict[int, dict[int, Any]] = {}
+            for cell_spec in spec.cells:
+                cell_specs.setdefault(cell_spec.row, {})[cell_spec.col] = cell_spec
+
+            # Style per data column, shared by every data row.
+            styled_width = max((len(r) for r in spec.rows), default=0) if spec.cell_style else 0
+            formats = {column_index_from_string(col): fmt for col, fmt in spec.number_formats.items()}
+            data_styles = [
+                named_style(spec.cell_style if col <= styled_width else None, formats.get(col, "General"))
+                for col in range(1, max(styled_width, max(formats, default=0)) + 1)
+            ]
+
+            styled_cells = [make_cell(ws, None, style) if style is not None else None for style in data_styles]
+
+            rows: list[tuple[list[Any], list[Any]]] = []
+            if spec.headers:
+                header = named_style(spec.header_style) if spec.header_style else None
+                rows.append((list(spec.headers), [header] * len(spec.headers)))
+            rows.extend((row, data_styles) for row in spec.rows)
+            last_row = max(len(rows), max(cell_specs, default=0))
+
+            for row_idx in range(1, last_row + 1):
+                values, styles = rows[row_idx - 1] if row_idx <= len(rows) else ([], [])
+                overrides = cell_specs.get(row_idx, {})
+                if not overrides and all(style is None for style in styles):
+                    ws.append(values)
+                    continue
+                if not overrides and styles is data_styles:
+                    # Plain data row: refill one styled cell per column; append()
+                    # serialises the row immediately, so the cells can be reused.
+                    row = list(values)
+                    row.extend([None] * (len(styled_cells) - len(row)))
+                    for col, cell in enumerate(styled_cells):
+                        if cell is not None:
+                            cell.value = row[col]
+                            row[col] = cell
+                    ws.append(row)
+                    continue
+                width = max(len(values), len(styles), max(overrides, default=0))
+                ws.append(
+                    [
+                        make_cell(
+                            ws,
+                            values[col - 1] if col <= len(values) else None,
+                            styles[col - 1] if col <= len(styles) else None,
+                            overrides.get(col),
+                        )
+                        for col in range(1, width + 1)
+                    ]
+                )
+
+        buf = io.BytesIO()
+        wb.save(buf)
+        return buf.getvalue()
+
     # -- Static helper methods -------------------------------------------------
 
     @staticmethod
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -10,6 +9,12 @@ from typing import Any
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError
+from firefly_dworkers.tools.google_api import (
+    GoogleApiSession,
+    google_api_session,
+    google_execute,
+    google_execute_batch,
+)
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.spreadsheet.base import SpreadsheetPort
 from firefly_dworkers.tools.spreadsheet.models import (
@@ -29,6 +34,8 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+_BATCH_URL = "https://sheets.googleapis.com/batch"
+
 
 def _hex_to_rgb_sheets(hex_color: str) -> dict[str, float]:
     """Convert a hex color string (e.g. '#1A73E8') to Google Sheets API color dict."""
@@ -188,7 +195,9 @@ class GoogleSheetsTool(SpreadsheetPort):
         self._service_account_key = service_account_key
         self._credentials_json = credentials_json
         self._scopes = list(scopes)
+        self._timeout = timeout
         self._service: Any | None = None
+        self._session: GoogleApiSession | None = None
 
     def _ensure_deps(self) -> None:
         if not GOOGLE_AVAILABLE:
@@ -211,6 +220,7 @@ class GoogleSheetsTool(SpreadsheetPort):
         else:
             raise ConnectorAuthError("GoogleSheetsTool requires service_account_key or credentials_json")
 
+        self._session = google_api_session(creds, batch_url=_BATCH_URL, timeout=self._timeout)
         self._service = _build("sheets", "v4", credentials=creds)
         return self._service
 
@@ -219,14 +229,14 @@ class GoogleSheetsTool(SpreadsheetPort):
     async def _read_spreadsheet(self, source: str, sheet_name: str = "") -> WorkbookData:
         svc = self._get_service()
         # Get spreadsheet metadata
-        meta = await asyncio.to_thread(lambda: svc.spreadsheets().get(spreadsheetId=source).execute())
+        meta = await google_execute(svc.spreadsheets().get(spreadsheetId=source), self._session)
 
         sheet_titles = [s["properties"]["title"] for s in meta.get("sheets", [])]
         target = sheet_name if sheet_name in sheet_titles else (sheet_titles[0] if sheet_titles else "Sheet1")
 
         # Get values from target sheet
-        result = await asyncio.to_thread(
-            lambda: svc.spreadsheets().values().get(spreadsheetId=source, range=target).execute()
+        result = await google_execute(
+            svc.spreadsheets().values().get(spreadsheetId=source, range=target), self._session
         )
 
         values = result.get("values", [])
@@ -253,7 +263,7 @@ class GoogleSheetsTool(SpreadsheetPort):
             "sheets": ([{"properties": {"title": spec.name}} for spec in sheets] if sheets else []),
         }
 
-        result = await asyncio.to_thread(lambda: svc.spreadsheets().create(body=body).execute())
+        result = await google_execute(svc.spreadsheets().create(body=body), self._session)
         spreadsheet_id = result["spreadsheetId"]
 
         # Resolve sheet IDs from the create response
@@ -262,26 +272,22 @@ class GoogleSheetsTool(SpreadsheetPort):
             props = sheet_meta.get("properties", {})
             sheet_id_map[props.get("title", "")] = props.get("sheetId", 0)
 
-        # Write data to sheets
+        # Write data to all sheets in one values.batchUpdate call
+        data: list[dict[str, Any]] = []
         for spec in sheets:
             if spec.headers or spec.rows:
                 values: list[list[Any]] = []
                 if spec.headers:
                     values.append(spec.headers)
                 values.extend(spec.rows)
-                await asyncio.to_thread(
-                    lambda _n=spec.name, _v=values: (
-                        svc.spreadsheets()
-                        .values()
-                        .update(
-                            spreadsheetId=spreadsheet_id,
-                            range=f"{_n}!A1",
-                            valueInputOption="RAW",
-                            body={"values": _v},
-                        )
-                        .execute()
-                    )
-                )
+                data.append({"range": f"{spec.name}!A1", "values": values})
+        if data:
+            await google_execute(
+                svc.spreadsheets()
+                .values()
+                .batchUpdate(spreadsheetId=spreadsheet_id, body={"valueInputOption": "RAW", "data": data}),
+                self._session,
+            )
 
         # Build formatting requests for all sheets
         format_requests: list[dict[str, Any]] = []
@@ -313,15 +319,9 @@ class GoogleSheetsTool(SpreadsheetPort):
                 )
 
         if format_requests:
-            await asyncio.to_thread(
-                lambda: (
-                    svc.spreadsheets()
-                    .batchUpdate(
-                        spreadsheetId=spreadsheet_id,
-                        body={"requests": format_requests},
-                    )
-                    .execute()
-                )
+            await google_execute(
+                svc.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": format_requests}),
+                self._session,
             )
 
         return spreadsheet_id.encode("utf-8")
@@ -329,34 +329,33 @@ class GoogleSheetsTool(SpreadsheetPort):
     async def _modify_spreadsheet(self, source: str, operations: list[SpreadsheetOperation]) -> bytes:
         svc = self._get_service()
 
+        # Coalesce operations: all new sheets in one batchUpdate, then one
+        # append per sheet (rows kept in operation order), sent as a batch.
+        add_sheet_requests: list[dict[str, Any]] = []
+        rows_by_sheet: dict[str, list[Any]] = {}
         for op in operations:
             if op.operation == "add_rows" and op.sheet_name:
                 rows = op.data.get("rows", [])
                 if rows:
-                    await asyncio.to_thread(
-                        lambda _sn=op.sheet_name, _r=rows: (
-                            svc.spreadsheets()
-                            .values()
-                            .append(
-                                spreadsheetId=source,
-                                range=f"{_sn}!A1",
-                                valueInputOption="RAW",
-                                body={"values": _r},
-                            )
-                            .execute()
-                        )
-                    )
+                    rows_by_sheet.setdefault(op.sheet_name, []).extend(rows)
             elif op.operation == "add_sheet":
                 sheet_title = op.data.get("name", "New Sheet")
-                await asyncio.to_thread(
-                    lambda _t=sheet_title: (
-                        svc.spreadsheets()
-                        .batchUpdate(
-                            spreadsheetId=source,
-                            body={"requests": [{"addSheet": {"properties": {"title": _t}}}]},
-                        )
-                        .execute()
-                    )
-                )
+                add_sheet_requests.append({"addSheet": {"properties": {"title": sheet_title}}})
+
+        if add_sheet_requests:
+            await google_execute(
+                svc.spreadsheets().batchUpdate(spreadsheetId=source, body={"requests": add_sheet_requests}),
+                self._session,
+            )
+        if rows_by_sheet:
+            await google_execute_batch(
+                [
+                    svc.spreadsheets()
+                    .values()
+                    .append(spreadsheetId=source, range=f"{name}!A1", valueInputOption="RAW", body={"values": rows})
+                    for name, rows in rows_by_sheet.items()
+                ],
+                self._session,
+            )
 
         return source.encode("utf-8")
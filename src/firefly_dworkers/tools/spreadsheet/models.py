@@ -27,6 +27,19 @@ class SheetData(BaseModel):
     rows: list[list[Any]] = Field(default_factory=list)
     row_count: int = 0
     col_count: int = 0
+    cell_range: str = ""  # A1 range the rows came from (range reads only)
+    next_cursor: str = ""  # Pass back as ``cursor`` to read the next page
+
+
+class SheetInfo(BaseModel):
+    """Index entry for one sheet: size and header row."""
+
+    name: str
+    dimensions: str = ""  # e.g. "A1:F5000"; empty when the file does not record it
+    max_row: int = 0
+    max_column: int = 0
+    headers: list[str] = Field(default_factory=list)
+    active: bool = False  # the sheet selected when the workbook was saved
 
 
 class WorkbookData(BaseModel):
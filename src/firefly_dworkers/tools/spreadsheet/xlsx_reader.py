@@ -0,0 +1,239 @@
+"""Range-addressed, paginated reads of large ``.xlsx`` workbooks.
+
+Reading a whole sheet into memory to return a few hundred rows does not
+scale to large workbooks.  This module keeps two caches, both keyed by the
+file's path, size and modification time so an edited file is never served
+stale:
+
+* a **sheet index** -- name, dimensions, header row and active flag of
+  every sheet --
+  built once per file version by :func:`sheet_index`;
+* **row cursors** -- open read-only worksheets positioned where the last
+  page ended.  openpyxl streams sheet XML and cannot seek to a row, so
+  :func:`read_rows` continues a parked cursor when asked for the next
+  page instead of re-parsing the sheet from the top.  Sequential paging
+  is therefore O(page); jumping to an arbitrary row costs one scan.
+
+Both :class:`~firefly_dworkers.tools.spreadsheet.excel.ExcelTool` and
+:class:`~firefly_dworkers.tools.data.csv_excel.SpreadsheetTool` read
+through here.  All functions are blocking; call them on a worker thread.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from firefly_dworkers.tools.spreadsheet.models import SheetData, SheetInfo
+
+try:
+    import openpyxl
+    from openpyxl.utils.cell import column_index_from_string, get_column_letter, range_boundaries
+
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    openpyxl = None  # type: ignore[assignment]
+    OPENPYXL_AVAILABLE = False
+
+_MAX_INDEXES = 32
+_MAX_CURSORS = 8
+
+_FileKey = tuple[str, int, int]
+
+
+@dataclass
+class _Cursor:
+    """A worksheet row iterator parked at ``next_row``."""
+
+    workbook: Any
+    rows: Iterator[tuple[Any, ...]]
+    next_row: int
+
+
+_lock = threading.Lock()
+_indexes: OrderedDict[_FileKey, list[SheetInfo]] = OrderedDict()
+_cursors: OrderedDict[tuple[Any, ...], _Cursor] = OrderedDict()
+
+
+def sheet_index(path: str) -> list[SheetInfo]:
+    """Return the cached index of every sheet in the workbook at *path*."""
+    _require_openpyxl()
+    key = _file_key(path)
+    with _lock:
+        cached = _indexes.get(key)
+        if cached is not None:
+            _indexes.move_to_end(key)
+            return cached
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        active = getattr(wb.active, "title", None)
+        index = [_sheet_info(ws, active=ws.title == active) for ws in wb.worksheets]
+    finally:
+        wb.close()
+    with _lock:
+        _indexes[key] = index
+        while len(_indexes) > _MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def read_rows(
+    path: str,
+    *,
+    sheet_name: str = "",
+    cell_range: str = "",
+    columns: Sequence[str] = (),
+    page_size: int = 0,
+    cursor: str = "",
+) -> SheetData:
+    """Read data rows from one sheet of the workbook at *path*.
+
+    Parameters:
+        path: Path to the ``.xlsx`` file.
+        sheet_name: Sheet to read (defaults to the workbook's active
+            sheet, or the first sheet when none is marked active).
+        cell_range: A1-style range such as ``A1:F5000``, ``B:D`` or
+            ``10:500``.  Headers always come from the sheet's first row,
+            which is never returned as data.
+        columns: Column projection -- header names or column letters.
+        page_size: Maximum rows to return (``0`` = the whole range).
+        cursor: ``next_cursor`` of the previous page.
+
+    Returns:
+        The selected rows; ``next_cursor`` is set when more rows remain.
+    """
+    _require_openpyxl()
+    file_key = _file_key(path)
+    index = sheet_index(path)
+    if not index:
+        raise ValueError(f"Workbook has no sheets: {path}")
+    if sheet_name:
+        info = next((s for s in index if s.name == sheet_name), None)
+    else:
+        info = next((s for s in index if s.active), index[0])
+    if info is None:
+        raise ValueError(f"Sheet '{sheet_name}' not found; available: {', '.join(s.name for s in index)}")
+
+    min_col, min_row, max_col, max_row = range_boundaries(cell_range) if cell_range else (None, None, None, None)
+    min_col = min_col or 1
+    max_col = max_col or max(info.max_column, 1)
+    if info.max_row:
+        max_row = min(max_row, info.max_row) if max_row else info.max_row
+    selected = _project(info.headers, min_col, max_col, columns)
+    if cursor and not cursor.isdigit():
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    start = int(cursor) if cursor else max(min_row or 2, 2)
+
+    key = (*file_key, info.name, min_col, max_col, max_row)
+    parked = _take_cursor((*key, start))
+    if parked is None:
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        ws = wb[info.name]
+        parked = _Cursor(
+            wb, ws.iter_rows(min_row=start, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True), start
+        )
+
+    out: list[list[Any]] = []
+    for row in parked.rows:
+        parked.next_row += 1
+        out.append([row[i] if i < len(row) else None for i in selected])
+        if page_size and len(out) >= page_size:
+            break
+    exhausted = not page_size or len(out) < page_size or (max_row is not None and parked.next_row > max_row)
+    if exhausted:
+        parked.workbook.close()
+    else:
+        _park_cursor((*key, parked.next_row), parked)
+
+    first = get_column_letter(min_col)
+    last = get_column_letter(max_col)
+    return SheetData(
+        name=info.name,
+        headers=[_header(info.headers, min_col + i) for i in selected],
+        rows=out,
+        row_count=len(out),
+        col_count=len(selected),
+        cell_range=f"{first}{start}:{last}{parked.next_row - 1}" if out else "",
+        next_cursor="" if exhausted else str(parked.next_row),
+    )
+
+
+def clear_cache() -> None:
+    """Drop cached sheet indexes and close parked cursors."""
+    with _lock:
+        _indexes.clear()
+        cursors = list(_cursors.values())
+        _cursors.clear()
+    for parked in cursors:
+        parked.workbook.close()
+
+
+# -- Internals -----------------------------------------------------------------
+
+
+def _require_openpyxl() -> None:
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl required: pip install firefly-dworkers[data]")
+
+
+def _file_key(path: str) -> _FileKey:
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _sheet_info(ws: Any, *, active: bool) -> SheetInfo:
+    # Read-only sheets report the size stored in the file; it may be absent.
+    header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    headers = [str(c) if c is not None else f"col_{j}" for j, c in enumerate(header_row)]
+    max_row = ws.max_row or 0
+    max_column = max(ws.max_column or 0, len(headers))
+    dimensions = f"A1:{get_column_letter(max_column)}{max_row}" if max_row and max_column else ""
+    return SheetInfo(
+        name=ws.title,
+        dimensions=dimensions,
+        max_row=max_row,
+        max_column=max_column,
+        headers=headers,
+        active=active,
+    )
+
+
+def _project(headers: list[str], min_col: int, max_col: int, columns: Sequence[str]) -> list[int]:
+    """Return offsets (relative to *min_col*) of the projected columns."""
+    if not columns:
+        return list(range(max_col - min_col + 1))
+    offsets: list[int] = []
+    for column in columns:
+        if column in headers:
+            index = headers.index(column) + 1
+        elif column.isalpha():
+            index = column_index_from_string(column.upper())
+        else:
+            raise ValueError(f"Unknown column '{column}'; expected a header name or column letter")
+        if not min_col <= index <= max_col:
+            raise ValueError(f"Column '{column}' is outside the requested range")
+        offsets.append(index - min_col)
+    return offsets
+
+
+def _header(headers: list[str], index: int) -> str:
+    return headers[index - 1] if index - 1 < len(headers) else f"col_{index - 1}"
+
+
+def _take_cursor(key: tuple[Any, ...]) -> _Cursor | None:
+    with _lock:
+        return _cursors.pop(key, None)
+
+
+def _park_cursor(key: tuple[Any, ...], parked: _Cursor) -> None:
+    with _lock:
+        evicted = [_cursors.pop(key)] if key in _cursors else []
+        _cursors[key] = parked
+        while len(_cursors) > _MAX_CURSORS:
+            evicted.append(_cursors.popitem(last=False)[1])
+    for old in evicted:
+        old.workbook.close()
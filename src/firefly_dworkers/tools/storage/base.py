@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
 from typing import Any
 
 from fireflyframework_genai.tools.base import BaseTool, GuardProtocol, ParameterSpec
@@ -29,6 +30,11 @@ class DocumentStorageTool(BaseTool):
     Subclasses must implement :meth:`_search`, :meth:`_read`, :meth:`_list`,
     and :meth:`_write` to provide access to a specific storage provider
     (e.g. SharePoint, Google Drive, Confluence).
+
+    The ``search`` and ``list`` actions return a single page of results.
+    :meth:`iter_search` and :meth:`iter_list` stream every result, page by
+    page, for bulk operations; providers that paginate override
+    :meth:`_search_pages` and :meth:`_list_pages`.
     """
 
     def __init__(self, name: str, *, description: str = "", guards: Sequence[GuardProtocol] = ()):
@@ -91,6 +97,51 @@ class DocumentStorageTool(BaseTool):
             return result.model_dump()
         raise ValueError(f"Unknown action '{action}'; expected search, read, list, or write")
 
+    # -- Streaming API --------------------------------------------------------
+
+    async def iter_search(self, query: str, *, limit: int | None = None) -> AsyncIterator[DocumentResult]:
+        """Yield all documents matching *query*, fetching further pages on demand."""
+        async for result in self._iter_pages(self._search_pages(query), limit):
+            yield result
+
+    async def iter_list(self, path: str = "", *, limit: int | None = None) -> AsyncIterator[DocumentResult]:
+        """Yield all documents under *path*, fetching further pages on demand."""
+        async for result in self._iter_pages(self._list_pages(path), limit):
+            yield result
+
+    async def _search_pages(self, query: str) -> AsyncIterator[list[DocumentResult]]:
+        """Yield pages of search results (default: the single :meth:`_search` page)."""
+        yield await self._search(query)
+
+    async def _list_pages(self, path: str) -> AsyncIterator[list[DocumentResult]]:
+        """Yield pages of listing results (default: the single :meth:`_list` page)."""
+        yield await self._list(path)
+
+    @staticmethod
+    async def _first_page(pages: AsyncIterator[list[DocumentResult]]) -> list[DocumentResult]:
+        async with aclosing(pages):
+            async for page in pages:
+                return page
+        return []
+
+    @staticmethod
+    async def _iter_pages(
+        pages: AsyncIterator[list[DocumentResult]], limit: int | None
+    ) -> AsyncIterator[DocumentResult]:
+        remaining = limit
+        async with aclosing(pages):
+            if remaining is not None and remaining <= 0:
+                return
+            async for page in pages:
+                for result in page:
+                    yield result
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+
+    # -- Provider hooks -------------------------------------------------------
+
     @abstractmethod
     async def _search(self, query: str) -> list[DocumentResult]: ...
 
@@ -7,14 +7,14 @@ This adapter uses the ``atlassian-python-api`` library.  Install with::
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.storage.base import DocumentResult, DocumentStorageTool
 
@@ -94,29 +94,39 @@ class ConfluenceTool(DocumentStorageTool):
     # -- port implementation -------------------------------------------------
 
     async def _search(self, query: str) -> list[DocumentResult]:
+        return await self._first_page(self._search_pages(query))
+
+    async def _search_pages(self, query: str) -> AsyncIterator[list[DocumentResult]]:
         client = self._get_client()
         cql = f'text ~ "{query}"'
         if self._space_key:
             cql += f' AND space = "{self._space_key}"'
 
-        results_data = await asyncio.to_thread(client.cql, cql, limit=50)
-        pages = results_data.get("results", [])
-        return [
-            DocumentResult(
-                id=str(page.get("content", {}).get("id", page.get("id", ""))),
-                name=page.get("content", {}).get("title", page.get("title", "")),
-                path=page.get("content", {}).get("_links", {}).get("webui", ""),
-                url=f"{self._base_url}{page.get('content', {}).get('_links', {}).get('webui', '')}",
-            )
-            for page in pages
-        ]
+        start, limit = 0, 50
+        while True:
+            results_data = await run_blocking("confluence", client.cql, cql, start=start, limit=limit)
+            pages = results_data.get("results", [])
+            yield [
+                DocumentResult(
+                    id=str(page.get("content", {}).get("id", page.get("id", ""))),
+                    name=page.get("content", {}).get("title", page.get("title", "")),
+                    path=page.get("content", {}).get("_links", {}).get("webui", ""),
+                    url=f"{self._base_url}{page.get('content', {}).get('_links', {}).get('webui', '')}",
+                )
+                for page in pages
+            ]
+            # A short page means the last page was reached.
+            if len(pages) < limit:
+                return
+            start += len(pages)
 
     async def _read(self, resource_id: str, path: str) -> DocumentResult:
         client = self._get_client()
         if not resource_id:
             raise ConnectorError("Confluence read requires resource_id (page ID)")
 
-        page = await asyncio.to_thread(
+        page = await run_blocking(
+            "confluence",
             client.get_page_by_id,
             resource_id,
             expand="body.storage,version",
@@ -135,28 +145,37 @@ class ConfluenceTool(DocumentStorageTool):
         )
 
     async def _list(self, path: str) -> list[DocumentResult]:
+        return await self._first_page(self._list_pages(path))
+
+    async def _list_pages(self, path: str) -> AsyncIterator[list[DocumentResult]]:
         client = self._get_client()
         space = path if path and path != "/" else self._space_key
         if not space:
             raise ConnectorError("Confluence list requires a space_key or path")
 
-        pages = await asyncio.to_thread(
-            client.get_all_pages_from_space,
-            space,
-            start=0,
-            limit=100,
-            expand="version",
-        )
-        return [
-            DocumentResult(
-                id=str(page.get("id", "")),
-                name=page.get("title", ""),
-                path=page.get("_links", {}).get("webui", ""),
-                modified_at=page.get("version", {}).get("when", ""),
-                url=f"{self._base_url}{page.get('_links', {}).get('webui', '')}",
+        start, limit = 0, 100
+        while True:
+            pages = await run_blocking(
+                "confluence",
+                client.get_all_pages_from_space,
+                space,
+                start=start,
+                limit=limit,
+                expand="version",
             )
-            for page in pages
-        ]
+            yield [
+                DocumentResult(
+                    id=str(page.get("id", "")),
+                    name=page.get("title", ""),
+                    path=page.get("_links", {}).get("webui", ""),
+                    modified_at=page.get("version", {}).get("when", ""),
+                    url=f"{self._base_url}{page.get('_links', {}).get('webui', '')}",
+                )
+                for page in pages
+            ]
+            if len(pages) < limit:
+                return
+            start += len(pages)
 
     async def _write(self, path: str, content: str) -> DocumentResult:
         client = self._get_client()
@@ -165,7 +184,8 @@ class ConfluenceTool(DocumentStorageTool):
             raise ConnectorError("Confluence write requires space_key")
 
         title = path.split("/")[-1] if "/" in path else path
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "confluence",
             client.create_page,
             space,
             title,
@@ -8,15 +8,15 @@ Install with::
 
 from __future__ import annotations
 
-import asyncio
 import io
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.google_api import GoogleApiSession, google_api_session, google_execute
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.storage.base import DocumentResult, DocumentStorageTool
 
@@ -31,6 +31,8 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+_BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
+
 
 @tool_registry.register("google_drive", category="storage")
 class GoogleDriveTool(DocumentStorageTool):
@@ -68,6 +70,7 @@ class GoogleDriveTool(DocumentStorageTool):
         self._scopes = list(scopes)
         self._timeout = timeout
         self._service: Any | None = None
+        self._session: GoogleApiSession | None = None
 
     def _ensure_deps(self) -> None:
         if not GOOGLE_AVAILABLE:
@@ -91,40 +94,48 @@ class GoogleDriveTool(DocumentStorageTool):
         else:
             raise ConnectorAuthError("GoogleDriveTool requires service_account_key or credentials_json")
 
+        self._session = google_api_session(creds, batch_url=_BATCH_URL, timeout=self._timeout)
         self._service = _build("drive", "v3", credentials=creds)
         return self._service
 
     # -- port implementation -------------------------------------------------
 
     async def _search(self, query: str) -> list[DocumentResult]:
-        svc = self._get_service()
+        return await self._first_page(self._search_pages(query))
+
+    async def _search_pages(self, query: str) -> AsyncIterator[list[DocumentResult]]:
         q = f"name contains '{query}' and trashed = false"
         if self._folder_id:
             q += f" and '{self._folder_id}' in parents"
 
-        response = await asyncio.to_thread(
-            lambda: (
-                svc.files()
-                .list(
-                    q=q,
-                    fields="files(id, name, mimeType, size, modifiedTime, webViewLink, parents)",
-                    pageSize=50,
+        fields = "files(id, name, mimeType, size, modifiedTime, webViewLink, parents)"
+        async for files in self._file_pages(q, fields, page_size=50):
+            yield [
+                DocumentResult(
+                    id=f.get("id", ""),
+                    name=f.get("name", ""),
+                    path="/".join(f.get("parents", [])),
+                    content_type=f.get("mimeType", ""),
+                    size_bytes=int(f.get("size", 0)),
+                    modified_at=f.get("modifiedTime", ""),
+                    url=f.get("webViewLink", ""),
                 )
-                .execute()
-            )
-        )
-        return [
-            DocumentResult(
-                id=f.get("id", ""),
-                name=f.get("name", ""),
-                path="/".join(f.get("parents", [])),
-                content_type=f.get("mimeType", ""),
-                size_bytes=int(f.get("size", 0)),
-                modified_at=f.get("modifiedTime", ""),
-                url=f.get("webViewLink", ""),
+                for f in files
+            ]
+
+    async def _file_pages(self, q: str, fields: str, *, page_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of ``files.list`` results, following ``nextPageToken``."""
+        svc = self._get_service()
+        page_token: str | None = None
+        while True:
+            response = await google_execute(
+                svc.files().list(q=q, fields=f"nextPageToken, {fields}", pageSize=page_size, pageToken=page_token),
+                self._session,
             )
-            for f in response.get("files", [])
-        ]
+            yield response.get("files", [])
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
 
     async def _read(self, resource_id: str, path: str) -> DocumentResult:
         svc = self._get_service()
@@ -139,10 +150,9 @@ class GoogleDriveTool(DocumentStorageTool):
         if not file_id:
             raise ConnectorError("GoogleDrive read requires resource_id or path")
 
-        meta = await asyncio.to_thread(
-            lambda: (
-                svc.files().get(fileId=file_id, fields="id, name, mimeType, size, modifiedTime, webViewLink").execute()
-            )
+        meta = await google_execute(
+            svc.files().get(fileId=file_id, fields="id, name, mimeType, size, modifiedTime, webViewLink"),
+            self._session,
         )
 
         # Download content for exportable types
@@ -150,10 +160,10 @@ class GoogleDriveTool(DocumentStorageTool):
         mime = meta.get("mimeType", "")
         if mime.startswith("application/vnd.google-apps."):
             export_mime = "text/plain"
-            data = await asyncio.to_thread(lambda: svc.files().export(fileId=file_id, mimeType=export_mime).execute())
+            data = await google_execute(svc.files().export(fileId=file_id, mimeType=export_mime), self._session)
             content = data.decode("utf-8") if isinstance(data, bytes) else str(data)
         else:
-            data = await asyncio.to_thread(lambda: svc.files().get_media(fileId=file_id).execute())
+            data = await google_execute(svc.files().get_media(fileId=file_id), self._session)
             content = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else str(data)
 
         return DocumentResult(
@@ -167,35 +177,28 @@ class GoogleDriveTool(DocumentStorageTool):
         )
 
     async def _list(self, path: str) -> list[DocumentResult]:
-        svc = self._get_service()
+        return await self._first_page(self._list_pages(path))
+
+    async def _list_pages(self, path: str) -> AsyncIterator[list[DocumentResult]]:
         folder_id = path if path and path != "/" else self._folder_id
         q = "trashed = false"
         if folder_id:
             q += f" and '{folder_id}' in parents"
 
-        response = await asyncio.to_thread(
-            lambda: (
-                svc.files()
-                .list(
-                    q=q,
-                    fields="files(id, name, mimeType, size, modifiedTime, webViewLink)",
-                    pageSize=100,
+        fields = "files(id, name, mimeType, size, modifiedTime, webViewLink)"
+        async for files in self._file_pages(q, fields, page_size=100):
+            yield [
+                DocumentResult(
+                    id=f.get("id", ""),
+                    name=f.get("name", ""),
+                    path=path,
+                    content_type=f.get("mimeType", ""),
+                    size_bytes=int(f.get("size", 0)),
+                    modified_at=f.get("modifiedTime", ""),
+                    url=f.get("webViewLink", ""),
                 )
-                .execute()
-            )
-        )
-        return [
-            DocumentResult(
-                id=f.get("id", ""),
-                name=f.get("name", ""),
-                path=path,
-                content_type=f.get("mimeType", ""),
-                size_bytes=int(f.get("size", 0)),
-                modified_at=f.get("modifiedTime", ""),
-                url=f.get("webViewLink", ""),
-            )
-            for f in response.get("files", [])
-        ]
+                for f in files
+            ]
 
     async def _write(self, path: str, content: str) -> DocumentResult:
         svc = self._get_service()
@@ -209,8 +212,9 @@ class GoogleDriveTool(DocumentStorageTool):
             mimetype="text/plain",
             resumable=False,
         )
-        result = await asyncio.to_thread(
-            lambda: svc.files().create(body=body, media_body=media, fields="id, name, webViewLink").execute()
+        result = await google_execute(
+            svc.files().create(body=body, media_body=media, fields="id, name, webViewLink"),
+            self._session,
         )
         return DocumentResult(
             id=result.get("id", ""),
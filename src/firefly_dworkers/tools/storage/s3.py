@@ -7,14 +7,14 @@ This adapter uses ``boto3`` for S3 operations.  Install with::
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.storage.base import DocumentResult, DocumentStorageTool
 
@@ -107,30 +107,24 @@ class S3Tool(DocumentStorageTool):
     # -- port implementation -------------------------------------------------
 
     async def _search(self, query: str) -> list[DocumentResult]:
+        return await self._first_page(self._search_pages(query))
+
+    async def _search_pages(self, query: str) -> AsyncIterator[list[DocumentResult]]:
+        async for resp in self._object_pages("S3 search", Prefix=self._full_key(query), MaxKeys=50):
+            yield [_object_result(obj) for obj in resp.get("Contents", [])]
+
+    async def _object_pages(self, operation: str, **params: Any) -> AsyncIterator[dict[str, Any]]:
+        """Yield ``list_objects_v2`` responses, following continuation tokens."""
         s3 = self._get_client()
-        prefix = self._full_key(query)
-        try:
-            resp = await asyncio.to_thread(
-                s3.list_objects_v2,
-                Bucket=self._bucket,
-                Prefix=prefix,
-                MaxKeys=50,
-            )
-        except _ClientError as exc:
-            raise ConnectorError(f"S3 search failed: {exc}") from exc
-
-        return [
-            DocumentResult(
-                id=obj["Key"],
-                name=obj["Key"].split("/")[-1],
-                path=obj["Key"],
-                size_bytes=obj.get("Size", 0),
-                modified_at=obj.get("LastModified", "").isoformat()
-                if hasattr(obj.get("LastModified", ""), "isoformat")
-                else str(obj.get("LastModified", "")),
-            )
-            for obj in resp.get("Contents", [])
-        ]
+        while True:
+            try:
+                resp = await run_blocking("s3", s3.list_objects_v2, Bucket=self._bucket, **params)
+            except _ClientError as exc:
+                raise ConnectorError(f"{operation} failed: {exc}") from exc
+            yield resp
+            if not resp.get("IsTruncated") or not resp.get("NextContinuationToken"):
+                return
+            params["ContinuationToken"] = resp["NextContinuationToken"]
 
     async def _read(self, resource_id: str, path: str) -> DocumentResult:
         s3 = self._get_client()
@@ -139,11 +133,11 @@ class S3Tool(DocumentStorageTool):
             raise ConnectorError("S3 read requires resource_id or path")
 
         try:
-            resp = await asyncio.to_thread(s3.get_object, Bucket=self._bucket, Key=key)
+            resp = await run_blocking("s3", s3.get_object, Bucket=self._bucket, Key=key)
         except _ClientError as exc:
             raise ConnectorError(f"S3 read failed for '{key}': {exc}") from exc
 
-        body_bytes: bytes = await asyncio.to_thread(resp["Body"].read)
+        body_bytes: bytes = await run_blocking("s3", resp["Body"].read)
         content = body_bytes.decode("utf-8", errors="replace")
 
         return DocumentResult(
@@ -159,47 +153,26 @@ class S3Tool(DocumentStorageTool):
         )
 
     async def _list(self, path: str) -> list[DocumentResult]:
-        s3 = self._get_client()
+        return await self._first_page(self._list_pages(path))
+
+    async def _list_pages(self, path: str) -> AsyncIterator[list[DocumentResult]]:
         prefix = self._full_key(path) if path and path != "/" else self._prefix
         if prefix and not prefix.endswith("/"):
             prefix += "/"
 
-        try:
-            resp = await asyncio.to_thread(
-                s3.list_objects_v2,
-                Bucket=self._bucket,
-                Prefix=prefix or "",
-                Delimiter="/",
-                MaxKeys=200,
-            )
-        except _ClientError as exc:
-            raise ConnectorError(f"S3 list failed: {exc}") from exc
-
-        results: list[DocumentResult] = []
-        # Folders (common prefixes)
-        for cp in resp.get("CommonPrefixes", []):
-            results.append(
+        async for resp in self._object_pages("S3 list", Prefix=prefix or "", Delimiter="/", MaxKeys=200):
+            # Folders (common prefixes) first, then files
+            results = [
                 DocumentResult(
                     id=cp["Prefix"],
                     name=cp["Prefix"].rstrip("/").split("/")[-1],
                     path=cp["Prefix"],
                     content_type="folder",
                 )
-            )
-        # Files
-        for obj in resp.get("Contents", []):
-            results.append(
-                DocumentResult(
-                    id=obj["Key"],
-                    name=obj["Key"].split("/")[-1],
-                    path=obj["Key"],
-                    size_bytes=obj.get("Size", 0),
-                    modified_at=obj.get("LastModified", "").isoformat()
-                    if hasattr(obj.get("LastModified", ""), "isoformat")
-                    else str(obj.get("LastModified", "")),
-                )
-            )
-        return results
+                for cp in resp.get("CommonPrefixes", [])
+            ]
+            results.extend(_object_result(obj) for obj in resp.get("Contents", []))
+            yield results
 
     async def _write(self, path: str, content: str) -> DocumentResult:
         s3 = self._get_client()
@@ -209,7 +182,8 @@ class S3Tool(DocumentStorageTool):
 
         body = content.encode("utf-8")
         try:
-            await asyncio.to_thread(
+            await run_blocking(
+                "s3",
                 s3.put_object,
                 Bucket=self._bucket,
                 Key=key,
@@ -226,3 +200,14 @@ class S3Tool(DocumentStorageTool):
             content=content,
             size_bytes=len(body),
         )
+
+
+def _object_result(obj: dict[str, Any]) -> DocumentResult:
+    modified = obj.get("LastModified", "")
+    return DocumentResult(
+        id=obj["Key"],
+        name=obj["Key"].split("/")[-1],
+        path=obj["Key"],
+        size_bytes=obj.get("Size", 0),
+        modified_at=modified.isoformat() if hasattr(modified, "isoformat") else str(modified),
+    )
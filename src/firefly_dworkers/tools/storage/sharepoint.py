@@ -9,36 +9,31 @@ calls against the Microsoft Graph API.  Install with::
 from __future__ import annotations
 
 import asyncio
+import codecs
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import aclosing
+from pathlib import Path
 from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
 from firefly_dworkers.exceptions import ConnectorAuthError, ConnectorError
+from firefly_dworkers.tools.executors import run_blocking
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.storage.base import DocumentResult, DocumentStorageTool
+from firefly_dworkers.tools.token_cache import MSAL_AVAILABLE, graph_access_token, graph_token_key, token_cache
 
 logger = logging.getLogger(__name__)
 
-try:
-    import msal
-
-    MSAL_AVAILABLE = True
-except ImportError:
-    msal = None  # type: ignore[assignment]
-    MSAL_AVAILABLE = False
-
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    httpx = None  # type: ignore[assignment]
-    HTTPX_AVAILABLE = False
-
 _GRAPH_BASE = "https://graph.microsoft.com/v1.0"
 
+# Graph accepts simple PUT uploads up to 4 MB; larger files need an upload
+# session whose chunks are multiples of 320 KiB.
+_SIMPLE_UPLOAD_LIMIT = 4_194_304
+_UPLOAD_CHUNK_UNIT = 327_680
+
 
 @tool_registry.register("sharepoint", category="storage")
 class SharePointTool(DocumentStorageTool):
@@ -53,6 +48,10 @@ class SharePointTool(DocumentStorageTool):
     * ``drive_id`` -- Optional pre-resolved drive ID; skips site lookup.
     * ``timeout`` -- HTTP request timeout in seconds.
     * ``scopes`` -- OAuth2 scopes (defaults to Graph ``Sites.ReadWrite.All``).
+    * ``max_read_bytes`` -- Bytes of file content returned by the ``read``
+      action; larger files are read partially via a byte-range request.
+    * ``upload_chunk_size`` -- Chunk size for upload sessions (files over
+      4 MB); must be a multiple of 320 KiB.
     """
 
     def __init__(
@@ -65,9 +64,13 @@ class SharePointTool(DocumentStorageTool):
         drive_id: str = "",
         timeout: float = 30.0,
         scopes: Sequence[str] = ("https://graph.microsoft.com/.default",),
+        max_read_bytes: int = 4_194_304,
+        upload_chunk_size: int = 10 * _UPLOAD_CHUNK_UNIT,
         guards: Sequence[GuardProtocol] = (),
         **kwargs: Any,
     ):
+        if upload_chunk_size <= 0 or upload_chunk_size % _UPLOAD_CHUNK_UNIT:
+            raise ValueError(f"upload_chunk_size must be a positive multiple of {_UPLOAD_CHUNK_UNIT} bytes")
         super().__init__(
             "sharepoint",
             description="Access SharePoint documents and lists via Microsoft Graph API",
@@ -80,7 +83,8 @@ class SharePointTool(DocumentStorageTool):
         self._drive_id = drive_id
         self._timeout = timeout
         self._scopes = list(scopes)
-        self._access_token: str | None = None
+        self._max_read_bytes = max_read_bytes
+        self._upload_chunk_size = upload_chunk_size
 
     # -- authentication ------------------------------------------------------
 
@@ -93,56 +97,74 @@ class SharePointTool(DocumentStorageTool):
             raise ImportError("httpx is required for SharePointTool. Install with: pip install httpx")
 
     async def _get_token(self) -> str:
-        """Acquire an OAuth2 access token via MSAL client credentials flow."""
-        self._ensure_deps()
-        if self._access_token:
-            return self._access_token
-
-        if not self._tenant_id or not self._client_id or not self._client_secret:
-            raise ConnectorAuthError("SharePoint requires tenant_id, client_id, and client_secret")
+        """Return a cached OAuth2 access token (MSAL client credentials flow).
 
-        authority = f"https://login.microsoftonline.com/{self._tenant_id}"
-        app = msal.ConfidentialClientApplication(
-            self._client_id,
-            authority=authority,
-            client_credential=self._client_secret,
+        Tokens are shared with every connector using the same tenant, client
+        and scopes, and are refreshed in the background before they expire.
+        """
+        self._ensure_deps()
+        return await graph_access_token(
+            tenant_id=self._tenant_id,
+            client_id=self._client_id,
+            client_secret=self._client_secret,
+            scopes=self._scopes,
+            label="SharePoint",
         )
-        result = await asyncio.to_thread(app.acquire_token_for_client, scopes=self._scopes)
-        if "access_token" not in result:
-            raise ConnectorAuthError(
-                f"SharePoint auth failed: {result.get('error_description', result.get('error', 'unknown'))}"
-            )
-        self._access_token = result["access_token"]
-        return self._access_token
+
+    def _invalidate_token(self) -> None:
+        token_cache.invalidate(graph_token_key(self._tenant_id, self._client_id, self._client_secret, self._scopes))
 
     async def _graph_get(self, path: str) -> dict[str, Any]:
         token = await self._get_token()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.get(
-                f"{_GRAPH_BASE}{path}",
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            if resp.status_code == 401:
-                self._access_token = None
-                raise ConnectorAuthError("SharePoint token expired or invalid")
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        # ``@odata.nextLink`` pagination URLs are already absolute.
+        url = path if path.startswith("https://") else f"{_GRAPH_BASE}{path}"
+        resp = await client.get(
+            url,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=self._timeout,
+        )
+        if resp.status_code == 401:
+            self._invalidate_token()
+            raise ConnectorAuthError("SharePoint token expired or invalid")
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _graph_pages(self, path: str) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the ``value`` array of each page, following ``@odata.nextLink``."""
+        next_link: str | None = path
+        while next_link:
+            data = await self._graph_get(next_link)
+            yield data.get("value", [])
+            next_link = data.get("@odata.nextLink")
 
     async def _graph_put(
         self, path: str, content: bytes, content_type: str = "application/octet-stream"
     ) -> dict[str, Any]:
         token = await self._get_token()
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.put(
-                f"{_GRAPH_BASE}{path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": content_type,
-                },
-                content=content,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = http_client()
+        resp = await client.put(
+            f"{_GRAPH_BASE}{path}",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": content_type,
+            },
+            content=content,
+            timeout=self._timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _graph_post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        token = await self._get_token()
+        resp = await http_client().post(
+            f"{_GRAPH_BASE}{path}",
+            headers={"Authorization": f"Bearer {token}"},
+            json=body,
+            timeout=self._timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def _resolve_drive(self) -> str:
         if self._drive_id:
@@ -161,12 +183,13 @@ class SharePointTool(DocumentStorageTool):
     # -- port implementation -------------------------------------------------
 
     async def _search(self, query: str) -> list[DocumentResult]:
+        return await self._first_page(self._search_pages(query))
+
+    async def _search_pages(self, query: str) -> AsyncIterator[list[DocumentResult]]:
         self._ensure_deps()
         drive_id = await self._resolve_drive()
-        data = await self._graph_get(f"/drives/{drive_id}/root/search(q='{query}')")
-        results = []
-        for item in data.get("value", []):
-            results.append(
+        async for items in self._graph_pages(f"/drives/{drive_id}/root/search(q='{query}')"):
+            yield [
                 DocumentResult(
                     id=item.get("id", ""),
                     name=item.get("name", ""),
@@ -176,33 +199,32 @@ class SharePointTool(DocumentStorageTool):
                     modified_at=item.get("lastModifiedDateTime", ""),
                     url=item.get("webUrl", ""),
                 )
-            )
-        return results
+                for item in items
+            ]
 
     async def _read(self, resource_id: str, path: str) -> DocumentResult:
         self._ensure_deps()
         drive_id = await self._resolve_drive()
-        if resource_id:
-            item = await self._graph_get(f"/drives/{drive_id}/items/{resource_id}")
-        elif path:
-            item = await self._graph_get(f"/drives/{drive_id}/root:/{path.lstrip('/')}")
-        else:
-            raise ConnectorError("SharePoint read requires resource_id or path")
+        item = await self._graph_get(self._item_path(drive_id, resource_id, path))
 
-        # Download content for small files (< 4 MB)
+        # Stream at most max_read_bytes of content; larger files are read partially.
         content = ""
         size = item.get("size", 0)
-        if size < 4_194_304 and "file" in item:
-            token = await self._get_token()
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                dl = await client.get(
-                    item.get(
-                        "@microsoft.graph.downloadUrl", f"{_GRAPH_BASE}/drives/{drive_id}/items/{item['id']}/content"
-                    ),
-                    headers={"Authorization": f"Bearer {token}"},
-                )
-                dl.raise_for_status()
-                content = dl.text
+        if "file" in item and self._max_read_bytes > 0:
+            partial = size > self._max_read_bytes
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            parts: list[str] = []
+            remaining = self._max_read_bytes
+            end = self._max_read_bytes - 1 if partial else None
+            stream = self.stream_content(resource_id=item.get("id", ""), end=end)
+            async with aclosing(stream):
+                async for chunk in stream:
+                    parts.append(decoder.decode(chunk[:remaining]))
+                    remaining -= len(chunk)
+                    if remaining <= 0:
+                        break
+            parts.append(decoder.decode(b"", final=not partial))
+            content = "".join(parts)
 
         return DocumentResult(
             id=item.get("id", ""),
@@ -216,40 +238,191 @@ class SharePointTool(DocumentStorageTool):
         )
 
     async def _list(self, path: str) -> list[DocumentResult]:
+        return await self._first_page(self._list_pages(path))
+
+    async def _list_pages(self, path: str) -> AsyncIterator[list[DocumentResult]]:
         self._ensure_deps()
         drive_id = await self._resolve_drive()
         if path and path != "/":
-            data = await self._graph_get(f"/drives/{drive_id}/root:/{path.lstrip('/')}:/children")
+            first = f"/drives/{drive_id}/root:/{path.lstrip('/')}:/children"
         else:
-            data = await self._graph_get(f"/drives/{drive_id}/root/children")
-
-        return [
-            DocumentResult(
-                id=item.get("id", ""),
-                name=item.get("name", ""),
-                path=f"{path.rstrip('/')}/{item.get('name', '')}",
-                content_type=item.get("file", {}).get("mimeType", "") if "file" in item else "folder",
-                size_bytes=item.get("size", 0),
-                modified_at=item.get("lastModifiedDateTime", ""),
-                url=item.get("webUrl", ""),
-            )
-            for item in data.get("value", [])
-        ]
+            first = f"/drives/{drive_id}/root/children"
+
+        async for items in self._graph_pages(first):
+            yield [
+                DocumentResult(
+                    id=item.get("id", ""),
+                    name=item.get("name", ""),
+                    path=f"{path.rstrip('/')}/{item.get('name', '')}",
+                    content_type=item.get("file", {}).get("mimeType", "") if "file" in item else "folder",
+                    size_bytes=item.get("size", 0),
+                    modified_at=item.get("lastModifiedDateTime", ""),
+                    url=item.get("webUrl", ""),
+                )
+                for item in items
+            ]
 
     async def _write(self, path: str, content: str) -> DocumentResult:
+        data = content.encode("utf-8")
+        item = await self._upload(path, len(data), _bytes_reader(data), "text/plain")
+        return DocumentResult(
+            id=item.get("id", ""),
+            name=item.get("name", ""),
+            path=path,
+            content=content,
+            size_bytes=len(data),
+            modified_at=item.get("lastModifiedDateTime", ""),
+            url=item.get("webUrl", ""),
+        )
+
+    # -- streaming transfers ---------------------------------------------------
+
+    async def stream_content(
+        self,
+        *,
+        resource_id: str = "",
+        path: str = "",
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a file in chunks without buffering it in memory.
+
+        Parameters:
+            resource_id: Drive item ID (takes precedence over *path*).
+            path: File path relative to the drive root.
+            start: First byte to read.
+            end: Last byte to read (inclusive); ``None`` reads to the end.
+        """
         self._ensure_deps()
         drive_id = await self._resolve_drive()
-        item = await self._graph_put(
-            f"/drives/{drive_id}/root:/{path.lstrip('/')}:/content",
-            content.encode("utf-8"),
-            "text/plain",
-        )
+        token = await self._get_token()
+        headers = {"Authorization": f"Bearer {token}"}
+        if start or end is not None:
+            headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+        item_path = self._item_path(drive_id, resource_id, path)
+        url = f"{_GRAPH_BASE}{item_path}{'/content' if resource_id else ':/content'}"
+        async with http_client().stream(
+            "GET", url, headers=headers, timeout=self._timeout, follow_redirects=True
+        ) as resp:
+            if resp.status_code == 401:
+                self._invalidate_token()
+                raise ConnectorAuthError("SharePoint token expired or invalid")
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                yield chunk
+
+    async def download(self, destination: str | Path, *, resource_id: str = "", path: str = "") -> int:
+        """Stream a file to *destination* and return the number of bytes written."""
+        written = 0
+        with Path(destination).open("wb") as fh:
+            async for chunk in self.stream_content(resource_id=resource_id, path=path):
+                await run_blocking("sharepoint", fh.write, chunk)
+                written += len(chunk)
+        return written
+
+    async def upload(self, path: str, source: bytes | str | Path, *, content_type: str = "") -> DocumentResult:
+        """Upload *source* (bytes or a local file path) to *path* in the drive.
+
+        Files over 4 MB are sent through a Graph upload session in
+        ``upload_chunk_size`` chunks; each chunk is read while the previous
+        one is uploading, so local files are never loaded whole.
+        """
+        if isinstance(source, bytes):
+            size, read = len(source), _bytes_reader(source)
+        else:
+            size, read = Path(source).stat().st_size, _file_reader(Path(source))
+        item = await self._upload(path, size, read, content_type or "application/octet-stream")
         return DocumentResult(
             id=item.get("id", ""),
             name=item.get("name", ""),
             path=path,
-            content=content,
-            size_bytes=len(content.encode("utf-8")),
+            content_type=item.get("file", {}).get("mimeType", content_type),
+            size_bytes=item.get("size", size),
             modified_at=item.get("lastModifiedDateTime", ""),
             url=item.get("webUrl", ""),
         )
+
+    async def _upload(
+        self, path: str, size: int, read: Callable[[int, int], Awaitable[bytes]], content_type: str
+    ) -> dict[str, Any]:
+        self._ensure_deps()
+        drive_id = await self._resolve_drive()
+        target = f"/drives/{drive_id}/root:/{path.lstrip('/')}"
+        if size <= _SIMPLE_UPLOAD_LIMIT:
+            data = await read(0, size)
+            if len(data) != size:
+                raise ConnectorError(f"Upload source for {path} changed size: expected {size} bytes, read {len(data)}")
+            return await self._graph_put(f"{target}:/content", data, content_type)
+
+        session = await self._graph_post(
+            f"{target}:/createUploadSession",
+            {"item": {"@microsoft.graph.conflictBehavior": "replace"}},
+        )
+        upload_url = session["uploadUrl"]
+        client = http_client()
+        item: dict[str, Any] = {}
+        offset = 0
+        pending = asyncio.ensure_future(read(0, self._upload_chunk_size))
+        try:
+            while offset < size:
+                chunk = await pending
+                expected = min(self._upload_chunk_size, size - offset)
+                if len(chunk) != expected:
+                    # The source shrank (or grew) since its size was taken;
+                    # sending this chunk would declare an invalid Content-Range.
+                    raise ConnectorError(
+                        f"Upload source for {path} changed size: expected {expected} bytes at offset {offset}, "
+                        f"read {len(chunk)}"
+                    )
+                end = offset + len(chunk)
+                if end < size:
+                    pending = asyncio.ensure_future(read(end, self._upload_chunk_size))
+                # The upload URL is pre-authenticated; Graph rejects a bearer token here.
+                resp = await client.put(
+                    upload_url,
+                    content=chunk,
+                    headers={"Content-Range": f"bytes {offset}-{end - 1}/{size}"},
+                    timeout=self._timeout,
+                )
+                resp.raise_for_status()
+                if resp.status_code in (200, 201):
+                    item = resp.json()
+                offset = end
+        except BaseException:
+            if not pending.done():
+                pending.cancel()
+            try:
+                await client.delete(upload_url, timeout=self._timeout)
+            except Exception:
+                logger.warning("Failed to cancel SharePoint upload session for %s", path)
+            raise
+        return item
+
+    @staticmethod
+    def _item_path(drive_id: str, resource_id: str, path: str) -> str:
+        if resource_id:
+            return f"/drives/{drive_id}/items/{resource_id}"
+        if path:
+            return f"/drives/{drive_id}/root:/{path.lstrip('/')}"
+        raise ConnectorError("SharePoint read requires resource_id or path")
+
+
+def _bytes_reader(data: bytes) -> Callable[[int, int], Awaitable[bytes]]:
+    view = memoryview(data)
+
+    async def read(offset: int, length: int) -> bytes:
+        return bytes(view[offset : offset + length])
+
+    return read
+
+
+def _file_reader(path: Path) -> Callable[[int, int], Awaitable[bytes]]:
+    def _read(offset: int, length: int) -> bytes:
+        with path.open("rb") as fh:
+            fh.seek(offset)
+            return fh.read(length)
+
+    async def read(offset: int, length: int) -> bytes:
+        return await run_blocking("sharepoint", _read, offset, length)
+
+    return read
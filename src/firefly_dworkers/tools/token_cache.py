@@ -0,0 +1,203 @@
+"""Shared, expiry-aware OAuth access token cache.
+
+Tools that authenticate with the client-credentials flow (SharePoint,
+Teams) share tokens through :data:`token_cache`, keyed by tenant, client
+and scopes.  A token is served until shortly before it expires; inside the
+refresh margin the cached token is still returned while a replacement is
+fetched in the background, so callers rarely wait on the identity
+provider.  Concurrent misses for the same key share one acquisition::
+
+    token = await graph_access_token(
+        tenant_id=tenant_id, client_id=client_id, client_secret=secret, scopes=scopes
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from firefly_dworkers.exceptions import ConnectorAuthError
+from firefly_dworkers.tools.executors import run_blocking
+
+try:
+    import msal
+
+    MSAL_AVAILABLE = True
+except ImportError:
+    msal = None  # type: ignore[assignment]
+    MSAL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TokenKey = tuple[str, ...]
+
+_DEFAULT_EXPIRES_IN = 3600
+
+
+@dataclass(frozen=True)
+class AccessToken:
+    """An access token and the epoch time at which it expires."""
+
+    token: str
+    expires_at: float
+
+
+class TokenCache:
+    """Process-wide cache of OAuth access tokens.
+
+    Parameters:
+        refresh_margin: Seconds before expiry at which a background
+            refresh starts.  Tokens are never served after they expire.
+    """
+
+    def __init__(self, *, refresh_margin: float = 300.0) -> None:
+        self._refresh_margin = refresh_margin
+        self._tokens: dict[TokenKey, AccessToken] = {}
+        self._inflight: dict[tuple[int, TokenKey], asyncio.Task[AccessToken]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._lock = threading.Lock()
+
+    async def get(self, key: TokenKey, fetch: Callable[[], Awaitable[AccessToken]]) -> str:
+        """Return a valid token for *key*, calling *fetch* only when needed."""
+        now = time.time()
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None and now < cached.expires_at:
+                self._hits += 1
+                refresh = now >= cached.expires_at - self._refresh_margin
+            else:
+                self._misses += 1
+                cached, refresh = None, False
+        if cached is not None:
+            if refresh:
+                self._acquire(key, fetch, background=True)
+            return cached.token
+        return (await asyncio.shield(self._acquire(key, fetch))).token
+
+    def invalidate(self, key: TokenKey) -> None:
+        """Drop the cached token for *key* (e.g. after the API rejected it)."""
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss/refresh counters."""
+        with self._lock:
+            return {
+                "entries": len(self._tokens),
+                "hits": self._hits,
+                "misses": self._misses,
+                "refreshes": self._refreshes,
+            }
+
+    def clear(self) -> None:
+        """Remove all tokens and reset counters (useful for testing)."""
+        with self._lock:
+            self._tokens.clear()
+            self._hits = 0
+            self._misses = 0
+            self._refreshes = 0
+
+    def _acquire(
+        self, key: TokenKey, fetch: Callable[[], Awaitable[AccessToken]], *, background: bool = False
+    ) -> asyncio.Task[AccessToken]:
+        # In-flight acquisitions are per event loop; tokens are shared by all loops.
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._inflight.get(inflight_key)
+            if task is not None:
+                return task
+            if background:
+                self._refreshes += 1
+            task = asyncio.ensure_future(self._fetch(key, fetch))
+            self._inflight[inflight_key] = task
+        task.add_done_callback(lambda done: self._finish(inflight_key, done, background))
+        return task
+
+    async def _fetch(self, key: TokenKey, fetch: Callable[[], Awaitable[AccessToken]]) -> AccessToken:
+        token = await fetch()
+        with self._lock:
+            self._tokens[key] = token
+        return token
+
+    def _finish(self, inflight_key: tuple[int, TokenKey], task: asyncio.Task[AccessToken], background: bool) -> None:
+        with self._lock:
+            if self._inflight.get(inflight_key) is task:
+                del self._inflight[inflight_key]
+        error = None if task.cancelled() else task.exception()
+        if background and error is not None:
+            logger.warning("Background token refresh failed: %s", error)
+
+
+token_cache = TokenCache()
+
+
+# -- Microsoft identity platform -------------------------------------------
+
+_msal_lock = threading.Lock()
+_msal_apps: dict[tuple[str, str, str], Any] = {}
+
+
+def graph_token_key(tenant_id: str, client_id: str, client_secret: str, scopes: Sequence[str]) -> TokenKey:
+    """Cache key for a client-credentials token; the secret is only stored hashed."""
+    secret_hash = hashlib.sha256(client_secret.encode()).hexdigest()[:16]
+    return ("msal", tenant_id, client_id, secret_hash, *sorted(scopes))
+
+
+def _msal_app(tenant_id: str, client_id: str, client_secret: str) -> Any:
+    key = (tenant_id, client_id, hashlib.sha256(client_secret.encode()).hexdigest())
+    with _msal_lock:
+        app = _msal_apps.get(key)
+        if app is None:
+            app = _msal_apps[key] = msal.ConfidentialClientApplication(
+                client_id,
+                authority=f"https://login.microsoftonline.com/{tenant_id}",
+                client_credential=client_secret,
+            )
+        return app
+
+
+async def graph_access_token(
+    *,
+    tenant_id: str,
+    client_id: str,
+    client_secret: str,
+    scopes: Sequence[str] = ("https://graph.microsoft.com/.default",),
+    label: str = "Microsoft Graph",
+) -> str:
+    """Return a cached client-credentials token for the Microsoft Graph API.
+
+    Parameters:
+        tenant_id: Azure AD tenant ID.
+        client_id: Application (client) ID.
+        client_secret: Client secret.
+        scopes: OAuth2 scopes to request.
+        label: Connector name used in error messages.
+
+    Raises:
+        ConnectorAuthError: If credentials are missing or MSAL rejects them.
+    """
+    if not tenant_id or not client_id or not client_secret:
+        raise ConnectorAuthError(f"{label} requires tenant_id, client_id, and client_secret")
+    if not MSAL_AVAILABLE:
+        raise ImportError("msal is required for Microsoft Graph connectors. Install with: pip install msal")
+
+    async def _fetch() -> AccessToken:
+        app = _msal_app(tenant_id, client_id, client_secret)
+        result = await run_blocking("auth", app.acquire_token_for_client, scopes=list(scopes))
+        if "access_token" not in result:
+            raise ConnectorAuthError(
+                f"{label} auth failed: {result.get('error_description', result.get('error', 'unknown'))}"
+            )
+        expires_in = float(result.get("expires_in") or _DEFAULT_EXPIRES_IN)
+        return AccessToken(token=result["access_token"], expires_at=time.time() + expires_in)
+
+    return await token_cache.get(graph_token_key(tenant_id, client_id, client_secret, scopes), _fetch)
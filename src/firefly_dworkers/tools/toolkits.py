@@ -21,6 +21,7 @@ from fireflyframework_genai.tools.base import BaseTool
 from fireflyframework_genai.tools.toolkit import ToolKit
 
 from firefly_dworkers.tenants.config import TenantConfig
+from firefly_dworkers.tools.executors import configure_executors
 from firefly_dworkers.tools.registry import tool_registry
 
 # ---------------------------------------------------------------------------
@@ -135,7 +136,22 @@ def _build_storage_tools(config: TenantConfig) -> list[BaseTool]:
     """Build storage tools for enabled connectors."""
     tools: list[BaseTool] = []
 
-    for attr_name in ("sharepoint", "google_drive", "confluence"):
+    sp_cfg = config.connectors.sharepoint
+    if getattr(sp_cfg, "enabled", False) and tool_registry.has("sharepoint"):
+        tools.append(
+            tool_registry.create(
+                "sharepoint",
+                tenant_id=sp_cfg.tenant_id,
+                client_id=sp_cfg.client_id,
+                client_secret=sp_cfg.client_secret,
+                site_url=sp_cfg.site_url,
+                timeout=sp_cfg.timeout,
+                max_read_bytes=sp_cfg.max_read_bytes,
+                upload_chunk_size=sp_cfg.upload_chunk_size,
+            )
+        )
+
+    for attr_name in ("google_drive", "confluence"):
         cfg = getattr(config.connectors, attr_name, None)
         if cfg is None:
             continue
@@ -225,7 +241,19 @@ def _build_data_tools(config: TenantConfig) -> list[BaseTool]:
     tools: list[BaseTool] = []
     sql_cfg = config.connectors.sql
     if getattr(sql_cfg, "enabled", False) and tool_registry.has("sql"):
-        tools.append(tool_registry.create("sql"))
+        tools.append(
+            tool_registry.create(
+                "sql",
+                connection_string=sql_cfg.connection_string,
+                read_only=sql_cfg.read_only,
+                max_rows=sql_cfg.max_rows,
+                timeout=sql_cfg.timeout,
+                pool_size=sql_cfg.pool_size,
+                cache_ttl_seconds=sql_cfg.cache_ttl_seconds,
+                cache_max_entries=sql_cfg.cache_max_entries,
+                cache_track_changes=sql_cfg.cache_track_changes,
+            )
+        )
     return tools
 
 
@@ -253,6 +281,7 @@ def researcher_toolkit(config: TenantConfig) -> ToolKit:
     RSS feed tools, and a research chain (search -> report) when the
     :class:`~fireflyframework_genai.tools.SequentialComposer` is available.
     """
+    configure_executors(config.connectors.executors)
     tools: list[Any] = []
     tools.extend(_build_web_tools(config))
     tools.extend(_build_storage_tools(config))
@@ -280,6 +309,7 @@ def analyst_toolkit(config: TenantConfig) -> ToolKit:
     and document tools, and all five consulting tools (requirement gathering,
     process mapping, gap analysis, report generation, documentation).
     """
+    configure_executors(config.connectors.executors)
     tools: list[BaseTool] = []
     tools.extend(_build_storage_tools(config))
     tools.extend(_build_communication_tools(config))
@@ -310,6 +340,7 @@ def data_analyst_toolkit(config: TenantConfig) -> ToolKit:
     Includes storage connectors, spreadsheet tools, data analysis tools,
     vision analysis, spreadsheet parsing, API client, and report generation.
     """
+    configure_executors(config.connectors.executors)
     tools: list[BaseTool] = []
     tools.extend(_build_storage_tools(config))
     tools.extend(_build_spreadsheet_tools(config))
@@ -339,6 +370,7 @@ def manager_toolkit(config: TenantConfig) -> ToolKit:
     productivity tools (presentation, document, spreadsheet, vision),
     report generation, and documentation.
     """
+    configure_executors(config.connectors.executors)
     tools: list[BaseTool] = []
     tools.extend(_build_project_tools(config))
     tools.extend(_build_communication_tools(config))
@@ -379,6 +411,7 @@ def designer_toolkit(
         autonomy_level: Autonomy level for design pipeline checkpoints.
         checkpoint_handler: Handler for autonomy checkpoints.
     """
+    configure_executors(config.connectors.executors)
     tools: list[Any] = []
     tools.extend(_build_presentation_tools(config))
     tools.extend(_build_document_tools(config))
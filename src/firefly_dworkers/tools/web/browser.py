@@ -12,18 +12,11 @@ from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.web.browsing import BrowsingResult, WebBrowsingTool
 
 # Optional dependency check
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    httpx = None  # type: ignore[assignment]
-    HTTPX_AVAILABLE = False
-
 try:
     from bs4 import BeautifulSoup
 
@@ -55,10 +48,9 @@ class WebBrowserTool(WebBrowsingTool):
         if not HTTPX_AVAILABLE:
             raise ImportError("httpx required. Install with: pip install httpx")
 
-        async with httpx.AsyncClient(timeout=self._timeout or 30.0, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            html = response.text
+        response = await http_client().get(url, timeout=self._timeout or 30.0, follow_redirects=True)
+        response.raise_for_status()
+        html = response.text
 
         title = ""
         text = html[:10000]
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Sequence
 from typing import Any
 
 from fireflyframework_genai.tools.base import BaseTool, GuardProtocol, ParameterSpec
 
+from firefly_dworkers.tools.executors import run_blocking
 from firefly_dworkers.tools.registry import tool_registry
 
 try:
@@ -57,7 +57,7 @@ class RSSFeedTool(BaseTool):
         url: str = kwargs["url"]
         max_entries: int = kwargs.get("max_entries", self._max_entries)
 
-        feed = await asyncio.to_thread(feedparser.parse, url)
+        feed = await run_blocking("rss", feedparser.parse, url)
 
         entries = []
         for entry in feed.entries[:max_entries]:
@@ -7,17 +7,10 @@ from typing import Any
 
 from fireflyframework_genai.tools.base import GuardProtocol
 
+from firefly_dworkers.tools.http_pool import HTTPX_AVAILABLE, http_client
 from firefly_dworkers.tools.registry import tool_registry
 from firefly_dworkers.tools.web.search import SearchResult, WebSearchTool
 
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    httpx = None  # type: ignore[assignment]
-    HTTPX_AVAILABLE = False
-
 
 @tool_registry.register("tavily", category="web_search")
 class TavilySearchTool(WebSearchTool):
@@ -54,17 +47,18 @@ class TavilySearchTool(WebSearchTool):
         if not HTTPX_AVAILABLE:
             raise ImportError("httpx required for TavilySearchTool — install with: pip install httpx")
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                self._base_url,
-                json={
-                    "api_key": self._api_key,
-                    "query": query,
-                    "max_results": max_results,
-                },
-            )
-            response.raise_for_status()
-            data: dict[str, Any] = response.json()
+        client = http_client()
+        response = await client.post(
+            self._base_url,
+            json={
+                "api_key": self._api_key,
+                "query": query,
+                "max_results": max_results,
+            },
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
 
         return [
             SearchResult(
@@ -1,23 +1,29 @@
 """Workers layer -- digital worker agents for consulting engagements."""
 
+from firefly_dworkers.workers.admission import AdmissionController, admission_controller
 from firefly_dworkers.workers.analyst import AnalystWorker
 from firefly_dworkers.workers.base import BaseWorker
 from firefly_dworkers.workers.data_analyst import DataAnalystWorker
 from firefly_dworkers.workers.designer import DocumentDesignerWorker
 from firefly_dworkers.workers.factory import WorkerFactory, worker_factory
 from firefly_dworkers.workers.manager import ManagerWorker
+from firefly_dworkers.workers.pool import SpecialistPool, specialist_pool
 from firefly_dworkers.workers.registry import WorkerRegistry, worker_registry
 from firefly_dworkers.workers.researcher import ResearcherWorker
 
 __all__ = [
+    "AdmissionController",
     "AnalystWorker",
     "BaseWorker",
     "DataAnalystWorker",
     "DocumentDesignerWorker",
     "ManagerWorker",
     "ResearcherWorker",
+    "SpecialistPool",
     "WorkerFactory",
     "WorkerRegistry",
+    "admission_controller",
+    "specialist_pool",
     "worker_factory",
     "worker_registry",
 ]
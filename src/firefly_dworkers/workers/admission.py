@@ -0,0 +1,238 @@
+"""AdmissionController -- per-tenant, per-role concurrency limits for worker runs.
+
+Each ``(tenant, role)`` pair gets a FIFO limiter sized from
+:attr:`WorkerConfig.WorkerSettings.max_concurrent_tasks`.  Runs beyond the
+limit wait in a queue (optionally bounded by ``max_queue_wait_seconds``) or,
+when ``reject_when_busy`` is set, fail fast with
+:class:`~firefly_dworkers.exceptions.ConcurrencyLimitError` so the server
+can answer ``429 Too Many Requests``.
+
+Admission is re-entrant within a task: a task that already holds a slot for
+a ``(tenant, role)`` pair passes straight through nested admissions for the
+same pair, so a worker delegating to itself cannot deadlock.
+
+Example::
+
+    async with admission_controller.admit(config, WorkerRole.ANALYST):
+        result = await worker.run(prompt)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from firefly_dworkers.exceptions import ConcurrencyLimitError
+from firefly_dworkers.types import WorkerRole
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tenants.config import TenantConfig, WorkerConfig
+
+_AdmissionKey = tuple[str, str]
+
+# Slots held by the current task, as ``(key, id(task))`` pairs.  Tasks
+# spawned while a slot is held inherit the context, so the task id keeps
+# child tasks from riding on their parent's slot.
+_held_slots: contextvars.ContextVar[frozenset[tuple[_AdmissionKey, int]]] = contextvars.ContextVar(
+    "dworkers_admission_held",
+    default=frozenset(),
+)
+
+
+class AdmissionStats(BaseModel):
+    """Point-in-time admission metrics for one ``(tenant, role)`` pair."""
+
+    tenant_id: str
+    role: str
+    limit: int
+    active: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    total_wait_ms: float = 0.0
+    avg_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+
+class _Limiter:
+    """FIFO counting limiter that hands slots directly to waiters."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.peak_queue_depth = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def set_limit(self, limit: int) -> None:
+        """Apply a (possibly changed) limit, waking waiters if it grew."""
+        self.limit = limit
+        while self.waiters and (limit <= 0 or self.active < limit):
+            fut = self.waiters.popleft()
+            if not fut.done():
+                self.active += 1
+                fut.set_result(None)
+
+    def try_acquire(self) -> bool:
+        if self.limit <= 0 or (self.active < self.limit and not self.waiters):
+            self.active += 1
+            return True
+        return False
+
+    async def acquire(self, timeout: float | None) -> None:
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.waiters.append(fut)
+        self.peak_queue_depth = max(self.peak_queue_depth, len(self.waiters))
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except BaseException:
+            if fut in self.waiters:
+                self.waiters.remove(fut)
+            elif fut.done() and not fut.cancelled():
+                # The slot was handed over just as we gave up -- pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self.waiters:
+            fut = self.waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)  # Slot transfers; ``active`` is unchanged
+                return
+        self.active = max(0, self.active - 1)
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.admitted += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+
+class AdmissionController:
+    """Enforces ``max_concurrent_tasks`` per ``(tenant, role)``.
+
+    A module-level singleton :data:`admission_controller` is provided and
+    is what :class:`~firefly_dworkers.workers.base.BaseWorker` and the
+    server routers use.
+    """
+
+    def __init__(self) -> None:
+        self._limiters: dict[_AdmissionKey, _Limiter] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.asynccontextmanager
+    async def admit(
+        self,
+        config: TenantConfig,
+        role: str | WorkerRole,
+        *,
+        fail_fast: bool | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[None]:
+        """Hold a concurrency slot for *role* in *config*'s tenant.
+
+        Parameters:
+            config: Tenant whose worker settings define the limit.
+            role: Worker role being run.  Roles without tenant settings
+                (e.g. dynamically registered agents) are not limited.
+            fail_fast: Override the tenant's ``reject_when_busy`` setting.
+            timeout: Override the tenant's ``max_queue_wait_seconds``.
+
+        Raises:
+            ConcurrencyLimitError: When the slot cannot be obtained because
+                the limit is reached and fail-fast is on, or the queue wait
+                exceeds the timeout.
+        """
+        role_value = role.value if isinstance(role, WorkerRole) else str(role)
+        key = (config.id, role_value)
+        held = _held_slots.get()
+        marker = (key, id(asyncio.current_task()))
+        settings = _settings_for(config, role_value)
+        if settings is None or marker in held:
+            yield
+            return
+
+        limiter = self._limiter(key, int(settings.max_concurrent_tasks))
+        reject = bool(settings.reject_when_busy) if fail_fast is None else fail_fast
+        wait_timeout = timeout if timeout is not None else (float(settings.max_queue_wait_seconds) or None)
+
+        t0 = time.perf_counter()
+        if not limiter.try_acquire():
+            if reject:
+                limiter.rejected += 1
+                raise ConcurrencyLimitError(
+                    f"Tenant '{config.id}' is at its limit of {limiter.limit} concurrent '{role_value}' runs"
+                )
+            try:
+                await limiter.acquire(wait_timeout)
+            except TimeoutError:
+                limiter.rejected += 1
+                raise ConcurrencyLimitError(
+                    f"Timed out after {wait_timeout}s waiting for a '{role_value}' slot for tenant '{config.id}'"
+                ) from None
+        limiter.record_wait((time.perf_counter() - t0) * 1000)
+
+        token = _held_slots.set(held | {marker})
+        try:
+            yield
+        finally:
+            _held_slots.reset(token)
+            limiter.release()
+
+    def stats(self, tenant_id: str | None = None) -> list[AdmissionStats]:
+        """Return admission metrics, optionally filtered to one tenant."""
+        with self._lock:
+            items = list(self._limiters.items())
+        return [
+            AdmissionStats(
+                tenant_id=tid,
+                role=role,
+                limit=lim.limit,
+                active=lim.active,
+                queue_depth=len(lim.waiters),
+                peak_queue_depth=lim.peak_queue_depth,
+                admitted=lim.admitted,
+                rejected=lim.rejected,
+                total_wait_ms=lim.total_wait_ms,
+                avg_wait_ms=lim.total_wait_ms / lim.admitted if lim.admitted else 0.0,
+                max_wait_ms=lim.max_wait_ms,
+            )
+            for (tid, role), lim in items
+            if tenant_id is None or tid == tenant_id
+        ]
+
+    def clear(self) -> None:
+        """Drop all limiters and metrics (useful for testing)."""
+        with self._lock:
+            self._limiters.clear()
+
+    def _limiter(self, key: _AdmissionKey, limit: int) -> _Limiter:
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = _Limiter(limit)
+        if limiter.limit != limit:
+            limiter.set_limit(limit)
+        return limiter
+
+
+def _settings_for(config: TenantConfig, role: str) -> WorkerConfig.WorkerSettings | None:
+    """Return the tenant's worker settings for *role*, or ``None`` if unknown."""
+    try:
+        return config.workers.settings_for(role)
+    except AttributeError:
+        return None
+
+
+admission_controller = AdmissionController()
@@ -6,13 +6,17 @@ worker-specific concerns: role, autonomy level, and tenant configuration.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fireflyframework_genai.agents.base import FireflyAgent
 
 from firefly_dworkers.tenants.config import TenantConfig
 from firefly_dworkers.types import AutonomyLevel, WorkerRole
 
+if TYPE_CHECKING:
+    from firefly_dworkers.workers.response_cache import CachedResponse, ResponseCache
+    from firefly_dworkers.workers.semantic_cache import SemanticCache
+
 
 class BaseWorker(FireflyAgent):
     """Base class for all digital workers.
@@ -58,9 +62,15 @@ class BaseWorker(FireflyAgent):
         self._tenant_config = tenant_config
         self._instructions_text = instructions if isinstance(instructions, str) else ""
         self._checkpoint_handler: Any = None
+        self._cache_model_id = str(getattr(resolved_model, "model_name", resolved_model))
+        self._cache_tool_names = _tool_names(tools)
 
         # Build guard + cost middleware from tenant config and merge with user
         # middleware (guards come first, then cost, then user middleware).
+        # The response caches have to short-circuit the model call, so they
+        # wrap :meth:`run` rather than joining the framework chain.
+        self._response_cache = self._build_response_cache(tenant_config)
+        self._semantic_cache = self._build_semantic_cache(tenant_config)
         guard_middleware = self._build_guard_middleware(tenant_config)
         cost_middleware = self._build_cost_middleware(tenant_config)
         user_middleware = kwargs.pop("middleware", None) or []
@@ -94,38 +104,33 @@ class BaseWorker(FireflyAgent):
                 OutputGuardMiddleware,
                 PromptGuardMiddleware,
             )
-            from fireflyframework_genai.security.output_guard import OutputGuard
-            from fireflyframework_genai.security.prompt_guard import PromptGuard
         except ImportError:
             return middleware
 
+        from firefly_dworkers.workers.guards import output_guard_for, prompt_guard_for
+
+        # Guards compile their pattern sets on construction, so instances
+        # are shared by every worker with the same guard settings.
         if guards_cfg.prompt_guard_enabled:
-            prompt_guard = PromptGuard(
-                custom_patterns=guards_cfg.custom_prompt_patterns,
-                sanitise=guards_cfg.sanitise_prompts,
-                max_input_length=guards_cfg.max_input_length,
-            )
-            middleware.append(
-                PromptGuardMiddleware(
-                    guard=prompt_guard,
-                    sanitise=guards_cfg.sanitise_prompts,
-                ),
-            )
+            prompt_guard = prompt_guard_for(guards_cfg)
+            if prompt_guard is not None:
+                middleware.append(
+                    PromptGuardMiddleware(
+                        guard=prompt_guard,
+                        sanitise=guards_cfg.sanitise_prompts,
+                    ),
+                )
 
         if guards_cfg.output_guard_enabled:
-            output_guard = OutputGuard(
-                custom_patterns=guards_cfg.custom_output_patterns or None,
-                deny_patterns=guards_cfg.custom_deny_patterns,
-                sanitise=guards_cfg.sanitise_outputs,
-                max_output_length=guards_cfg.max_output_length,
-            )
-            middleware.append(
-                OutputGuardMiddleware(
-                    guard=output_guard,
-                    sanitise=guards_cfg.sanitise_outputs,
-                    block_categories=guards_cfg.output_block_categories,
-                ),
-            )
+            output_guard = output_guard_for(guards_cfg)
+            if output_guard is not None:
+                middleware.append(
+                    OutputGuardMiddleware(
+                        guard=output_guard,
+                        sanitise=guards_cfg.sanitise_outputs,
+                        block_categories=guards_cfg.output_block_categories,
+                    ),
+                )
 
         return middleware
 
@@ -160,6 +165,95 @@ class BaseWorker(FireflyAgent):
         )
         return middleware
 
+    # -- Response cache builders -----------------------------------------------
+
+    @staticmethod
+    def _build_response_cache(config: TenantConfig) -> ResponseCache | None:
+        """Return the tenant's shared response cache, or ``None`` when disabled."""
+        from firefly_dworkers.workers.response_cache import response_cache_for
+
+        return response_cache_for(config)
+
+    @staticmethod
+    def _build_semantic_cache(config: TenantConfig) -> SemanticCache | None:
+        """Return the tenant's shared semantic cache, or ``None`` when disabled."""
+        from firefly_dworkers.workers.semantic_cache import semantic_cache_for
+
+        return semantic_cache_for(config)
+
+    # -- Execution -----------------------------------------------------------
+
+    async def run(self, prompt: Any, **kwargs: Any) -> Any:
+        """Run the worker, holding a tenant concurrency slot for its role.
+
+        Waits (or fails fast, per tenant settings) when the tenant already
+        has ``max_concurrent_tasks`` runs in flight for this role.  When the
+        tenant's response cache is enabled, a request identical (or, with
+        the semantic cache, similar) to an earlier one returns a
+        :class:`CachedResponse` without calling the model or taking a slot.
+
+        Raises:
+            ConcurrencyLimitError: When admission is rejected.
+        """
+        from firefly_dworkers.workers.admission import admission_controller
+
+        cached = self.cached_response(prompt, **kwargs)
+        if cached is not None:
+            return cached
+        async with admission_controller.admit(self._tenant_config, self._role):
+            result = await super().run(prompt, **kwargs)
+        self.cache_response(prompt, result.output if hasattr(result, "output") else result, **kwargs)
+        return result
+
+    def cached_response(self, prompt: Any, **kwargs: Any) -> CachedResponse | None:
+        """Look *prompt* up in the tenant's response caches.
+
+        Exact matches win; the semantic cache is only consulted for plain
+        text prompts without further run options.  Runs with a
+        ``conversation_id`` are never served from the cache.
+        """
+        from firefly_dworkers.workers.response_cache import CachedResponse
+
+        options = _cache_options(kwargs)
+        if options is None:
+            return None
+        if self._response_cache is not None:
+            output = self._response_cache.get(self._cache_key(prompt, options))
+            if output is not None:
+                return CachedResponse(output=output)
+        if self._semantic_cache is not None and isinstance(prompt, str) and not options:
+            match = self._semantic_cache.lookup(self._cache_scope, prompt)
+            if match is not None:
+                return CachedResponse(output=match.output, approximate=True, similarity=match.similarity)
+        return None
+
+    def cache_response(self, prompt: Any, output: Any, **kwargs: Any) -> None:
+        """Store *output* as the answer to *prompt* in the tenant's response caches."""
+        options = _cache_options(kwargs)
+        if options is None:
+            return
+        if self._response_cache is not None:
+            self._response_cache.put(self._cache_key(prompt, options), output)
+        if self._semantic_cache is not None and isinstance(prompt, str) and not options:
+            self._semantic_cache.add(self._cache_scope, prompt, output)
+
+    @property
+    def _cache_scope(self) -> str:
+        """Semantic cache scope: this role with this model, instructions and tools."""
+        return f"{self._role.value}:{self._cache_key(None, {})}"
+
+    def _cache_key(self, prompt: Any, options: dict[str, Any]) -> str:
+        from firefly_dworkers.workers.response_cache import response_cache_key
+
+        return response_cache_key(
+            tenant_id=self._tenant_config.id,
+            model=self._cache_model_id,
+            instructions=self._instructions_text,
+            tools=self._cache_tool_names,
+            prompt=prompt,
+            options=options,
+        )
+
     # -- Properties ----------------------------------------------------------
 
     @property
@@ -177,6 +271,11 @@ class BaseWorker(FireflyAgent):
         """The tenant configuration bound to this worker."""
         return self._tenant_config
 
+    @property
+    def config_fingerprint(self) -> str:
+        """Hash of this worker's tenant, model, resolved instructions and tools."""
+        return self._cache_key(None, {})
+
     @property
     def checkpoint_handler(self) -> Any:
         """The checkpoint handler for autonomy checkpoints, or ``None``."""
@@ -201,3 +300,19 @@ class BaseWorker(FireflyAgent):
         if self._checkpoint_handler is None:
             return True
         return await self._checkpoint_handler.on_checkpoint(self.name, phase, deliverable)
+
+
+def _cache_options(kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Run options that take part in the cache key, or ``None`` if the run must not be cached."""
+    if kwargs.get("conversation_id"):
+        return None
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _tool_names(tools: Any) -> list[str]:
+    """Names identifying *tools* in response cache keys."""
+    names: list[str] = []
+    for tool in tools or ():
+        name = getattr(tool, "name", None) or getattr(tool, "__name__", None) or type(tool).__name__
+        names.append(str(name))
+    return names
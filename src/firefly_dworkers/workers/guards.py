@@ -0,0 +1,278 @@
+"""Guard caching and streaming output scanning.
+
+Building a :class:`PromptGuard` or :class:`OutputGuard` compiles its whole
+regex pattern set, so :data:`guard_cache` shares one instance per guard
+kind and tenant guard configuration (keyed by a fingerprint of
+:class:`~firefly_dworkers.tenants.config.GuardsConfig`).  Creating many
+workers for the same tenant compiles the patterns once.
+
+:class:`StreamingOutputGuard` scans a streamed response chunk by chunk.
+Each character is scanned a bounded number of times, and only a short
+tail (``stream_window_chars``) is held back so that a secret split across
+two chunks is still caught before it is emitted::
+
+    guard = streaming_output_guard(config)
+    async for token in stream.stream_tokens():
+        safe = guard.feed(token)   # may be "" while text is held back
+        ...
+    tail = guard.flush()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from firefly_dworkers.exceptions import GuardViolationError
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tenants.config import GuardsConfig, TenantConfig
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[REDACTED]"
+
+
+def guards_fingerprint(config: GuardsConfig) -> str:
+    """Hash of a tenant's guard settings; equal settings share guard instances."""
+    return hashlib.sha256(config.model_dump_json().encode()).hexdigest()
+
+
+class GuardCache:
+    """Thread-safe LRU cache of constructed guard objects.
+
+    Parameters:
+        max_entries: Maximum number of guards kept.
+    """
+
+    def __init__(self, *, max_entries: int = 64) -> None:
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get_or_create(self, kind: str, config: GuardsConfig, factory: Callable[[], Any]) -> Any:
+        """Return the cached *kind* guard for *config*, building it with *factory* on a miss."""
+        key = (kind, guards_fingerprint(config))
+        with self._lock:
+            guard = self._entries.get(key)
+            if guard is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return guard
+            self._misses += 1
+        guard = factory()
+        with self._lock:
+            guard = self._entries.setdefault(key, guard)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return guard
+
+    def stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def clear(self) -> None:
+        """Remove all guards and reset counters (useful for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+guard_cache = GuardCache()
+
+
+class StreamingOutputGuard:
+    """Incrementally scans streamed output for blocked content.
+
+    Matches in ``deny`` always raise.  Matches in *block_categories* are
+    replaced with ``[REDACTED]`` when *sanitise* is set and raise
+    otherwise.  Other categories are ignored.
+
+    Parameters:
+        patterns: Compiled patterns by category and name.
+        block_categories: Categories that are redacted or rejected.
+        sanitise: Redact instead of raising for *block_categories*.
+        window: Characters held back so that matches spanning chunk
+            boundaries are caught; should exceed the longest expected match.
+        max_length: Reject output longer than this (``0`` = no limit).
+    """
+
+    def __init__(
+        self,
+        patterns: Mapping[str, Mapping[str, re.Pattern[str]]],
+        *,
+        block_categories: list[str],
+        sanitise: bool = True,
+        window: int = 256,
+        max_length: int = 0,
+    ) -> None:
+        self._checks = [
+            (category, name, pattern)
+            for category, group in patterns.items()
+            if category == "deny" or category in block_categories
+            for name, pattern in group.items()
+        ]
+        self._sanitise = sanitise
+        self._window = window
+        self._max_length = max_length
+        self._pending = ""
+        self._seen = 0
+
+    def feed(self, chunk: str) -> str:
+        """Add *chunk* and return the text that is now safe to emit."""
+        self._pending += chunk
+        self._seen += len(chunk)
+        if self._max_length and self._seen > self._max_length:
+            raise GuardViolationError(f"Output exceeds the maximum length of {self._max_length} characters")
+        # Scan in batches so each character is scanned about twice.
+        if len(self._pending) < 2 * self._window:
+            return ""
+        return self._release(len(self._pending) - self._window)
+
+    def flush(self) -> str:
+        """Scan and return everything still held back."""
+        return self._release(len(self._pending))
+
+    def _release(self, cut: int) -> str:
+        text = self._pending
+        spans: list[tuple[int, int]] = []
+        for category, name, pattern in self._checks:
+            for match in pattern.finditer(text):
+                if match.start() >= cut or match.end() == match.start():
+                    continue
+                if category == "deny" or not self._sanitise:
+                    raise GuardViolationError(f"Output blocked by guard pattern '{name}' ({category})")
+                spans.append(match.span())
+        merged = _merge_spans(spans)
+        # Hold back a match that straddles the cut so it is redacted whole.
+        for start, end in merged:
+            if start < cut < end:
+                cut = start
+        safe, self._pending = text[:cut], text[cut:]
+        for start, end in reversed([span for span in merged if span[1] <= cut]):
+            safe = safe[:start] + REDACTED + safe[end:]
+        return safe
+
+
+def _merge_spans(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def streaming_output_guard(config: TenantConfig) -> StreamingOutputGuard | None:
+    """Return a fresh streaming guard for *config*, or ``None`` when not configured.
+
+    Requires ``security.guards.output_guard_enabled`` and
+    ``output_guard_mode: streaming``.  The built-in patterns come from the
+    tenant's cached :class:`OutputGuard`; the tenant's custom and deny
+    patterns are compiled from *config* directly.  When the guard's
+    patterns cannot be read, a warning is logged and ``None`` is returned
+    rather than a guard that scans for nothing.
+    """
+    guards_cfg = config.security.guards
+    if not guards_cfg.output_guard_enabled or guards_cfg.output_guard_mode != "streaming":
+        return None
+    guard = output_guard_for(guards_cfg)
+    if guard is None:
+        return None
+    patterns = _output_guard_patterns(guard)
+    if not patterns:
+        logger.warning(
+            "Cannot read the patterns of %s; streamed output for tenant %r is not scanned",
+            type(guard).__name__,
+            config.id,
+        )
+        return None
+    _add_tenant_patterns(patterns, guards_cfg)
+    return StreamingOutputGuard(
+        patterns,
+        block_categories=guards_cfg.output_block_categories,
+        sanitise=guards_cfg.sanitise_outputs,
+        window=guards_cfg.stream_window_chars,
+        max_length=guards_cfg.max_output_length,
+    )
+
+
+def _output_guard_patterns(guard: Any) -> dict[str, dict[str, re.Pattern[str]]]:
+    """Copy the compiled pattern groups of an :class:`OutputGuard`.
+
+    The framework exposes no public accessor for them, so ``patterns`` is
+    preferred when present and the private ``_groups`` used otherwise.
+    Returns an empty dict when neither holds compiled patterns.
+    """
+    groups = getattr(guard, "patterns", None)
+    if not isinstance(groups, Mapping):
+        groups = getattr(guard, "_groups", None)
+    if not isinstance(groups, Mapping):
+        return {}
+    patterns: dict[str, dict[str, re.Pattern[str]]] = {}
+    for category, group in groups.items():
+        if isinstance(group, Mapping):
+            compiled = {name: p for name, p in group.items() if isinstance(p, re.Pattern)}
+            if compiled:
+                patterns[str(category)] = compiled
+    return patterns
+
+
+def _add_tenant_patterns(patterns: dict[str, dict[str, re.Pattern[str]]], guards_cfg: GuardsConfig) -> None:
+    """Ensure the tenant's own custom and deny patterns are scanned."""
+    custom = patterns.setdefault("custom", {})
+    for name, pattern in guards_cfg.custom_output_patterns.items():
+        custom.setdefault(name, re.compile(pattern))
+    deny = patterns.setdefault("deny", {})
+    known = {p.pattern for p in deny.values()}
+    for index, pattern in enumerate(guards_cfg.custom_deny_patterns):
+        if pattern not in known:
+            deny[f"custom_deny_{index}"] = re.compile(pattern)
+
+
+def prompt_guard_for(guards_cfg: GuardsConfig) -> Any | None:
+    """Return the shared :class:`PromptGuard` for *guards_cfg*, or ``None`` if unavailable."""
+    try:
+        from fireflyframework_genai.security.prompt_guard import PromptGuard
+    except ImportError:
+        return None
+
+    return guard_cache.get_or_create(
+        "prompt",
+        guards_cfg,
+        lambda: PromptGuard(
+            custom_patterns=guards_cfg.custom_prompt_patterns,
+            sanitise=guards_cfg.sanitise_prompts,
+            max_input_length=guards_cfg.max_input_length,
+        ),
+    )
+
+
+def output_guard_for(guards_cfg: GuardsConfig) -> Any | None:
+    """Return the shared :class:`OutputGuard` for *guards_cfg*, or ``None`` if unavailable."""
+    try:
+        from fireflyframework_genai.security.output_guard import OutputGuard
+    except ImportError:
+        return None
+
+    return guard_cache.get_or_create(
+        "output",
+        guards_cfg,
+        lambda: OutputGuard(
+            custom_patterns=guards_cfg.custom_output_patterns or None,
+            deny_patterns=guards_cfg.custom_deny_patterns,
+            sanitise=guards_cfg.sanitise_outputs,
+            max_output_length=guards_cfg.max_output_length,
+        ),
+    )
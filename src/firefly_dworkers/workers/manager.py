@@ -6,8 +6,9 @@ to intelligently route tasks and PlanAndExecute for planning.
 
 from __future__ import annotations
 
+import contextlib
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from firefly_dworkers.exceptions import VerticalNotFoundError
@@ -134,6 +135,23 @@ class ManagerWorker(BaseWorker):
         self._specialists = list(specialists)
         self._router = None  # Reset so it's recreated on next access
 
+    @contextlib.contextmanager
+    def lease_specialists(self, roles: Sequence[str | WorkerRole]) -> Iterator[list[BaseWorker]]:
+        """Borrow specialists for *roles* from the shared pool for one run.
+
+        The specialists are bound to this manager's memory while leased and
+        returned to :data:`~firefly_dworkers.workers.pool.specialist_pool`
+        (and detached from this manager) when the block exits.
+        """
+        from firefly_dworkers.workers.pool import specialist_pool
+
+        with specialist_pool.lease(self.tenant_config, roles, memory=self.memory) as specialists:
+            self.set_specialists(specialists)
+            try:
+                yield specialists
+            finally:
+                self.set_specialists([])
+
     async def delegate(self, prompt: str) -> Any:
         """Delegate a task to the most appropriate specialist.
 
@@ -0,0 +1,232 @@
+"""SpecialistPool -- reusable, tenant-scoped pool of worker instances.
+
+Constructing a worker is comparatively expensive: it renders the role
+prompt, builds the toolkit and assembles guard/cost middleware.  The
+delegation path (orchestrator, manager, TUI) used to repeat that work for
+every project or message.  The pool keeps idle workers per
+``(tenant, role, model)`` and leases them exclusively to one run at a
+time, binding the run's memory on checkout and restoring it on release so
+state never leaks between runs.
+
+Example::
+
+    with specialist_pool.lease(config, [WorkerRole.ANALYST, WorkerRole.RESEARCHER], memory=mem) as workers:
+        router = DelegationRouter(agents=workers, strategy=ContentBasedStrategy(), memory=mem)
+        await router.route(prompt)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from firefly_dworkers.types import WorkerRole
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tenants.config import TenantConfig
+    from firefly_dworkers.workers.base import BaseWorker
+    from firefly_dworkers.workers.factory import WorkerFactory
+
+_PoolKey = tuple[str, str, str]
+
+_UNSET: Any = object()
+
+
+class _Lease:
+    """Bookkeeping for a checked-out worker."""
+
+    __slots__ = ("key", "config", "memory", "checkpoint_handler")
+
+    def __init__(self, key: _PoolKey, config: TenantConfig, memory: Any, checkpoint_handler: Any) -> None:
+        self.key = key
+        self.config = config
+        self.memory = memory
+        self.checkpoint_handler = checkpoint_handler
+
+
+class SpecialistPool:
+    """Thread-safe pool of reusable workers, scoped per tenant.
+
+    Workers are keyed by tenant ID, role and model.  If a tenant is
+    re-registered with a new :class:`TenantConfig` object, idle workers
+    built from the previous config are discarded on the next checkout.
+
+    Parameters:
+        factory: Worker factory used to build new instances.  Defaults
+            to the module-level :data:`~firefly_dworkers.workers.factory.worker_factory`.
+        max_idle_per_key: Upper bound on idle workers retained per
+            ``(tenant, role, model)`` key.  Extra workers are dropped on
+            release.
+    """
+
+    def __init__(self, *, factory: WorkerFactory | None = None, max_idle_per_key: int = 4) -> None:
+        self._factory = factory
+        self._max_idle = max_idle_per_key
+        self._idle: dict[_PoolKey, list[BaseWorker]] = {}
+        self._configs: dict[str, TenantConfig] = {}
+        self._leases: dict[int, _Lease] = {}
+        self._seq = 0
+        self._created = 0
+        self._reused = 0
+        self._lock = threading.Lock()
+
+    # -- Checkout / release ---------------------------------------------------
+
+    def acquire(
+        self,
+        role: str | WorkerRole,
+        config: TenantConfig,
+        *,
+        memory: Any = _UNSET,
+        model: str = "",
+    ) -> BaseWorker:
+        """Check out a worker for *role*, creating one if none is idle.
+
+        The returned worker is owned exclusively by the caller until
+        :meth:`release` is called.  When *memory* is given it is bound to
+        the worker for the duration of the lease.
+
+        Raises:
+            KeyError: If no worker is registered for *role*.
+        """
+        key = self._key(role, config, model)
+        worker: BaseWorker | None = None
+        with self._lock:
+            self._check_config(config)
+            idle = self._idle.get(key)
+            if idle:
+                worker = idle.pop()
+                self._reused += 1
+            else:
+                self._seq += 1
+                seq = self._seq
+
+        if worker is None:
+            worker = self._create(role, config, model=model, seq=seq)
+            with self._lock:
+                self._created += 1
+
+        lease = _Lease(key, config, getattr(worker, "memory", None), getattr(worker, "checkpoint_handler", None))
+        with self._lock:
+            self._leases[id(worker)] = lease
+        if memory is not _UNSET:
+            worker.memory = memory
+        return worker
+
+    def release(self, worker: BaseWorker) -> None:
+        """Return *worker* to the pool, restoring its pre-lease state.
+
+        Workers not obtained from this pool are ignored.
+        """
+        with self._lock:
+            lease = self._leases.pop(id(worker), None)
+        if lease is None:
+            return
+
+        worker.memory = lease.memory
+        if hasattr(worker, "checkpoint_handler"):
+            worker.checkpoint_handler = lease.checkpoint_handler
+
+        with self._lock:
+            if self._configs.get(lease.key[0]) is not lease.config:
+                return  # Tenant invalidated or reconfigured while leased
+            idle = self._idle.setdefault(lease.key, [])
+            if len(idle) < self._max_idle:
+                idle.append(worker)
+
+    @contextlib.contextmanager
+    def lease(
+        self,
+        config: TenantConfig,
+        roles: Sequence[str | WorkerRole],
+        *,
+        memory: Any = _UNSET,
+        model: str = "",
+    ) -> Iterator[list[BaseWorker]]:
+        """Context manager that checks out one worker per role.
+
+        Roles with no registered worker are skipped.  All workers are
+        released when the block exits, even on error.
+        """
+        workers: list[BaseWorker] = []
+        try:
+            for role in roles:
+                try:
+                    workers.append(self.acquire(role, config, memory=memory, model=model))
+                except KeyError:
+                    continue
+            yield workers
+        finally:
+            for worker in workers:
+                self.release(worker)
+
+    # -- Maintenance ----------------------------------------------------------
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """Drop idle workers for *tenant_id*, or for every tenant when ``None``.
+
+        Workers currently leased are discarded when released.
+        """
+        with self._lock:
+            if tenant_id is None:
+                self._idle.clear()
+                self._configs.clear()
+                return
+            self._configs.pop(tenant_id, None)
+            for key in [k for k in self._idle if k[0] == tenant_id]:
+                del self._idle[key]
+
+    def stats(self) -> dict[str, int]:
+        """Return pool counters: workers created, reused, idle and leased."""
+        with self._lock:
+            return {
+                "created": self._created,
+                "reused": self._reused,
+                "idle": sum(len(v) for v in self._idle.values()),
+                "leased": len(self._leases),
+            }
+
+    def clear(self) -> None:
+        """Remove all idle workers and reset counters (useful for testing)."""
+        with self._lock:
+            self._idle.clear()
+            self._configs.clear()
+            self._leases.clear()
+            self._seq = 0
+            self._created = 0
+            self._reused = 0
+
+    # -- Internal helpers -----------------------------------------------------
+
+    @staticmethod
+    def _key(role: str | WorkerRole, config: TenantConfig, model: str) -> _PoolKey:
+        role_value = role.value if isinstance(role, WorkerRole) else str(role)
+        return (config.id, role_value, model)
+
+    def _check_config(self, config: TenantConfig) -> None:
+        """Discard idle workers built from a stale config.  Caller holds the lock."""
+        current = self._configs.get(config.id)
+        if current is config:
+            return
+        if current is not None:
+            for key in [k for k in self._idle if k[0] == config.id]:
+                del self._idle[key]
+        self._configs[config.id] = config
+
+    def _create(self, role: str | WorkerRole, config: TenantConfig, *, model: str, seq: int) -> BaseWorker:
+        factory = self._factory
+        if factory is None:
+            from firefly_dworkers.workers.factory import worker_factory
+
+            factory = worker_factory
+
+        role_value = role.value if isinstance(role, WorkerRole) else str(role)
+        kwargs: dict[str, Any] = {"name": f"{role_value}-{config.id}-pool-{seq}"}
+        if model:
+            kwargs["model"] = model
+        return factory.create(role, config, **kwargs)
+
+
+specialist_pool = SpecialistPool()
@@ -0,0 +1,329 @@
+"""Response cache -- exact-match reuse of worker completions.
+
+Identical requests (same tenant, model, instructions, tools, prompt,
+message history and run options) are answered from the cache instead of
+the provider.  Entries live in a per-tenant in-memory LRU and, optionally,
+a SQLite database shared by the process so they survive restarts.  Both
+tiers honour the tenant's TTL.
+
+Caching is opt-in per tenant via :class:`~firefly_dworkers.tenants.config.CacheConfig`::
+
+    cache:
+      enabled: true
+      ttl_seconds: 3600
+      persistent: true    # also write to DWORKERS_RESPONSE_CACHE_PATH
+
+Runs that carry a ``conversation_id`` are never cached: their history is
+loaded from conversation memory and is not part of the request hash.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tenants.config import TenantConfig
+
+logger = logging.getLogger(__name__)
+
+# Fields that differ between otherwise identical requests (e.g. message timestamps).
+_VOLATILE_FIELDS = frozenset({"timestamp"})
+
+
+@dataclass
+class CachedResponse:
+    """Stand-in for an agent run result served from the cache.
+
+    ``approximate`` is set when the answer was given to a similar rather
+    than identical prompt (see :mod:`~firefly_dworkers.workers.semantic_cache`).
+    """
+
+    output: Any
+    cached: bool = True
+    approximate: bool = False
+    similarity: float = 1.0
+
+
+@runtime_checkable
+class ResponseStore(Protocol):
+    """Protocol for cached-response storage."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the output stored under *key*, or ``None`` on a miss."""
+        ...
+
+    def put(self, key: str, output: Any, expires_at: float) -> None:
+        """Store *output* until *expires_at* (``0`` = never expires)."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+
+
+class InMemoryResponseStore:
+    """Thread-safe LRU store kept in process memory.
+
+    Parameters:
+        max_entries: Maximum number of responses kept; least recently used
+            entries are evicted first.
+    """
+
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            output, expires_at = entry
+            if expires_at and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return output
+
+    def put(self, key: str, output: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (output, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseStore:
+    """Stores responses in a SQLite database at *path*.
+
+    Only JSON-serialisable outputs are persisted; anything else stays in
+    the in-memory tier.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, output TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute("SELECT output, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] and row[1] <= time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.warning("Ignoring unreadable cached response %s", key)
+            return None
+
+    def put(self, key: str, output: Any, expires_at: float) -> None:
+        try:
+            payload = json.dumps(output)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, output, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at > 0 AND expires_at <= ?",
+                (time.time(),),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+
+class ResponseCache:
+    """Two-tier response cache: an in-memory LRU backed by an optional store.
+
+    Parameters:
+        memory: The in-memory tier.
+        persistent: Optional second tier consulted on memory misses.
+        ttl_seconds: Lifetime of new entries (``0`` = never expire).
+    """
+
+    def __init__(
+        self,
+        memory: InMemoryResponseStore,
+        *,
+        persistent: ResponseStore | None = None,
+        ttl_seconds: float = 0.0,
+    ) -> None:
+        self._memory = memory
+        self._persistent = persistent
+        self._ttl = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached output for *key*, or ``None`` on a miss."""
+        output = self._memory.get(key)
+        if output is None and self._persistent is not None:
+            output = self._persistent.get(key)
+            if output is not None:
+                self._memory.put(key, output, self._expires_at())
+        with self._lock:
+            if output is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return output
+
+    def put(self, key: str, output: Any) -> None:
+        """Cache *output* under *key* in every tier (``None`` outputs are not cached)."""
+        if output is None:
+            return
+        expires_at = self._expires_at()
+        self._memory.put(key, output, expires_at)
+        if self._persistent is not None:
+            self._persistent.put(key, output, expires_at)
+
+    def stats(self) -> dict[str, int]:
+        """Return in-memory size and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._memory), "hits": self._hits, "misses": self._misses}
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._memory.clear()
+        if self._persistent is not None:
+            self._persistent.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def _expires_at(self) -> float:
+        return time.time() + self._ttl if self._ttl > 0 else 0.0
+
+
+def response_cache_key(
+    *,
+    tenant_id: str,
+    model: str,
+    instructions: str,
+    tools: list[str],
+    prompt: Any,
+    options: Mapping[str, Any] | None = None,
+) -> str:
+    """Canonical hash of one worker request.
+
+    *options* are the remaining run keyword arguments, e.g.
+    ``message_history``; volatile fields such as message timestamps are
+    ignored.
+    """
+    payload = {
+        "tenant": tenant_id,
+        "model": model,
+        "instructions": instructions,
+        "tools": sorted(tools),
+        "prompt": _canonical(prompt),
+        "options": _canonical(dict(options or {})),
+    }
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert *value* to JSON-compatible data with volatile fields removed."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if isinstance(value, Mapping):
+        return {str(k): _canonical(v) for k, v in value.items() if k not in _VOLATILE_FIELDS}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+# -- Per-tenant caches --------------------------------------------------------
+
+_caches: dict[str, ResponseCache] = {}
+_persistent_store: SQLiteResponseStore | None = None
+_caches_lock = threading.Lock()
+
+
+def response_cache_for(config: TenantConfig) -> ResponseCache | None:
+    """Return the tenant's response cache, or ``None`` when caching is off.
+
+    The cache is created on first use from the tenant's ``cache`` settings
+    and shared by all of the tenant's workers.
+    """
+    settings = config.cache
+    if not settings.enabled:
+        return None
+    with _caches_lock:
+        cache = _caches.get(config.id)
+        if cache is None:
+            cache = ResponseCache(
+                InMemoryResponseStore(max_entries=settings.max_entries),
+                persistent=_sqlite_store() if settings.persistent else None,
+                ttl_seconds=settings.ttl_seconds,
+            )
+            _caches[config.id] = cache
+        return cache
+
+
+def clear_response_caches() -> None:
+    """Drop every tenant's cache (useful for testing and after config reloads)."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.clear()
+        _caches.clear()
+
+
+def _sqlite_store() -> SQLiteResponseStore | None:
+    """The process-wide SQLite tier, or ``None`` if no path is configured."""
+    global _persistent_store
+    if _persistent_store is None:
+        from firefly_dworkers.config import get_config
+
+        path = get_config().response_cache_path
+        if not path:
+            return None
+        _persistent_store = SQLiteResponseStore(path)
+    return _persistent_store
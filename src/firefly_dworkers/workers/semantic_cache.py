@@ -0,0 +1,209 @@
+"""Semantic cache -- reuse worker answers for near-duplicate prompts.
+
+Where the exact-match :mod:`response cache <firefly_dworkers.workers.response_cache>`
+only helps when a request repeats verbatim, the semantic cache embeds each
+prompt locally and serves the answer of a previous prompt whose cosine
+similarity clears the tenant's threshold.  Entries are scoped to one
+tenant, role, model, instruction set and toolset, so an answer is only
+reused by a worker that would have been asked the same question.
+
+Results served this way are flagged ``approximate`` (see
+:class:`~firefly_dworkers.workers.response_cache.CachedResponse`), and the
+streaming API reports it in the ``complete`` event's metadata.
+
+The default :class:`HashingEmbedder` needs no model or extra dependency: it
+hashes words and character trigrams into a fixed-size vector, which is
+enough to match rephrasings that share most of their vocabulary.  Any
+object with an ``embed(text) -> list[float]`` method returning normalised
+vectors can be used instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from firefly_dworkers.tenants.config import TenantConfig
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+@runtime_checkable
+class Embedder(Protocol):
+    """Protocol for prompt embedders."""
+
+    def embed(self, text: str) -> list[float]:
+        """Return the L2-normalised embedding of *text*."""
+        ...
+
+
+class HashingEmbedder:
+    """Dependency-free bag-of-features embedder.
+
+    Lowercased words and their character trigrams are hashed into
+    *dimensions* signed buckets and the vector is L2-normalised.
+
+    Parameters:
+        dimensions: Size of the embedding vectors.
+    """
+
+    def __init__(self, *, dimensions: int = 512) -> None:
+        self._dimensions = dimensions
+
+    def embed(self, text: str) -> list[float]:
+        vector = [0.0] * self._dimensions
+        for feature in _features(text):
+            digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+            vector[digest % self._dimensions] += 1.0 if digest >> 63 else -1.0
+        norm = math.sqrt(math.sumprod(vector, vector))
+        return [v / norm for v in vector] if norm else vector
+
+
+@dataclass
+class SemanticMatch:
+    """A cached answer whose prompt is similar to the one looked up."""
+
+    output: Any
+    similarity: float
+    prompt: str
+
+
+@dataclass
+class _Entry:
+    prompt: str
+    vector: list[float]
+    numbers: frozenset[str]
+    output: Any
+    expires_at: float
+
+
+class SemanticCache:
+    """Thread-safe store of prompt embeddings and their answers.
+
+    Prompts only match when they mention the same numbers: "revenue in
+    2023" and "revenue in 2024" embed almost identically but must not
+    share an answer.
+
+    Parameters:
+        embedder: Prompt embedder.  Defaults to :class:`HashingEmbedder`.
+        threshold: Minimum cosine similarity for a match.
+        max_entries: Entries kept per scope; the oldest are dropped first.
+        ttl_seconds: Lifetime of new entries (``0`` = never expire).
+    """
+
+    def __init__(
+        self,
+        *,
+        embedder: Embedder | None = None,
+        threshold: float = 0.9,
+        max_entries: int = 256,
+        ttl_seconds: float = 0.0,
+    ) -> None:
+        self._embedder = embedder or HashingEmbedder()
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._scopes: dict[str, deque[_Entry]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, scope: str, prompt: str) -> SemanticMatch | None:
+        """Return the most similar cached answer in *scope*, or ``None``."""
+        vector = self._embedder.embed(prompt)
+        numbers = _numbers(prompt)
+        now = time.time()
+        best: _Entry | None = None
+        best_score = self._threshold
+        with self._lock:
+            for entry in self._scopes.get(scope, ()):
+                if (entry.expires_at and entry.expires_at <= now) or entry.numbers != numbers:
+                    continue
+                score = math.sumprod(vector, entry.vector)
+                if score >= best_score:
+                    best, best_score = entry, score
+            if best is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return SemanticMatch(output=best.output, similarity=best_score, prompt=best.prompt)
+
+    def add(self, scope: str, prompt: str, output: Any) -> None:
+        """Remember *output* as the answer to *prompt* in *scope*."""
+        if output is None:
+            return
+        entry = _Entry(
+            prompt=prompt,
+            vector=self._embedder.embed(prompt),
+            numbers=_numbers(prompt),
+            output=output,
+            expires_at=time.time() + self._ttl if self._ttl > 0 else 0.0,
+        )
+        with self._lock:
+            entries = self._scopes.setdefault(scope, deque(maxlen=self._max_entries))
+            entries.append(entry)
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and hit/miss counters."""
+        with self._lock:
+            entries = sum(len(e) for e in self._scopes.values())
+            return {"entries": entries, "hits": self._hits, "misses": self._misses}
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._scopes.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _numbers(text: str) -> frozenset[str]:
+    return frozenset(_NUMBER_RE.findall(text))
+
+
+def _features(text: str) -> list[str]:
+    features: list[str] = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        features.append(token)
+        padded = f"#{token}#"
+        features.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return features
+
+
+# -- Per-tenant caches --------------------------------------------------------
+
+_caches: dict[str, SemanticCache] = {}
+_caches_lock = threading.Lock()
+
+
+def semantic_cache_for(config: TenantConfig) -> SemanticCache | None:
+    """Return the tenant's semantic cache, or ``None`` when it is disabled."""
+    settings = config.cache
+    if not settings.semantic_enabled:
+        return None
+    with _caches_lock:
+        cache = _caches.get(config.id)
+        if cache is None:
+            cache = SemanticCache(
+                threshold=settings.semantic_threshold,
+                max_entries=settings.semantic_max_entries,
+                ttl_seconds=settings.ttl_seconds,
+            )
+            _caches[config.id] = cache
+        return cache
+
+
+def clear_semantic_caches() -> None:
+    """Drop every tenant's semantic cache (useful for testing)."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.clear()
+        _caches.clear()
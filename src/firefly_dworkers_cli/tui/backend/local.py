@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 from collections.abc import AsyncIterator
@@ -219,6 +220,7 @@ class LocalClient:
         message_history: list | None = None,
         participants: list[tuple[str, str, str]] | None = None,
     ) -> AsyncIterator[StreamEvent]:
+        leases = contextlib.ExitStack()
         try:
             self._ensure_workers_registered()
             from firefly_dworkers.tenants.registry import tenant_registry
@@ -240,17 +242,16 @@ class LocalClient:
             # Wire up delegation for manager when multiple agents present.
             if role == "manager" and participants:
                 agent_roles = [r for r, _, _ in participants if r not in ("user", "manager")]
-                if len(agent_roles) >= 2 and hasattr(worker, "set_specialists"):
+                if len(agent_roles) >= 2 and hasattr(worker, "lease_specialists"):
                     try:
-                        specialists = []
-                        for agent_role in agent_roles:
-                            specialist = worker_factory.create(
-                                WorkerRole(agent_role), config, name=f"{agent_role}-delegate"
-                            )
-                            specialists.append(specialist)
-                        worker.set_specialists(specialists)
+                        # Specialists come from the shared pool rather than
+                        # being rebuilt for every message.
+                        leases.enter_context(
+                            worker.lease_specialists([WorkerRole(r) for r in agent_roles])
+                        )
                     except Exception:
-                        pass  # Delegation is best-effort; fall back to manager handling directly
+                        # Delegation is best-effort; the manager handles the message directly.
+                        logger.warning("Could not lease specialists %s for delegation", agent_roles, exc_info=True)
 
             # Build multimodal content if attachments are provided.
             input_content: str | list = prompt
@@ -340,6 +341,8 @@ class LocalClient:
         except Exception as exc:
             logger.warning("run_worker failed: %s", exc, exc_info=True)
             yield StreamEvent(type="error", content=str(exc))
+        finally:
+            leases.close()
 
     # -- Projects -------------------------------------------------------------
 
@@ -472,6 +475,8 @@ class LocalClient:
             connectors: list[ConnectorStatus] = []
             for field_name in type(config.connectors).model_fields:
                 cfg = getattr(config.connectors, field_name)
+                if not hasattr(cfg, "enabled"):
+                    continue
                 enabled = getattr(cfg, "enabled", False)
                 provider = getattr(cfg, "provider", "")
                 connectors.append(
@@ -54,6 +54,8 @@ def _list_connectors(tenant_id: str) -> list[dict[str, Any]]:
         connectors: list[dict[str, Any]] = []
         for field_name in type(config.connectors).model_fields:
             cfg = getattr(config.connectors, field_name)
+            if not hasattr(cfg, "enabled"):
+                continue
             enabled = getattr(cfg, "enabled", False)
             provider = getattr(cfg, "provider", "")
             connectors.append(
@@ -0,0 +1,153 @@
+"""Jobs API router -- submit, inspect, follow and cancel background runs."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+
+from firefly_dworkers.jobs import Job, JobPriority, JobRunner, job_scheduler
+from firefly_dworkers.sdk.models import (
+    ExecutePlanRequest,
+    JobResponse,
+    ProjectRequest,
+    RunWorkerRequest,
+    SubmitJobRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+# ---------------------------------------------------------------------------
+# Helpers shared by the workers, plans and projects routers
+# ---------------------------------------------------------------------------
+
+
+def _to_response(job: Job) -> JobResponse:
+    return JobResponse(**job.to_dict())
+
+
+def submit_job(
+    kind: str,
+    runner: JobRunner,
+    *,
+    tenant_id: str,
+    priority: str | None,
+    default_priority: JobPriority,
+    metadata: dict[str, Any] | None = None,
+) -> Job:
+    """Queue *runner* on the scheduler, mapping a bad priority to ``422``."""
+    try:
+        resolved = JobPriority.parse(priority, default_priority)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return job_scheduler.submit(kind, runner, tenant_id=tenant_id, priority=resolved, metadata=metadata)
+
+
+def accepted_response(job: Job) -> JSONResponse:
+    """``202 Accepted`` response pointing at the job resource."""
+    return JSONResponse(
+        status_code=202,
+        content=_to_response(job).model_dump(mode="json"),
+        headers={"Location": f"/api/jobs/{job.id}"},
+    )
+
+
+async def _stream_job_events(job_id: str, after: int) -> AsyncIterator[str]:
+    """Yield the job's events as SSE, each tagged with its replay id."""
+    async for event_id, event in job_scheduler.subscribe(job_id, after=after):
+        yield f"id: {event_id}\ndata: {event.model_dump_json()}\n\n"
+
+
+def _parse_event_id(value: str | None) -> int:
+    try:
+        return max(0, int(value)) if value else 0
+    except ValueError:
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+@router.post("", status_code=202, response_model=None)
+async def create_job(request: SubmitJobRequest) -> JSONResponse:
+    """Submit a worker, plan or project run as a background job.
+
+    Returns ``202 Accepted`` with the job record; follow progress via
+    ``GET /api/jobs/{id}`` or ``GET /api/jobs/{id}/events``.
+    """
+    from firefly_dworkers_server.api.plans import _submit_plan_job
+    from firefly_dworkers_server.api.projects import _submit_project_job
+    from firefly_dworkers_server.api.workers import _submit_worker_job
+
+    params = {**request.params, "background": True}
+    if request.priority is not None:
+        params["priority"] = request.priority
+    try:
+        if request.kind == "worker":
+            return await _submit_worker_job(RunWorkerRequest.model_validate(params))
+        if request.kind == "plan":
+            return _submit_plan_job(ExecutePlanRequest.model_validate(params))
+        if request.kind == "project":
+            return await _submit_project_job(ProjectRequest.model_validate(params))
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors(include_url=False)) from exc
+    raise HTTPException(
+        status_code=422,
+        detail=f"Unknown job kind '{request.kind}'. Expected one of ['worker', 'plan', 'project']",
+    )
+
+
+@router.get("")
+async def list_jobs(tenant_id: str | None = None) -> list[JobResponse]:
+    """List known jobs, newest first, optionally filtered by tenant."""
+    return [_to_response(job) for job in job_scheduler.list_jobs(tenant_id)]
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str) -> JobResponse:
+    """Get a job's status and, once finished, its result."""
+    job = job_scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return _to_response(job)
+
+
+@router.get("/{job_id}/events")
+async def get_job_events(
+    job_id: str,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """Follow a job's progress events with SSE.
+
+    Every event carries an ``id:`` line.  A client that reconnects with the
+    ``Last-Event-ID`` header gets the events it missed replayed from the
+    job's bounded event log, followed by live events.  The stream ends
+    with a ``job_complete`` event once the job has finished.
+    """
+    if job_scheduler.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return StreamingResponse(
+        _stream_job_events(job_id, _parse_event_id(last_event_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str) -> JobResponse:
+    """Cancel a queued or running job."""
+    job = job_scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    if not job_scheduler.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' has already finished")
+    return _to_response(job_scheduler.get(job_id) or job)
@@ -65,3 +65,19 @@ async def get_agent_usage(agent_name: str) -> UsageResponse:
         )
     except ImportError:
         return UsageResponse()
+
+
+@router.get("/admission")
+async def get_admission_stats(tenant_id: str | None = None) -> list[dict[str, Any]]:
+    """Get per-tenant, per-role concurrency metrics (active, queue depth, wait times)."""
+    from firefly_dworkers.workers.admission import admission_controller
+
+    return [s.model_dump() for s in admission_controller.stats(tenant_id)]
+
+
+@router.get("/executors")
+async def get_executor_stats() -> list[dict[str, Any]]:
+    """Get per-connector thread pool metrics (active threads, queue depth, saturation)."""
+    from firefly_dworkers.tools.executors import connector_executors
+
+    return [s.model_dump() for s in connector_executors.stats()]
@@ -5,12 +5,17 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from firefly_dworkers.exceptions import PlanNotFoundError
 from firefly_dworkers.sdk.models import ExecutePlanRequest, PlanResponse, StreamEvent
+from firefly_dworkers_server.api.jobs import accepted_response, submit_job
+
+if TYPE_CHECKING:
+    from firefly_dworkers.jobs import JobContext
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +47,24 @@ async def get_plan(plan_name: str) -> dict:
     }
 
 
+@router.get("/{plan_name}/analysis")
+async def get_plan_analysis(plan_name: str) -> dict:
+    """Get the plan's topological levels, maximum width and critical path."""
+    from firefly_dworkers.exceptions import PlanError
+    from firefly_dworkers.plans import plan_registry
+    from firefly_dworkers.plans.analysis import analyze_plan
+
+    try:
+        plan = plan_registry.get(plan_name)
+    except PlanNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    try:
+        return analyze_plan(plan).model_dump()
+    except PlanError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
 # ---------------------------------------------------------------------------
 # SSE event handler -- bridges PipelineEventHandler to an asyncio.Queue
 # ---------------------------------------------------------------------------
@@ -50,7 +73,7 @@ async def get_plan(plan_name: str) -> dict:
 class _SSEEventHandler:
     """PipelineEventHandler that pushes StreamEvent instances to a queue."""
 
-    def __init__(self, queue: asyncio.Queue[StreamEvent | None]) -> None:
+    def __init__(self, queue: asyncio.Queue[StreamEvent | None] | _JobEventSink) -> None:
         self._queue = queue
 
     async def on_node_start(self, node_id: str, pipeline_name: str) -> None:
@@ -101,11 +124,62 @@ class _SSEEventHandler:
         await self._queue.put(None)
 
 
+class _JobEventSink:
+    """Queue-like adapter that forwards pipeline events to a background job."""
+
+    def __init__(self, ctx: JobContext) -> None:
+        self._ctx = ctx
+
+    async def put(self, event: StreamEvent | None) -> None:
+        if event is not None:
+            await self._ctx.emit(event)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
+def _resolve_plan_and_config(request: ExecutePlanRequest) -> tuple[Any, Any]:
+    """Look up the plan and tenant config, raising ``404`` if either is unknown."""
+    from firefly_dworkers.exceptions import TenantNotFoundError
+    from firefly_dworkers.plans import plan_registry
+    from firefly_dworkers.tenants.registry import tenant_registry
+
+    try:
+        plan = plan_registry.get(request.plan_name)
+    except PlanNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    try:
+        config = tenant_registry.get(request.tenant_id)
+    except TenantNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    return plan, config
+
+
+def _plan_builder(request: ExecutePlanRequest, plan: Any, config: Any) -> Any:
+    """Create the PlanBuilder, wiring in the step memo store when requested."""
+    from firefly_dworkers.plans.builder import PlanBuilder
+    from firefly_dworkers.plans.memo import step_memo_store
+
+    memo = step_memo_store() if request.reuse_step_outputs else None
+    return PlanBuilder(plan, config, memo=memo)
+
+
+def _plan_response(request: ExecutePlanRequest, plan: Any, result: Any) -> PlanResponse:
+    from firefly_dworkers.plans.analysis import build_run_report
+
+    return PlanResponse(
+        plan_name=request.plan_name,
+        success=result.success,
+        outputs={nid: nr.output for nid, nr in result.outputs.items() if nr.success},
+        duration_ms=result.total_duration_ms,
+        report=build_run_report(plan, result).model_dump(),
+    )
+
+
 async def _build_and_run_pipeline(
     request: ExecutePlanRequest,
     queue: asyncio.Queue[StreamEvent | None],
@@ -116,7 +190,6 @@ async def _build_and_run_pipeline(
     """
     from firefly_dworkers.exceptions import TenantNotFoundError
     from firefly_dworkers.plans import plan_registry
-    from firefly_dworkers.plans.builder import PlanBuilder
     from firefly_dworkers.tenants.registry import tenant_registry
 
     try:
@@ -135,7 +208,7 @@ async def _build_and_run_pipeline(
 
     handler = _SSEEventHandler(queue)
     try:
-        pipeline = PlanBuilder(plan, config).build()
+        pipeline = _plan_builder(request, plan, config).build()
         # Inject the event handler after build() returns
         pipeline._event_handler = handler
         await pipeline.run(inputs=request.inputs)
@@ -168,13 +241,39 @@ async def _stream_plan_events(request: ExecutePlanRequest) -> AsyncIterator[str]
 # ---------------------------------------------------------------------------
 
 
-@router.post("/execute")
-async def execute_plan(request: ExecutePlanRequest) -> StreamingResponse:
+def _submit_plan_job(request: ExecutePlanRequest) -> JSONResponse:
+    """Validate the plan and tenant, then queue execution as a background job."""
+    from firefly_dworkers.jobs import JobPriority
+
+    plan, config = _resolve_plan_and_config(request)
+
+    async def _runner(ctx: JobContext) -> dict:
+        pipeline = _plan_builder(request, plan, config).build()
+        pipeline._event_handler = _SSEEventHandler(_JobEventSink(ctx))
+        result = await pipeline.run(inputs=request.inputs)
+        return _plan_response(request, plan, result).model_dump()
+
+    job = submit_job(
+        "plan",
+        _runner,
+        tenant_id=request.tenant_id,
+        priority=request.priority,
+        default_priority=JobPriority.BATCH,
+        metadata={"plan_name": request.plan_name},
+    )
+    return accepted_response(job)
+
+
+@router.post("/execute", response_model=None)
+async def execute_plan(request: ExecutePlanRequest) -> StreamingResponse | JSONResponse:
     """Execute a consulting plan with SSE streaming.
 
     Streams pipeline progress events (node_start, node_complete, etc.)
-    as Server-Sent Events.
+    as Server-Sent Events.  With ``background=true`` the plan is queued on
+    the job scheduler and ``202 Accepted`` is returned with the job record.
     """
+    if request.background:
+        return _submit_plan_job(request)
     return StreamingResponse(
         _stream_plan_events(request),
         media_type="text/event-stream",
@@ -188,31 +287,14 @@ async def execute_plan_sync(request: ExecutePlanRequest) -> PlanResponse:
 
     Returns the complete result in a single response.
     """
-    from firefly_dworkers.exceptions import TenantNotFoundError
-    from firefly_dworkers.plans import plan_registry
-    from firefly_dworkers.plans.builder import PlanBuilder
-    from firefly_dworkers.tenants.registry import tenant_registry
 
-    try:
-        plan = plan_registry.get(request.plan_name)
-    except PlanNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    plan, config = _resolve_plan_and_config(request)
 
     try:
-        config = tenant_registry.get(request.tenant_id)
-    except TenantNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    try:
-        pipeline = PlanBuilder(plan, config).build()
+        pipeline = _plan_builder(request, plan, config).build()
         result = await pipeline.run(inputs=request.inputs)
     except Exception as exc:
         logger.exception("Plan execution error for '%s'", request.plan_name)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    return PlanResponse(
-        plan_name=request.plan_name,
-        success=result.success,
-        outputs={nid: nr.output for nid, nr in result.outputs.items() if nr.success},
-        duration_ms=result.total_duration_ms,
-    )
+    return _plan_response(request, plan, result)
@@ -7,9 +7,10 @@ import uuid
 from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from firefly_dworkers.sdk.models import ProjectEvent, ProjectRequest, ProjectResponse
+from firefly_dworkers_server.api.jobs import accepted_response, submit_job
 
 logger = logging.getLogger(__name__)
 
@@ -52,12 +53,49 @@ async def _stream_project_events(request: ProjectRequest) -> AsyncIterator[str]:
         yield f"data: {error_event.model_dump_json()}\n\n"
 
 
-@router.post("/run")
-async def run_project(request: ProjectRequest) -> StreamingResponse:
+async def _submit_project_job(request: ProjectRequest) -> JSONResponse:
+    """Queue the project run as a background job."""
+    from firefly_dworkers.jobs import JobContext, JobPriority
+
+    project_id = request.project_id or str(uuid.uuid4())
+    config = await _resolve_config(request.tenant_id)
+
+    async def _runner(ctx: JobContext) -> dict:
+        from firefly_dworkers.orchestration import ProjectOrchestrator
+
+        orchestrator = ProjectOrchestrator(config, project_id=project_id)
+        response = ProjectResponse(project_id=project_id, success=False)
+        async for event in orchestrator.run_stream(request.brief):
+            await ctx.emit(event)
+            if event.type == "project_complete":
+                response.success = event.metadata.get("success", True)
+                response.deliverables = event.metadata.get("deliverables", {})
+                response.duration_ms = event.metadata.get("duration_ms", 0.0)
+            elif event.type == "error":
+                raise RuntimeError(event.content)
+        return response.model_dump()
+
+    job = submit_job(
+        "project",
+        _runner,
+        tenant_id=request.tenant_id,
+        priority=request.priority,
+        default_priority=JobPriority.BATCH,
+        metadata={"project_id": project_id},
+    )
+    return accepted_response(job)
+
+
+@router.post("/run", response_model=None)
+async def run_project(request: ProjectRequest) -> StreamingResponse | JSONResponse:
     """Run a multi-agent project with SSE streaming.
 
-    Streams project orchestration events as Server-Sent Events.
+    Streams project orchestration events as Server-Sent Events.  With
+    ``background=true`` the project is queued on the job scheduler and
+    ``202 Accepted`` is returned with the job record instead.
     """
+    if request.background:
+        return await _submit_project_job(request)
     return StreamingResponse(
         _stream_project_events(request),
         media_type="text/event-stream",
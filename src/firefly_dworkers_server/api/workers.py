@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import logging
 from collections.abc import AsyncIterator
+from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from firefly_dworkers.sdk.models import RunWorkerRequest, StreamEvent, WorkerResponse
+from firefly_dworkers_server.api.jobs import accepted_response, submit_job
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +25,25 @@ async def list_workers() -> list[str]:
     return worker_registry.list_workers()
 
 
-async def _create_worker(request: RunWorkerRequest):
-    """Create a worker from the request, resolving tenant config."""
+async def _resolve_config(tenant_id: str):
+    """Resolve tenant config, raising HTTPException on failure."""
     from firefly_dworkers.exceptions import TenantNotFoundError
     from firefly_dworkers.tenants.registry import tenant_registry
-    from firefly_dworkers.types import WorkerRole
-    from firefly_dworkers.workers.factory import worker_factory
 
     try:
-        config = tenant_registry.get(request.tenant_id)
+        return tenant_registry.get(tenant_id)
     except TenantNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+
+async def _create_worker(request: RunWorkerRequest, config=None):
+    """Create a worker from the request, resolving tenant config."""
+    from firefly_dworkers.types import WorkerRole
+    from firefly_dworkers.workers.factory import worker_factory
+
+    if config is None:
+        config = await _resolve_config(request.tenant_id)
+
     try:
         role = WorkerRole(request.worker_role)
     except ValueError as exc:
@@ -97,27 +106,66 @@ def _build_input_content(request: RunWorkerRequest) -> str | list:
     return content
 
 
+def _cache_metadata(result: Any) -> dict[str, Any]:
+    """Event metadata flagging a result served from the response cache (empty otherwise)."""
+    from firefly_dworkers.workers.response_cache import CachedResponse
+
+    if not isinstance(result, CachedResponse):
+        return {}
+    return {"cached": True, "approximate": result.approximate, "similarity": result.similarity}
+
+
 async def _stream_worker_events(request: RunWorkerRequest) -> AsyncIterator[str]:
     """Generator that yields SSE events from a worker execution."""
+    from firefly_dworkers.exceptions import ConcurrencyLimitError, GuardViolationError
+    from firefly_dworkers.workers.admission import admission_controller
+    from firefly_dworkers.workers.guards import streaming_output_guard
+
     try:
-        worker = await _create_worker(request)
+        config = await _resolve_config(request.tenant_id)
+        worker = await _create_worker(request, config)
         input_content = _build_input_content(request)
-
-        stream_ctx = await worker.run_stream(
-            input_content,
-            conversation_id=request.conversation_id,
-            streaming_mode="incremental",
-        )
         collected_output: list[str] = []
 
-        async with stream_ctx as stream:
-            async for token in stream.stream_tokens():
-                collected_output.append(token)
-                event = StreamEvent(type="token", content=token)
+        cached = worker.cached_response(input_content, conversation_id=request.conversation_id)
+        if cached_metadata := _cache_metadata(cached):
+            cached_event = StreamEvent(
+                type="complete",
+                content=str(cached.output),
+                metadata={"worker_role": request.worker_role, **cached_metadata},
+            )
+            yield f"data: {cached_event.model_dump_json()}\n\n"
+            return
+
+        # Scan tokens as they arrive when the tenant uses the streaming output guard.
+        stream_guard = streaming_output_guard(config)
+
+        # Hold a tenant concurrency slot for the whole stream.
+        async with admission_controller.admit(config, request.worker_role):
+            stream_ctx = await worker.run_stream(
+                input_content,
+                conversation_id=request.conversation_id,
+                streaming_mode="incremental",
+            )
+
+            async with stream_ctx as stream:
+                async for token in stream.stream_tokens():
+                    if stream_guard is not None:
+                        token = stream_guard.feed(token)
+                        if not token:
+                            continue
+                    collected_output.append(token)
+                    event = StreamEvent(type="token", content=token)
+                    yield f"data: {event.model_dump_json()}\n\n"
+
+            if stream_guard is not None and (tail := stream_guard.flush()):
+                collected_output.append(tail)
+                event = StreamEvent(type="token", content=tail)
                 yield f"data: {event.model_dump_json()}\n\n"
 
         # Send completion event
         full_output = "".join(collected_output)
+        worker.cache_response(input_content, full_output, conversation_id=request.conversation_id)
         complete_event = StreamEvent(
             type="complete",
             content=full_output,
@@ -134,6 +182,24 @@ async def _stream_worker_events(request: RunWorkerRequest) -> AsyncIterator[str]
         )
         yield f"data: {error_event.model_dump_json()}\n\n"
 
+    except ConcurrencyLimitError as exc:
+        logger.info("Worker run rejected for role '%s': %s", request.worker_role, exc)
+        error_event = StreamEvent(
+            type="error",
+            content=str(exc),
+            metadata={"status_code": 429},
+        )
+        yield f"data: {error_event.model_dump_json()}\n\n"
+
+    except GuardViolationError as exc:
+        logger.warning("Worker output blocked for role '%s': %s", request.worker_role, exc)
+        error_event = StreamEvent(
+            type="error",
+            content=str(exc),
+            metadata={"status_code": 422},
+        )
+        yield f"data: {error_event.model_dump_json()}\n\n"
+
     except Exception as exc:
         logger.exception("Worker streaming error for role '%s'", request.worker_role)
         error_event = StreamEvent(
@@ -143,12 +209,48 @@ async def _stream_worker_events(request: RunWorkerRequest) -> AsyncIterator[str]
         yield f"data: {error_event.model_dump_json()}\n\n"
 
 
-@router.post("/run")
-async def run_worker_stream(request: RunWorkerRequest) -> StreamingResponse:
+async def _submit_worker_job(request: RunWorkerRequest) -> JSONResponse:
+    """Validate the request, then queue the worker run as a background job."""
+    from firefly_dworkers.jobs import JobContext, JobPriority
+
+    config = await _resolve_config(request.tenant_id)
+    worker = await _create_worker(request, config)
+    input_content = _build_input_content(request)
+
+    async def _runner(ctx: JobContext) -> dict:
+        result = await worker.run(input_content, conversation_id=request.conversation_id)
+        output = str(result.output) if hasattr(result, "output") else str(result)
+        metadata = {"worker_role": request.worker_role, **_cache_metadata(result)}
+        await ctx.emit(StreamEvent(type="complete", content=output, metadata=metadata))
+        return WorkerResponse(
+            worker_name=worker.name,
+            role=request.worker_role,
+            output=output,
+            conversation_id=request.conversation_id,
+        ).model_dump()
+
+    job = submit_job(
+        "worker",
+        _runner,
+        tenant_id=request.tenant_id,
+        priority=request.priority,
+        default_priority=JobPriority.INTERACTIVE,
+        metadata={"worker_role": request.worker_role},
+    )
+    return accepted_response(job)
+
+
+@router.post("/run", response_model=None)
+async def run_worker_stream(request: RunWorkerRequest) -> StreamingResponse | JSONResponse:
     """Run a worker with SSE streaming.
 
-    Streams token-by-token events as Server-Sent Events (SSE).
+    Streams token-by-token events as Server-Sent Events (SSE).  With
+    ``background=true`` the run is queued on the job scheduler instead and
+    ``202 Accepted`` is returned with the job record; poll
+    ``GET /api/jobs/{id}`` for the result.
     """
+    if request.background:
+        return await _submit_worker_job(request)
     return StreamingResponse(
         _stream_worker_events(request),
         media_type="text/event-stream",
@@ -162,6 +264,8 @@ async def run_worker_sync(request: RunWorkerRequest) -> WorkerResponse:
 
     Returns the complete output in a single response.
     """
+    from firefly_dworkers.exceptions import ConcurrencyLimitError
+
     worker = await _create_worker(request)
 
     try:
@@ -170,6 +274,8 @@ async def run_worker_sync(request: RunWorkerRequest) -> WorkerResponse:
             conversation_id=request.conversation_id,
         )
         output = str(result.output) if hasattr(result, "output") else str(result)
+    except ConcurrencyLimitError as exc:
+        raise HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "1"}) from exc
     except Exception as exc:
         logger.exception("Worker execution error for role '%s'", request.worker_role)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
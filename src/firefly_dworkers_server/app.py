@@ -7,9 +7,12 @@ observability (tracing + usage metrics).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fastapi import FastAPI
 
 
@@ -25,6 +28,29 @@ def _configure_observability(app: FastAPI) -> None:
         pass  # Framework REST middleware not available
 
 
+def _configure_tool_shutdown(app: FastAPI) -> None:
+    """Close the shared tool HTTP pool, SQL and IMAP connection pools and connector thread pools on shutdown."""
+    inner = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[Any]:
+        async with inner(app) as state:
+            try:
+                yield state
+            finally:
+                from firefly_dworkers.tools.communication.imap_pool import close_imap_sessions
+                from firefly_dworkers.tools.data.sql_pool import close_sql_pools
+                from firefly_dworkers.tools.executors import connector_executors
+                from firefly_dworkers.tools.http_pool import close_http_clients
+
+                await close_http_clients()
+                await close_sql_pools()
+                close_imap_sessions()
+                connector_executors.shutdown(wait=False)
+
+    app.router.lifespan_context = lifespan
+
+
 def create_dworkers_app(
     *,
     title: str = "Firefly Dworkers",
@@ -49,11 +75,15 @@ def create_dworkers_app(
     # Wire HTTP-level observability (trace propagation)
     _configure_observability(app)
 
+    # Release pooled keep-alive connections on shutdown
+    _configure_tool_shutdown(app)
+
     # Include dworkers-specific routers
     from firefly_dworkers_server.api.connectors import router as connectors_router
     from firefly_dworkers_server.api.conversations import (
         router as conversations_router,
     )
+    from firefly_dworkers_server.api.jobs import router as jobs_router
     from firefly_dworkers_server.api.knowledge import router as knowledge_router
     from firefly_dworkers_server.api.observability import (
         router as observability_router,
@@ -68,6 +98,7 @@ def create_dworkers_app(
     app.include_router(projects_router, prefix="/api/projects", tags=["projects"])
     app.include_router(tenants_router, prefix="/api/tenants", tags=["tenants"])
     app.include_router(knowledge_router, prefix="/api/knowledge", tags=["knowledge"])
+    app.include_router(jobs_router, prefix="/api/jobs", tags=["jobs"])
     app.include_router(
         observability_router,
         prefix="/api/observability",
@@ -258,6 +258,22 @@ class TestDataSet:
         assert len(ds.series) == 2
         assert ds.series[0].values[0] == 100
 
+    def test_from_columns(self):
+        data = {"quarter": ["Q1", "Q2"], "revenue": [100, None], "cost": [80, 90]}
+        ds = DataSet.from_columns("Sales", data, category="quarter", series=["revenue"])
+        assert ds.categories == ["Q1", "Q2"]
+        assert [s.name for s in ds.series] == ["revenue"]
+        assert ds.series[0].values == [100, 0]
+
+    def test_from_columns_defaults_to_first_column_and_all_series(self):
+        ds = DataSet.from_columns("Sales", {"quarter": ["Q1"], "revenue": [1], "cost": [2]})
+        assert ds.categories == ["Q1"]
+        assert [s.name for s in ds.series] == ["revenue", "cost"]
+
+    def test_from_columns_unknown_category(self):
+        with pytest.raises(KeyError, match="region"):
+            DataSet.from_columns("Sales", {"quarter": ["Q1"]}, category="region")
+
 
 # ── ImageRequest ──────────────────────────────────────────────────────────
 
@@ -0,0 +1,221 @@
+"""Tests for JobScheduler and the job stores."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from firefly_dworkers.jobs.models import Job, JobPriority, JobStatus
+from firefly_dworkers.jobs.scheduler import JobContext, JobScheduler
+from firefly_dworkers.jobs.store import FileJobStore, InMemoryJobStore
+from firefly_dworkers.sdk.models import StreamEvent
+
+
+def _recording_runner(order: list[str], label: str, gate: asyncio.Event | None = None):
+    async def _runner(ctx: JobContext) -> str:
+        if gate is not None:
+            await gate.wait()
+        order.append(label)
+        return label
+
+    return _runner
+
+
+class TestJobScheduler:
+    async def test_submit_runs_job_and_records_result(self) -> None:
+        scheduler = JobScheduler(max_concurrency=2)
+        job = scheduler.submit("demo", _recording_runner([], "done"), tenant_id="t1")
+        finished = await scheduler.wait(job.id, timeout=1)
+        assert finished is not None
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.result == "done"
+        assert finished.started_at is not None and finished.finished_at is not None
+
+    async def test_failed_runner_marks_job_failed(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+
+        async def _boom(ctx: JobContext) -> None:
+            raise RuntimeError("kaput")
+
+        job = scheduler.submit("demo", _boom)
+        finished = await scheduler.wait(job.id, timeout=1)
+        assert finished.status == JobStatus.FAILED
+        assert finished.error == "kaput"
+
+    async def test_higher_priority_dispatched_first(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+        gate = asyncio.Event()
+        order: list[str] = []
+        blocker = scheduler.submit("demo", _recording_runner(order, "blocker", gate))
+        batch = scheduler.submit("demo", _recording_runner(order, "batch"), priority=JobPriority.BATCH)
+        interactive = scheduler.submit("demo", _recording_runner(order, "interactive"), priority=JobPriority.INTERACTIVE)
+        gate.set()
+        for job in (blocker, batch, interactive):
+            await scheduler.wait(job.id, timeout=1)
+        assert order == ["blocker", "interactive", "batch"]
+
+    async def test_tenants_served_round_robin(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1, weight_for=lambda tid: 1)
+        gate = asyncio.Event()
+        order: list[str] = []
+        jobs = [scheduler.submit("demo", _recording_runner(order, "gate", gate), tenant_id="a")]
+        jobs += [scheduler.submit("demo", _recording_runner(order, f"a{i}"), tenant_id="a") for i in range(3)]
+        jobs += [scheduler.submit("demo", _recording_runner(order, f"b{i}"), tenant_id="b") for i in range(2)]
+        gate.set()
+        for job in jobs:
+            await scheduler.wait(job.id, timeout=1)
+        assert order == ["gate", "a0", "b0", "a1", "b1", "a2"]
+
+    async def test_weight_gives_tenant_more_turns(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1, weight_for=lambda tid: 2 if tid == "big" else 1)
+        gate = asyncio.Event()
+        order: list[str] = []
+        jobs = [scheduler.submit("demo", _recording_runner(order, "gate", gate), tenant_id="small")]
+        jobs += [scheduler.submit("demo", _recording_runner(order, f"big{i}"), tenant_id="big") for i in range(4)]
+        jobs += [scheduler.submit("demo", _recording_runner(order, f"small{i}"), tenant_id="small") for i in range(2)]
+        gate.set()
+        for job in jobs:
+            await scheduler.wait(job.id, timeout=1)
+        assert order[1:] == ["big0", "big1", "small0", "big2", "big3", "small1"]
+
+    async def test_max_concurrency_respected(self) -> None:
+        scheduler = JobScheduler(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def _runner(ctx: JobContext) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        jobs = [scheduler.submit("demo", _runner) for _ in range(6)]
+        for job in jobs:
+            await scheduler.wait(job.id, timeout=1)
+        assert peak == 2
+
+    async def test_cancel_queued_job(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+        gate = asyncio.Event()
+        order: list[str] = []
+        blocker = scheduler.submit("demo", _recording_runner(order, "blocker", gate))
+        queued = scheduler.submit("demo", _recording_runner(order, "queued"))
+        assert scheduler.cancel(queued.id) is True
+        gate.set()
+        await scheduler.wait(blocker.id, timeout=1)
+        assert scheduler.get(queued.id).status == JobStatus.CANCELLED
+        assert order == ["blocker"]
+
+    async def test_cancel_running_job(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+        job = scheduler.submit("demo", _recording_runner([], "never", asyncio.Event()))
+        await asyncio.sleep(0)
+        assert scheduler.get(job.id).status == JobStatus.RUNNING
+        assert scheduler.cancel(job.id) is True
+        finished = await scheduler.wait(job.id, timeout=1)
+        assert finished.status == JobStatus.CANCELLED
+        assert scheduler.cancel(job.id) is False
+
+    async def test_subscribe_receives_events(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+        gate = asyncio.Event()
+
+        async def _runner(ctx: JobContext) -> None:
+            await gate.wait()
+            await ctx.emit(StreamEvent(type="token", content="a"))
+            await ctx.emit(StreamEvent(type="token", content="b"))
+
+        job = scheduler.submit("demo", _runner)
+        received: list[str] = []
+
+        async def _consume() -> None:
+            async for _, event in scheduler.subscribe(job.id):
+                received.append(event.content)
+
+        consumer = asyncio.create_task(_consume())
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.wait_for(consumer, 1)
+        assert received == ["a", "b", "succeeded"]
+
+    async def test_subscribe_replays_after_event_id(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+
+        async def _runner(ctx: JobContext) -> None:
+            for token in ("a", "b", "c"):
+                await ctx.emit(StreamEvent(type="token", content=token))
+
+        job = scheduler.submit("demo", _runner)
+        await scheduler.wait(job.id, timeout=1)
+        replayed = [(eid, event.content) async for eid, event in scheduler.subscribe(job.id, after=1)]
+        assert replayed == [(2, "b"), (3, "c"), (4, "succeeded")]
+
+    async def test_event_log_is_bounded(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1, max_events_per_job=2, max_event_logs=1)
+
+        async def _runner(ctx: JobContext) -> None:
+            for token in ("a", "b", "c"):
+                await ctx.emit(StreamEvent(type="token", content=token))
+
+        first = scheduler.submit("demo", _runner)
+        await scheduler.wait(first.id, timeout=1)
+        ids = [eid async for eid, _ in scheduler.subscribe(first.id)]
+        assert ids == [3, 4]
+
+        second = scheduler.submit("demo", _runner)
+        await scheduler.wait(second.id, timeout=1)
+        assert [eid async for eid, _ in scheduler.subscribe(first.id)] == []
+
+    async def test_stats_report_queue_depth(self) -> None:
+        scheduler = JobScheduler(max_concurrency=1)
+        gate = asyncio.Event()
+        jobs = [scheduler.submit("demo", _recording_runner([], str(i), gate), tenant_id="t") for i in range(3)]
+        stats = scheduler.stats()
+        assert stats["running"] == 1
+        assert stats["queued"] == {"t": 2}
+        gate.set()
+        for job in jobs:
+            await scheduler.wait(job.id, timeout=1)
+
+
+class TestJobModels:
+    def test_priority_parse(self) -> None:
+        assert JobPriority.parse("batch", JobPriority.NORMAL) == JobPriority.BATCH
+        assert JobPriority.parse(None, JobPriority.INTERACTIVE) == JobPriority.INTERACTIVE
+        assert JobPriority.parse(0, JobPriority.NORMAL) == JobPriority.INTERACTIVE
+        with pytest.raises(ValueError, match="Unknown job priority"):
+            JobPriority.parse("urgent", JobPriority.NORMAL)
+
+    def test_round_trip(self) -> None:
+        job = Job(kind="plan", tenant_id="t", priority=JobPriority.BATCH, metadata={"plan_name": "x"})
+        restored = Job.from_dict(job.to_dict())
+        assert restored.id == job.id
+        assert restored.priority == JobPriority.BATCH
+        assert restored.metadata == {"plan_name": "x"}
+        assert restored.created_at == job.created_at
+
+
+class TestJobStores:
+    def test_in_memory_evicts_oldest_finished_jobs(self) -> None:
+        store = InMemoryJobStore(max_jobs=2)
+        running = Job(kind="demo", status=JobStatus.RUNNING)
+        done = Job(kind="demo", status=JobStatus.SUCCEEDED)
+        store.save(running)
+        store.save(done)
+        store.save(Job(kind="demo"))
+        assert store.get(running.id) is not None
+        assert store.get(done.id) is None
+
+    def test_file_store_round_trip(self, tmp_path) -> None:
+        store = FileJobStore(tmp_path)
+        job = Job(kind="worker", tenant_id="acme", status=JobStatus.SUCCEEDED, result={"output": "ok"})
+        store.save(job)
+        loaded = store.get(job.id)
+        assert loaded is not None
+        assert loaded.result == {"output": "ok"}
+        assert [j.id for j in store.list_jobs("acme")] == [job.id]
+        assert store.list_jobs("other") == []
+        store.delete(job.id)
+        assert store.get(job.id) is None
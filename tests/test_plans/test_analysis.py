@@ -0,0 +1,88 @@
+"""Tests for plan analysis (levels, critical path, run reports)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from firefly_dworkers.exceptions import PlanError
+from firefly_dworkers.plans.analysis import analyze_plan, build_run_report, topological_levels
+from firefly_dworkers.plans.base import BasePlan, PlanStep
+from firefly_dworkers.plans.templates.market_analysis import market_analysis_plan
+from firefly_dworkers.types import WorkerRole
+
+
+def _step(step_id: str, *depends_on: str) -> PlanStep:
+    return PlanStep(step_id=step_id, name=step_id, worker_role=WorkerRole.ANALYST, depends_on=list(depends_on))
+
+
+def _diamond(max_concurrency: int = 0) -> BasePlan:
+    return BasePlan(
+        "diamond",
+        steps=[_step("a"), _step("b", "a"), _step("c", "a"), _step("d", "b", "c")],
+        max_concurrency=max_concurrency,
+    )
+
+
+def _result(latencies: dict[str, float], total: float) -> SimpleNamespace:
+    outputs = {nid: SimpleNamespace(latency_ms=ms, success=True) for nid, ms in latencies.items()}
+    return SimpleNamespace(outputs=outputs, total_duration_ms=total, success=True)
+
+
+class TestTopologicalLevels:
+    def test_diamond_levels(self) -> None:
+        assert topological_levels(_diamond()) == [["a"], ["b", "c"], ["d"]]
+
+    def test_cycle_raises(self) -> None:
+        plan = BasePlan("loop", steps=[_step("a", "b"), _step("b", "a")])
+        with pytest.raises(PlanError, match="cycle"):
+            topological_levels(plan)
+
+    def test_unknown_dependency_raises(self) -> None:
+        with pytest.raises(PlanError, match="does not exist"):
+            topological_levels(BasePlan("bad", steps=[_step("a", "ghost")]))
+
+
+class TestAnalyzePlan:
+    def test_width_and_unweighted_critical_path(self) -> None:
+        analysis = analyze_plan(_diamond())
+        assert analysis.max_width == 2
+        assert analysis.step_count == 4
+        assert analysis.critical_path[0] == "a"
+        assert analysis.critical_path[-1] == "d"
+        assert analysis.critical_path_cost == 3.0
+
+    def test_weighted_critical_path_follows_slowest_branch(self) -> None:
+        analysis = analyze_plan(_diamond(), latencies={"a": 10, "b": 5, "c": 50, "d": 10})
+        assert analysis.critical_path == ["a", "c", "d"]
+        assert analysis.critical_path_cost == 70
+
+    def test_concurrency_cap_limits_effective_width(self) -> None:
+        assert analyze_plan(_diamond(max_concurrency=1)).effective_width == 1
+        assert analyze_plan(_diamond()).effective_width == 2
+
+    def test_market_analysis_template(self) -> None:
+        analysis = analyze_plan(market_analysis_plan())
+        assert analysis.levels[0] == ["define-scope"]
+        assert analysis.max_width == 2
+        assert analysis.critical_path[-1] == "executive-review"
+
+    def test_empty_plan(self) -> None:
+        analysis = analyze_plan(BasePlan("empty"))
+        assert analysis.levels == []
+        assert analysis.critical_path == []
+
+
+class TestRunReport:
+    def test_report_compares_wall_and_step_time(self) -> None:
+        report = build_run_report(_diamond(), _result({"a": 10, "b": 40, "c": 40, "d": 10}, total=60))
+        assert report.step_time_ms == 100
+        assert report.wall_time_ms == 60
+        assert report.parallelism == pytest.approx(100 / 60)
+        assert report.critical_path_ms == 60
+
+    def test_skipped_steps_cost_nothing(self) -> None:
+        report = build_run_report(_diamond(), _result({"a": 10, "b": 20}, total=30))
+        assert report.critical_path == ["a", "b"]
+        assert report.critical_path_ms == 30
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -40,6 +41,21 @@ def _make_mock_worker(name: str = "mock-worker") -> MagicMock:
     return mock
 
 
+def _built_nodes(builder: PlanBuilder, worker: MagicMock | None = None) -> dict:
+    """Build with a recording PipelineBuilder and return the wired nodes by step ID."""
+    nodes: dict = {}
+    with patch("firefly_dworkers.plans.builder.PipelineBuilder") as pb_cls:
+        pb_cls.return_value.add_node.side_effect = lambda node_id, node, **kw: nodes.__setitem__(node_id, node)
+        if worker is None:
+            builder.build()
+        else:
+            with patch("firefly_dworkers.plans.builder._create_step_worker", return_value=worker):
+                builder.build()
+                for node in nodes.values():
+                    node.worker  # noqa: B018 -- bind while the patch is active
+    return nodes
+
+
 # ---------------------------------------------------------------------------
 # PlanRegistry tests
 # ---------------------------------------------------------------------------
@@ -184,6 +200,108 @@ class TestPlanBuilder:
         assert node.retry_max == 3
         assert node.timeout_seconds == 60
 
+    async def test_concurrency_cap_limits_parallel_runs(self) -> None:
+        plan = BasePlan("test-plan", max_concurrency=1)
+        plan.add_step(PlanStep(step_id="s1", name="Step 1", worker_role=WorkerRole.ANALYST))
+        plan.add_step(PlanStep(step_id="s2", name="Step 2", worker_role=WorkerRole.RESEARCHER))
+
+        running = 0
+        peak = 0
+
+        async def _run(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        worker = _make_mock_worker()
+        worker.run = _run
+        nodes = _built_nodes(PlanBuilder(plan, _make_config(), use_cache=False), worker)
+
+        await asyncio.gather(*(node.run("go") for node in nodes.values()))
+        assert peak == 1
+
+    async def test_memo_reuses_step_outputs_across_builds(self) -> None:
+        from firefly_dworkers.plans.memo import InMemoryStepMemoStore
+
+        plan = BasePlan("test-plan")
+        plan.add_step(PlanStep(step_id="s1", name="Step 1", worker_role=WorkerRole.ANALYST))
+        memo = InMemoryStepMemoStore()
+        calls = 0
+
+        async def _run(prompt, **kwargs):
+            nonlocal calls
+            calls += 1
+            return MagicMock(output="result")
+
+        worker = _make_mock_worker()
+        worker.run = _run
+        for _ in range(2):
+            nodes = _built_nodes(PlanBuilder(plan, _make_config(), memo=memo, use_cache=False), worker)
+            result = await nodes["s1"].run("same prompt")
+            assert result.output == "result"
+
+        assert calls == 1
+
+    async def test_memo_is_not_shared_between_tenants(self) -> None:
+        from firefly_dworkers.plans.memo import InMemoryStepMemoStore
+
+        plan = BasePlan("test-plan")
+        plan.add_step(PlanStep(step_id="s1", name="Step 1", worker_role=WorkerRole.ANALYST))
+        memo = InMemoryStepMemoStore()
+        calls = 0
+
+        async def _run(prompt, **kwargs):
+            nonlocal calls
+            calls += 1
+            return MagicMock(output="result")
+
+        worker = _make_mock_worker()
+        worker.run = _run
+        for tenant_id in ("tenant-a", "tenant-b"):
+            config = _make_config().model_copy(update={"id": tenant_id})
+            nodes = _built_nodes(PlanBuilder(plan, config, memo=memo, use_cache=False), worker)
+            await nodes["s1"].run("same prompt")
+
+        assert calls == 2
+
+    def test_workers_are_created_lazily(self) -> None:
+        plan = BasePlan("test-plan")
+        plan.add_step(PlanStep(step_id="s1", name="Step 1", worker_role=WorkerRole.ANALYST))
+
+        with patch("firefly_dworkers.plans.builder._create_step_worker") as create:
+            create.return_value = _make_mock_worker()
+            nodes = _built_nodes(PlanBuilder(plan, _make_config(), use_cache=False))
+            assert create.call_count == 0
+            assert nodes["s1"].worker is create.return_value
+            assert create.call_count == 1
+
+    def test_compiled_plan_is_cached(self) -> None:
+        from firefly_dworkers.plans.compiled import PlanCache
+
+        cache = PlanCache()
+        plan = BasePlan("test-plan")
+        plan.add_step(PlanStep(step_id="s1", name="Step 1", worker_role=WorkerRole.ANALYST))
+        config = _make_config()
+
+        first = PlanBuilder(plan, config, cache=cache).compile()
+        assert PlanBuilder(plan, config, cache=cache).compile() is first
+        assert cache.stats()["hits"] == 1
+
+        # Editing the plan or re-registering the tenant recompiles
+        plan.add_step(PlanStep(step_id="s2", name="Step 2", worker_role=WorkerRole.ANALYST, depends_on=["s1"]))
+        edited = PlanBuilder(plan, config, cache=cache).compile()
+        assert edited is not first
+        assert edited.order == ["s1", "s2"]
+        assert PlanBuilder(plan, _make_config(), cache=cache).compile() is not edited
+
+    def test_analyze_reports_builder_cap(self) -> None:
+        plan = BasePlan("test-plan", max_concurrency=4)
+        plan.add_step(PlanStep(step_id="s1", name="Step 1", worker_role=WorkerRole.ANALYST))
+        assert PlanBuilder(plan, _make_config()).analyze().max_concurrency == 4
+        assert PlanBuilder(plan, _make_config(), max_concurrency=2).analyze().max_concurrency == 2
+
 
 # ---------------------------------------------------------------------------
 # Plan template tests
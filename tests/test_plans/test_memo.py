@@ -0,0 +1,121 @@
+"""Tests for plan step-output memoisation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from firefly_dworkers.plans.base import PlanStep
+from firefly_dworkers.plans.memo import (
+    FileStepMemoStore,
+    InMemoryStepMemoStore,
+    MemoizedRun,
+    memoize_runs,
+    step_memo_key,
+)
+from firefly_dworkers.types import WorkerRole
+
+
+def _step(**overrides) -> PlanStep:
+    fields = {"step_id": "s1", "name": "Step 1", "worker_role": WorkerRole.ANALYST, "prompt_template": "Analyse {x}"}
+    fields.update(overrides)
+    return PlanStep(**fields)
+
+
+class _Worker:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def run(self, prompt, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("model down")
+        return SimpleNamespace(output=f"answer to {prompt}")
+
+
+class TestStepMemoKey:
+    def test_stable_for_same_inputs(self) -> None:
+        assert step_memo_key("p", _step(), "prompt", "m") == step_memo_key("p", _step(), "prompt", "m")
+
+    @pytest.mark.parametrize(
+        ("plan", "step", "prompt", "model"),
+        [
+            ("other", _step(), "prompt", "m"),
+            ("p", _step(prompt_template="changed"), "prompt", "m"),
+            ("p", _step(description="changed"), "prompt", "m"),
+            ("p", _step(), "prompt with new upstream output", "m"),
+            ("p", _step(), "prompt", "other-model"),
+        ],
+    )
+    def test_changes_with_any_component(self, plan, step, prompt, model) -> None:
+        assert step_memo_key(plan, step, prompt, model) != step_memo_key("p", _step(), "prompt", "m")
+
+    @pytest.mark.parametrize("scope", [{"tenant_id": "acme"}, {"worker_fingerprint": "other-instructions"}])
+    def test_changes_with_tenant_and_worker(self, scope) -> None:
+        assert step_memo_key("p", _step(), "prompt", "m", **scope) != step_memo_key("p", _step(), "prompt", "m")
+
+
+class TestMemoizeRuns:
+    async def test_second_run_reuses_output(self) -> None:
+        worker = _Worker()
+        memoize_runs(worker, InMemoryStepMemoStore(), "p", _step(), "m")
+        first = await worker.run("hello")
+        second = await worker.run("hello")
+        assert worker.calls == 1
+        assert isinstance(second, MemoizedRun)
+        assert second.output == first.output
+
+    async def test_changed_prompt_reruns(self) -> None:
+        worker = _Worker()
+        memoize_runs(worker, InMemoryStepMemoStore(), "p", _step(), "m")
+        await worker.run("hello")
+        await worker.run("hello, with different upstream output")
+        assert worker.calls == 2
+
+    async def test_tenants_do_not_share_outputs(self) -> None:
+        store = InMemoryStepMemoStore()
+        acme, globex = _Worker(), _Worker()
+        memoize_runs(acme, store, "p", _step(), "m", tenant_id="acme", fingerprint=lambda: "f")
+        memoize_runs(globex, store, "p", _step(), "m", tenant_id="globex", fingerprint=lambda: "f")
+        await acme.run("hello")
+        result = await globex.run("hello")
+        assert (acme.calls, globex.calls) == (1, 1)
+        assert not isinstance(result, MemoizedRun)
+
+    async def test_changed_worker_fingerprint_reruns(self) -> None:
+        worker = _Worker()
+        fingerprints = iter(["v1", "v2"])
+        memoize_runs(worker, InMemoryStepMemoStore(), "p", _step(), "m", fingerprint=lambda: next(fingerprints))
+        await worker.run("hello")
+        await worker.run("hello")
+        assert worker.calls == 2
+
+    async def test_failures_are_not_memoised(self) -> None:
+        store = InMemoryStepMemoStore()
+        worker = _Worker(fail=True)
+        memoize_runs(worker, store, "p", _step(), "m")
+        with pytest.raises(RuntimeError):
+            await worker.run("hello")
+        with pytest.raises(RuntimeError):
+            await worker.run("hello")
+        assert worker.calls == 2
+
+
+class TestStores:
+    def test_in_memory_lru_eviction(self) -> None:
+        store = InMemoryStepMemoStore(max_entries=2)
+        store.put("a", 1)
+        store.put("b", 2)
+        store.get("a")
+        store.put("c", 3)
+        assert store.get("a") == 1
+        assert store.get("b") is None
+
+    def test_file_store_round_trip(self, tmp_path) -> None:
+        store = FileStepMemoStore(tmp_path)
+        store.put("k", {"summary": "ok"})
+        assert FileStepMemoStore(tmp_path).get("k") == {"summary": "ok"}
+        store.clear()
+        assert store.get("k") is None
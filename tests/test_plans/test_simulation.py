@@ -0,0 +1,104 @@
+"""Tests for the dry-run plan simulator."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from firefly_dworkers.plans.base import BasePlan, PlanStep
+from firefly_dworkers.plans.builder import PlanBuilder
+from firefly_dworkers.plans.compiled import PlanCache
+from firefly_dworkers.plans.simulation import SimulationModel, StepProfile
+from firefly_dworkers.plans.templates.market_analysis import market_analysis_plan
+from firefly_dworkers.tenants.config import TenantConfig, WorkerConfig
+from firefly_dworkers.types import WorkerRole
+
+
+def _config(**researcher) -> TenantConfig:
+    workers = WorkerConfig(researcher=WorkerConfig.WorkerSettings(**researcher)) if researcher else WorkerConfig()
+    return TenantConfig(id="sim-tenant", name="Sim Tenant", workers=workers)
+
+
+def _step(step_id: str, *depends_on: str, role: WorkerRole = WorkerRole.ANALYST) -> PlanStep:
+    return PlanStep(step_id=step_id, name=step_id, worker_role=role, depends_on=list(depends_on))
+
+
+def _diamond(max_concurrency: int = 0, role: WorkerRole = WorkerRole.ANALYST) -> BasePlan:
+    return BasePlan(
+        "diamond",
+        steps=[_step("a"), _step("b", "a", role=role), _step("c", "a", role=role), _step("d", "b", "c")],
+        max_concurrency=max_concurrency,
+    )
+
+
+def _model(**latencies: float) -> SimulationModel:
+    return SimulationModel(
+        default=StepProfile(latency_ms=100, tokens=1000, cost_usd=0.5),
+        steps={sid: StepProfile(latency_ms=ms, tokens=1000, cost_usd=0.5) for sid, ms in latencies.items()},
+    )
+
+
+def _simulate(plan: BasePlan, model: SimulationModel, config: TenantConfig | None = None, **kwargs):
+    return PlanBuilder(plan, config or _config(), cache=PlanCache(), **kwargs).simulate(model)
+
+
+class TestSimulate:
+    def test_parallel_branches_overlap(self) -> None:
+        report = _simulate(_diamond(), _model(c=300))
+        assert report.wall_time_ms == 500
+        assert report.step_time_ms == 600
+        assert report.peak_concurrency == 2
+        assert report.critical_path == ["a", "c", "d"]
+        assert report.critical_path_ms == 500
+        assert report.steps["d"].start_ms == 400
+
+    def test_totals_tokens_and_cost(self) -> None:
+        report = _simulate(_diamond(), _model())
+        assert report.total_tokens == 4000
+        assert report.estimated_cost_usd == pytest.approx(2.0)
+
+    def test_plan_cap_serialises_branches(self) -> None:
+        report = _simulate(_diamond(), _model(), max_concurrency=1)
+        assert report.peak_concurrency == 1
+        assert report.wall_time_ms == 400
+        assert report.max_concurrency == 1
+
+    def test_tenant_role_limit_applies(self) -> None:
+        report = _simulate(_diamond(role=WorkerRole.RESEARCHER), _model(), _config(max_concurrent_tasks=1))
+        assert report.peak_concurrency == 1
+        assert report.wall_time_ms == 400
+
+    def test_no_workers_are_created(self) -> None:
+        with patch("firefly_dworkers.plans.builder._create_step_worker") as create:
+            _simulate(market_analysis_plan(), SimulationModel())
+        create.assert_not_called()
+
+    def test_empty_plan(self) -> None:
+        report = _simulate(BasePlan("empty"), SimulationModel())
+        assert report.wall_time_ms == 0
+        assert report.steps == {}
+
+
+class TestCalibration:
+    def test_step_and_role_profiles_from_usage(self) -> None:
+        plan = _diamond()
+        by_agent = {
+            "diamond-a": {"total_requests": 2, "total_latency_ms": 4000, "total_tokens": 3000, "total_cost_usd": 0.2},
+            "analyst-acme": SimpleNamespace(
+                total_requests=2, total_latency_ms=2000, total_tokens=1000, total_cost_usd=0.0
+            ),
+            "unrelated": {"total_requests": 5, "total_latency_ms": 1, "total_tokens": 1, "total_cost_usd": 0},
+        }
+        model = SimulationModel.from_usage(by_agent, plan=plan)
+        assert model.steps["a"].latency_ms == 2000
+        assert model.steps["a"].tokens == 1500
+        # Role profile averages every analyst request seen
+        assert model.roles["analyst"].latency_ms == 1500
+        assert model.profile_for(plan.steps[3]) == model.roles["analyst"]
+        assert model.profile_for(_step("x", role=WorkerRole.MANAGER)) == model.default
+
+    def test_agents_without_requests_are_ignored(self) -> None:
+        model = SimulationModel.from_usage({"analyst-x": {"total_requests": 0}})
+        assert model.roles == {}
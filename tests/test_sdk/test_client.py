@@ -15,6 +15,7 @@ from firefly_dworkers.sdk.models import (
     IndexDocumentRequest,
     RunWorkerRequest,
     SearchKnowledgeRequest,
+    SubmitJobRequest,
 )
 
 # ---------------------------------------------------------------------------
@@ -138,6 +139,31 @@ class TestDworkersClient:
         assert len(resp.results) == 1
         assert resp.results[0].chunk_id == "c1"
 
+    def test_submit_job(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "POST"
+            assert request.url.path == "/api/jobs"
+            body = json.loads(request.content)
+            assert body["kind"] == "plan"
+            assert body["params"] == {"plan_name": "market-analysis"}
+            assert "priority" not in body
+            return _json_response({"id": "job-1", "kind": "plan", "priority": "batch"}, status_code=202)
+
+        client = self._make_client(handler)
+        job = client.submit_job(SubmitJobRequest(kind="plan", params={"plan_name": "market-analysis"}))
+        assert job.id == "job-1"
+        assert job.status == "queued"
+
+    def test_get_and_cancel_job(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/jobs/job-1"
+            status = "cancelled" if request.method == "DELETE" else "running"
+            return _json_response({"id": "job-1", "kind": "worker", "status": status})
+
+        client = self._make_client(handler)
+        assert client.get_job("job-1").status == "running"
+        assert client.cancel_job("job-1").status == "cancelled"
+
     def test_list_plans(self) -> None:
         def handler(request: httpx.Request) -> httpx.Response:
             assert request.url.path == "/api/plans"
@@ -287,6 +313,19 @@ class TestAsyncDworkersClient:
         assert resp.results == []
         await client.close()
 
+    async def test_submit_and_get_job(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return _json_response({"id": "job-1", "kind": "worker"}, status_code=202)
+            assert request.url.path == "/api/jobs/job-1"
+            return _json_response({"id": "job-1", "kind": "worker", "status": "succeeded", "result": {"output": "ok"}})
+
+        client = self._make_client(handler)
+        job = await client.submit_job(SubmitJobRequest(kind="worker", params={"worker_role": "analyst", "prompt": "x"}))
+        finished = await client.get_job(job.id)
+        assert finished.result == {"output": "ok"}
+        await client.close()
+
     async def test_list_plans(self) -> None:
         def handler(request: httpx.Request) -> httpx.Response:
             return _json_response(["plan-a", "plan-b"])
@@ -246,6 +246,17 @@ class TestAppFactory:
         assert app.title == "Custom Title"
         assert app.version == "1.0.0"
 
+    def test_shutdown_closes_shared_http_pool(self):
+        from unittest.mock import AsyncMock, patch
+
+        app = create_dworkers_app()
+        with (
+            patch("firefly_dworkers.tools.http_pool.close_http_clients", new_callable=AsyncMock) as close,
+            TestClient(app),
+        ):
+            close.assert_not_awaited()
+        close.assert_awaited_once()
+
     def test_package_exports(self):
         import firefly_dworkers_server
 
@@ -483,3 +483,105 @@ class TestExecutePlanSync:
 
         assert resp.status_code == 200
         assert captured_inputs["value"] == {"topic": "AI"}
+
+
+# ---------------------------------------------------------------------------
+# Tests: background execution  POST /api/plans/execute {"background": true}
+# ---------------------------------------------------------------------------
+
+
+class TestExecutePlanBackground:
+    def test_returns_202_with_job(self, client):
+        """Background execution should queue a job and return its record."""
+        plan = _make_plan()
+        config = _make_tenant_config()
+        pipeline = _make_mock_pipeline()
+
+        with (
+            patch("firefly_dworkers.plans.plan_registry") as mock_pr,
+            patch("firefly_dworkers.tenants.registry.tenant_registry") as mock_tr,
+            patch("firefly_dworkers.plans.builder.PlanBuilder") as mock_pb_cls,
+        ):
+            mock_pr.get.return_value = plan
+            mock_tr.get.return_value = config
+            mock_pb_cls.return_value.build.return_value = pipeline
+
+            resp = client.post(
+                "/api/plans/execute",
+                json={"plan_name": "test-plan", "tenant_id": "test-tenant", "background": True},
+            )
+
+        assert resp.status_code == 202
+        data = resp.json()
+        assert data["kind"] == "plan"
+        assert data["priority"] == "batch"
+        assert resp.headers["location"] == f"/api/jobs/{data['id']}"
+
+        job_resp = client.get(f"/api/jobs/{data['id']}")
+        assert job_resp.status_code == 200
+        assert job_resp.json()["metadata"] == {"plan_name": "test-plan"}
+
+    def test_unknown_plan_rejected_before_queueing(self, client):
+        """A missing plan should return 404 instead of a job."""
+        from firefly_dworkers.exceptions import PlanNotFoundError
+
+        with patch("firefly_dworkers.plans.plan_registry") as mock_pr:
+            mock_pr.get.side_effect = PlanNotFoundError("Plan 'nope' not found")
+
+            resp = client.post(
+                "/api/plans/execute",
+                json={"plan_name": "nope", "tenant_id": "test-tenant", "background": True},
+            )
+
+        assert resp.status_code == 404
+
+    def test_invalid_priority_returns_422(self, client):
+        """An unknown priority name should be rejected."""
+        with (
+            patch("firefly_dworkers.plans.plan_registry") as mock_pr,
+            patch("firefly_dworkers.tenants.registry.tenant_registry") as mock_tr,
+        ):
+            mock_pr.get.return_value = _make_plan()
+            mock_tr.get.return_value = _make_tenant_config()
+
+            resp = client.post(
+                "/api/plans/execute",
+                json={"plan_name": "test-plan", "background": True, "priority": "urgent"},
+            )
+
+        assert resp.status_code == 422
+
+    def test_unknown_job_returns_404(self, client):
+        resp = client.get("/api/jobs/does-not-exist")
+        assert resp.status_code == 404
+        assert client.get("/api/jobs/does-not-exist/events").status_code == 404
+
+
+class TestSubmitPlanJob:
+    def test_submit_plan_job(self, client):
+        """POST /api/jobs should queue a plan run like the background flag does."""
+        with (
+            patch("firefly_dworkers.plans.plan_registry") as mock_pr,
+            patch("firefly_dworkers.tenants.registry.tenant_registry") as mock_tr,
+            patch("firefly_dworkers.plans.builder.PlanBuilder") as mock_pb_cls,
+        ):
+            mock_pr.get.return_value = _make_plan()
+            mock_tr.get.return_value = _make_tenant_config()
+            mock_pb_cls.return_value.build.return_value = _make_mock_pipeline()
+
+            resp = client.post(
+                "/api/jobs",
+                json={"kind": "plan", "params": {"plan_name": "test-plan"}, "priority": "normal"},
+            )
+
+        assert resp.status_code == 202
+        assert resp.json()["kind"] == "plan"
+        assert resp.json()["priority"] == "normal"
+
+    def test_unknown_kind_returns_422(self, client):
+        resp = client.post("/api/jobs", json={"kind": "nope", "params": {}})
+        assert resp.status_code == 422
+
+    def test_invalid_params_return_422(self, client):
+        resp = client.post("/api/jobs", json={"kind": "plan", "params": {}})
+        assert resp.status_code == 422
@@ -189,6 +189,33 @@ class TestRunWorkerStream:
         events = _parse_sse_events(resp.text)
         assert any(e.type == "complete" for e in events)
 
+    def test_stream_serves_cached_response(self, client):
+        """A cache hit should yield a single complete event flagged as cached."""
+        from firefly_dworkers.workers.response_cache import CachedResponse
+
+        config = _make_tenant_config()
+        worker = _make_mock_worker(["never", "streamed"])
+        worker.cached_response.return_value = CachedResponse(output="From cache", approximate=True, similarity=0.93)
+
+        with (
+            patch("firefly_dworkers.tenants.registry.tenant_registry") as mock_tr,
+            patch("firefly_dworkers.workers.factory.worker_factory") as mock_wf,
+        ):
+            mock_tr.get.return_value = config
+            mock_wf.create.return_value = worker
+
+            resp = client.post(
+                "/api/workers/run",
+                json={"worker_role": "analyst", "prompt": "test", "tenant_id": "test-tenant"},
+            )
+
+        events = _parse_sse_events(resp.text)
+        assert [e.type for e in events] == ["complete"]
+        assert events[0].content == "From cache"
+        assert events[0].metadata["cached"] is True
+        assert events[0].metadata["approximate"] is True
+        assert events[0].metadata["similarity"] == 0.93
+
     def test_stream_unknown_tenant_returns_404(self, client):
         """An unknown tenant should produce an SSE error event (since the
         generator catches the HTTPException raised by _create_worker)."""
@@ -384,6 +411,30 @@ class TestRunWorkerSync:
         assert resp.status_code == 500
         assert "LLM timeout" in resp.json()["detail"]
 
+    def test_sync_concurrency_limit_returns_429(self, client):
+        """A rejected admission should surface as 429 Too Many Requests."""
+        from firefly_dworkers.exceptions import ConcurrencyLimitError
+
+        config = _make_tenant_config()
+        worker = MagicMock()
+        worker.name = "test-worker"
+        worker.run = AsyncMock(side_effect=ConcurrencyLimitError("tenant busy"))
+
+        with (
+            patch("firefly_dworkers.tenants.registry.tenant_registry") as mock_tr,
+            patch("firefly_dworkers.workers.factory.worker_factory") as mock_wf,
+        ):
+            mock_tr.get.return_value = config
+            mock_wf.create.return_value = worker
+
+            resp = client.post(
+                "/api/workers/run/sync",
+                json={"worker_role": "analyst", "prompt": "test", "tenant_id": "test-tenant"},
+            )
+
+        assert resp.status_code == 429
+        assert "Retry-After" in resp.headers
+
 
 # ---------------------------------------------------------------------------
 # Tests: StreamEvent model
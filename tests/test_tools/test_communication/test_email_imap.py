@@ -0,0 +1,224 @@
+"""Tests for EmailTool IMAP reading: pooled sessions, batched FETCH and UID sync."""
+
+from __future__ import annotations
+
+import base64
+import imaplib
+
+import pytest
+
+from firefly_dworkers.exceptions import ConnectorAuthError
+from firefly_dworkers.tools.communication import email as email_tool
+from firefly_dworkers.tools.communication import imap_pool
+from firefly_dworkers.tools.communication.email import EmailTool
+
+_PLAIN = b'("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 12 1)'
+_MULTIPART = (
+    b'(("TEXT" "HTML" ("CHARSET" "utf-8") NIL NIL "7BIT" 30 1)'
+    b'("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "BASE64" 20 1)'
+    b' "ALTERNATIVE" ("BOUNDARY" "b1") NIL NIL)'
+)
+
+
+def _message(uid: int, subject: str, body: bytes, structure: bytes = _PLAIN) -> tuple[bytes, bytes, bytes]:
+    headers = f"From: sender{uid}@example.com\r\nSubject: {subject}\r\nDate: Mon, 5 Oct 2026 10:00:00 +0000\r\n\r\n"
+    return headers.encode(), structure, body
+
+
+class FakeIMAP:
+    """In-memory stand-in for ``imaplib.IMAP4_SSL`` that records commands."""
+
+    instances: list[FakeIMAP] = []
+    mailbox: dict[int, tuple[bytes, bytes, bytes]] = {}
+    uidvalidity = 7
+
+    def __init__(self, host: str, port: int, timeout: float | None = None) -> None:
+        self.commands: list[tuple[str, ...]] = []
+        self.logged_out = False
+        FakeIMAP.instances.append(self)
+
+    def login(self, username: str, password: str) -> tuple[str, list[bytes]]:
+        if password == "wrong":
+            raise imaplib.IMAP4.error("AUTHENTICATIONFAILED")
+        return "OK", [b"Logged in"]
+
+    def select(self, mailbox: str, readonly: bool = False) -> tuple[str, list[bytes]]:
+        self.commands.append(("SELECT", mailbox, str(readonly)))
+        return "OK", [str(len(self.mailbox)).encode()]
+
+    def response(self, code: str) -> tuple[str, list[bytes]]:
+        return code, [str(self.uidvalidity).encode()]
+
+    def noop(self) -> tuple[str, list[bytes]]:
+        return "OK", [b"NOOP completed"]
+
+    def logout(self) -> tuple[str, list[bytes]]:
+        self.logged_out = True
+        return "BYE", [b""]
+
+    def fetch(self, message_set: str, items: str) -> tuple[str, list]:
+        self.commands.append(("FETCH", message_set, items))
+        uids = sorted(self.mailbox)
+        seqs = self._expand(message_set, len(uids))
+        return "OK", self._respond([uids[s - 1] for s in seqs], items)
+
+    def uid(self, command: str, *args: str) -> tuple[str, list]:
+        self.commands.append(("UID", command, *args))
+        if command == "SEARCH":
+            low = int(args[0].split()[1].split(":")[0])
+            uids = [u for u in sorted(self.mailbox) if u >= low] or sorted(self.mailbox)[-1:]
+            return "OK", [" ".join(map(str, uids)).encode()]
+        wanted = self._expand(args[0], max(self.mailbox, default=0))
+        return "OK", self._respond([u for u in sorted(self.mailbox) if u in wanted], args[1])
+
+    def _respond(self, uids: list[int], items: str) -> list:
+        data: list = []
+        for seq, uid in enumerate(uids, start=1):
+            headers, structure, body = self.mailbox[uid]
+            if "HEADER.FIELDS" in items:
+                head = b'%d (UID %d BODYSTRUCTURE %s BODY[HEADER.FIELDS (FROM TO SUBJECT DATE MESSAGE-ID)] {%d}' % (
+                    seq, uid, structure, len(headers)
+                )
+                data += [(head, headers), b")"]
+            else:
+                section = items.split("BODY.PEEK[")[1].split("]")[0]
+                data += [(b"%d (UID %d BODY[%s]<0> {%d}" % (seq, uid, section.encode(), len(body)), body), b")"]
+        return data
+
+    @staticmethod
+    def _expand(message_set: str, highest: int) -> set[int]:
+        result: set[int] = set()
+        for part in message_set.split(","):
+            lo, _, hi = part.partition(":")
+            lo_n = highest if lo == "*" else int(lo)
+            hi_n = lo_n if not hi else highest if hi == "*" else int(hi)
+            result.update(range(min(lo_n, hi_n), max(lo_n, hi_n) + 1))
+        return result
+
+
+@pytest.fixture
+def imap(monkeypatch: pytest.MonkeyPatch) -> type[FakeIMAP]:
+    FakeIMAP.instances = []
+    FakeIMAP.uidvalidity = 7
+    FakeIMAP.mailbox = {100 + i: _message(100 + i, f"Report {i}", f"Body {i}".encode()) for i in range(1, 6)}
+    sessions = imap_pool.IMAPSessions()
+    monkeypatch.setattr(imaplib, "IMAP4_SSL", FakeIMAP)
+    monkeypatch.setattr(email_tool, "imap_sessions", sessions)
+    return FakeIMAP
+
+
+def _tool(password: str = "secret") -> EmailTool:
+    return EmailTool(imap_host="imap.example.com", username="user@example.com", password=password)
+
+
+class TestFetchParsing:
+    def test_parse_fetch_with_literals_and_lists(self) -> None:
+        data = [
+            (b'1 (UID 101 FLAGS (\\Seen) BODY[HEADER.FIELDS (SUBJECT)] {14}', b"Subject: Hi\r\n\r\n"),
+            b' INTERNALDATE "05-Oct-2026 10:00:00 +0000")',
+        ]
+        (item,) = email_tool._parse_fetch(data)
+        assert item["UID"] == "101"
+        assert item["FLAGS"] == ["\\Seen"]
+        assert item["BODY[HEADER.FIELDS (SUBJECT)]"] == b"Subject: Hi\r\n\r\n"
+        assert item["INTERNALDATE"] == "05-Oct-2026 10:00:00 +0000"
+
+    def test_find_text_part_in_multipart(self) -> None:
+        (item,) = email_tool._parse_fetch([b"1 (UID 5 BODYSTRUCTURE " + _MULTIPART + b")"])
+        assert email_tool._find_text_part(item["BODYSTRUCTURE"]) == ("2", "BASE64", "utf-8")
+
+    def test_uid_set_compresses_ranges(self) -> None:
+        assert email_tool._uid_set([7, 1, 2, 3, 9, 10]) == "1:3,7,9:10"
+
+    def test_decode_truncated_base64(self) -> None:
+        encoded = base64.b64encode("héllo wörld".encode())
+        assert email_tool._decode_body(encoded[:-3], "BASE64", "utf-8").startswith("héllo w")
+
+
+class TestIMAPSessions:
+    async def test_session_is_reused(self, imap: type[FakeIMAP]) -> None:
+        tool = _tool()
+        await tool.execute(action="read", channel="INBOX", limit=2)
+        await tool.execute(action="read", channel="INBOX", limit=2)
+        assert len(imap.instances) == 1
+        assert email_tool.imap_sessions.stats() == {"idle": 1, "opened": 1, "reused": 1}
+
+    async def test_other_credentials_get_their_own_session(self, imap: type[FakeIMAP]) -> None:
+        await _tool("secret").read_messages(limit=1)
+        await _tool("other").read_messages(limit=1)
+        assert len(imap.instances) == 2
+
+    async def test_dropped_connection_is_replaced(self, imap: type[FakeIMAP], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(email_tool, "imap_sessions", imap_pool.IMAPSessions(check_after=0))
+        tool = _tool()
+        await tool.read_messages(limit=1)
+        monkeypatch.setattr(FakeIMAP, "noop", lambda self: ("BYE", [b"Autologout"]))
+        await tool.read_messages(limit=1)
+        assert len(imap.instances) == 2
+        assert imap.instances[0].logged_out
+
+    async def test_failed_session_is_discarded(self, imap: type[FakeIMAP]) -> None:
+        await _tool().read_messages(limit=1)
+        sessions = email_tool.imap_sessions
+        with pytest.raises(KeyError), sessions.session("imap.example.com", 993, "user@example.com", "secret"):
+            raise KeyError("boom")
+        assert imap.instances[0].logged_out
+        assert email_tool.imap_sessions.stats()["idle"] == 0
+
+    async def test_login_failure_raises_auth_error(self, imap: type[FakeIMAP]) -> None:
+        with pytest.raises(ConnectorAuthError, match="IMAP login failed"):
+            await _tool("wrong").read_messages()
+
+
+class TestEmailToolRead:
+    async def test_latest_messages_in_one_fetch(self, imap: type[FakeIMAP]) -> None:
+        result = await _tool().execute(action="read", channel="INBOX", limit=3)
+        assert [m["id"] for m in result] == ["103", "104", "105"]
+        assert [m["content"] for m in result] == ["Body 3", "Body 4", "Body 5"]
+        assert result[0]["subject"] == "Report 3"
+        assert result[0]["sender"] == "sender103@example.com"
+        conn = imap.instances[0]
+        assert conn.commands[0] == ("SELECT", "INBOX", "True")
+        assert [c[:2] for c in conn.commands[1:]] == [("FETCH", "3:5"), ("UID", "FETCH")]
+        assert conn.commands[2][2] == "103:105"
+
+    async def test_headers_only(self, imap: type[FakeIMAP]) -> None:
+        result = await _tool().execute(action="read", limit=2, include_body=False)
+        assert [m["content"] for m in result] == ["", ""]
+        assert len(imap.instances[0].commands) == 2
+
+    async def test_message_id_is_fetched_once(self, imap: type[FakeIMAP]) -> None:
+        imap.mailbox[104] = _message(104, "Alt", base64.b64encode(b"plain text"), _MULTIPART)
+        (message,) = await _tool().read_messages(message_id="104")
+        assert message.content == "plain text"
+        fetches = [c for c in imap.instances[0].commands if c[0] != "SELECT"]
+        assert [c[2] for c in fetches] == ["104", "104"]
+        assert "BODY.PEEK[2]<0." in fetches[1][3]
+
+
+    async def test_invalid_message_id(self, imap: type[FakeIMAP]) -> None:
+        with pytest.raises(ValueError, match="Invalid message_id"):
+            await _tool().read_messages(message_id="1; DELETE")
+
+
+class TestEmailToolSync:
+    async def test_incremental_sync(self, imap: type[FakeIMAP]) -> None:
+        tool = _tool()
+        first = await tool.execute(action="sync", limit=3)
+        assert [m["id"] for m in first["messages"]] == ["101", "102", "103"]
+        assert first["messages"][0]["content"] == ""
+        assert (first["last_uid"], first["has_more"], first["uidvalidity"]) == (103, True, 7)
+
+        second = await tool.sync(since_uid=first["last_uid"], uidvalidity=first["uidvalidity"])
+        assert [m["id"] for m in second["messages"]] == ["104", "105"]
+        assert second["has_more"] is False
+
+        third = await tool.sync(since_uid=second["last_uid"], uidvalidity=7)
+        assert third["messages"] == []
+        assert third["last_uid"] == 105
+
+    async def test_uidvalidity_change_resets(self, imap: type[FakeIMAP]) -> None:
+        imap.uidvalidity = 8
+        result = await _tool().sync(since_uid=104, uidvalidity=7)
+        assert result["reset"] is True
+        assert len(result["messages"]) == 5
@@ -0,0 +1,60 @@
+"""Tests for column-oriented data tool results."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from firefly_dworkers.tools.data import columnar, sql
+from firefly_dworkers.tools.data.columnar import check_result_format, to_columns, to_numpy
+from firefly_dworkers.tools.data.csv_excel import SpreadsheetTool
+from firefly_dworkers.tools.data.sql import SQLClientTool
+
+
+class TestToColumns:
+    def test_transposes_rows(self) -> None:
+        assert to_columns(["a", "b"], [(1, "x"), (2, "y")]) == {"a": [1, 2], "b": ["x", "y"]}
+
+    def test_pads_short_rows_and_drops_extra_cells(self) -> None:
+        assert to_columns(["a", "b"], [(1,), (2, "y", "extra")]) == {"a": [1, 2], "b": [None, "y"]}
+
+    def test_rejects_unknown_format(self) -> None:
+        with pytest.raises(ValueError, match="result_format"):
+            check_result_format("arrow")
+
+    @pytest.mark.skipif(not columnar.NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_to_numpy(self) -> None:
+        arrays = to_numpy({"n": [1, 2, 3], "s": ["a", None, "c"]})
+        assert arrays["n"].sum() == 6
+        assert arrays["s"].dtype == object
+
+
+class TestSQLColumns:
+    async def test_sqlite_columns(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sql, "AIOSQLITE_AVAILABLE", False)
+        db_path = str(tmp_path / "sales.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE sales (region TEXT, revenue REAL)")
+        conn.executemany("INSERT INTO sales VALUES (?, ?)", [("EMEA", 1.5), ("APAC", 2.0), ("AMER", 3.0)])
+        conn.commit()
+        conn.close()
+
+        tool = SQLClientTool(connection_string=db_path, result_format="columns")
+        result = await tool.execute(query="SELECT region, revenue FROM sales", max_rows=2)
+        assert "rows" not in result
+        assert result["format"] == "columns"
+        assert result["data"] == {"region": ["EMEA", "APAC"], "revenue": [1.5, 2.0]}
+        assert result["row_count"] == 2
+        assert result["truncated"] is True
+
+
+class TestSpreadsheetColumns:
+    async def test_parse_csv_columns(self) -> None:
+        tool = SpreadsheetTool()
+        result = await tool.execute(action="parse_csv", content="a,b\n1,x\n2,y\n", result_format="columns")
+        assert result["columns"] == ["a", "b"]
+        assert result["data"] == {"a": ["1", "2"], "b": ["x", "y"]}
+        assert result["row_count"] == 2
+        assert result["truncated"] is False
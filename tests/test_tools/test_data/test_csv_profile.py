@@ -0,0 +1,67 @@
+"""Tests for single-pass CSV profiling."""
+
+from __future__ import annotations
+
+import csv
+import io
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from firefly_dworkers.tools.data.csv_profile import profile_csv  # noqa: E402
+
+
+def _profile(text: str, **kwargs):
+    reader = csv.reader(io.StringIO(text))
+    return profile_csv(reader, next(reader), **kwargs)
+
+
+class TestProfileCsv:
+    def test_numeric_statistics_across_chunks(self) -> None:
+        text = "n\n" + "".join(f"{i}\n" for i in range(1, 101))
+        (col,) = _profile(text, chunk_size=7)["columns"]
+        assert col["type"] == "integer"
+        assert col["count"] == 100
+        assert (col["min"], col["max"], col["mean"]) == (1.0, 100.0, 50.5)
+        assert col["quantiles"]["50%"] == pytest.approx(50.5)
+        assert col["quantiles_approximate"] is False
+
+    def test_std_is_stable_with_large_offsets(self) -> None:
+        text = "n\n" + "".join(f"{1_000_000_000 + i % 2}\n" for i in range(100_000))
+        (col,) = _profile(text, chunk_size=7_919)["columns"]
+        assert col["mean"] == pytest.approx(1_000_000_000.5)
+        assert col["std"] == pytest.approx(0.5)
+
+    def test_std_across_chunks_matches_single_pass(self) -> None:
+        values = [1_760_000_000 + i * 37 % 101 for i in range(1_000)]
+        text = "t\n" + "".join(f"{v}\n" for v in values)
+        mean = sum(values) / len(values)
+        expected = (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5
+        (col,) = _profile(text, chunk_size=13)["columns"]
+        assert col["std"] == pytest.approx(expected, rel=1e-9)
+
+    def test_types_and_nulls(self) -> None:
+        result = _profile("a,b,c,d\n1.5,x,1,\n2,y,z,\n")
+        a, b, c, d = result["columns"]
+        assert (a["type"], b["type"], c["type"], d["type"]) == ("number", "string", "mixed", "empty")
+        assert d["nulls"] == 2
+        assert "top" not in a
+
+    def test_top_k_categories(self) -> None:
+        (col,) = _profile("k\n" + "a\n" * 3 + "b\n" * 2 + "c\n", top_k=2)["columns"]
+        assert col["top"] == [{"value": "a", "count": 3}, {"value": "b", "count": 2}]
+        assert col["distinct"] == 3
+
+    def test_bounded_state_is_flagged_approximate(self) -> None:
+        text = "k\n" + "".join(f"v{i}\n" for i in range(50)) + "".join(f"{i}\n" for i in range(50))
+        (col,) = _profile(text, max_distinct=10, sample_size=20)["columns"]
+        assert col["distinct"] is None
+        assert col["top_approximate"] is True
+        assert col["quantiles_approximate"] is True
+        assert 0 <= col["quantiles"]["50%"] <= 49
+
+    def test_ragged_rows(self) -> None:
+        result = _profile("a,b\n1\n2,x,extra\n")
+        assert result["row_count"] == 2
+        assert result["columns"][1]["nulls"] == 1
@@ -7,14 +7,17 @@ SpreadsheetTool tests validate CSV parsing logic.
 
 from __future__ import annotations
 
+import contextlib
 import sqlite3
 import tempfile
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fireflyframework_genai.exceptions import ToolError
 from fireflyframework_genai.tools.base import BaseTool
 
 from firefly_dworkers.exceptions import ConnectorError
+from firefly_dworkers.tools.data import sql
 from firefly_dworkers.tools.data.api_client import GenericAPITool
 from firefly_dworkers.tools.data.csv_excel import SpreadsheetTool
 from firefly_dworkers.tools.data.sql import SQLClientTool
@@ -77,6 +80,66 @@ class TestSpreadsheetTool:
         assert result["row_count"] == 2
         assert result["columns"] == ["col1", "col2", "col3"]
 
+    async def test_parse_csv_from_file(self, tmp_path):
+        path = tmp_path / "people.csv"
+        path.write_text("name,age\nAlice,30\nBob,25\nCarol,41\n")
+        tool = SpreadsheetTool()
+        result = await tool.execute(action="parse_csv", file_path=str(path), max_rows=2)
+        assert [r["name"] for r in result["rows"]] == ["Alice", "Bob"]
+        assert result["truncated"] is True
+
+    async def test_describe_csv_from_file(self, tmp_path):
+        path = tmp_path / "people.csv"
+        path.write_text("name,age\n" + "x,1\n" * 500)
+        result = await SpreadsheetTool().execute(action="describe", file_path=str(path))
+        assert result["row_count"] == 500
+
+    async def test_profile_csv(self):
+        pytest.importorskip("numpy")
+        tool = SpreadsheetTool()
+        result = await tool.execute(action="profile", content="region,revenue\nEMEA,10\nAPAC,\nEMEA,30\n")
+        region, revenue = result["columns"]
+        assert result["row_count"] == 3
+        assert region["top"][0] == {"value": "EMEA", "count": 2}
+        assert revenue["type"] == "integer"
+        assert revenue["nulls"] == 1
+        assert revenue["mean"] == 20.0
+
+    async def test_parse_excel_pages(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        wb = openpyxl.Workbook()
+        wb.active.append(["name", "age"])
+        for i in range(5):
+            wb.active.append([f"p{i}", 20 + i])
+        path = str(tmp_path / "people.xlsx")
+        wb.save(path)
+
+        tool = SpreadsheetTool()
+        first = await tool.execute(action="parse_excel", file_path=path, max_rows=3, columns=["name"])
+        assert first["rows"] == [{"name": "p0"}, {"name": "p1"}, {"name": "p2"}]
+        assert first["truncated"] is True
+        rest = await tool.execute(action="parse_excel", file_path=path, max_rows=3, cursor=first["next_cursor"])
+        assert rest["rows"] == [{"name": "p3", "age": 23}, {"name": "p4", "age": 24}]
+        assert rest["truncated"] is False
+
+    async def test_parse_excel_defaults_to_the_active_sheet(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        wb = openpyxl.Workbook()
+        wb.active.title = "Cover"
+        wb.active.append(["title"])
+        wb.active.append(["Quarterly report"])
+        data = wb.create_sheet("Data")
+        data.append(["region", "revenue"])
+        data.append(["EMEA", 10])
+        wb.active = data
+        path = str(tmp_path / "report.xlsx")
+        wb.save(path)
+
+        tool = SpreadsheetTool()
+        for sheet_name in ("", "Missing"):
+            result = await tool.execute(action="parse_excel", file_path=path, sheet_name=sheet_name)
+            assert result["rows"] == [{"region": "EMEA", "revenue": 10}]
+
     async def test_unknown_action_raises(self):
         tool = SpreadsheetTool()
         with pytest.raises(ToolError, match="Unknown action"):
@@ -301,3 +364,71 @@ class TestSQLClientTool:
         tool = SQLClientTool()
         with pytest.raises(ConnectorError, match="connection_string"):
             tool._detect_backend()
+
+
+class _FakeCursor:
+    def __init__(self, records: list[dict]) -> None:
+        self._records = records
+        self.fetches: list[int] = []
+
+    async def fetch(self, n: int, *, timeout: float | None = None) -> list[dict]:
+        self.fetches.append(n)
+        batch, self._records = self._records[:n], self._records[n:]
+        return batch
+
+
+class _FakeConnection:
+    def __init__(self, records: list[dict]) -> None:
+        self.cursor_obj = _FakeCursor(records)
+        self.readonly: bool | None = None
+
+    def transaction(self, *, readonly: bool = False) -> contextlib.AbstractAsyncContextManager:
+        self.readonly = readonly
+        return contextlib.nullcontext()
+
+    async def cursor(self, query: str) -> _FakeCursor:
+        return self.cursor_obj
+
+
+class TestSQLClientToolStreaming:
+    @pytest.fixture()
+    def pg(self, monkeypatch: pytest.MonkeyPatch) -> _FakeConnection:
+        conn = _FakeConnection([{"n": i} for i in range(10)])
+        pool = MagicMock(acquire=AsyncMock(return_value=conn), release=AsyncMock())
+        monkeypatch.setattr(sql, "ASYNCPG_AVAILABLE", True)
+        monkeypatch.setattr(sql.sql_pools, "postgres", AsyncMock(return_value=pool))
+        return conn
+
+    async def test_postgres_fetches_only_max_rows(self, pg: _FakeConnection):
+        tool = SQLClientTool(connection_string="postgresql://u:p@h/db", max_rows=3)
+        result = await tool.execute(query="SELECT n FROM numbers")
+        assert pg.cursor_obj.fetches == [4]
+        assert pg.readonly is True
+        assert result["row_count"] == 3
+        assert result["truncated"] is True
+
+    async def test_postgres_iter_batches(self, pg: _FakeConnection):
+        tool = SQLClientTool(connection_string="postgresql://u:p@h/db", max_rows=3)
+        batches = [batch async for batch in tool.iter_batches("SELECT n FROM numbers", batch_size=4)]
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert batches[-1][-1] == {"n": 9}
+
+    async def test_sqlite_iter_batches_returns_all_rows(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(sql, "AIOSQLITE_AVAILABLE", False)
+        db_path = str(tmp_path / "numbers.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE numbers (n INTEGER)")
+        conn.executemany("INSERT INTO numbers VALUES (?)", [(i,) for i in range(25)])
+        conn.commit()
+        conn.close()
+
+        tool = SQLClientTool(connection_string=db_path, max_rows=5)
+        batches = [batch async for batch in tool.iter_batches("SELECT n FROM numbers", batch_size=10)]
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert batches[0][0] == {"n": 0}
+
+    async def test_iter_batches_enforces_read_only(self):
+        tool = SQLClientTool(connection_string=":memory:")
+        with pytest.raises(ConnectorError, match="Read-only"):
+            async for _ in tool.iter_batches("DELETE FROM numbers"):
+                pass
@@ -0,0 +1,141 @@
+"""Tests for the SQLClientTool query result cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from firefly_dworkers.tools.data import sql
+from firefly_dworkers.tools.data.sql import SQLClientTool
+from firefly_dworkers.tools.data.sql_cache import QueryResultCache, normalize_query
+
+
+def _make_db(path: Path) -> str:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER, val TEXT)")
+    conn.execute("INSERT INTO items VALUES (1, 'a')")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def _insert(db: str, row: tuple[int, str]) -> None:
+    conn = sqlite3.connect(db)
+    conn.execute("INSERT INTO items VALUES (?, ?)", row)
+    conn.commit()
+    conn.close()
+
+
+class TestNormalizeQuery:
+    def test_collapses_whitespace_and_semicolons(self) -> None:
+        assert normalize_query("  SELECT *\n  FROM items ;  ") == "SELECT * FROM items"
+
+    def test_keeps_quoted_text(self) -> None:
+        assert normalize_query("SELECT 'a   b'  FROM \"my  table\"") == "SELECT 'a   b' FROM \"my  table\""
+
+
+class TestQueryResultCache:
+    def test_expires_after_ttl(self) -> None:
+        cache = QueryResultCache(ttl_seconds=10)
+        with patch("firefly_dworkers.tools.data.sql_cache.time.monotonic", return_value=100.0):
+            cache.put(("q",), {"rows": []})
+        with patch("firefly_dworkers.tools.data.sql_cache.time.monotonic", return_value=105.0):
+            assert cache.get(("q",)) == {"rows": []}
+        with patch("firefly_dworkers.tools.data.sql_cache.time.monotonic", return_value=111.0):
+            assert cache.get(("q",)) is None
+        assert cache.stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+    def test_version_mismatch_is_a_miss(self) -> None:
+        cache = QueryResultCache(ttl_seconds=60)
+        cache.put(("q",), {"rows": []}, version=1)
+        assert cache.get(("q",), version=2) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = QueryResultCache(ttl_seconds=60, max_entries=2)
+        cache.put(("a",), {})
+        cache.put(("b",), {})
+        cache.get(("a",))
+        cache.put(("c",), {})
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == {}
+
+
+class TestSQLClientToolCache:
+    @pytest.fixture(autouse=True)
+    def _sync_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sql, "AIOSQLITE_AVAILABLE", False)
+
+    def test_disabled_by_default(self) -> None:
+        assert SQLClientTool(connection_string="/tmp/x.db").cache is None
+
+    async def test_repeated_query_is_served_from_cache(self, tmp_path: Path) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db, cache_ttl_seconds=60, cache_track_changes=False)
+        try:
+            first = await tool.execute(query="SELECT * FROM items")
+            _insert(db, (2, "b"))
+            second = await tool.execute(query="SELECT *   FROM items;")
+        finally:
+            await tool.aclose()
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert second["query"] == "SELECT *   FROM items;"
+        assert second["row_count"] == 1
+
+    @pytest.mark.parametrize("result_format", ["rows", "columns"])
+    async def test_mutating_a_result_does_not_change_the_cache(self, tmp_path: Path, result_format: str) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db, cache_ttl_seconds=60, cache_track_changes=False)
+        key = "rows" if result_format == "rows" else "data"
+        try:
+            first = await tool.execute(query="SELECT * FROM items", result_format=result_format)
+            expected = repr(first[key])
+            first[key].clear()
+            first["columns"].append("extra")
+            second = await tool.execute(query="SELECT * FROM items", result_format=result_format)
+            second_rows = second[key]
+            (second_rows[0] if result_format == "rows" else second_rows["id"]).clear()
+            third = await tool.execute(query="SELECT * FROM items", result_format=result_format)
+        finally:
+            await tool.aclose()
+        assert third["cached"] is True
+        assert repr(third[key]) == expected
+        assert "extra" not in third["columns"]
+
+    async def test_database_change_invalidates(self, tmp_path: Path) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db, cache_ttl_seconds=60)
+        try:
+            await tool.execute(query="SELECT * FROM items")
+            assert (await tool.execute(query="SELECT * FROM items"))["cached"] is True
+            _insert(db, (2, "b"))
+            result = await tool.execute(query="SELECT * FROM items")
+        finally:
+            await tool.aclose()
+        assert "cached" not in result
+        assert result["row_count"] == 2
+
+    async def test_key_includes_max_rows(self, tmp_path: Path) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db, cache_ttl_seconds=60)
+        try:
+            await tool.execute(query="SELECT * FROM items", max_rows=10)
+            result = await tool.execute(query="SELECT * FROM items", max_rows=5)
+        finally:
+            await tool.aclose()
+        assert "cached" not in result
+
+    async def test_writes_clear_the_cache(self, tmp_path: Path) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db, read_only=False, cache_ttl_seconds=60, cache_track_changes=False)
+        try:
+            await tool.execute(query="SELECT * FROM items")
+            await tool.execute(query="DELETE FROM items")
+            assert tool.cache is not None
+            assert len(tool.cache) == 0
+        finally:
+            await tool.aclose()
@@ -0,0 +1,89 @@
+"""Tests for the shared SQL connection pools."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from firefly_dworkers.tools import executors
+from firefly_dworkers.tools.data import sql, sql_pool
+from firefly_dworkers.tools.data.sql import SQLClientTool
+from firefly_dworkers.tools.data.sql_pool import SQLPools, sql_pools
+
+
+def _make_db(path: Path) -> str:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER, val TEXT)")
+    conn.execute("INSERT INTO items VALUES (1, 'a')")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+class TestSqliteSyncPool:
+    def test_connection_is_reused_per_thread(self, tmp_path: Path) -> None:
+        pools = SQLPools()
+        db = _make_db(tmp_path / "app.db")
+        assert pools.sqlite_sync(db) is pools.sqlite_sync(db)
+        assert pools.stats()["sqlite_sync_connections"] == 1
+
+    async def test_closed_connection_is_replaced(self, tmp_path: Path) -> None:
+        pools = SQLPools()
+        db = _make_db(tmp_path / "app.db")
+        first = pools.sqlite_sync(db)
+        await pools.close(db)
+        second = pools.sqlite_sync(db)
+        assert second is not first
+        assert second.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+
+class TestSQLClientToolPooling:
+    @pytest.fixture(autouse=True)
+    def _sync_path(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        monkeypatch.setattr(sql, "AIOSQLITE_AVAILABLE", False)
+        # One worker thread, so every query sees the same thread-local connection.
+        single = executors.ConnectorExecutors(default_max_workers=1)
+        monkeypatch.setattr(executors, "connector_executors", single)
+        yield
+        single.shutdown()
+
+    async def test_queries_share_a_connection(self, tmp_path: Path) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db)
+        try:
+            for _ in range(3):
+                assert (await tool.execute(query="SELECT * FROM items"))["row_count"] == 1
+            conns = [conn for conn, path in sql_pools._sync_conns.items() if path == db]
+            assert len(conns) == 1
+        finally:
+            await tool.aclose()
+        assert db not in sql_pools._sync_conns.values()
+
+    async def test_uncommitted_writes_are_rolled_back(self, tmp_path: Path) -> None:
+        db = _make_db(tmp_path / "app.db")
+        tool = SQLClientTool(connection_string=db, read_only=False)
+        try:
+            await tool.execute(query="INSERT INTO items VALUES (2, 'b')")
+            result = await tool.execute(query="SELECT * FROM items")
+        finally:
+            await tool.aclose()
+        assert result["row_count"] == 1
+
+
+@pytest.mark.skipif(not sql_pool.AIOSQLITE_AVAILABLE, reason="aiosqlite not installed")
+class TestSqliteAsyncPool:
+    async def test_connections_are_reused_up_to_pool_size(self, tmp_path: Path) -> None:
+        pools = SQLPools()
+        db = _make_db(tmp_path / "app.db")
+        try:
+            async with pools.sqlite(db, max_size=2) as first:
+                pass
+            async with pools.sqlite(db, max_size=2) as second:
+                assert second is first
+            assert pools.stats()["sqlite_connections"] == 1
+        finally:
+            await pools.close()
+        assert pools.stats()["sqlite_pools"] == 0
@@ -0,0 +1,142 @@
+"""Tests for the per-connector thread pools."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from firefly_dworkers.tenants.config import ConnectorsConfig, ExecutorsConfig
+from firefly_dworkers.tools.executors import ConnectorExecutor, ConnectorExecutors
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class TestConnectorExecutor:
+    async def test_runs_on_named_thread(self) -> None:
+        executor = ConnectorExecutor("jira", 2)
+        try:
+            name = await executor.run(lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+        assert name.startswith("dworkers-jira")
+
+    async def test_passes_arguments_and_context(self) -> None:
+        executor = ConnectorExecutor("sql", 1)
+        _request_id.set("req-1")
+        try:
+            result = await executor.run(lambda a, *, b: (a + b, _request_id.get()), 1, b=2)
+        finally:
+            executor.shutdown()
+        assert result == (3, "req-1")
+
+    async def test_errors_propagate_and_are_counted(self) -> None:
+        executor = ConnectorExecutor("s3", 1)
+
+        def _fail() -> None:
+            raise RuntimeError("boom")
+
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await executor.run(_fail)
+        finally:
+            executor.shutdown()
+        stats = executor.stats()
+        assert stats.failed == 1
+        assert stats.completed == 1
+
+    async def test_queue_depth_and_saturation(self) -> None:
+        executor = ConnectorExecutor("confluence", 1)
+        release = threading.Event()
+        try:
+            calls = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            busy = executor.stats()
+            release.set()
+            await asyncio.gather(*calls)
+        finally:
+            executor.shutdown()
+        assert busy.active == 1
+        assert busy.queue_depth == 2
+        assert busy.saturated
+        assert busy.saturated_submissions == 2
+        done = executor.stats()
+        assert done.queue_depth == 0
+        assert done.peak_queue_depth >= 2
+        assert done.completed == 3
+        assert not done.saturated
+
+    async def test_cancelled_queued_call_leaves_the_queue(self) -> None:
+        executor = ConnectorExecutor("slack", 1)
+        release = threading.Event()
+        try:
+            running = asyncio.ensure_future(executor.run(release.wait))
+            queued = asyncio.ensure_future(executor.run(lambda: None))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            await asyncio.sleep(0)
+            assert executor.stats().queue_depth == 0
+            release.set()
+            await running
+        finally:
+            executor.shutdown()
+
+    def test_requires_a_worker(self) -> None:
+        with pytest.raises(ValueError, match="at least one worker"):
+            ConnectorExecutor("email", 0)
+
+
+class TestConnectorExecutors:
+    async def test_pools_are_isolated(self) -> None:
+        executors = ConnectorExecutors(default_max_workers=1)
+        release = threading.Event()
+        try:
+            blocked = asyncio.ensure_future(executors.get("confluence").run(release.wait))
+            await asyncio.sleep(0.05)
+            # A saturated Confluence pool does not delay Jira calls.
+            assert await asyncio.wait_for(executors.get("jira").run(lambda: "ok"), 1) == "ok"
+            release.set()
+            await blocked
+        finally:
+            executors.shutdown()
+
+    def test_sizes_from_config(self) -> None:
+        executors = ConnectorExecutors(default_max_workers=2, max_workers={"render": 6})
+        try:
+            assert executors.get("render").max_workers == 6
+            assert executors.get("google").max_workers == 2
+            assert executors.get("google") is executors.get("google")
+        finally:
+            executors.shutdown()
+
+    def test_configure_only_grows_pools(self) -> None:
+        executors = ConnectorExecutors(default_max_workers=2)
+        try:
+            small = executors.get("sql")
+            executors.configure(max_workers={"sql": 5})
+            assert executors.get("sql") is not small
+            assert executors.get("sql").max_workers == 5
+            executors.configure(default_max_workers=1, max_workers={"sql": 3})
+            assert executors.get("sql").max_workers == 5
+            assert executors.get("rss").max_workers == 2
+        finally:
+            executors.shutdown()
+
+    def test_stats_sorted_by_name(self) -> None:
+        executors = ConnectorExecutors()
+        try:
+            executors.get("s3")
+            executors.get("google")
+            assert [s.name for s in executors.stats()] == ["google", "s3"]
+        finally:
+            executors.shutdown()
+
+
+class TestExecutorsConfig:
+    def test_defaults(self) -> None:
+        config = ConnectorsConfig()
+        assert config.executors == ExecutorsConfig()
+        assert config.executors.default_max_workers == 4
+        assert "executors" not in config.enabled_connectors()
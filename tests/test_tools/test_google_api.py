@@ -0,0 +1,186 @@
+"""Tests for async Google API request execution and batching."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from firefly_dworkers.exceptions import ConnectorError
+from firefly_dworkers.tools import google_api
+from firefly_dworkers.tools.google_api import GoogleApiSession, google_execute, google_execute_batch
+from firefly_dworkers.tools.token_cache import token_cache
+
+_BATCH_URL = "https://sheets.googleapis.com/batch"
+
+
+@dataclass
+class _Request:
+    """Duck-typed stand-in for ``googleapiclient.http.HttpRequest``."""
+
+    method: str
+    uri: str
+    body: str | None = None
+    headers: dict[str, str] = field(default_factory=lambda: {"content-type": "application/json"})
+    resumable: Any = None
+    execute: Any = None
+
+    def postproc(self, resp: Any, content: bytes) -> Any:
+        if resp.status >= 300:
+            raise RuntimeError(f"HTTP {resp.status} {resp.reason}")
+        return json.loads(content) if content else {}
+
+
+def _session(handler) -> tuple[GoogleApiSession, Any]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    session = GoogleApiSession(MagicMock(), batch_url=_BATCH_URL)
+    session._token = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+    return session, patch.object(google_api, "http_client", return_value=client)
+
+
+def _batch_reply(parts: list[tuple[int, int, str]], boundary: str = "batch_reply") -> httpx.Response:
+    body = ""
+    for index, status, payload in parts:
+        body += (
+            f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <response-item-{index}>\r\n\r\n"
+            f"HTTP/1.1 {status} {'OK' if status < 300 else 'Bad Request'}\r\n"
+            f"Content-Type: application/json; charset=UTF-8\r\n\r\n{payload}\r\n"
+        )
+    body += f"--{boundary}--\r\n"
+    return httpx.Response(200, headers={"content-type": f"multipart/mixed; boundary={boundary}"}, content=body.encode())
+
+
+class TestGoogleApiSession:
+    async def test_execute_sends_request_with_token(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"spreadsheetId": "s1"})
+
+        session, client = _session(handler)
+        request = _Request("POST", "https://sheets.googleapis.com/v4/spreadsheets?alt=json", body='{"a": 1}')
+        with client:
+            assert await session.execute(request) == {"spreadsheetId": "s1"}
+        assert seen[0].headers["authorization"] == "Bearer tok"
+        assert seen[0].content == b'{"a": 1}'
+
+    async def test_execute_surfaces_http_errors_through_postproc(self) -> None:
+        session, client = _session(lambda request: httpx.Response(404))
+        with client, pytest.raises(RuntimeError, match="404"):
+            await session.execute(_Request("GET", "https://sheets.googleapis.com/v4/spreadsheets/x"))
+
+    async def test_resumable_uploads_use_the_client_library(self) -> None:
+        session, client = _session(lambda request: httpx.Response(500))
+        request = _Request("POST", "https://www.googleapis.com/upload", resumable=object(), execute=lambda: {"id": "f"})
+        with client:
+            assert await session.execute(request) == {"id": "f"}
+
+    async def test_batch_encodes_calls_and_orders_replies(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return _batch_reply([(1, 200, '{"n": 1}'), (0, 200, '{"n": 0}')])
+
+        session, client = _session(handler)
+        requests = [
+            _Request("POST", f"https://sheets.googleapis.com/v4/spreadsheets/s:append?range=S{i}", body="{}")
+            for i in range(2)
+        ]
+        with client:
+            assert await session.execute_batch(requests) == [{"n": 0}, {"n": 1}]
+        assert len(seen) == 1
+        assert str(seen[0].url) == _BATCH_URL
+        assert seen[0].headers["content-type"].startswith("multipart/mixed; boundary=")
+        body = seen[0].content.decode()
+        assert "POST /v4/spreadsheets/s:append?range=S1 HTTP/1.1" in body
+        assert "Content-ID: <item-0>" in body
+
+    async def test_batch_is_split_by_max_size(self) -> None:
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            count = request.content.count(b"Content-ID:")
+            calls.append(count)
+            return _batch_reply([(i, 200, "{}") for i in range(count)])
+
+        session, client = _session(handler)
+        session._max_batch_size = 2
+        with client:
+            results = await session.execute_batch([_Request("GET", "https://x.googleapis.com/v1/a") for _ in range(5)])
+        assert len(results) == 5
+        assert calls == [2, 2, 1]
+
+    async def test_failed_call_raises(self) -> None:
+        session, client = _session(lambda request: _batch_reply([(0, 200, "{}"), (1, 400, "{}")]))
+        with client, pytest.raises(RuntimeError, match="400"):
+            await session.execute_batch([_Request("GET", "https://x.googleapis.com/v1/a") for _ in range(2)])
+
+    async def test_missing_reply_raises(self) -> None:
+        session, client = _session(lambda request: _batch_reply([(0, 200, "{}")]))
+        with client, pytest.raises(ConnectorError, match="missing"):
+            await session.execute_batch([_Request("GET", "https://x.googleapis.com/v1/a") for _ in range(2)])
+
+    @pytest.mark.parametrize("batch", [False, True])
+    async def test_rejected_token_is_invalidated_and_retried_once(self, batch: bool) -> None:
+        tokens: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            tokens.append(request.headers["authorization"])
+            if len(tokens) == 1:
+                return httpx.Response(401)
+            return _batch_reply([(0, 200, "{}"), (1, 200, "{}")]) if batch else httpx.Response(200, json={})
+
+        session, client = _session(handler)
+        session._token = AsyncMock(side_effect=["stale", "fresh"])  # type: ignore[method-assign]
+        requests = [_Request("GET", "https://x.googleapis.com/v1/a") for _ in range(2 if batch else 1)]
+        with client, patch.object(token_cache, "invalidate") as invalidate:
+            await session.execute_batch(requests)
+        invalidate.assert_called_once_with(session._token_key)
+        assert tokens == ["Bearer stale", "Bearer fresh"]
+
+    async def test_second_401_is_not_retried(self) -> None:
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(401)
+
+        session, client = _session(handler)
+        with client, pytest.raises(RuntimeError, match="401"):
+            await session.execute(_Request("GET", "https://x.googleapis.com/v1/a"))
+        assert len(calls) == 2
+
+    async def test_token_is_refreshed_and_cached(self) -> None:
+        token_cache.clear()
+        creds = MagicMock(service_account_email="svc@example.com", scopes=["scope"], token="fresh")
+        creds.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)  # google-auth uses naive UTC
+        session = GoogleApiSession(creds, batch_url=_BATCH_URL)
+        with (
+            patch.object(google_api, "GOOGLE_AUTH_AVAILABLE", True),
+            patch.object(google_api, "google_auth_httplib2", MagicMock(), create=True),
+            patch.object(google_api, "httplib2", MagicMock(), create=True),
+        ):
+            assert await session._token() == "fresh"
+            assert await session._token() == "fresh"
+        creds.refresh.assert_called_once()
+        token_cache.clear()
+
+
+class TestFallbackWithoutSession:
+    async def test_execute_uses_the_client_library(self) -> None:
+        request = MagicMock()
+        request.execute.return_value = {"ok": True}
+        assert await google_execute(request, None) == {"ok": True}
+
+    async def test_batch_executes_each_request(self) -> None:
+        requests = [MagicMock(), MagicMock()]
+        for i, request in enumerate(requests):
+            request.execute.return_value = i
+        assert await google_execute_batch(requests, None) == [0, 1]
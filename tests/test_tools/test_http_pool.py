@@ -0,0 +1,115 @@
+"""Tests for the shared HTTP client pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from firefly_dworkers.config import reset_config
+from firefly_dworkers.tools import http_pool
+from firefly_dworkers.tools.http_pool import HttpClientPool, close_http_clients, get_http_pool, http_client
+
+
+@pytest.fixture(autouse=True)
+async def _reset_pool():
+    await close_http_clients()
+    reset_config()
+    yield
+    await close_http_clients()
+    reset_config()
+
+
+def _pool(handler, **kwargs) -> HttpClientPool:
+    return HttpClientPool(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestHttpClientPool:
+    async def test_client_is_reused_within_a_loop(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200))
+        assert pool.client() is pool.client()
+        assert pool.stats()["created"] == 1
+
+    async def test_closed_client_is_replaced(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200))
+        first = pool.client()
+        await pool.aclose()
+        assert first.is_closed
+        assert pool.client() is not first
+        assert pool.stats()["clients"] == 1
+
+    def test_each_event_loop_gets_its_own_client(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200))
+
+        async def _get() -> httpx.AsyncClient:
+            return pool.client()
+
+        assert asyncio.run(_get()) is not asyncio.run(_get())
+        assert pool.stats()["created"] == 2
+
+    async def test_requests_are_served(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200, json={"path": request.url.path}))
+        resp = await pool.client().get("https://api.example.com/items", timeout=5.0)
+        assert resp.json() == {"path": "/items"}
+
+    async def test_cookies_are_not_carried_between_calls(self) -> None:
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=tenantA; Path=/"})
+
+        client = _pool(handler).client()
+        first = await client.get("https://api.example.com/a", timeout=5.0)
+        await client.get("https://api.example.com/b", timeout=5.0)
+        assert first.cookies["session"] == "tenantA"
+        assert seen == [None, None]
+        assert not client.cookies
+
+    async def test_per_host_limit(self) -> None:
+        active = {"api.example.com": 0, "other.example.com": 0}
+        peak = dict(active)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200)
+
+        client = _pool(handler, max_connections_per_host=2).client()
+        urls = ["https://api.example.com/"] * 6 + ["https://other.example.com/"] * 2
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+        assert all(resp.status_code == 200 for resp in responses)
+        assert peak == {"api.example.com": 2, "other.example.com": 2}
+
+    async def test_streamed_response_holds_its_slot_until_closed(self) -> None:
+        async def body():
+            yield b"data"
+
+        client = _pool(lambda request: httpx.Response(200, content=body()), max_connections_per_host=1).client()
+        async with client.stream("GET", "https://api.example.com/") as resp:
+            second = asyncio.ensure_future(client.get("https://api.example.com/"))
+            await asyncio.sleep(0.01)
+            assert not second.done()
+            assert await resp.aread() == b"data"
+        assert (await second).status_code == 200
+
+    def test_http2_requires_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(http_pool.importlib.util, "find_spec", lambda name: None)
+        assert not HttpClientPool(http2=True).http2
+
+
+class TestModuleAccessors:
+    async def test_shared_pool_uses_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DWORKERS_HTTP_MAX_CONNECTIONS_PER_HOST", "3")
+        assert get_http_pool().stats()["max_connections_per_host"] == 3
+        assert http_client() is http_client()
+
+    async def test_close_resets_the_pool(self) -> None:
+        client = http_client()
+        await close_http_clients()
+        assert client.is_closed
+        assert http_client() is not client
@@ -169,7 +169,6 @@ class TestGoogleSlidesToolCreate:
         mock_service.presentations.return_value.create.return_value.execute.return_value = {
             "presentationId": "styled-pres",
         }
-        # First batchUpdate creates slides, second applies styling
         mock_service.presentations.return_value.batchUpdate.return_value.execute.return_value = {
             "replies": [{"createSlide": {"objectId": "slide_abc"}}],
         }
@@ -186,12 +185,11 @@ class TestGoogleSlidesToolCreate:
         result = await tool._create_presentation("", slides)
         assert result == b"styled-pres"
 
-        # batchUpdate should be called twice: once for createSlide, once for styling
+        # Slides are created and styled in a single batchUpdate
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
-        assert len(batch_calls) >= 2
+        assert len(batch_calls) == 1
 
-        # Second call should contain styling requests
-        styling_body = batch_calls[1][1]["body"] if "body" in batch_calls[1][1] else batch_calls[1][0][0]
+        styling_body = batch_calls[0][1]["body"]
         if isinstance(styling_body, dict):
             styling_requests = styling_body.get("requests", [])
         else:
@@ -201,7 +199,7 @@ class TestGoogleSlidesToolCreate:
         text_style_reqs = [r for r in styling_requests if "updateTextStyle" in r]
         assert len(text_style_reqs) >= 1
         style_req = text_style_reqs[0]["updateTextStyle"]
-        assert style_req["objectId"] == "slide_abc_title"
+        assert style_req["objectId"] == "dw_slide_0_title"
         assert style_req["style"]["fontFamily"] == "Arial"
         assert style_req["style"]["bold"] is True
 
@@ -221,6 +219,7 @@ class TestGoogleSlidesToolCreate:
         slides = [
             SlideSpec(
                 title="Test",
+                content="Body text",
                 body_style=TextStyle(font_name="Roboto", font_size=12, italic=True),
             )
         ]
@@ -228,14 +227,14 @@ class TestGoogleSlidesToolCreate:
         assert result == b"body-styled-pres"
 
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
-        assert len(batch_calls) >= 2
+        assert len(batch_calls) == 1
 
-        styling_body = batch_calls[1][1]["body"]
+        styling_body = batch_calls[0][1]["body"]
         styling_requests = styling_body.get("requests", [])
         text_style_reqs = [r for r in styling_requests if "updateTextStyle" in r]
         assert len(text_style_reqs) >= 1
         body_req = text_style_reqs[0]["updateTextStyle"]
-        assert body_req["objectId"] == "slide_xyz_body"
+        assert body_req["objectId"] == "dw_slide_0_body"
         assert body_req["style"]["fontFamily"] == "Roboto"
         assert body_req["style"]["italic"] is True
 
@@ -257,14 +256,14 @@ class TestGoogleSlidesToolCreate:
         assert result == b"bg-pres"
 
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
-        assert len(batch_calls) >= 2
+        assert len(batch_calls) == 1
 
-        styling_body = batch_calls[1][1]["body"]
+        styling_body = batch_calls[0][1]["body"]
         styling_requests = styling_body.get("requests", [])
         bg_reqs = [r for r in styling_requests if "updatePageProperties" in r]
         assert len(bg_reqs) == 1
         bg_req = bg_reqs[0]["updatePageProperties"]
-        assert bg_req["objectId"] == "slide_bg"
+        assert bg_req["objectId"] == "dw_slide_0"
         rgb = bg_req["pageProperties"]["pageBackgroundFill"]["solidFill"]["color"]["rgbColor"]
         assert abs(rgb["red"] - 0.0) < 0.01
         assert abs(rgb["green"] - 0.2) < 0.01
@@ -299,15 +298,15 @@ class TestGoogleSlidesToolCreate:
         assert result == b"img-pres"
 
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
-        assert len(batch_calls) >= 2
+        assert len(batch_calls) == 1
 
-        styling_body = batch_calls[1][1]["body"]
+        styling_body = batch_calls[0][1]["body"]
         styling_requests = styling_body.get("requests", [])
         img_reqs = [r for r in styling_requests if "createImage" in r]
         assert len(img_reqs) == 1
         img_req = img_reqs[0]["createImage"]
         assert img_req["url"] == "https://example.com/photo.png"
-        assert img_req["elementProperties"]["pageObjectId"] == "slide_img"
+        assert img_req["elementProperties"]["pageObjectId"] == "dw_slide_0"
         assert img_req["elementProperties"]["size"]["width"]["magnitude"] == 300
         assert img_req["elementProperties"]["size"]["height"]["magnitude"] == 200
 
@@ -339,7 +338,7 @@ class TestGoogleSlidesToolCreate:
         await tool._create_presentation("", slides)
 
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
-        styling_body = batch_calls[1][1]["body"]
+        styling_body = batch_calls[0][1]["body"]
         styling_requests = styling_body.get("requests", [])
         img_reqs = [r for r in styling_requests if "createImage" in r]
         assert len(img_reqs) == 1
@@ -364,7 +363,7 @@ class TestGoogleSlidesToolCreate:
         result = await tool._create_presentation("", slides)
         assert result == b"plain-pres"
 
-        # Only one batchUpdate call (for createSlide), no styling call
+        # A single batchUpdate creates and fills the slide
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
         assert len(batch_calls) == 1
 
@@ -399,12 +398,47 @@ class TestGoogleSlidesToolCreate:
         assert result == b"multi-pres"
 
         batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
-        assert len(batch_calls) >= 2
+        assert len(batch_calls) == 1
 
-        styling_body = batch_calls[1][1]["body"]
+        styling_body = batch_calls[0][1]["body"]
         styling_requests = styling_body.get("requests", [])
-        # Should have: 1 updatePageProperties + 1 updateTextStyle + 1 createImage = 3
-        assert len(styling_requests) == 3
+        # Besides creating and filling the slides: 1 updatePageProperties + 1 updateTextStyle + 1 createImage
+        enhancements = [r for r in styling_requests if "createSlide" not in r and "insertText" not in r]
+        assert len(enhancements) == 3
+
+
+    async def test_create_large_deck_uses_one_batch_update(self) -> None:
+        """Every slide is created, filled and styled in one batchUpdate with preassigned IDs."""
+        mock_service = MagicMock()
+        mock_service.presentations.return_value.create.return_value.execute.return_value = {
+            "presentationId": "deck",
+        }
+        mock_service.presentations.return_value.batchUpdate.return_value.execute.return_value = {"replies": []}
+
+        tool = GoogleSlidesTool(service_account_key="/fake/key.json")
+        tool._service = mock_service
+
+        slides = [
+            SlideSpec(title=f"Slide {i}", bullet_points=["a", "b"], title_style=TextStyle(bold=True))
+            for i in range(30)
+        ]
+        await tool._create_presentation("", slides)
+
+        batch_calls = mock_service.presentations.return_value.batchUpdate.call_args_list
+        assert len(batch_calls) == 1
+        requests = batch_calls[0][1]["body"]["requests"]
+        creates = [r["createSlide"] for r in requests if "createSlide" in r]
+        assert [c["objectId"] for c in creates] == [f"dw_slide_{i}" for i in range(30)]
+        assert creates[0]["placeholderIdMappings"][0]["objectId"] == "dw_slide_0_title"
+        inserts = [r["insertText"] for r in requests if "insertText" in r]
+        assert {"objectId": "dw_slide_29_body", "text": "a\nb"} in inserts
+        assert len([r for r in requests if "updateTextStyle" in r]) == 30
+
+    async def test_style_without_text_is_skipped(self) -> None:
+        """Styling an empty placeholder is rejected by the API, so no request is built."""
+        tool = GoogleSlidesTool(service_account_key="/fake/key.json")
+        slides = [SlideSpec(title="Only title", body_style=TextStyle(bold=True))]
+        assert tool._build_slide_enhancement_requests(slides, ["dw_slide_0"], {}) == []
 
 
 class TestGoogleSlidesToolModify:
@@ -11,6 +11,7 @@ from fireflyframework_genai.tools.base import BaseTool
 
 from firefly_dworkers.design.models import DataSeries, ResolvedChart, TextStyle
 from firefly_dworkers.tools.registry import tool_registry
+from firefly_dworkers.tools.spreadsheet import xlsx_reader
 from firefly_dworkers.tools.spreadsheet.base import SpreadsheetPort
 from firefly_dworkers.tools.spreadsheet.excel import ExcelTool
 from firefly_dworkers.tools.spreadsheet.models import CellSpec, SheetSpec, SpreadsheetOperation
@@ -34,6 +35,125 @@ class TestExcelToolRegistration:
         assert ExcelTool().name == "excel"
 
 
+def _write_numbers(path, n_rows: int) -> str:
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Numbers"
+    ws.append(["id", "square", "label"])
+    for i in range(1, n_rows + 1):
+        ws.append([i, i * i, f"row{i}"])
+    wb.save(path)
+    return str(path)
+
+
+class TestExcelToolRangeRead:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        yield
+        xlsx_reader.clear_cache()
+
+    async def test_range_and_projection(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 20)
+        result = await ExcelTool().execute(action="read", source=path, cell_range="A5:C7", columns=["label", "A"])
+        sheet = result["sheets"][0]
+        assert sheet["headers"] == ["label", "id"]
+        assert sheet["rows"] == [["row4", 4], ["row5", 5], ["row6", 6]]
+        assert sheet["cell_range"] == "A5:C7"
+        assert sheet["next_cursor"] == ""
+
+    async def test_pages_continue_parked_cursor(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 25)
+        tool = ExcelTool()
+        first = await tool.read_range(path, columns=["id"], page_size=10)
+        assert first.rows[0] == [1]
+        assert first.next_cursor == "12"
+        assert len(xlsx_reader._cursors) == 1
+
+        seen = [r[0] for r in first.rows]
+        cursor = first.next_cursor
+        while cursor:
+            page = await tool.read_range(path, columns=["id"], page_size=10, cursor=cursor)
+            seen.extend(r[0] for r in page.rows)
+            cursor = page.next_cursor
+        assert seen == list(range(1, 26))
+        assert len(xlsx_reader._cursors) == 0
+
+    async def test_cursor_without_parked_reader(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 10)
+        page = await ExcelTool().read_range(path, page_size=3, cursor="8")
+        assert [r[0] for r in page.rows] == [7, 8, 9]
+
+    async def test_invalid_cursor(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 3)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await ExcelTool().read_range(path, page_size=2, cursor="abc")
+
+    async def test_unknown_column(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 3)
+        with pytest.raises(ValueError, match="Unknown column"):
+            await ExcelTool().read_range(path, columns=["missing column"])
+
+    async def test_index_action(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 5)
+        result = await ExcelTool().execute(action="index", source=path)
+        (info,) = result["sheets"]
+        assert info["name"] == "Numbers"
+        assert info["dimensions"] == "A1:C6"
+        assert (info["max_row"], info["max_column"]) == (6, 3)
+        assert info["headers"] == ["id", "square", "label"]
+        assert info["active"] is True
+
+    async def test_index_refreshes_when_file_changes(self, tmp_path) -> None:
+        path = _write_numbers(tmp_path / "n.xlsx", 5)
+        assert xlsx_reader.sheet_index(path) is xlsx_reader.sheet_index(path)
+        _write_numbers(tmp_path / "n.xlsx", 50)
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert xlsx_reader.sheet_index(path)[0].max_row == 51
+
+
+class TestExcelToolWriteOnly:
+    @staticmethod
+    def _cells(data: bytes) -> set[tuple]:
+        openpyxl = pytest.importorskip("openpyxl")
+        ws = openpyxl.load_workbook(io.BytesIO(data))["Data"]
+        return {
+            (c.coordinate, c.value, c.number_format, c.font.b, c.font.i, c.font.name, c.alignment.horizontal)
+            for row in ws.iter_rows()
+            for c in row
+            if c.has_style or c.value is not None
+        }
+
+    def test_matches_regular_path(self) -> None:
+        pytest.importorskip("openpyxl")
+        spec = SheetSpec(
+            name="Data",
+            headers=["id", "amount", "label"],
+            rows=[[i, i * 1.5, f"row{i}"] for i in range(20)] + [[99]],
+            header_style=TextStyle(bold=True),
+            cell_style=TextStyle(font_name="Arial", alignment="center"),
+            number_formats={"B": "0.00", "D": "0%"},
+            column_widths=[10, 20],
+            cells=[
+                CellSpec(row=2, col=1, value=-1, number_format="0.0"),
+                CellSpec(row=30, col=2, formula="=SUM(B2:B21)", style=TextStyle(italic=True)),
+            ],
+        )
+        regular = ExcelTool(write_only_rows=0)._create_sync([spec])
+        streamed = ExcelTool(write_only_rows=10)._create_sync([spec])
+        assert self._cells(streamed) == self._cells(regular)
+
+    def test_used_only_for_large_sheets_without_charts(self) -> None:
+        tool = ExcelTool(write_only_rows=3)
+        small = SheetSpec(name="a", rows=[[1], [2]])
+        large = SheetSpec(name="b", rows=[[1], [2], [3]])
+        chart = ResolvedChart(chart_type="bar", categories=["x"], series=[DataSeries(name="s", values=[1])])
+        assert not tool._use_write_only([small])
+        assert tool._use_write_only([small, large])
+        assert not tool._use_write_only([large.model_copy(update={"chart": chart})])
+        assert not ExcelTool(write_only_rows=0)._use_write_only([large])
+
+
 class TestExcelToolRead:
     async def test_read_spreadsheet(self) -> None:
         openpyxl = pytest.importorskip("openpyxl")
@@ -247,7 +247,7 @@ class TestGoogleSheetsToolCreate:
             "spreadsheetId": "new-sheet-id",
             "sheets": [{"properties": {"title": "Data", "sheetId": 0}}],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
         tool._service = mock_service
@@ -256,6 +256,28 @@ class TestGoogleSheetsToolCreate:
         result = await tool._create_spreadsheet(sheets)
         assert result == b"new-sheet-id"
 
+    async def test_create_writes_all_sheets_in_one_call(self) -> None:
+        """Values for every sheet are written with a single values.batchUpdate."""
+        mock_service = MagicMock()
+        mock_service.spreadsheets.return_value.create.return_value.execute.return_value = {
+            "spreadsheetId": "multi",
+            "sheets": [{"properties": {"title": f"S{i}", "sheetId": i}} for i in range(3)],
+        }
+
+        tool = GoogleSheetsTool(service_account_key="/fake/key.json")
+        tool._service = mock_service
+
+        sheets = [SheetSpec(name=f"S{i}", headers=["A"], rows=[[i]]) for i in range(3)]
+        await tool._create_spreadsheet(sheets)
+
+        values = mock_service.spreadsheets.return_value.values.return_value
+        assert values.update.call_count == 0
+        values.batchUpdate.assert_called_once()
+        body = values.batchUpdate.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "RAW"
+        assert [d["range"] for d in body["data"]] == ["S0!A1", "S1!A1", "S2!A1"]
+        assert body["data"][2]["values"] == [["A"], [2]]
+
     async def test_create_spreadsheet_empty(self) -> None:
         """Test creating an empty spreadsheet."""
         mock_service = MagicMock()
@@ -277,7 +299,7 @@ class TestGoogleSheetsToolCreate:
             "spreadsheetId": "styled-sheet",
             "sheets": [{"properties": {"title": "Sales", "sheetId": 0}}],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
         mock_service.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
@@ -317,7 +339,7 @@ class TestGoogleSheetsToolCreate:
             "spreadsheetId": "width-sheet",
             "sheets": [{"properties": {"title": "Data", "sheetId": 0}}],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
         mock_service.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
@@ -351,7 +373,7 @@ class TestGoogleSheetsToolCreate:
             "spreadsheetId": "fmt-sheet",
             "sheets": [{"properties": {"title": "Finance", "sheetId": 0}}],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
         mock_service.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
@@ -394,7 +416,7 @@ class TestGoogleSheetsToolCreate:
             "spreadsheetId": "all-fmt-sheet",
             "sheets": [{"properties": {"title": "Report", "sheetId": 0}}],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
         mock_service.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
@@ -427,7 +449,7 @@ class TestGoogleSheetsToolCreate:
             "spreadsheetId": "plain-sheet",
             "sheets": [{"properties": {"title": "Data", "sheetId": 0}}],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
         tool._service = mock_service
@@ -455,7 +477,7 @@ class TestGoogleSheetsToolCreate:
                 {"properties": {"title": "Costs", "sheetId": 1}},
             ],
         }
-        mock_service.spreadsheets.return_value.values.return_value.update.return_value.execute.return_value = {}
+        mock_service.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {}
         mock_service.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {}
 
         tool = GoogleSheetsTool(service_account_key="/fake/key.json")
@@ -534,6 +556,32 @@ class TestGoogleSheetsToolModify:
         result = await tool._modify_spreadsheet("sheet-id", ops)
         assert result == b"sheet-id"
 
+    async def test_modify_coalesces_operations(self) -> None:
+        """New sheets share one batchUpdate; rows are appended once per sheet, in order."""
+        mock_service = MagicMock()
+
+        tool = GoogleSheetsTool(service_account_key="/fake/key.json")
+        tool._service = mock_service
+
+        from firefly_dworkers.tools.spreadsheet.models import SpreadsheetOperation
+
+        ops = [
+            SpreadsheetOperation(operation="add_sheet", data={"name": "A"}),
+            SpreadsheetOperation(operation="add_rows", sheet_name="A", data={"rows": [[1]]}),
+            SpreadsheetOperation(operation="add_sheet", data={"name": "B"}),
+            SpreadsheetOperation(operation="add_rows", sheet_name="B", data={"rows": [[2]]}),
+            SpreadsheetOperation(operation="add_rows", sheet_name="A", data={"rows": [[3]]}),
+        ]
+        await tool._modify_spreadsheet("sheet-id", ops)
+
+        batch_update = mock_service.spreadsheets.return_value.batchUpdate
+        batch_update.assert_called_once()
+        titles = [r["addSheet"]["properties"]["title"] for r in batch_update.call_args.kwargs["body"]["requests"]]
+        assert titles == ["A", "B"]
+        append = mock_service.spreadsheets.return_value.values.return_value.append
+        appended = {c.kwargs["range"]: c.kwargs["body"]["values"] for c in append.call_args_list}
+        assert appended == {"A!A1": [[1], [3]], "B!A1": [[2]]}
+
     async def test_modify_no_operations(self) -> None:
         """Test modify with no operations."""
         mock_service = MagicMock()
@@ -111,3 +111,33 @@ class TestDocumentStorageTool:
         from fireflyframework_genai.tools.base import BaseTool
 
         assert isinstance(FakeStorageTool("test"), BaseTool)
+
+
+class PagedStorageTool(FakeStorageTool):
+    """Serves three pages of two results and records how many were fetched."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.pages_fetched = 0
+
+    async def _list_pages(self, path: str):
+        for page in range(3):
+            self.pages_fetched += 1
+            yield [DocumentResult(id=f"{page}-{i}", name=f"file{i}") for i in range(2)]
+
+
+class TestStreamingListing:
+    async def test_iter_list_streams_every_page(self):
+        tool = PagedStorageTool("test")
+        ids = [doc.id async for doc in tool.iter_list("/docs")]
+        assert ids == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+
+    async def test_limit_stops_fetching_pages(self):
+        tool = PagedStorageTool("test")
+        ids = [doc.id async for doc in tool.iter_list("/docs", limit=2)]
+        assert ids == ["0-0", "0-1"]
+        assert tool.pages_fetched == 1
+
+    async def test_unpaged_provider_yields_its_single_page(self):
+        results = [doc.name async for doc in FakeStorageTool("test").iter_search("q")]
+        assert results == ["Result for q"]
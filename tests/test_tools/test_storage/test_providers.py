@@ -12,10 +12,12 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fireflyframework_genai.exceptions import ToolError
 from fireflyframework_genai.tools.base import BaseTool
 
+from firefly_dworkers.exceptions import ConnectorError
 from firefly_dworkers.tools.storage.confluence import ConfluenceTool
 from firefly_dworkers.tools.storage.google_drive import GoogleDriveTool
 from firefly_dworkers.tools.storage.s3 import S3Tool
@@ -26,6 +28,10 @@ from firefly_dworkers.tools.storage.sharepoint import SharePointTool
 # ---------------------------------------------------------------------------
 
 
+def _mock_http(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 class TestSharePointTool:
     def test_instantiation(self):
         tool = SharePointTool()
@@ -111,20 +117,140 @@ class TestSharePointTool:
                 "@microsoft.graph.downloadUrl": "https://download.example.com/readme.txt",
             }
         )
-        # Mock httpx for download
-        mock_resp = MagicMock()
-        mock_resp.text = "Hello, World!"
-        mock_resp.raise_for_status = MagicMock()
+        requests = []
 
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_resp)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"Hello, World!")
 
-        with patch("firefly_dworkers.tools.storage.sharepoint.httpx.AsyncClient", return_value=mock_client):
+        with patch("firefly_dworkers.tools.storage.sharepoint.http_client", return_value=_mock_http(handler)):
             result = await tool.execute(action="read", resource_id="item-1")
         assert result["id"] == "item-1"
         assert result["content"] == "Hello, World!"
+        assert requests[0].url.path.endswith("/items/item-1/content")
+        assert "range" not in requests[0].headers
+
+    async def test_read_large_file_requests_a_byte_range(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d", max_read_bytes=8)
+        tool._get_token = AsyncMock(return_value="fake-token")  # type: ignore[method-assign]
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        tool._graph_get = AsyncMock(  # type: ignore[method-assign]
+            return_value={"id": "big", "name": "deck.txt", "file": {"mimeType": "text/plain"}, "size": 10_000_000}
+        )
+        ranges = []
+
+        def handler(request):
+            ranges.append(request.headers.get("range"))
+            # Servers may ignore Range; the read is still capped.
+            return httpx.Response(200, content="héllo wörld".encode())
+
+        with patch("firefly_dworkers.tools.storage.sharepoint.http_client", return_value=_mock_http(handler)):
+            result = await tool.execute(action="read", resource_id="big")
+        assert ranges == ["bytes=0-7"]
+        assert result["content"] == "héllo w"
+        assert result["size_bytes"] == 10_000_000
+
+    async def test_stream_content_yields_chunks(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d")
+        tool._get_token = AsyncMock(return_value="fake-token")  # type: ignore[method-assign]
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+
+        async def body():
+            for part in (b"a" * 10, b"b" * 10):
+                yield part
+
+        def handler(request):
+            assert request.url.path.endswith("/root:/docs/deck.pptx:/content")
+            assert request.headers["range"] == "bytes=5-"
+            return httpx.Response(206, content=body())
+
+        with patch("firefly_dworkers.tools.storage.sharepoint.http_client", return_value=_mock_http(handler)):
+            chunks = [chunk async for chunk in tool.stream_content(path="/docs/deck.pptx", start=5)]
+        assert b"".join(chunks) == b"a" * 10 + b"b" * 10
+
+    async def test_small_upload_uses_a_single_put(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d")
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        tool._graph_put = AsyncMock(return_value={"id": "new", "name": "notes.txt"})  # type: ignore[method-assign]
+        tool._graph_post = AsyncMock()  # type: ignore[method-assign]
+        result = await tool.execute(action="write", path="/notes.txt", content="hello")
+        assert result["id"] == "new"
+        tool._graph_put.assert_awaited_once_with("/drives/d/root:/notes.txt:/content", b"hello", "text/plain")
+        tool._graph_post.assert_not_awaited()
+
+    async def test_large_upload_uses_an_upload_session(self, tmp_path):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d", upload_chunk_size=327_680)
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        tool._graph_post = AsyncMock(  # type: ignore[method-assign]
+            return_value={"uploadUrl": "https://upload.example.com/session"}
+        )
+        source = tmp_path / "deck.pptx"
+        source.write_bytes(bytes(range(256)) * 20_000)  # 5,120,000 bytes
+        received = []
+
+        def handler(request):
+            assert "authorization" not in request.headers
+            received.append((request.headers["content-range"], request.content))
+            if len(b"".join(part for _, part in received)) < 5_120_000:
+                return httpx.Response(202, json={"nextExpectedRanges": []})
+            return httpx.Response(201, json={"id": "deck", "name": "deck.pptx", "size": 5_120_000})
+
+        with patch("firefly_dworkers.tools.storage.sharepoint.http_client", return_value=_mock_http(handler)):
+            result = await tool.upload("/decks/deck.pptx", source)
+        assert result.id == "deck"
+        assert result.size_bytes == 5_120_000
+        assert len(received) == 16
+        assert received[0][0] == "bytes 0-327679/5120000"
+        assert received[-1][0] == "bytes 4915200-5119999/5120000"
+        assert b"".join(part for _, part in received) == source.read_bytes()
+        tool._graph_post.assert_awaited_once()
+        assert tool._graph_post.await_args.args[0] == "/drives/d/root:/decks/deck.pptx:/createUploadSession"
+
+    async def test_failed_upload_cancels_the_session(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d", upload_chunk_size=327_680)
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        tool._graph_post = AsyncMock(  # type: ignore[method-assign]
+            return_value={"uploadUrl": "https://upload.example.com/session"}
+        )
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(500 if request.method == "PUT" else 204)
+
+        with (
+            patch("firefly_dworkers.tools.storage.sharepoint.http_client", return_value=_mock_http(handler)),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await tool.upload("/big.bin", b"x" * 5_000_000)
+        assert methods == ["PUT", "DELETE"]
+
+    async def test_short_read_aborts_the_upload(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d", upload_chunk_size=327_680)
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        tool._graph_post = AsyncMock(  # type: ignore[method-assign]
+            return_value={"uploadUrl": "https://upload.example.com/session"}
+        )
+        requests = []
+
+        async def read(offset, length):
+            # The source was truncated to 400,000 bytes after its size was taken.
+            return b"x" * max(0, min(length, 400_000 - offset))
+
+        def handler(request):
+            requests.append((request.method, request.headers.get("content-range")))
+            return httpx.Response(202 if request.method == "PUT" else 204, json={})
+
+        with (
+            patch("firefly_dworkers.tools.storage.sharepoint.http_client", return_value=_mock_http(handler)),
+            pytest.raises(ConnectorError, match="changed size"),
+        ):
+            await tool._upload("/big.bin", 5_000_000, read, "application/octet-stream")
+        assert requests == [("PUT", "bytes 0-327679/5000000"), ("DELETE", None)]
+
+    def test_upload_chunk_size_must_be_a_multiple_of_320_kib(self):
+        with pytest.raises(ValueError, match="multiple"):
+            SharePointTool(upload_chunk_size=1_000_000)
 
     async def test_list_with_mocked_graph_api(self):
         tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="drive-123")
@@ -173,6 +299,30 @@ class TestSharePointTool:
         assert result["content"] == "Hello World"
         assert result["size_bytes"] == len(b"Hello World")
 
+    async def test_iter_list_follows_next_link(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d")
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        next_link = "https://graph.microsoft.com/v1.0/drives/d/root/children?$skiptoken=abc"
+        tool._graph_get = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[
+                {"value": [{"id": "1", "name": "a.txt"}], "@odata.nextLink": next_link},
+                {"value": [{"id": "2", "name": "b.txt"}]},
+            ]
+        )
+        ids = [doc.id async for doc in tool.iter_list("/")]
+        assert ids == ["1", "2"]
+        assert tool._graph_get.await_args_list[1].args == (next_link,)
+
+    async def test_list_action_returns_first_page_only(self):
+        tool = SharePointTool(tenant_id="t", client_id="c", client_secret="s", drive_id="d")
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+        tool._graph_get = AsyncMock(  # type: ignore[method-assign]
+            return_value={"value": [{"id": "1", "name": "a.txt"}], "@odata.nextLink": "https://next"}
+        )
+        result = await tool.execute(action="list", path="/")
+        assert [r["id"] for r in result] == ["1"]
+        tool._graph_get.assert_awaited_once()
+
 
 # ---------------------------------------------------------------------------
 # GoogleDriveTool
@@ -298,6 +448,20 @@ class TestGoogleDriveTool:
         assert result["id"] == "new-f1"
         assert result["content"] == "Content"
 
+    async def test_iter_list_follows_page_tokens(self):
+        tool = GoogleDriveTool(service_account_key="/fake/key.json")
+        mock_files = MagicMock()
+        mock_files.list.return_value.execute.side_effect = [
+            {"files": [{"id": "f1", "name": "a"}], "nextPageToken": "tok"},
+            {"files": [{"id": "f2", "name": "b"}]},
+        ]
+        tool._service = MagicMock()
+        tool._service.files.return_value = mock_files
+
+        ids = [doc.id async for doc in tool.iter_list("folder-id")]
+        assert ids == ["f1", "f2"]
+        assert [c.kwargs["pageToken"] for c in mock_files.list.call_args_list] == [None, "tok"]
+
 
 # ---------------------------------------------------------------------------
 # ConfluenceTool
@@ -408,6 +572,17 @@ class TestConfluenceTool:
         with pytest.raises(ToolError, match="space_key"):
             await tool.execute(action="list", path="")
 
+    async def test_iter_list_pages_with_start(self):
+        tool = ConfluenceTool(base_url="https://wiki.example.com", username="u", api_token="t", space_key="ENG")
+        full_page = [{"id": str(i), "title": f"Page {i}"} for i in range(100)]
+        tool._client = MagicMock()
+        tool._client.get_all_pages_from_space.side_effect = [full_page, [{"id": "100", "title": "Last"}]]
+
+        docs = [doc async for doc in tool.iter_list("ENG")]
+        assert len(docs) == 101
+        starts = [c.kwargs["start"] for c in tool._client.get_all_pages_from_space.call_args_list]
+        assert starts == [0, 100]
+
 
 # ---------------------------------------------------------------------------
 # S3Tool
@@ -524,3 +699,18 @@ class TestS3Tool:
     def test_full_key_without_prefix(self):
         tool = S3Tool(bucket="b")
         assert tool._full_key("file.txt") == "file.txt"
+
+    async def test_iter_search_follows_continuation_tokens(self):
+        tool = S3Tool(bucket="my-bucket", region="us-east-1")
+        mock_s3 = MagicMock()
+        mock_s3.list_objects_v2.side_effect = [
+            {"Contents": [{"Key": "a.txt"}], "IsTruncated": True, "NextContinuationToken": "tok"},
+            {"Contents": [{"Key": "b.txt"}], "IsTruncated": False},
+        ]
+        tool._client = mock_s3
+        tool._ensure_deps = MagicMock()  # type: ignore[method-assign]
+
+        keys = [doc.id async for doc in tool.iter_search("")]
+        assert keys == ["a.txt", "b.txt"]
+        assert "ContinuationToken" not in mock_s3.list_objects_v2.call_args_list[0].kwargs
+        assert mock_s3.list_objects_v2.call_args_list[1].kwargs["ContinuationToken"] == "tok"
@@ -0,0 +1,112 @@
+"""Tests for the shared OAuth token cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from firefly_dworkers.exceptions import ConnectorAuthError
+from firefly_dworkers.tools import token_cache as token_cache_module
+from firefly_dworkers.tools.token_cache import AccessToken, TokenCache, graph_access_token, token_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    token_cache.clear()
+    token_cache_module._msal_apps.clear()
+    yield
+    token_cache.clear()
+    token_cache_module._msal_apps.clear()
+
+
+class _Fetcher:
+    def __init__(self, expires_in: float = 3600.0, delay: float = 0.0) -> None:
+        self.calls = 0
+        self._expires_in = expires_in
+        self._delay = delay
+
+    async def __call__(self) -> AccessToken:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return AccessToken(token=f"token-{self.calls}", expires_at=time.time() + self._expires_in)
+
+
+class TestTokenCache:
+    async def test_token_is_reused_until_expiry(self) -> None:
+        cache, fetch = TokenCache(), _Fetcher()
+        assert await cache.get(("k",), fetch) == "token-1"
+        assert await cache.get(("k",), fetch) == "token-1"
+        assert fetch.calls == 1
+        with patch("firefly_dworkers.tools.token_cache.time.time", return_value=time.time() + 7200):
+            assert await cache.get(("k",), fetch) == "token-2"
+
+    async def test_concurrent_misses_share_one_acquisition(self) -> None:
+        cache, fetch = TokenCache(), _Fetcher(delay=0.01)
+        tokens = await asyncio.gather(*(cache.get(("k",), fetch) for _ in range(5)))
+        assert tokens == ["token-1"] * 5
+        assert fetch.calls == 1
+
+    async def test_token_near_expiry_is_refreshed_in_background(self) -> None:
+        cache, fetch = TokenCache(refresh_margin=300), _Fetcher(expires_in=60)
+        await cache.get(("k",), fetch)
+        # Still valid, so it is served while a replacement is fetched.
+        assert await cache.get(("k",), fetch) == "token-1"
+        await asyncio.sleep(0.01)
+        assert fetch.calls == 2
+        assert await cache.get(("k",), fetch) == "token-2"
+        assert cache.stats()["refreshes"] >= 1
+
+    async def test_invalidate_forces_a_new_token(self) -> None:
+        cache, fetch = TokenCache(), _Fetcher()
+        await cache.get(("k",), fetch)
+        cache.invalidate(("k",))
+        assert await cache.get(("k",), fetch) == "token-2"
+
+    async def test_failed_acquisition_is_not_cached(self) -> None:
+        cache = TokenCache()
+
+        async def _fail() -> AccessToken:
+            raise ConnectorAuthError("denied")
+
+        with pytest.raises(ConnectorAuthError):
+            await cache.get(("k",), _fail)
+        assert await cache.get(("k",), _Fetcher()) == "token-1"
+
+
+class TestGraphAccessToken:
+    async def test_msal_app_is_reused_and_expires_in_honoured(self) -> None:
+        app = MagicMock()
+        app.acquire_token_for_client.return_value = {"access_token": "graph", "expires_in": 3599}
+        msal = MagicMock()
+        msal.ConfidentialClientApplication.return_value = app
+        with (
+            patch.object(token_cache_module, "msal", msal),
+            patch.object(token_cache_module, "MSAL_AVAILABLE", True),
+        ):
+            for _ in range(3):
+                token = await graph_access_token(tenant_id="t", client_id="c", client_secret="s")
+            key = token_cache_module.graph_token_key("t", "c", "s", ["https://graph.microsoft.com/.default"])
+            token_cache.invalidate(key)
+            await graph_access_token(tenant_id="t", client_id="c", client_secret="s")
+        assert token == "graph"
+        assert msal.ConfidentialClientApplication.call_count == 1
+        assert app.acquire_token_for_client.call_count == 2
+
+    async def test_missing_credentials(self) -> None:
+        with pytest.raises(ConnectorAuthError, match="requires tenant_id"):
+            await graph_access_token(tenant_id="", client_id="c", client_secret="s", label="SharePoint")
+
+    async def test_auth_error_is_raised(self) -> None:
+        app = MagicMock()
+        app.acquire_token_for_client.return_value = {"error": "invalid_client"}
+        msal = MagicMock()
+        msal.ConfidentialClientApplication.return_value = app
+        with (
+            patch.object(token_cache_module, "msal", msal),
+            patch.object(token_cache_module, "MSAL_AVAILABLE", True),
+            pytest.raises(ConnectorAuthError, match="invalid_client"),
+        ):
+            await graph_access_token(tenant_id="t", client_id="c", client_secret="s")
@@ -164,6 +164,16 @@ class TestToolkitFactories:
         tool_names = [t.name for t in kit.tools]
         assert "sharepoint" not in tool_names
 
+    def test_sharepoint_receives_connector_settings(self) -> None:
+        cfg = self._make_config(
+            sharepoint={"enabled": True, "client_id": "app", "max_read_bytes": 1024, "upload_chunk_size": 655_360},
+        )
+        kit = researcher_toolkit(cfg)
+        (tool,) = [t for t in kit.tools if t.name == "sharepoint"]
+        assert tool._client_id == "app"
+        assert tool._max_read_bytes == 1024
+        assert tool._upload_chunk_size == 655_360
+
     # -- communication connector inclusion ------------------------------------
 
     def test_analyst_includes_slack_when_enabled(self) -> None:
@@ -0,0 +1,111 @@
+"""Tests for AdmissionController (per-tenant, per-role concurrency limits)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from firefly_dworkers.exceptions import ConcurrencyLimitError
+from firefly_dworkers.tenants.config import TenantConfig, WorkerConfig
+from firefly_dworkers.types import WorkerRole
+from firefly_dworkers.workers.admission import AdmissionController
+
+
+def _config(limit: int = 1, *, reject: bool = False, wait: float = 0.0, tenant_id: str = "adm") -> TenantConfig:
+    settings = {"max_concurrent_tasks": limit, "reject_when_busy": reject, "max_queue_wait_seconds": wait}
+    return TenantConfig(id=tenant_id, name="Admission Test", workers=WorkerConfig(analyst=settings))
+
+
+class TestAdmissionController:
+    async def test_admits_within_limit(self) -> None:
+        controller = AdmissionController()
+        async with controller.admit(_config(limit=2), WorkerRole.ANALYST):
+            stats = controller.stats("adm")[0]
+            assert stats.active == 1
+        assert controller.stats("adm")[0].active == 0
+        assert controller.stats("adm")[0].admitted == 1
+
+    async def test_limit_caps_concurrency(self) -> None:
+        controller = AdmissionController()
+        config = _config(limit=2)
+        running = 0
+        peak = 0
+
+        async def _job() -> None:
+            nonlocal running, peak
+            async with controller.admit(config, WorkerRole.ANALYST):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(_job() for _ in range(6)))
+        assert peak == 2
+        stats = controller.stats("adm")[0]
+        assert stats.admitted == 6
+        assert stats.peak_queue_depth >= 1
+        assert stats.max_wait_ms > 0
+
+    async def test_fail_fast_rejects_when_busy(self) -> None:
+        controller = AdmissionController()
+        config = _config(limit=1, reject=True)
+        async with controller.admit(config, WorkerRole.ANALYST):
+            with pytest.raises(ConcurrencyLimitError):
+                await asyncio.create_task(self._enter(controller, config))
+        assert controller.stats("adm")[0].rejected == 1
+
+    async def test_queue_wait_timeout_rejects(self) -> None:
+        controller = AdmissionController()
+        config = _config(limit=1, wait=0.01)
+        gate = asyncio.Event()
+
+        async def _holder() -> None:
+            async with controller.admit(config, WorkerRole.ANALYST):
+                await gate.wait()
+
+        holder = asyncio.create_task(_holder())
+        await asyncio.sleep(0)
+
+        async def _waiter() -> None:
+            async with controller.admit(config, WorkerRole.ANALYST):
+                pass
+
+        with pytest.raises(ConcurrencyLimitError):
+            await asyncio.create_task(_waiter())
+        gate.set()
+        await holder
+        stats = controller.stats("adm")[0]
+        assert stats.queue_depth == 0
+        assert stats.active == 0
+
+    async def test_nested_admission_is_reentrant(self) -> None:
+        controller = AdmissionController()
+        config = _config(limit=1)
+        async with controller.admit(config, WorkerRole.ANALYST), controller.admit(config, WorkerRole.ANALYST):
+            assert controller.stats("adm")[0].active == 1
+
+    async def test_zero_limit_is_unlimited(self) -> None:
+        controller = AdmissionController()
+        config = _config(limit=0, reject=True)
+        async with controller.admit(config, WorkerRole.ANALYST):
+            await asyncio.create_task(self._enter(controller, config))
+
+    async def test_tenants_and_roles_are_independent(self) -> None:
+        controller = AdmissionController()
+        a = _config(limit=1, reject=True, tenant_id="a")
+        b = _config(limit=1, reject=True, tenant_id="b")
+        async with controller.admit(a, WorkerRole.ANALYST):
+            await asyncio.create_task(self._enter(controller, b))
+            await asyncio.create_task(self._enter(controller, a, WorkerRole.RESEARCHER))
+
+    async def test_unknown_role_is_not_limited(self) -> None:
+        controller = AdmissionController()
+        async with controller.admit(_config(), "custom_agent"):
+            pass
+        assert controller.stats() == []
+
+    @staticmethod
+    async def _enter(controller: AdmissionController, config: TenantConfig, role=WorkerRole.ANALYST) -> None:
+        async with controller.admit(config, role):
+            pass
@@ -295,6 +295,15 @@ class TestBuildGuardMiddleware:
         output_mw = middleware[0]
         assert output_mw._guard._max_length == 8192
 
+    def test_guards_are_shared_for_equal_settings(self) -> None:
+        """Guard instances are reused while the tenant's guard settings are unchanged."""
+        first = BaseWorker._build_guard_middleware(_make_config())
+        second = BaseWorker._build_guard_middleware(_make_config())
+        changed = BaseWorker._build_guard_middleware(_make_config(guards=GuardsConfig(max_output_length=99)))
+        assert first[0]._guard is second[0]._guard
+        assert first[1]._guard is second[1]._guard
+        assert changed[1]._guard is not first[1]._guard
+
     def test_framework_import_fallback(self) -> None:
         """Graceful fallback when framework guard modules are not available."""
         config = _make_config()
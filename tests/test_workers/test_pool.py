@@ -0,0 +1,125 @@
+"""Tests for SpecialistPool."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from firefly_dworkers.tenants.config import TenantConfig
+from firefly_dworkers.types import WorkerRole
+from firefly_dworkers.workers.pool import SpecialistPool
+
+
+def _make_factory() -> MagicMock:
+    """Factory whose ``create`` returns a fresh mock worker per call."""
+    factory = MagicMock()
+
+    def _create(role, config, **kwargs):
+        worker = MagicMock()
+        worker.name = kwargs.get("name", "")
+        worker.memory = "default-memory"
+        worker.checkpoint_handler = None
+        return worker
+
+    factory.create.side_effect = _create
+    return factory
+
+
+def _config(tenant_id: str = "pool-test") -> TenantConfig:
+    return TenantConfig(id=tenant_id, name="Pool Test")
+
+
+class TestSpecialistPool:
+    def test_acquire_creates_worker(self) -> None:
+        factory = _make_factory()
+        pool = SpecialistPool(factory=factory)
+        worker = pool.acquire(WorkerRole.ANALYST, _config())
+        assert factory.create.call_count == 1
+        assert "analyst-pool-test" in worker.name
+
+    def test_release_then_acquire_reuses_worker(self) -> None:
+        factory = _make_factory()
+        pool = SpecialistPool(factory=factory)
+        config = _config()
+        first = pool.acquire(WorkerRole.ANALYST, config)
+        pool.release(first)
+        second = pool.acquire(WorkerRole.ANALYST, config)
+        assert second is first
+        assert factory.create.call_count == 1
+        assert pool.stats()["reused"] == 1
+
+    def test_concurrent_leases_get_distinct_workers(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        config = _config()
+        a = pool.acquire(WorkerRole.ANALYST, config)
+        b = pool.acquire(WorkerRole.ANALYST, config)
+        assert a is not b
+        assert pool.stats()["leased"] == 2
+
+    def test_memory_bound_for_lease_and_restored(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        run_memory = object()
+        worker = pool.acquire(WorkerRole.RESEARCHER, _config(), memory=run_memory)
+        assert worker.memory is run_memory
+        pool.release(worker)
+        assert worker.memory == "default-memory"
+
+    def test_checkpoint_handler_restored_on_release(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        worker = pool.acquire(WorkerRole.ANALYST, _config())
+        worker.checkpoint_handler = MagicMock()
+        pool.release(worker)
+        assert worker.checkpoint_handler is None
+
+    def test_tenants_are_isolated(self) -> None:
+        factory = _make_factory()
+        pool = SpecialistPool(factory=factory)
+        worker = pool.acquire(WorkerRole.ANALYST, _config("t1"))
+        pool.release(worker)
+        other = pool.acquire(WorkerRole.ANALYST, _config("t2"))
+        assert other is not worker
+        assert factory.create.call_count == 2
+
+    def test_reconfigured_tenant_discards_idle_workers(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        worker = pool.acquire(WorkerRole.ANALYST, _config())
+        pool.release(worker)
+        fresh = pool.acquire(WorkerRole.ANALYST, _config())  # new config object, same id
+        assert fresh is not worker
+
+    def test_invalidate_drops_idle_workers(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        config = _config()
+        worker = pool.acquire(WorkerRole.ANALYST, config)
+        pool.release(worker)
+        pool.invalidate("pool-test")
+        assert pool.stats()["idle"] == 0
+        assert pool.acquire(WorkerRole.ANALYST, config) is not worker
+
+    def test_max_idle_bounds_retained_workers(self) -> None:
+        pool = SpecialistPool(factory=_make_factory(), max_idle_per_key=1)
+        config = _config()
+        a = pool.acquire(WorkerRole.ANALYST, config)
+        b = pool.acquire(WorkerRole.ANALYST, config)
+        pool.release(a)
+        pool.release(b)
+        assert pool.stats()["idle"] == 1
+
+    def test_lease_context_releases_on_exit(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        with pool.lease(_config(), [WorkerRole.ANALYST, WorkerRole.RESEARCHER]) as workers:
+            assert len(workers) == 2
+            assert pool.stats()["leased"] == 2
+        assert pool.stats()["leased"] == 0
+        assert pool.stats()["idle"] == 2
+
+    def test_lease_skips_unregistered_roles(self) -> None:
+        factory = _make_factory()
+        factory.create.side_effect = KeyError("nope")
+        pool = SpecialistPool(factory=factory)
+        with pool.lease(_config(), [WorkerRole.ANALYST]) as workers:
+            assert workers == []
+
+    def test_release_unknown_worker_is_noop(self) -> None:
+        pool = SpecialistPool(factory=_make_factory())
+        pool.release(MagicMock())
+        assert pool.stats()["idle"] == 0
@@ -0,0 +1,138 @@
+"""Tests for the exact-match LLM response cache."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from firefly_dworkers.tenants.config import CacheConfig, TenantConfig
+from firefly_dworkers.workers.response_cache import (
+    CachedResponse,
+    InMemoryResponseStore,
+    ResponseCache,
+    SQLiteResponseStore,
+    clear_response_caches,
+    response_cache_for,
+    response_cache_key,
+)
+
+
+@dataclass
+class _Message:
+    content: str
+    timestamp: datetime
+
+
+def _key(**overrides) -> str:
+    fields = {"tenant_id": "t", "model": "m", "instructions": "be brief", "tools": ["search"], "prompt": "hi"}
+    fields.update(overrides)
+    return response_cache_key(**fields)
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    clear_response_caches()
+    yield
+    clear_response_caches()
+
+
+class TestResponseCacheKey:
+    def test_stable_for_same_request(self) -> None:
+        assert _key() == _key(tools=["search"])
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"tenant_id": "other"},
+            {"model": "other"},
+            {"instructions": "be verbose"},
+            {"tools": ["search", "write"]},
+            {"prompt": "hello"},
+            {"options": {"message_history": [_Message("earlier", datetime(2026, 1, 1))]}},
+        ],
+    )
+    def test_changes_with_any_component(self, overrides) -> None:
+        assert _key(**overrides) != _key()
+
+    def test_message_timestamps_are_ignored(self) -> None:
+        first = {"message_history": [_Message("earlier", datetime(2026, 1, 1))]}
+        second = {"message_history": [_Message("earlier", datetime(2026, 6, 1))]}
+        assert _key(options=first) == _key(options=second)
+
+
+class TestResponseCache:
+    def test_hits_and_misses_are_counted(self) -> None:
+        cache = ResponseCache(InMemoryResponseStore())
+        assert cache.get("k") is None
+        cache.put("k", "answer")
+        assert cache.get("k") == "answer"
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_none_outputs_are_not_cached(self) -> None:
+        cache = ResponseCache(InMemoryResponseStore())
+        cache.put("k", None)
+        assert cache.stats()["entries"] == 0
+
+    def test_ttl_expires_entries(self) -> None:
+        cache = ResponseCache(InMemoryResponseStore(), ttl_seconds=60)
+        cache.put("k", "answer")
+        with patch("firefly_dworkers.workers.response_cache.time.time", return_value=10**12):
+            assert cache.get("k") is None
+            assert len(cache._memory) == 0
+
+    def test_lru_eviction(self) -> None:
+        store = InMemoryResponseStore(max_entries=2)
+        store.put("a", 1, 0)
+        store.put("b", 2, 0)
+        store.get("a")
+        store.put("c", 3, 0)
+        assert store.get("a") == 1
+        assert store.get("b") is None
+
+    def test_sqlite_tier_survives_new_memory_tier(self, tmp_path) -> None:
+        path = tmp_path / "responses.db"
+        ResponseCache(InMemoryResponseStore(), persistent=SQLiteResponseStore(path)).put("k", {"summary": "ok"})
+        cache = ResponseCache(InMemoryResponseStore(), persistent=SQLiteResponseStore(path))
+        assert cache.get("k") == {"summary": "ok"}
+        assert len(cache._memory) == 1
+
+    def test_sqlite_skips_unserialisable_outputs(self, tmp_path) -> None:
+        store = SQLiteResponseStore(tmp_path / "responses.db")
+        store.put("k", object(), 0)
+        assert store.get("k") is None
+        assert store.purge_expired() == 0
+
+
+class TestTenantCaches:
+    def test_disabled_by_default(self) -> None:
+        assert response_cache_for(TenantConfig(id="t", name="T")) is None
+
+    def test_shared_per_tenant(self) -> None:
+        config = TenantConfig(id="t", name="T", cache=CacheConfig(enabled=True))
+        other = TenantConfig(id="u", name="U", cache=CacheConfig(enabled=True))
+        assert response_cache_for(config) is response_cache_for(config)
+        assert response_cache_for(config) is not response_cache_for(other)
+
+
+class TestWorkerIntegration:
+    async def test_identical_runs_call_the_model_once(self) -> None:
+        from fireflyframework_genai.agents.base import FireflyAgent
+
+        from firefly_dworkers.workers.analyst import AnalystWorker
+
+        config = TenantConfig(id="cached", name="Cached", cache=CacheConfig(enabled=True))
+        worker = AnalystWorker(config, model="test")
+        with patch.object(FireflyAgent, "run", AsyncMock(return_value=SimpleNamespace(output="done"))) as run:
+            await worker.run("Summarise Q3")
+            second = await worker.run("Summarise Q3")
+            await worker.run("Summarise Q3", conversation_id="conv-1")
+            different = await worker.run("Summarise Q4")
+        assert run.await_count == 3
+        assert isinstance(second, CachedResponse)
+        assert second.output == "done"
+        assert not second.approximate
+        assert not isinstance(different, CachedResponse)
@@ -0,0 +1,106 @@
+"""Tests for the semantic (near-duplicate prompt) response cache."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from firefly_dworkers.tenants.config import CacheConfig, TenantConfig
+from firefly_dworkers.workers.response_cache import CachedResponse, clear_response_caches
+from firefly_dworkers.workers.semantic_cache import (
+    HashingEmbedder,
+    SemanticCache,
+    clear_semantic_caches,
+    semantic_cache_for,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    clear_response_caches()
+    clear_semantic_caches()
+    yield
+    clear_response_caches()
+    clear_semantic_caches()
+
+
+class TestHashingEmbedder:
+    def test_vectors_are_normalised(self) -> None:
+        vector = HashingEmbedder(dimensions=64).embed("Quarterly revenue by region")
+        assert len(vector) == 64
+        assert math.sumprod(vector, vector) == pytest.approx(1.0)
+
+    def test_paraphrase_scores_higher_than_unrelated_text(self) -> None:
+        embedder = HashingEmbedder()
+        base = embedder.embed("Summarise the competitive landscape for Acme in Europe")
+        paraphrase = embedder.embed("Summarize Acme's competitive landscape in Europe")
+        unrelated = embedder.embed("Draft an onboarding email for new hires")
+        assert math.sumprod(base, paraphrase) > 0.7
+        assert math.sumprod(base, unrelated) < 0.3
+
+    def test_empty_text(self) -> None:
+        assert not any(HashingEmbedder(dimensions=8).embed("  "))
+
+
+class TestSemanticCache:
+    def test_serves_similar_prompt_in_same_scope(self) -> None:
+        cache = SemanticCache(threshold=0.7)
+        cache.add("analyst", "Summarise the competitive landscape for Acme in Europe", "report")
+        match = cache.lookup("analyst", "Summarize Acme's competitive landscape in Europe")
+        assert match is not None
+        assert match.output == "report"
+        assert 0.7 <= match.similarity < 1.0
+
+    def test_other_scope_or_dissimilar_prompt_misses(self) -> None:
+        cache = SemanticCache(threshold=0.7)
+        cache.add("analyst", "Summarise the competitive landscape for Acme in Europe", "report")
+        assert cache.lookup("researcher", "Summarise the competitive landscape for Acme in Europe") is None
+        assert cache.lookup("analyst", "Draft an onboarding email for new hires") is None
+        assert cache.stats() == {"entries": 1, "hits": 0, "misses": 2}
+
+    def test_prompts_with_different_numbers_never_match(self) -> None:
+        cache = SemanticCache(threshold=0.5)
+        cache.add("s", "What was Acme revenue in 2023?", "1.2bn")
+        assert cache.lookup("s", "What was Acme revenue in 2024?") is None
+        assert cache.lookup("s", "what was acme's revenue in 2023").output == "1.2bn"
+
+    def test_oldest_entries_are_dropped(self) -> None:
+        cache = SemanticCache(max_entries=1)
+        cache.add("s", "first prompt", "a")
+        cache.add("s", "second prompt", "b")
+        assert cache.lookup("s", "first prompt") is None
+        assert cache.lookup("s", "second prompt").output == "b"
+
+    def test_expired_entries_are_ignored(self) -> None:
+        cache = SemanticCache(ttl_seconds=60)
+        cache.add("s", "a prompt", "answer")
+        with patch("firefly_dworkers.workers.semantic_cache.time.time", return_value=10**12):
+            assert cache.lookup("s", "a prompt") is None
+
+    def test_tenant_toggle(self) -> None:
+        assert semantic_cache_for(TenantConfig(id="t", name="T")) is None
+        config = TenantConfig(id="t", name="T", cache=CacheConfig(semantic_enabled=True))
+        assert semantic_cache_for(config) is semantic_cache_for(config)
+
+
+class TestWorkerIntegration:
+    async def test_paraphrased_prompt_is_served_approximately(self) -> None:
+        from fireflyframework_genai.agents.base import FireflyAgent
+
+        from firefly_dworkers.workers.analyst import AnalystWorker
+
+        config = TenantConfig(
+            id="semantic",
+            name="Semantic",
+            cache=CacheConfig(semantic_enabled=True, semantic_threshold=0.7),
+        )
+        worker = AnalystWorker(config, model="test")
+        with patch.object(FireflyAgent, "run", AsyncMock(return_value=SimpleNamespace(output="report"))) as run:
+            await worker.run("Summarise the competitive landscape for Acme in Europe")
+            result = await worker.run("Summarize Acme's competitive landscape in Europe")
+        assert run.await_count == 1
+        assert isinstance(result, CachedResponse)
+        assert result.approximate
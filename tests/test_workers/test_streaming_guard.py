@@ -0,0 +1,126 @@
+"""Tests for incremental (streaming) output guarding and guard caching."""
+
+from __future__ import annotations
+
+import logging
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from firefly_dworkers.exceptions import GuardViolationError
+from firefly_dworkers.tenants.config import GuardsConfig, SecurityConfig, TenantConfig
+from firefly_dworkers.workers import guards
+from firefly_dworkers.workers.guards import GuardCache, StreamingOutputGuard, streaming_output_guard
+
+_PATTERNS = {
+    "secrets": {"api_key": re.compile(r"sk-[A-Za-z0-9]{16}")},
+    "pii": {"ssn": re.compile(r"\d{3}-\d{2}-\d{4}")},
+    "deny": {"forbidden": re.compile(r"FORBIDDEN")},
+    "harmful": {"rude": re.compile(r"rude")},
+}
+
+
+def _guard(**kwargs) -> StreamingOutputGuard:
+    kwargs.setdefault("block_categories", ["secrets", "pii"])
+    kwargs.setdefault("window", 8)
+    return StreamingOutputGuard(_PATTERNS, **kwargs)
+
+
+def _stream(guard: StreamingOutputGuard, text: str, size: int = 3) -> str:
+    out = [guard.feed(text[i : i + size]) for i in range(0, len(text), size)]
+    return "".join(out) + guard.flush()
+
+
+class TestStreamingOutputGuard:
+    def test_clean_text_passes_through(self) -> None:
+        text = "Revenue grew 12% year on year across all regions."
+        assert _stream(_guard(), text) == text
+
+    def test_secret_split_across_chunks_is_redacted(self) -> None:
+        text = "Use key sk-ABCDEFGH12345678 to call the API, then report back to the team."
+        assert _stream(_guard(window=32), text, size=5) == (
+            "Use key [REDACTED] to call the API, then report back to the team."
+        )
+
+    def test_text_is_released_before_the_stream_ends(self) -> None:
+        guard = _guard()
+        released = guard.feed("a" * 40)
+        assert released == "a" * 32
+        assert guard.flush() == "a" * 8
+
+    def test_deny_pattern_raises(self) -> None:
+        with pytest.raises(GuardViolationError, match="forbidden"):
+            _stream(_guard(), "This output is FORBIDDEN to show")
+
+    def test_reject_mode_raises_on_blocked_category(self) -> None:
+        with pytest.raises(GuardViolationError, match="ssn"):
+            _stream(_guard(sanitise=False), "SSN 123-45-6789 leaked")
+
+    def test_unblocked_categories_are_ignored(self) -> None:
+        assert _stream(_guard(), "a rude remark") == "a rude remark"
+
+    def test_max_length(self) -> None:
+        guard = _guard(max_length=10)
+        with pytest.raises(GuardViolationError, match="maximum length"):
+            guard.feed("x" * 11)
+
+
+class TestStreamingOutputGuardFactory:
+    def test_complete_mode_has_no_stream_guard(self) -> None:
+        assert streaming_output_guard(TenantConfig(id="t", name="T")) is None
+
+    def test_disabled_output_guard_has_no_stream_guard(self) -> None:
+        guards = GuardsConfig(output_guard_enabled=False, output_guard_mode="streaming")
+        config = TenantConfig(id="t", name="T", security=SecurityConfig(guards=guards))
+        assert streaming_output_guard(config) is None
+
+    @staticmethod
+    def _streaming_config(**kwargs) -> TenantConfig:
+        settings = GuardsConfig(output_guard_mode="streaming", stream_window_chars=8, **kwargs)
+        return TenantConfig(id="t", name="T", security=SecurityConfig(guards=settings))
+
+    def test_patterns_come_from_the_output_guard(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(guards, "output_guard_for", lambda cfg: SimpleNamespace(_groups=_PATTERNS))
+        guard = streaming_output_guard(self._streaming_config())
+        assert guard is not None
+        assert _stream(guard, "SSN 123-45-6789 leaked") == "SSN [REDACTED] leaked"
+
+    def test_tenant_deny_patterns_are_compiled_from_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(guards, "output_guard_for", lambda cfg: SimpleNamespace(_groups=_PATTERNS))
+        guard = streaming_output_guard(self._streaming_config(custom_deny_patterns=["TOP SECRET"]))
+        assert guard is not None
+        with pytest.raises(GuardViolationError):
+            _stream(guard, "This memo is TOP SECRET")
+
+    def test_unreadable_patterns_disable_the_stream_guard(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setattr(guards, "output_guard_for", lambda cfg: SimpleNamespace())
+        with caplog.at_level(logging.WARNING, logger=guards.__name__):
+            assert streaming_output_guard(self._streaming_config()) is None
+        assert "not scanned" in caplog.text
+
+
+class TestGuardCache:
+    def test_same_settings_share_one_instance(self) -> None:
+        cache = GuardCache()
+        built: list[object] = []
+
+        def _factory() -> object:
+            built.append(object())
+            return built[-1]
+
+        first = cache.get_or_create("output", GuardsConfig(), _factory)
+        second = cache.get_or_create("output", GuardsConfig(), _factory)
+        other = cache.get_or_create("output", GuardsConfig(max_output_length=10), _factory)
+        assert first is second
+        assert other is not first
+        assert len(built) == 2
+        assert cache.stats() == {"entries": 2, "hits": 1, "misses": 2}
+
+    def test_kinds_are_cached_separately(self) -> None:
+        cache = GuardCache()
+        assert cache.get_or_create("prompt", GuardsConfig(), object) is not cache.get_or_create(
+            "output", GuardsConfig(), object
+        )